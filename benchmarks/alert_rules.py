@@ -0,0 +1,102 @@
+"""Latency benchmark: alert rule evaluation per refresh cycle.
+
+여러 클러스터의 노드 메트릭, non-running Pod, 재시작, 워크로드 행을 만들고 기본 경보 규칙과
+워크로드 집계 규칙을 새로고침 한 주기(모든 클러스터 evaluate) 동안 평가하는 시간을 측정합니다.
+--non-running으로 Running이 아닌 Pod의 비율을 바꿔 장애 상황(대량 Pending)도 측정할 수 있습니다.
+
+사용법:
+    python benchmarks/alert_rules.py --clusters 20 --nodes 10000 --pods 200000
+"""
+
+import argparse
+import time
+
+from kubernetes_dashboard.alerts import DEFAULT_RULES, AlertEngine, parse_rule
+from kubernetes_dashboard.records import NodeRow, PodRow, RestartRow, WorkloadRow, intern
+
+EXTRA_RULES = (
+    {"name": "WorkloadRestarts", "source": "workloads", "by": ["ns"], "expr": "sum(restarts) > 50", "for": 2},
+    {"name": "WorkloadUnready", "source": "workloads", "expr": "non_running > 0", "for": "5m"},
+)
+
+
+def _snapshot(cluster: str, nodes: int, pods: int, non_running: float, hot: int, cycle: int) -> dict[str, list]:
+    # hot개 중 하나의 노드/워크로드가 임계값을 넘음
+    node_rows = [
+        NodeRow(cluster, intern(f"node-{n}"), 4.0, 16.0, 95.0 if n % hot == 0 else float(40 + (n + cycle) % 40), 50.0)
+        for n in range(nodes)
+    ]
+    failing = int(pods * non_running)
+    pod_rows = [
+        PodRow(
+            cluster,
+            f"app-{i % 500}-{i:06d}",
+            intern(f"namespace-{i % 40}"),
+            node_rows[i % nodes].node,
+            "Pending" if i % 3 else "Failed",
+            "Unschedulable",
+            f"Deployment/app-{i % 500}",
+        )
+        for i in range(failing)
+    ]
+    restart_rows = [
+        RestartRow(cluster, f"app-{i}-{i:06d}", intern(f"namespace-{i % 40}"), "node-0", i, "app", 0, i % 10, i)
+        for i in range(50)
+    ]
+    workload_rows = [
+        WorkloadRow(
+            cluster, intern(f"namespace-{w % 40}"), "Deployment", f"app-{w}", pods // 500, 0, int(w % hot == 0), w % 7
+        )
+        for w in range(500)
+    ]
+    return {
+        "node_metrics": node_rows,
+        "non_running_pods": pod_rows,
+        "recent_restarts": restart_rows,
+        "workloads": workload_rows,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clusters", type=int, default=20)
+    parser.add_argument("--nodes", type=int, default=10_000, help="전체 노드 수")
+    parser.add_argument("--pods", type=int, default=200_000, help="전체 Pod 수")
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--hot", type=int, default=50, help="N개 중 하나의 노드/워크로드가 임계값을 넘음")
+    args = parser.parse_args()
+
+    rules = [parse_rule(spec) for spec in (*DEFAULT_RULES, *EXTRA_RULES)]
+    clusters = [intern(f"cluster-{c:03d}") for c in range(args.clusters)]
+    for non_running in (0.05, 1.0):
+        cycles = [
+            [
+                (
+                    ctx,
+                    _snapshot(
+                        ctx, args.nodes // args.clusters, args.pods // args.clusters, non_running, args.hot, cycle
+                    ),
+                )
+                for ctx in clusters
+            ]
+            for cycle in range(args.cycles)
+        ]
+        engine = AlertEngine(rules)
+        times = []
+        for cycle, parts in enumerate(cycles):
+            started = time.perf_counter()
+            for ctx, snapshot in parts:
+                engine.evaluate(ctx, snapshot, now=cycle * 30.0)
+            times.append(time.perf_counter() - started)
+        rows = sum(len(rows) for _, snapshot in cycles[0] for rows in snapshot.values())
+        firing = len(engine.alerts())
+        times.sort()
+        print(
+            f"non-running {non_running:>5.0%} ({rows:,} rows, {len(rules)} rules): "
+            f"median {1000 * times[len(times) // 2]:6.1f} ms, max {1000 * times[-1]:6.1f} ms per cycle, "
+            f"{firing:,} firing"
+        )
+
+
+if __name__ == "__main__":
+    main()
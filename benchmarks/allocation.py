@@ -0,0 +1,84 @@
+"""Latency benchmark: requests/limits allocation per refresh cycle.
+
+wire 모듈이 변환한 것과 같은 형태(SimpleNamespace)의 Pod 목록을 만들고, 여러 클러스터의
+노드별/네임스페이스별 requests/limits 합계와 allocatable/사용량 결합(allocation.allocation())을
+새로고침 한 주기 동안 계산하는 시간을 측정합니다.
+
+사용법:
+    python benchmarks/allocation.py --clusters 20 --nodes 10000 --containers 200000
+"""
+
+import argparse
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from kubernetes_dashboard.allocation import allocation
+from kubernetes_dashboard.inventory import NodeInfo
+from kubernetes_dashboard.records import NodeRow, intern
+
+# 자주 쓰이는 requests/limits 값
+_CPU = ("50m", "100m", "250m", "500m", "1", "2")
+_MEM = ("64Mi", "128Mi", "256Mi", "512Mi", "1Gi", "512M")
+
+
+def _container(i: int) -> Any:
+    requests = {"cpu": _CPU[i % len(_CPU)], "memory": _MEM[i % len(_MEM)]}
+    # 절반만 limits 지정
+    limits = {"cpu": _CPU[(i + 1) % len(_CPU)], "memory": _MEM[(i + 2) % len(_MEM)]} if i % 2 else None
+    return SimpleNamespace(name="app", resources=SimpleNamespace(requests=requests, limits=limits))
+
+
+def _cluster(nodes: int, containers: int) -> tuple[list[Any], dict[str, NodeInfo], list[NodeRow]]:
+    node_names = [intern(f"node-{n}") for n in range(nodes)]
+    pods: list[Any] = []
+    # Pod당 평균 1.5개 컨테이너 (사이드카가 있는 Pod 절반)
+    i = 0
+    while i < containers:
+        count = 2 if len(pods) % 2 else 1
+        pods.append(
+            SimpleNamespace(
+                metadata=SimpleNamespace(namespace=intern(f"namespace-{len(pods) % 40}")),
+                spec=SimpleNamespace(
+                    node_name=node_names[len(pods) % nodes],
+                    containers=[_container(i + k) for k in range(count)],
+                    init_containers=None,
+                ),
+                status=SimpleNamespace(phase="Running"),
+            )
+        )
+        i += count
+    inventory = {name: NodeInfo(name, "1", 16.0, 64 * 1024**3, 15.5, 62 * 1024**3, {}, (), {}) for name in node_names}
+    usage = [NodeRow("c", name, 8.0, 32 * 1024**3, 50.0, 50.0) for name in node_names]
+    return pods, inventory, usage
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clusters", type=int, default=20)
+    parser.add_argument("--nodes", type=int, default=10_000, help="전체 노드 수")
+    parser.add_argument("--containers", type=int, default=200_000, help="전체 컨테이너 수")
+    parser.add_argument("--cycles", type=int, default=5)
+    args = parser.parse_args()
+
+    clusters = [
+        (intern(f"cluster-{c:03d}"), *_cluster(args.nodes // args.clusters, args.containers // args.clusters))
+        for c in range(args.clusters)
+    ]
+    pods = sum(len(cluster[1]) for cluster in clusters)
+    timings = []
+    for _ in range(args.cycles):
+        start = time.perf_counter()
+        node_rows = ns_rows = 0
+        for ctx, cluster_pods, inventory, usage in clusters:
+            nodes, namespaces = allocation(ctx, cluster_pods, inventory, usage)
+            node_rows += len(nodes)
+            ns_rows += len(namespaces)
+        timings.append(time.perf_counter() - start)
+    print(f"{args.clusters} clusters, {pods:,} pods, {args.containers:,} containers, {args.nodes:,} nodes")
+    print(f"node rows {node_rows:,}, namespace rows {ns_rows:,}")
+    print(f"allocation per cycle: best {min(timings) * 1000:.1f} ms, mean {sum(timings) / len(timings) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,542 @@
+"""Load benchmark: concurrent dashboard sessions against a fake apiserver.
+
+대시보드 한 replica가 동시에 몇 명의 사용자를 감당할 수 있는지 측정합니다.
+Streamlit AppTest로 dashboard.py(main())를 브라우저 없이 실행하는 세션을 N개 만들고, 각 세션이 스레드에서
+동시에 Overview → 클러스터 상세 페이지들 → Logs & Events 순으로 페이지를 전환합니다
+(Streamlit 서버도 세션마다 별도 스레드에서 스크립트를 실행하며, st.cache_resource의 SnapshotStore는 모든 세션이 공유).
+
+API 서버는 별도 프로세스에서 실행하는 가짜 서버(HTTP)이며 컨텍스트마다 경로 접두사(/cluster-N)로 구분합니다.
+Pod/노드/메트릭/이벤트/네임스페이스/로그 요청에 합성 응답을 반환하고 요청 수를 기록하므로,
+측정하는 CPU와 메모리에는 대시보드 프로세스의 사용량만 포함됩니다.
+
+세션 수별로 다음을 출력합니다:
+- 페이지 실행(rerun)당 지연 시간 (p50/p95/max, 페이지 종류별 p95)
+- API 서버 요청 수 (전체, 세션당)
+- 프로세스 CPU 시간과 사용률, RSS 메모리
+
+사용법:
+    python benchmarks/load_sessions.py --sessions 1,5,10,20 --clusters 3 --pods 5000
+    python benchmarks/load_sessions.py --sessions 10 --refresh --api-latency 50 --json results.json
+"""
+
+import argparse
+import gzip
+import json
+import multiprocessing
+import os
+import re
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.connection import Connection
+from typing import Any
+
+OVERVIEW = "Overview"
+LOGS_AND_EVENTS = "Logs & Events"
+# 가짜 API 서버의 요청 수 조회 경로 (?reset=1이면 조회 후 초기화)
+_STATS_PATH = "/__stats"
+
+# 경로 → 요청 종류 (요청 수 집계용)
+_ROUTES = (
+    ("pods", re.compile(r"^/api/v1/pods$")),
+    ("nodes", re.compile(r"^/api/v1/nodes$")),
+    ("metrics", re.compile(r"^/apis/metrics\.k8s\.io/v1beta1/nodes$")),
+    ("pod_metrics", re.compile(r"^/apis/metrics\.k8s\.io/v1beta1/pods$")),
+    ("events", re.compile(r"^/api/v1/(?:namespaces/[^/]+/)?events$")),
+    ("namespaces", re.compile(r"^/api/v1/namespaces$")),
+    ("namespace_pods", re.compile(r"^/api/v1/namespaces/[^/]+/pods$")),
+    ("log", re.compile(r"^/api/v1/namespaces/[^/]+/pods/[^/]+/log$")),
+    ("pod", re.compile(r"^/api/v1/namespaces/[^/]+/pods/[^/]+$")),
+)
+_CLUSTER_PREFIX = re.compile(r"^/(cluster-\d+)(/.*)$")
+
+
+# ------------------- Fake apiserver ------------------- #
+def _pod(cluster: int, i: int, nodes: int, namespaces: int, non_running: float) -> dict[str, Any]:
+    """합성 Pod 객체를 만듭니다 (Deployment 소유, 일부는 Pending)."""
+    app = f"app-{i % 200}"
+    pending = (i % 1000) < non_running * 1000
+    return {
+        "metadata": {
+            "name": f"{app}-{i:06d}",
+            "namespace": f"namespace-{i % namespaces}",
+            "uid": f"{cluster}-{i}",
+            "resourceVersion": str(i),
+            "labels": {"app": app},
+            "ownerReferences": [
+                {
+                    "apiVersion": "apps/v1",
+                    "kind": "ReplicaSet",
+                    "name": f"{app}-5d9c",
+                    "uid": f"rs-{app}",
+                    "controller": True,
+                }
+            ],
+        },
+        "spec": {
+            "nodeName": None if pending else f"node-{i % nodes}",
+            "containers": [
+                {
+                    "name": "app",
+                    "image": f"registry.example.com/{app}:1.0",
+                    "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}, "limits": {"memory": "256Mi"}},
+                }
+            ],
+        },
+        "status": {
+            "phase": "Pending" if pending else "Running",
+            "reason": "Unschedulable" if pending else None,
+            "containerStatuses": [
+                {"name": "app", "ready": not pending, "restartCount": i % 3, "image": "x", "imageID": "x"}
+            ],
+        },
+    }
+
+
+def _bodies(cluster: int, pods: int, nodes: int, namespaces: int, non_running: float) -> dict[str, Any]:
+    """클러스터 하나의 응답 본문을 미리 만듭니다."""
+    items = [_pod(cluster, i, nodes, namespaces, non_running) for i in range(pods)]
+    by_namespace: dict[str, list[dict[str, Any]]] = {}
+    for item in items:
+        by_namespace.setdefault(item["metadata"]["namespace"], []).append(item)
+    node_items = [
+        {
+            "metadata": {"name": f"node-{n}", "resourceVersion": "1", "labels": {"zone": f"zone-{n % 3}"}},
+            "spec": {},
+            "status": {
+                "capacity": {"cpu": "16", "memory": "64Gi"},
+                "allocatable": {"cpu": "15500m", "memory": "62Gi"},
+                "conditions": [{"type": "Ready", "status": "True"}],
+            },
+        }
+        for n in range(nodes)
+    ]
+    events = [
+        {
+            "metadata": {"name": f"event-{e}", "namespace": f"namespace-{e % namespaces}"},
+            "involvedObject": {
+                "kind": "Pod",
+                "name": items[e % pods]["metadata"]["name"],
+                "namespace": items[e % pods]["metadata"]["namespace"],
+            },
+            "type": "Warning" if e % 4 == 0 else "Normal",
+            "reason": "BackOff" if e % 4 == 0 else "Pulled",
+            "message": "synthetic event",
+            "lastTimestamp": f"2025-01-01T00:{e % 60:02d}:00Z",
+        }
+        for e in range(min(pods, 500))
+    ]
+
+    def dump(data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    return {
+        "pods": dump({"metadata": {"resourceVersion": "1"}, "items": items}),
+        "nodes": dump({"metadata": {"resourceVersion": "1"}, "items": node_items}),
+        "metrics": dump(
+            {
+                "items": [
+                    {"metadata": {"name": f"node-{n}"}, "usage": {"cpu": f"{1000 + n % 8 * 1000}m", "memory": "24Gi"}}
+                    for n in range(nodes)
+                ]
+            }
+        ),
+        "pod_metrics": dump(
+            {
+                "items": [
+                    {
+                        "metadata": {"name": item["metadata"]["name"], "namespace": item["metadata"]["namespace"]},
+                        "containers": [{"name": "app", "usage": {"cpu": "100m", "memory": "256Mi"}}],
+                    }
+                    for item in items
+                    if item["status"]["phase"] == "Running"
+                ]
+            }
+        ),
+        "events": dump({"metadata": {}, "items": events}),
+        "namespaces": dump({"metadata": {}, "items": [{"metadata": {"name": ns}} for ns in sorted(by_namespace)]}),
+        "namespace_pods": {ns: dump({"metadata": {}, "items": pods_}) for ns, pods_ in by_namespace.items()},
+        "pod": {item["metadata"]["name"]: dump(item) for item in items},
+    }
+
+
+def _serve(conn: Connection, clusters: int, pods: int, nodes: int, namespaces: int, latency: float) -> None:
+    """가짜 API 서버를 실행합니다 (별도 프로세스). 포트 번호를 conn으로 보냅니다."""
+    bodies = [_bodies(c, pods, nodes, namespaces, 0.05) for c in range(clusters)]
+    counts: Counter[str] = Counter()
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+        def _send(self, status: int, body: bytes, content_type: str = "application/json") -> None:
+            if "gzip" in (self.headers.get("Accept-Encoding") or "") and len(body) > 1024:
+                body = gzip.compress(body, compresslevel=1)
+                self.send_response(status)
+                self.send_header("Content-Encoding", "gzip")
+            else:
+                self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            path, _, query = self.path.partition("?")
+            if path == _STATS_PATH:
+                with lock:
+                    snapshot = dict(counts)
+                    if "reset=1" in query:
+                        counts.clear()
+                self._send(200, json.dumps(snapshot).encode())
+                return
+            match = _CLUSTER_PREFIX.match(path)
+            route = None
+            if match:
+                cluster, path = match.groups()
+                index = int(cluster.split("-")[1])
+                route = next((name for name, pattern in _ROUTES if pattern.match(path)), None)
+            if route is None or index >= len(bodies):
+                self._send(404, b'{"kind":"Status","status":"Failure","code":404}')
+                return
+            with lock:
+                counts[f"{cluster} {route}"] += 1
+            if latency:
+                time.sleep(latency)
+            data = bodies[index]
+            parts = path.split("/")
+            if route == "log":
+                self._send(200, b"synthetic log line\n" * 100, "text/plain")
+            elif route == "namespace_pods":
+                self._send(200, data[route].get(parts[4], b'{"metadata":{},"items":[]}'))
+            elif route == "pod":
+                body = data[route].get(parts[6])
+                self._send(200, body) if body else self._send(404, b'{"code":404}')
+            else:
+                self._send(200, data[route])
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    conn.send(server.server_address[1])
+    server.serve_forever()
+
+
+def _kubeconfig(port: int, clusters: int) -> str:
+    """가짜 API 서버를 가리키는 kubeconfig 파일을 만들고 경로를 반환합니다."""
+    names = [f"cluster-{c}" for c in range(clusters)]
+    config = {
+        "apiVersion": "v1",
+        "kind": "Config",
+        "clusters": [{"name": n, "cluster": {"server": f"http://127.0.0.1:{port}/{n}"}} for n in names],
+        "users": [{"name": "load", "user": {"token": "load-test"}}],
+        "contexts": [{"name": n, "context": {"cluster": n, "user": "load"}} for n in names],
+        "current-context": names[0],
+    }
+    fd, path = tempfile.mkstemp(suffix=".yaml", prefix="load-kubeconfig-")
+    with os.fdopen(fd, "w") as f:
+        json.dump(config, f)
+    return path
+
+
+def _api_calls(port: int) -> Counter[str]:
+    """가짜 API 서버의 요청 수를 조회하고 초기화합니다."""
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}{_STATS_PATH}?reset=1") as response:
+        return Counter(json.load(response))
+
+
+# ------------------- Sessions ------------------- #
+@dataclass
+class SessionResult:
+    """세션 하나의 측정 결과
+
+    Attributes:
+        timings (list[tuple[str, float]]): (페이지 종류, rerun 시간(초)) 목록
+        errors (list[str]): 페이지에서 발생한 예외 메시지
+    """
+
+    timings: list[tuple[str, float]] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+
+def _page_kind(page: str) -> str:
+    if page in (OVERVIEW, LOGS_AND_EVENTS):
+        return page
+    return "Cluster"
+
+
+def _session(
+    script: str,
+    clusters: Sequence[str],
+    rounds: int,
+    refresh: bool,
+    timeout: float,
+    barrier: threading.Barrier,
+    result: SessionResult,
+) -> None:
+    """세션 하나가 모든 클러스터를 선택한 뒤 페이지를 순서대로 전환합니다."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(script, default_timeout=timeout)
+
+    def timed(kind: str) -> None:
+        start = time.perf_counter()
+        at.run()
+        result.timings.append((kind, time.perf_counter() - start))
+        result.errors.extend(str(e.value) for e in at.exception)
+
+    barrier.wait()
+    try:
+        timed(OVERVIEW)
+        at.sidebar.multiselect[0].set_value(list(clusters))
+        timed(OVERVIEW)
+        pages = [OVERVIEW, *clusters, LOGS_AND_EVENTS]
+        for _ in range(rounds):
+            if refresh:
+                # 수동 새로고침: 공유 캐시를 비우고 다시 수집 (가장 나쁜 경우)
+                at.sidebar.button[0].click()
+            for page in pages:
+                at.sidebar.radio[0].set_value(page)
+                timed(_page_kind(page))
+    except Exception as e:
+        # 페이지가 렌더링되지 않아 위젯을 찾을 수 없는 경우 등. 나머지 세션은 계속 측정
+        result.errors.append(f"session aborted: {e!r}")
+
+
+def _peak_rss_mib() -> float:
+    """프로세스의 최대 RSS(MiB)를 반환합니다 (ru_maxrss 단위는 Linux KiB, macOS 바이트)."""
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 2**20
+
+
+def _share_runtime(script: str) -> None:
+    """AppTest 세션을 한 프로세스에서 동시에 실행할 수 있도록 실제 서버처럼 전역 상태를 공유합니다.
+
+    AppTest.run()은 단일 세션을 가정하고 rerun마다 전역 상태를 설정했다가 되돌리므로, 세션을 동시에 실행하면
+    다른 세션의 rerun이 끝나면서 실행 중인 세션의 상태가 사라집니다. 따라서 다음을 미리 설치합니다:
+    - Runtime 하나 (AppTest가 참조하는 Runtime은 하위 클래스로 바꿔 AppTest의 할당이 전역 값을 바꾸지 않도록 함)
+    - global.appTest 설정 (꺼지면 위젯 정보가 기록되지 않음)
+    - 미리 컴파일한 스크립트 바이트코드 캐시 (Python 3.11은 여러 스레드에서 동시에 AST를 만들면 SystemError 발생)
+
+    Args:
+        script (str): 대시보드 스크립트 경로
+    """
+    from unittest.mock import MagicMock
+
+    from streamlit import config
+    from streamlit.components.v2.component_manager import BidiComponentManager
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+    from streamlit.runtime.dataframe_source_manager import DataframeSourceManager
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import app_test, local_script_runner
+
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.dataframe_source_mgr = DataframeSourceManager()
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    components = BidiComponentManager()
+    components.discover_and_register_components(start_file_watching=False)
+    runtime.bidi_component_registry = components
+    Runtime._instance = runtime
+    config.set_option("global.appTest", True)
+
+    class _SessionRuntime(Runtime):
+        pass
+
+    script_cache = ScriptCache()
+    script_cache.get_bytecode(script)
+    app_test.Runtime = _SessionRuntime  # type: ignore[misc]
+    app_test.ScriptCache = local_script_runner.ScriptCache = lambda: script_cache  # type: ignore[misc,assignment]
+
+
+def _rss_mib() -> float:
+    """현재 RSS(MiB)를 반환합니다 (/proc가 없으면 최대 RSS)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        return _peak_rss_mib()
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[int(q) - 1]
+
+
+@dataclass
+class LevelReport:
+    """세션 수 한 단계의 측정 결과"""
+
+    sessions: int
+    reruns: int
+    errors: int
+    wall_seconds: float
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    p95_ms_by_page: dict[str, float]
+    api_calls: int
+    api_calls_per_session: float
+    api_calls_by_route: dict[str, int]
+    cpu_seconds: float
+    cpu_percent: float
+    rss_mib: float
+    peak_rss_mib: float
+
+
+def _reset_caches() -> None:
+    """세션 수 단계마다 공유 캐시를 비워 같은 조건(콜드 스타트)에서 시작합니다."""
+    import streamlit as st
+
+    from kubernetes_dashboard.collectors import invalidate_caches
+
+    st.cache_resource.clear()
+    invalidate_caches()
+
+
+def run_level(script: str, port: int, clusters: Sequence[str], sessions: int, args: argparse.Namespace) -> LevelReport:
+    """세션 sessions개를 동시에 실행하고 결과를 집계합니다."""
+    _reset_caches()
+    _api_calls(port)
+    results = [SessionResult() for _ in range(sessions)]
+    barrier = threading.Barrier(sessions)
+    threads = [
+        threading.Thread(
+            target=_session,
+            args=(script, clusters, args.rounds, args.refresh, args.timeout, barrier, result),
+            daemon=True,
+        )
+        for result in results
+    ]
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    calls = _api_calls(port)
+
+    timings = [seconds * 1000 for result in results for _, seconds in result.timings]
+    by_page: dict[str, list[float]] = {}
+    for result in results:
+        for kind, seconds in result.timings:
+            by_page.setdefault(kind, []).append(seconds * 1000)
+    errors = [error for result in results for error in result.errors]
+    if errors:
+        print(f"  {len(errors)} page errors, first: {errors[0]}", file=sys.stderr)
+    by_route: Counter[str] = Counter()
+    for key, count in calls.items():
+        by_route[key.split(" ", 1)[1]] += count
+    total = sum(calls.values())
+    return LevelReport(
+        sessions=sessions,
+        reruns=len(timings),
+        errors=len(errors),
+        wall_seconds=wall,
+        p50_ms=_percentile(timings, 50),
+        p95_ms=_percentile(timings, 95),
+        max_ms=max(timings, default=0.0),
+        p95_ms_by_page={kind: _percentile(values, 95) for kind, values in sorted(by_page.items())},
+        api_calls=total,
+        api_calls_per_session=total / sessions,
+        api_calls_by_route=dict(sorted(by_route.items())),
+        cpu_seconds=cpu,
+        cpu_percent=cpu / wall * 100 if wall else 0.0,
+        rss_mib=_rss_mib(),
+        peak_rss_mib=_peak_rss_mib(),
+    )
+
+
+def _print_report(reports: Sequence[LevelReport]) -> None:
+    header = (
+        f"{'sessions':>8} {'reruns':>6} {'errors':>6} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} "
+        f"{'api calls':>9} {'/session':>8} {'cpu s':>7} {'cpu %':>6} {'rss MiB':>8}"
+    )
+    print(header)
+    for r in reports:
+        print(
+            f"{r.sessions:>8} {r.reruns:>6} {r.errors:>6} {r.p50_ms:>8.0f} {r.p95_ms:>8.0f} {r.max_ms:>8.0f} "
+            f"{r.api_calls:>9} {r.api_calls_per_session:>8.1f} {r.cpu_seconds:>7.1f} {r.cpu_percent:>6.0f} "
+            f"{r.rss_mib:>8.0f}"
+        )
+    print()
+    kinds = sorted({kind for r in reports for kind in r.p95_ms_by_page})
+    print(f"{'sessions':>8} " + " ".join(f"{f'p95 {kind}':>20}" for kind in kinds))
+    for r in reports:
+        print(f"{r.sessions:>8} " + " ".join(f"{r.p95_ms_by_page.get(kind, 0.0):>20.0f}" for kind in kinds))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", default="1,5,10,20", help="쉼표로 구분한 동시 세션 수 목록")
+    parser.add_argument("--clusters", type=int, default=3)
+    parser.add_argument("--pods", type=int, default=5000, help="클러스터당 Pod 수")
+    parser.add_argument("--nodes", type=int, default=100, help="클러스터당 노드 수")
+    parser.add_argument("--namespaces", type=int, default=20, help="클러스터당 네임스페이스 수")
+    parser.add_argument("--rounds", type=int, default=2, help="세션마다 전체 페이지를 순회하는 횟수")
+    parser.add_argument("--refresh", action="store_true", help="순회마다 수동 새로고침 (공유 캐시 무효화)")
+    parser.add_argument("--api-latency", type=float, default=0.0, help="가짜 API 서버 응답 지연(ms)")
+    parser.add_argument("--timeout", type=float, default=300.0, help="rerun 하나의 최대 시간(초)")
+    parser.add_argument("--json", help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+    levels = [int(value) for value in args.sessions.split(",") if value.strip()]
+
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    server = multiprocessing.Process(
+        target=_serve,
+        args=(sender, args.clusters, args.pods, args.nodes, args.namespaces, args.api_latency / 1000),
+        daemon=True,
+    )
+    server.start()
+    port = receiver.recv()
+    kubeconfig = _kubeconfig(port, args.clusters)
+    # 대시보드가 kubeconfig를 읽기 전에 설정 (스냅샷 저장은 비활성화)
+    os.environ["KUBECONFIG"] = kubeconfig
+    os.environ["DASHBOARD_SNAPSHOT_DIR"] = ""
+
+    from streamlit.logger import set_log_level
+
+    from kubernetes_dashboard import dashboard
+
+    # 세션 스레드의 "missing ScriptRunContext" 경고 등은 출력하지 않음
+    set_log_level("error")
+    _share_runtime(str(dashboard.__file__))
+
+    clusters = [f"cluster-{c}" for c in range(args.clusters)]
+    print(
+        f"{args.clusters} clusters x {args.pods:,} pods / {args.nodes} nodes, {args.rounds} rounds per session"
+        f"{', manual refresh every round' if args.refresh else ''}, api latency {args.api_latency:.0f} ms"
+    )
+    reports = []
+    try:
+        for sessions in levels:
+            reports.append(run_level(str(dashboard.__file__), port, clusters, sessions, args))
+            print(f"  {sessions} sessions done in {reports[-1].wall_seconds:.1f} s", file=sys.stderr)
+    finally:
+        server.terminate()
+        os.unlink(kubeconfig)
+    print()
+    _print_report(reports)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([asdict(report) for report in reports], f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
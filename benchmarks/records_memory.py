@@ -0,0 +1,107 @@
+"""Memory benchmark: dict rows vs. slotted records.
+
+수집 함수가 예전처럼 행마다 딕셔너리를 만들 때와 records 모듈의 slotted 행 +
+문자열 intern을 사용할 때의 메모리 사용량을 tracemalloc으로 비교합니다.
+Kubernetes API 응답을 역직렬화하면 같은 네임스페이스/노드 이름도 행마다 별도의 문자열
+객체가 되므로, 합성 데이터도 매번 새 문자열을 만들어 같은 조건을 재현합니다.
+
+사용법:
+    python benchmarks/records_memory.py --clusters 20 --pods 5000
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from kubernetes_dashboard.records import PodRow, frame, intern
+
+
+def _fresh(value: str) -> str:
+    """역직렬화된 값처럼 내용은 같지만 별도 객체인 문자열을 만듭니다."""
+    return "".join(list(value))
+
+
+def _source(clusters: int, pods: int) -> list[tuple[str, ...]]:
+    rows: list[tuple[str, ...]] = []
+    for c in range(clusters):
+        for p in range(pods):
+            rows.append(
+                (
+                    _fresh(f"cluster-{c:03d}"),
+                    _fresh(f"app-{p % 500}-7d9c8f6b5-{p:05d}"),
+                    _fresh(f"namespace-{p % 40}"),
+                    _fresh(f"ip-10-0-{p % 200}-{c}.ec2.internal"),
+                    _fresh("Pending"),
+                    _fresh("Unschedulable"),
+                )
+            )
+    return rows
+
+
+def dict_rows(source: list[tuple[str, ...]]) -> list[dict[str, Any]]:
+    return [
+        {"cluster": c, "pod": pod, "ns": ns, "node": node, "phase": phase, "reason": reason}
+        for c, pod, ns, node, phase, reason in source
+    ]
+
+
+def record_rows(source: list[tuple[str, ...]]) -> list[PodRow]:
+    return [
+        PodRow(intern(c), pod, intern(ns), intern(node), intern(phase), intern(reason))
+        for c, pod, ns, node, phase, reason in source
+    ]
+
+
+def measure(
+    clusters: int, pods: int, build: Callable[[list[tuple[str, ...]]], list[Any]]
+) -> tuple[list[Any], int, float]:
+    """원본 문자열 생성부터 행 생성까지 추적하여, 원본을 해제한 뒤 남은 메모리를 측정합니다.
+
+    Returns:
+        tuple: (행 목록, 유지되는 바이트 수, 행 생성 시간(초))
+    """
+    tracemalloc.start()
+    source = _source(clusters, pods)
+    started = time.perf_counter()
+    rows = build(source)
+    elapsed = time.perf_counter() - started
+    del source  # 행이 참조하지 않는 중복 문자열은 여기서 해제됨
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rows, current, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clusters", type=int, default=20)
+    parser.add_argument("--pods", type=int, default=5000, help="클러스터당 행 수")
+    args = parser.parse_args()
+
+    total = args.clusters * args.pods
+    print(f"rows: {total:,} ({args.clusters} clusters x {args.pods} pods)")
+
+    results = {
+        name: measure(args.clusters, args.pods, build) for name, build in (("dict", dict_rows), ("record", record_rows))
+    }
+
+    base = results["dict"][1]
+    for name, (_, retained, elapsed) in results.items():
+        print(
+            f"{name:>6}: {retained / 2**20:8.1f} MiB retained  "
+            f"{retained / total:6.0f} B/row  build {elapsed * 1000:7.1f} ms  ({retained / base:5.1%} of dict)"
+        )
+
+    # 기존 방식(pd.DataFrame(딕셔너리 목록))과 열 단위 변환 비교
+    import pandas as pd
+
+    pd.DataFrame(results["dict"][0][:100])  # pandas 초기화 비용 제외
+    for name, convert in (("dict", pd.DataFrame), ("record", lambda rows: frame(rows, PodRow))):
+        started = time.perf_counter()
+        convert(results[name][0])
+        print(f"{name:>6}: DataFrame {1000 * (time.perf_counter() - started):7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Latency benchmark: fleet-wide search index.
+
+여러 클러스터의 Pod/노드/네임스페이스 문서로 클러스터별 SearchSegment를 만들고,
+접두사/부분 문자열/레이블/여러 검색어 조합의 검색 시간을 측정합니다.
+세그먼트 생성 시간은 클러스터가 새로고침될 때 그 클러스터에서만 발생합니다.
+
+사용법:
+    python benchmarks/search_index.py --clusters 20 --pods 25000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from kubernetes_dashboard.records import SearchRow, intern
+from kubernetes_dashboard.search import NAMESPACE, NODE, POD, SearchSegment, label_terms, search
+
+PHASES = ("Running",) * 18 + ("Pending", "Failed")
+
+
+def _segment(cluster: str, pods: int) -> SearchSegment:
+    rows: list[SearchRow] = []
+    terms: list[list[str]] = []
+    for n in range(40):
+        ns = intern(f"namespace-{n}")
+        rows.append(SearchRow(cluster, NAMESPACE, ns, ns, "", ""))
+        terms.append([ns])
+    for n in range(pods // 50):
+        node = intern(f"ip-10-{n // 250}-{n % 250}-{hash(cluster) % 200}.ec2.internal")
+        labels = {
+            "topology.kubernetes.io/zone": f"ap-northeast-2{'abc'[n % 3]}",
+            "node.kubernetes.io/instance-type": "m6i.4xlarge",
+        }
+        rows.append(SearchRow(cluster, NODE, "", node, node, "Ready"))
+        terms.append([node, *label_terms(labels)])
+    for i in range(pods):
+        app = f"app-{i % 500}"
+        name = f"{app}-7d9c8f6b5-{i:06d}"
+        ns = intern(f"namespace-{i % 40}")
+        node = rows[40 + i % (pods // 50)].name
+        phase = PHASES[i % len(PHASES)]
+        labels = {"app": app, "team": f"team-{i % 12}", "pod-template-hash": "7d9c8f6b5"}
+        rows.append(SearchRow(cluster, POD, ns, name, node, phase))
+        terms.append([name, ns, node, phase, *label_terms(labels)])
+    return SearchSegment(cluster, rows, terms)
+
+
+def _time(fn: Callable[[], Any], repeat: int = 5) -> float:
+    """fn을 여러 번 실행한 최소 시간(ms)을 반환합니다."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clusters", type=int, default=20)
+    parser.add_argument("--pods", type=int, default=25_000, help="클러스터당 Pod 수")
+    args = parser.parse_args()
+
+    segments = []
+    started = time.perf_counter()
+    for c in range(args.clusters):
+        segments.append(_segment(intern(f"cluster-{c:03d}"), args.pods))
+    elapsed = time.perf_counter() - started
+    documents = sum(len(segment) for segment in segments)
+    print(f"documents: {documents:,} in {len(segments)} segments")
+    print(f"{'build (per cluster)':>28}: {1000 * elapsed / len(segments):8.1f} ms (문서 생성 포함)")
+
+    queries = (
+        "ap",
+        "app-42",
+        "000042",
+        "7d9c8f6b5",
+        "pending",
+        "namespace-7 app=app-1",
+        "team=team-2 pending",
+        "ap-northeast-2b",
+        "no-such-pod",
+    )
+    for query in queries:
+        total = search(segments, query).total
+        print(f"{query!r:>38}: {_time(partial(search, segments, query)):8.1f} ms ({total:,} matches)")
+
+
+if __name__ == "__main__":
+    main()
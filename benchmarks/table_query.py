@@ -0,0 +1,93 @@
+"""Latency benchmark: server-side table queries vs. shipping every row.
+
+TableStore로 정렬/필터/검색을 수행하고 한 페이지만 DataFrame으로 만드는 시간과,
+기존 방식처럼 전체 행을 DataFrame으로 만들어 브라우저로 보낼 Arrow 데이터로 직렬화하는 시간을 비교합니다.
+
+사용법:
+    python benchmarks/table_query.py --rows 100000
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from kubernetes_dashboard.records import PodRow, frame, intern
+from kubernetes_dashboard.table import TableStore
+
+PHASES = ("Pending", "Failed", "Unknown")
+REASONS = ("N/A", "Unschedulable", "Evicted", "NodeLost")
+
+
+def _rows(count: int) -> list[PodRow]:
+    rng = random.Random(0)
+    return [
+        PodRow(
+            intern(f"cluster-{i % 20:03d}"),
+            f"app-{i % 500}-7d9c8f6b5-{i:06d}",
+            intern(f"namespace-{i % 40}"),
+            intern(f"ip-10-0-{i % 200}-{i % 20}.ec2.internal"),
+            intern(rng.choice(PHASES)),
+            intern(rng.choice(REASONS)),
+            intern(f"Deployment/app-{i % 500}"),
+        )
+        for i in range(count)
+    ]
+
+
+def _page(store: TableStore, query: dict[str, Any]) -> Any:
+    """쿼리 결과 한 페이지를 DataFrame으로 만듭니다."""
+    return frame(store.query(**query).rows, PodRow)
+
+
+def _time(fn: Callable[[], Any], repeat: int = 5) -> float:
+    """fn을 여러 번 실행한 최소 시간(ms)을 반환합니다."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rows = _rows(args.rows)
+    print(f"rows: {len(rows):,}")
+
+    started = time.perf_counter()
+    store = TableStore(rows, PodRow)
+    print(f"{'build index':>28}: {1000 * (time.perf_counter() - started):8.1f} ms (새로고침마다 한 번)")
+
+    queries: dict[str, dict[str, Any]] = {
+        "sort ns": {"sort": "ns"},
+        "sort pod desc": {"sort": "pod", "descending": True},
+        "filter phase+cluster, sort": {"filters": {"phase": ["Pending"], "cluster": ["cluster-001"]}, "sort": "reason"},
+        "search 'app-42', sort node": {"search": "app-42", "sort": "node"},
+        "last page": {"sort": "cluster", "offset": args.rows - 50},
+    }
+    for name, query in queries.items():
+        elapsed = _time(partial(_page, store, query))
+        print(f"{name:>28}: {elapsed:8.1f} ms (page of 50 → DataFrame)")
+
+    # 기존 방식: 전체 행을 DataFrame으로 만들고 st.dataframe이 보내는 Arrow IPC로 직렬화
+    import pyarrow as pa
+
+    def ship_all() -> int:
+        table = pa.Table.from_pandas(frame(rows, PodRow))
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return int(sink.getvalue().size)
+
+    size = ship_all()
+    print(f"{'ship all rows':>28}: {_time(ship_all, repeat=3):8.1f} ms ({size / 2**20:.1f} MiB payload)")
+
+
+if __name__ == "__main__":
+    main()
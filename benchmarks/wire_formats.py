@@ -0,0 +1,352 @@
+"""Wire-format benchmark: JSON vs. gzip JSON vs. protobuf pod lists.
+
+Pod 목록 응답을 JSON, gzip JSON, protobuf(및 gzip protobuf)로 받을 때 전송되는 바이트 수와
+응답을 collectors가 사용하는 객체로 변환하는 시간을 비교합니다. 기존 방식인 kubernetes client의
+V1PodList 모델 역직렬화 시간도 함께 출력합니다.
+
+fixture 디렉토리에는 실제 클러스터에서 기록한 응답 본문(pods.json, pods.pb)을 사용하며,
+--record로 현재 kubeconfig의 컨텍스트에서 기록할 수 있습니다. fixture를 지정하지 않으면
+실제 Pod와 비슷한 구조(managedFields, 컨테이너 spec, 상태 조건 포함)의 합성 응답을 사용합니다.
+gzip 크기는 API 서버와 같은 압축 수준(1)으로 계산합니다.
+
+사용법:
+    python benchmarks/wire_formats.py --pods 5000
+    python benchmarks/wire_formats.py --record my-context --fixtures fixtures/
+    python benchmarks/wire_formats.py --fixtures fixtures/
+"""
+
+import argparse
+import gzip
+import json
+import time
+from collections.abc import Callable
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from kubernetes_dashboard.wire import JSON, POD, PROTOBUF, decode_json, decode_protobuf, fetch
+
+# API 서버의 gzip 압축 수준 (k8s.io/apiserver defaultGzipContentEncodingLevel)
+GZIP_LEVEL = 1
+
+# 합성 protobuf 인코딩용 필드 번호: JSON 이름 → (필드 번호, 하위 스키마 / "time" / None)
+_TIME = "time"
+_QUANTITIES = "quantities"
+_RAW = "raw"
+_META = {
+    "name": (1, None),
+    "generateName": (2, None),
+    "namespace": (3, None),
+    "uid": (5, None),
+    "resourceVersion": (6, None),
+    "creationTimestamp": (8, _TIME),
+    "labels": (11, None),
+    "annotations": (12, None),
+    "ownerReferences": (
+        13,
+        {"kind": (1, None), "name": (3, None), "uid": (4, None), "apiVersion": (5, None), "controller": (6, None)},
+    ),
+    "managedFields": (
+        17,
+        {
+            "manager": (1, None),
+            "operation": (2, None),
+            "apiVersion": (3, None),
+            "time": (4, _TIME),
+            "fieldsType": (6, None),
+            "fieldsV1": (7, _RAW),
+        },
+    ),
+}
+_CONTAINER = {
+    "name": (1, None),
+    "image": (2, None),
+    "args": (4, None),
+    "ports": (6, {"name": (1, None), "containerPort": (3, None), "protocol": (4, None)}),
+    "env": (7, {"name": (1, None), "value": (2, None)}),
+    "resources": (8, {"limits": (1, _QUANTITIES), "requests": (2, _QUANTITIES)}),
+    "volumeMounts": (9, {"name": (1, None), "readOnly": (2, None), "mountPath": (3, None)}),
+    "terminationMessagePath": (13, None),
+    "imagePullPolicy": (14, None),
+}
+_STATE = {
+    "running": (2, {"startedAt": (1, _TIME)}),
+    "terminated": (3, {"exitCode": (1, None), "reason": (3, None), "finishedAt": (6, _TIME)}),
+}
+_POD = {
+    "metadata": (1, _META),
+    "spec": (
+        2,
+        {
+            "containers": (2, _CONTAINER),
+            "restartPolicy": (3, None),
+            "terminationGracePeriodSeconds": (4, None),
+            "dnsPolicy": (6, None),
+            "serviceAccountName": (8, None),
+            "nodeName": (10, None),
+            "schedulerName": (19, None),
+            "tolerations": (
+                22,
+                {"key": (1, None), "operator": (2, None), "effect": (4, None), "tolerationSeconds": (5, None)},
+            ),
+        },
+    ),
+    "status": (
+        3,
+        {
+            "phase": (1, None),
+            "conditions": (2, {"type": (1, None), "status": (2, None), "lastTransitionTime": (4, _TIME)}),
+            "hostIP": (5, None),
+            "podIP": (6, None),
+            "startTime": (7, _TIME),
+            "containerStatuses": (
+                8,
+                {
+                    "name": (1, None),
+                    "state": (2, _STATE),
+                    "lastState": (3, _STATE),
+                    "ready": (4, None),
+                    "restartCount": (5, None),
+                    "image": (6, None),
+                    "imageID": (7, None),
+                    "containerID": (8, None),
+                    "started": (9, None),
+                },
+            ),
+            "qosClass": (9, None),
+        },
+    ),
+}
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _bytes_field(number: int, data: bytes) -> bytes:
+    return _varint(number << 3 | 2) + _varint(len(data)) + data
+
+
+def _encode(data: dict[str, Any], schema: dict[str, Any]) -> bytes:
+    """합성 JSON 객체를 스키마의 필드 번호로 protobuf 인코딩합니다."""
+    out = bytearray()
+    for name, value in data.items():
+        number, sub = schema[name]
+        for item in value if isinstance(value, list) else [value]:
+            if sub == _TIME:
+                seconds = int(datetime.fromisoformat(item).timestamp())
+                out += _bytes_field(number, _varint(1 << 3) + _varint(seconds))
+            elif sub == _RAW:
+                # FieldsV1는 protobuf에서 JSON 문자열(Raw=1)로 전송됨
+                out += _bytes_field(number, _bytes_field(1, json.dumps(item).encode()))
+            elif sub == _QUANTITIES:
+                for key, quantity in item.items():
+                    entry = _bytes_field(1, key.encode()) + _bytes_field(2, _bytes_field(1, quantity.encode()))
+                    out += _bytes_field(number, entry)
+            elif isinstance(item, dict) and sub is None:
+                for key, text in item.items():
+                    out += _bytes_field(number, _bytes_field(1, key.encode()) + _bytes_field(2, text.encode()))
+            elif isinstance(item, dict):
+                out += _bytes_field(number, _encode(item, sub))
+            elif isinstance(item, bool | int):
+                out += _varint(number << 3) + _varint(int(item))
+            else:
+                out += _bytes_field(number, str(item).encode())
+    return bytes(out)
+
+
+def _pod(i: int) -> dict[str, Any]:
+    """실제 Deployment Pod와 비슷한 크기와 구조의 JSON 객체를 만듭니다."""
+    app = f"app-{i % 500}"
+    name = f"{app}-7d9c8f6b5-{i:06d}"
+    ts = "2025-01-02T03:04:05Z"
+    phase = "Running" if i % 20 else "Pending"
+    return {
+        "metadata": {
+            "name": name,
+            "generateName": f"{app}-7d9c8f6b5-",
+            "namespace": f"namespace-{i % 40}",
+            "uid": f"0b6c3f3e-{i:08d}-4a8e-9f1d-5c2b7e9a1d3f",
+            "resourceVersion": str(1000000 + i),
+            "creationTimestamp": ts,
+            "labels": {"app": app, "pod-template-hash": "7d9c8f6b5", "team": f"team-{i % 12}"},
+            "annotations": {"kubectl.kubernetes.io/restartedAt": ts, "prometheus.io/scrape": "true"},
+            "ownerReferences": [
+                {
+                    "apiVersion": "apps/v1",
+                    "kind": "ReplicaSet",
+                    "name": f"{app}-7d9c8f6b5",
+                    "uid": f"5e1a2b3c-{i % 500:08d}-4d5e-8f9a-0b1c2d3e4f5a",
+                    "controller": True,
+                }
+            ],
+            "managedFields": [
+                {
+                    "manager": manager,
+                    "operation": "Update",
+                    "apiVersion": "v1",
+                    "time": ts,
+                    "fieldsType": "FieldsV1",
+                    "fieldsV1": {"f:metadata": {"f:labels": {".": {}, "f:app": {}}}} | extra,
+                }
+                for manager, extra in (
+                    ("kube-controller-manager", {"f:spec": {"f:containers": {f'k:{{"name":"{app}"}}': {}}}}),
+                    ("kubelet", {"f:status": {"f:conditions": {}, "f:containerStatuses": {}, "f:podIP": {}}}),
+                )
+            ],
+        },
+        "spec": {
+            "containers": [
+                {
+                    "name": app,
+                    "image": f"registry.example.com/{app}:1.{i % 30}.0",
+                    "args": ["--port=8080", "--log-level=info"],
+                    "ports": [{"name": "http", "containerPort": 8080, "protocol": "TCP"}],
+                    "env": [{"name": f"ENV_{n}", "value": f"value-{n}"} for n in range(6)],
+                    "resources": {
+                        "limits": {"cpu": "1", "memory": "512Mi"},
+                        "requests": {"cpu": "100m", "memory": "128Mi"},
+                    },
+                    "volumeMounts": [
+                        {
+                            "name": "kube-api-access",
+                            "readOnly": True,
+                            "mountPath": "/var/run/secrets/kubernetes.io/serviceaccount",
+                        }
+                    ],
+                    "terminationMessagePath": "/dev/termination-log",
+                    "imagePullPolicy": "IfNotPresent",
+                }
+            ],
+            "restartPolicy": "Always",
+            "terminationGracePeriodSeconds": 30,
+            "dnsPolicy": "ClusterFirst",
+            "serviceAccountName": "default",
+            "nodeName": f"ip-10-0-{i % 200}-{i % 20}.ec2.internal",
+            "schedulerName": "default-scheduler",
+            "tolerations": [
+                {"key": key, "operator": "Exists", "effect": "NoExecute", "tolerationSeconds": 300}
+                for key in ("node.kubernetes.io/not-ready", "node.kubernetes.io/unreachable")
+            ],
+        },
+        "status": {
+            "phase": phase,
+            "conditions": [
+                {"type": kind, "status": "True", "lastTransitionTime": ts}
+                for kind in ("Initialized", "Ready", "ContainersReady", "PodScheduled")
+            ],
+            "hostIP": f"10.0.{i % 200}.{i % 20}",
+            "podIP": f"10.1.{i // 250 % 250}.{i % 250}",
+            "startTime": ts,
+            "containerStatuses": [
+                {
+                    "name": app,
+                    "state": {"running": {"startedAt": ts}},
+                    "lastState": (
+                        {"terminated": {"exitCode": 137, "reason": "OOMKilled", "finishedAt": ts}} if i % 7 == 0 else {}
+                    ),
+                    "ready": phase == "Running",
+                    "restartCount": i % 7,
+                    "image": f"registry.example.com/{app}:1.{i % 30}.0",
+                    "imageID": f"registry.example.com/{app}@sha256:{i:064x}",
+                    "containerID": f"containerd://{i:064x}",
+                    "started": True,
+                }
+            ],
+            "qosClass": "Burstable",
+        },
+    }
+
+
+def _fixtures(count: int) -> tuple[bytes, bytes]:
+    """합성 Pod 목록의 JSON, protobuf 응답 본문을 만듭니다."""
+    pods = [_pod(i) for i in range(count)]
+    body = json.dumps({"kind": "PodList", "apiVersion": "v1", "metadata": {"resourceVersion": "1"}, "items": pods})
+    items = b"".join(_bytes_field(2, _encode(pod, _POD)) for pod in pods)
+    raw = _bytes_field(1, _bytes_field(2, b"1")) + items
+    type_meta = _bytes_field(1, b"v1") + _bytes_field(2, b"PodList")
+    unknown = _bytes_field(1, type_meta) + _bytes_field(2, raw) + _bytes_field(4, PROTOBUF.encode())
+    return body.encode(), b"k8s\x00" + unknown
+
+
+def _record(context: str, directory: Path) -> None:
+    """컨텍스트의 Pod 목록 응답을 JSON과 protobuf로 기록합니다."""
+    from kubernetes_dashboard.kube_client import api_for
+
+    core, _ = api_for(context)
+    directory.mkdir(parents=True, exist_ok=True)
+    for accept, filename in ((JSON, "pods.json"), (PROTOBUF, "pods.pb")):
+        response = fetch(core.api_client, "/api/v1/pods", (accept,), compress=False)
+        if response.content_type != accept:
+            print(f"{filename}: server answered with {response.content_type}, skipped")
+            continue
+        (directory / filename).write_bytes(response.body)
+        print(f"{filename}: {len(response.body):,} bytes recorded")
+
+
+def _client_decode(body: bytes) -> Any:
+    """기존 방식: kubernetes client의 V1PodList 모델 역직렬화"""
+    from kubernetes.client import ApiClient
+
+    return ApiClient().deserialize(body.decode("utf-8"), "V1PodList", "application/json")
+
+
+def _time(fn: Callable[[], Any], repeat: int = 3) -> float:
+    """fn을 여러 번 실행한 최소 시간(ms)을 반환합니다."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def _decode_gzip(decoder: Callable[[bytes, Any], Any], body: bytes) -> Any:
+    return decoder(gzip.decompress(body), POD)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pods", type=int, default=5000, help="합성 fixture의 Pod 수")
+    parser.add_argument("--fixtures", type=Path, help="기록된 응답 본문 디렉토리 (pods.json, pods.pb)")
+    parser.add_argument("--record", metavar="CONTEXT", help="컨텍스트의 응답을 --fixtures 디렉토리에 기록하고 종료")
+    args = parser.parse_args()
+
+    if args.record:
+        if args.fixtures is None:
+            parser.error("--record requires --fixtures")
+        _record(args.record, args.fixtures)
+        return
+
+    if args.fixtures is not None:
+        json_body = (args.fixtures / "pods.json").read_bytes()
+        protobuf_body = (args.fixtures / "pods.pb").read_bytes()
+    else:
+        json_body, protobuf_body = _fixtures(args.pods)
+    json_gzip = gzip.compress(json_body, GZIP_LEVEL)
+    protobuf_gzip = gzip.compress(protobuf_body, GZIP_LEVEL)
+
+    pods = len(decode_json(json_body, POD).items)
+    assert decode_protobuf(protobuf_body, POD) == decode_json(json_body, POD), "protobuf/JSON decode mismatch"
+    print(f"pods: {pods:,}")
+
+    cases: list[tuple[str, int, Callable[[], Any]]] = [
+        ("json (client models)", len(json_body), partial(_client_decode, json_body)),
+        ("json", len(json_body), partial(decode_json, json_body, POD)),
+        ("gzip json", len(json_gzip), partial(_decode_gzip, decode_json, json_gzip)),
+        ("protobuf", len(protobuf_body), partial(decode_protobuf, protobuf_body, POD)),
+        ("gzip protobuf", len(protobuf_gzip), partial(_decode_gzip, decode_protobuf, protobuf_gzip)),
+    ]
+    print(f"{'format':>22} {'wire bytes':>14} {'decode':>11}")
+    for name, size, fn in cases:
+        print(f"{name:>22} {size / 2**20:10.2f} MiB {_time(fn):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,19 @@ Kubernetes Dashboard 모듈 실행 진입점
 
 이 모듈은 Poetry 스크립트를 통해 대시보드를 실행할 때 사용되는 진입점입니다.
 Streamlit CLI를 직접 호출하여 dashboard.py를 실행합니다.
+`exporter`, `snapshot`, `importtime` 하위 명령을 지정하면 Streamlit을 import하지 않고 headless 모드로 실행합니다.
 """
 
+import importlib
 import os
 import sys
 
-import streamlit.web.cli as stcli
+# 하위 명령 → 진입점 모듈 (Streamlit/pandas를 import하지 않는 모듈만 등록)
+_HEADLESS_COMMANDS = {
+    "exporter": "kubernetes_dashboard.exporter",
+    "importtime": "kubernetes_dashboard.importtime",
+    "snapshot": "kubernetes_dashboard.snapshot",
+}
 
 
 def main() -> None:
@@ -16,10 +23,18 @@ def main() -> None:
 
     dashboard.py 파일의 경로를 찾아 Streamlit CLI를 통해 실행합니다.
     Poetry의 스크립트 엔트리 포인트로 사용됩니다.
+    첫 번째 인자가 headless 하위 명령인 경우 해당 모듈의 main()을 실행합니다.
 
     Returns:
         None: 프로그램 종료 코드는 sys.exit()을 통해 전달됩니다.
     """
+    if len(sys.argv) > 1 and sys.argv[1] in _HEADLESS_COMMANDS:
+        # headless 모드에서는 Streamlit을 import하지 않음
+        module = importlib.import_module(_HEADLESS_COMMANDS[sys.argv[1]])
+        sys.exit(module.main(sys.argv[2:]))
+
+    import streamlit.web.cli as stcli
+
     # Streamlit CLI를 직접 호출
     dashboard_path = os.path.join(os.path.dirname(__file__), "dashboard.py")
     sys.argv = ["streamlit", "run", dashboard_path]
@@ -0,0 +1,396 @@
+"""Declarative alert rules evaluated on every refresh.
+
+이 모듈은 수집 결과의 행(node_metrics, non_running_pods, recent_restarts, workloads, node_allocation 등)에 대한
+임계값 경보 규칙을 제공합니다. 규칙은 열 단위 numpy 비교로 평가되므로 행마다 Python 조건을
+실행하지 않으며, 조건에 일치한 series(노드, 네임스페이스 등)만 상태를 갱신합니다.
+
+SnapshotStore가 데이터셋을 다시 수집할 때마다 클러스터별로 한 번 평가하므로,
+연속 샘플 수와 지속 시간은 세션 수와 관계없이 새로고침 단위로 계산됩니다.
+
+주요 기능:
+- "cpu_percent > 90", "count > 5", "sum(restarts) > 10" 형태의 조건식
+- where(열 == 값) 필터와 by(열 목록) 그룹별 count/sum/max 집계
+- for: 연속 샘플 수(정수) 또는 지속 시간("10m")을 만족해야 firing
+- clear: firing 상태의 series는 이 임계값을 넘는 동안 유지 (히스테리시스)
+- 환경 변수 DASHBOARD_ALERT_RULES로 YAML 규칙 파일 지정 (기본 규칙 대체)
+"""
+
+import os
+import re
+import threading
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from operator import attrgetter
+from typing import Any
+
+import numpy as np
+import yaml
+
+from kubernetes_dashboard.records import AlertRow, intern
+
+# 규칙 파일(YAML) 경로를 지정하는 환경 변수
+RULES_ENV = "DASHBOARD_ALERT_RULES"
+
+FIRING = "firing"
+PENDING = "pending"
+
+# 원본 키별 series 기본 열 (집계하지 않는 규칙에서 by를 생략한 경우)
+SERIES_KEYS: dict[str, tuple[str, ...]] = {
+    "node_metrics": ("node",),
+    "non_running_pods": ("ns", "pod"),
+    "recent_restarts": ("ns", "pod", "container"),
+    "workloads": ("ns", "kind", "name"),
+    "node_allocation": ("node",),
+    "namespace_allocation": ("ns",),
+}
+
+_OPS = {
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    "==": np.equal,
+    "!=": np.not_equal,
+}
+_AGGREGATES = ("count", "sum", "max")
+_EXPR = re.compile(r"^\s*(?:(sum|max)\((\w+)\)|(\w+))\s*(>=|<=|==|!=|>|<)\s*(-?\d+(?:\.\d+)?)\s*$")
+_DURATION = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smh])\s*$")
+_SECONDS = {"s": 1, "m": 60, "h": 3600}
+
+# 규칙 파일이 없을 때 사용하는 기본 규칙
+DEFAULT_RULES: tuple[dict[str, Any], ...] = (
+    {
+        "name": "NodeCPUHigh",
+        "source": "node_metrics",
+        "expr": "cpu_percent > 90",
+        "for": 3,
+        "clear": 80,
+        "severity": "critical",
+    },
+    {"name": "NodeMemoryHigh", "source": "node_metrics", "expr": "mem_percent > 90", "for": 3, "clear": 85},
+    {
+        "name": "NamespacePodsPending",
+        "source": "non_running_pods",
+        "where": {"phase": "Pending"},
+        "by": ["ns"],
+        "expr": "count > 5",
+        "for": "10m",
+    },
+    {"name": "ContainerRestarting", "source": "recent_restarts", "expr": "restarts_1h > 5"},
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    """임계값 경보 규칙 한 개
+
+    Attributes:
+        name (str): 경보 이름
+        source (str): 평가할 행 목록의 스냅샷 키 (node_metrics 등)
+        metric (str): 비교할 열 이름. aggregate가 "count"이면 사용하지 않음
+        op (str): 비교 연산자 (">", ">=", "<", "<=", "==", "!=")
+        threshold (float): firing 임계값
+        aggregate (str | None): by 그룹별 집계 ("count", "sum", "max"). None이면 행 단위
+        by (tuple[str, ...]): series를 구분하는 열 (클러스터는 항상 포함)
+        where (tuple[tuple[str, str], ...]): 평가 전에 적용하는 (열, 값) 일치 조건
+        for_samples (int): firing까지 필요한 연속 샘플 수
+        for_seconds (float): firing까지 필요한 지속 시간(초)
+        clear (float | None): firing 상태를 유지하는 임계값. None이면 threshold
+        severity (str): 심각도
+    """
+
+    name: str
+    source: str
+    metric: str
+    op: str
+    threshold: float
+    aggregate: str | None = None
+    by: tuple[str, ...] = ()
+    where: tuple[tuple[str, str], ...] = ()
+    for_samples: int = 1
+    for_seconds: float = 0.0
+    clear: float | None = None
+    severity: str = "warning"
+
+    @property
+    def series_columns(self) -> tuple[str, ...]:
+        """series를 구분하는 열을 반환합니다."""
+        if self.aggregate is None:
+            return self.by or SERIES_KEYS.get(self.source, ())
+        return self.by
+
+    def matches(self, rows: Sequence[Any]) -> list[tuple[tuple[Any, ...], float, bool]]:
+        """행 목록에서 firing 또는 유지(clear) 조건에 일치하는 series를 찾습니다.
+
+        Args:
+            rows (Sequence[Any]): 단일 클러스터의 행 목록 (Record 또는 딕셔너리)
+
+        Returns:
+            list[tuple]: (series 키, 값, firing 조건 일치 여부) 목록
+        """
+        if not len(rows):
+            return []
+        mask: np.ndarray | None = None
+        for column, expected in self.where:
+            matched = np.asarray(_column(rows, column), dtype=object) == expected
+            mask = matched if mask is None else mask & matched
+        columns = self.series_columns
+
+        if self.aggregate is None:
+            values = _numbers(_column(rows, self.metric))
+            fires, holds = self._compare(values)
+            if mask is not None:
+                fires &= mask
+                holds &= mask
+            # 일치한 행만 series 키를 만듦
+            ids = np.flatnonzero(holds)
+            keys = _keys([rows[i] for i in ids.tolist()], columns)
+            return list(zip(keys, values[ids].tolist(), fires[ids].tolist(), strict=True))
+
+        if mask is not None:
+            rows = [rows[i] for i in np.flatnonzero(mask).tolist()]
+            if not rows:
+                return []
+        # 그룹 번호 부여 (dict.fromkeys와 map으로 행마다 Python 코드를 실행하지 않음)
+        keys = _column(rows, columns[0]) if len(columns) == 1 else _keys(rows, columns)
+        index = {key: i for i, key in enumerate(dict.fromkeys(keys))}
+        codes = np.fromiter(map(index.__getitem__, keys), dtype=np.intp, count=len(keys))
+        groups = list(index) if len(columns) != 1 else [(key,) for key in index]
+        totals: np.ndarray
+        if self.aggregate == "count":
+            totals = np.bincount(codes, minlength=len(groups)).astype(np.float64)
+        else:
+            values = np.nan_to_num(_numbers(_column(rows, self.metric)), nan=0.0)
+            if self.aggregate == "sum":
+                totals = np.bincount(codes, weights=values, minlength=len(groups))
+            else:
+                totals = np.full(len(groups), -np.inf)
+                np.maximum.at(totals, codes, values)
+        fires, holds = self._compare(totals)
+        ids = np.flatnonzero(holds)
+        return list(zip([groups[i] for i in ids.tolist()], totals[ids].tolist(), fires[ids].tolist(), strict=True))
+
+    def _compare(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """(firing 조건, firing 또는 유지 조건) mask를 반환합니다. NaN은 항상 불일치."""
+        op = _OPS[self.op]
+        fires = op(values, self.threshold)
+        if self.clear is None:
+            return fires, fires.copy()
+        return fires, fires | op(values, self.clear)
+
+
+def _column(rows: Sequence[Any], name: str) -> list[Any]:
+    """행 목록에서 한 열의 값을 읽습니다 (딕셔너리 행이 섞여 있어도 동작)."""
+    try:
+        return list(map(attrgetter(name), rows))
+    except AttributeError:
+        return [row.get(name) for row in rows]
+
+
+def _keys(rows: Sequence[Any], columns: Sequence[str]) -> list[tuple[Any, ...]]:
+    """행마다 columns 값의 튜플을 만듭니다."""
+    if not columns:
+        return [()] * len(rows)
+    return list(zip(*(_column(rows, column) for column in columns), strict=True))
+
+
+def _numbers(values: list[Any]) -> np.ndarray:
+    """값 목록을 float 배열로 변환합니다. 숫자가 아닌 값("N/A" 등)은 NaN."""
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return np.fromiter(
+            (v if isinstance(v, int | float) else np.nan for v in values), dtype=np.float64, count=len(values)
+        )
+
+
+def _duration(value: Any) -> tuple[int, float]:
+    """for 값을 (연속 샘플 수, 지속 시간(초))으로 변환합니다."""
+    if value is None:
+        return 1, 0.0
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 1:
+        return value, 0.0
+    match = _DURATION.match(str(value))
+    if match is None:
+        raise ValueError(f"invalid 'for' value {value!r} (expected a sample count or a duration like '10m')")
+    return 1, float(match.group(1)) * _SECONDS[match.group(2)]
+
+
+def parse_rule(spec: Mapping[str, Any]) -> Rule:
+    """규칙 정의(딕셔너리)를 Rule로 변환합니다.
+
+    Args:
+        spec (Mapping[str, Any]): name, source, expr와 선택 항목 by, where, for, clear, severity
+
+    Returns:
+        Rule: 변환된 규칙
+
+    Raises:
+        ValueError: 필수 항목이 없거나 조건식, for 값이 잘못된 경우
+    """
+    try:
+        name, source, expr = str(spec["name"]), str(spec["source"]), str(spec["expr"])
+    except KeyError as e:
+        raise ValueError(f"alert rule is missing {e.args[0]!r}") from None
+    match = _EXPR.match(expr)
+    if match is None:
+        raise ValueError(f"{name}: invalid expression {expr!r}")
+    function, argument, column, op, threshold = match.groups()
+    aggregate = function
+    metric = argument or column
+    if column in _AGGREGATES:
+        aggregate = column
+    if aggregate in ("sum", "max") and not argument:
+        raise ValueError(f"{name}: {aggregate} needs a column, e.g. {aggregate}(restarts)")
+    for_samples, for_seconds = _duration(spec.get("for"))
+    clear = spec.get("clear")
+    return Rule(
+        name=intern(name),
+        source=source,
+        metric=metric,
+        op=op,
+        threshold=float(threshold),
+        aggregate=aggregate,
+        by=tuple(spec.get("by") or ()),
+        where=tuple((str(k), str(v)) for k, v in (spec.get("where") or {}).items()),
+        for_samples=for_samples,
+        for_seconds=for_seconds,
+        clear=None if clear is None else float(clear),
+        severity=intern(str(spec.get("severity", "warning"))),
+    )
+
+
+def load_rules(path: str | None = None) -> list[Rule]:
+    """규칙 파일을 읽습니다. 파일이 없거나 잘못되었으면 경고를 출력하고 기본 규칙을 사용합니다.
+
+    Args:
+        path (str, optional): YAML 규칙 파일 경로 (규칙 목록 또는 rules 키). 기본값은 DASHBOARD_ALERT_RULES
+
+    Returns:
+        list[Rule]: 규칙 목록
+    """
+    path = path or os.environ.get(RULES_ENV)
+    if not path:
+        return [parse_rule(spec) for spec in DEFAULT_RULES]
+    try:
+        with open(path, encoding="utf-8") as f:
+            loaded = yaml.safe_load(f)
+        specs = loaded.get("rules", []) if isinstance(loaded, dict) else loaded
+        return [parse_rule(spec) for spec in specs or []]
+    except (OSError, ValueError, AttributeError, TypeError, yaml.YAMLError) as e:
+        print(f"Warning: could not load alert rules from {path}: {e}. Using the default rules.")
+        return [parse_rule(spec) for spec in DEFAULT_RULES]
+
+
+@dataclass(slots=True)
+class _Series:
+    """series 하나의 히스테리시스 상태"""
+
+    since: float
+    value: float
+    samples: int = 0
+    firing: bool = False
+
+
+class AlertEngine:
+    """규칙별, 클러스터별 series 상태를 보관하며 새로고침마다 규칙을 평가합니다.
+
+    Attributes:
+        rules (list[Rule]): 평가할 규칙
+    """
+
+    def __init__(self, rules: Iterable[Rule]) -> None:
+        self.rules = list(rules)
+        self._by_source: dict[str, list[Rule]] = {}
+        for rule in self.rules:
+            self._by_source.setdefault(rule.source, []).append(rule)
+        # (규칙 이름, 클러스터) → series 키 → 상태
+        self._series: dict[tuple[str, str], dict[tuple[Any, ...], _Series]] = {}
+        self._lock = threading.Lock()
+
+    def evaluate(self, cluster: str, snapshot: Mapping[str, Any], now: float | None = None) -> None:
+        """단일 클러스터의 새 수집 결과로 규칙을 평가합니다.
+
+        snapshot에 원본 키가 있는 규칙만 평가하며, 이번에 일치하지 않은 series는 해제됩니다.
+
+        Args:
+            cluster (str): Kubernetes 컨텍스트 이름
+            snapshot (Mapping[str, Any]): collect_cluster() 형태의 데이터 (일부 키만 있어도 됨)
+            now (float, optional): 평가 시각(Unix time). 기본값은 현재 시각
+        """
+        now = time.time() if now is None else now
+        for source, rules in self._by_source.items():
+            rows = snapshot.get(source)
+            if rows is None:
+                continue
+            for rule in rules:
+                self._update(rule, cluster, rule.matches(rows), now)
+
+    def _update(self, rule: Rule, cluster: str, matches: list[tuple[tuple[Any, ...], float, bool]], now: float) -> None:
+        with self._lock:
+            previous = self._series.get((rule.name, cluster), {})
+        current: dict[tuple[Any, ...], _Series] = {}
+        for key, value, fires in matches:
+            series = previous.get(key)
+            if series is None or not (fires or series.firing):
+                if not fires:
+                    # 유지 조건에만 일치: firing 상태가 아니면 추적하지 않음
+                    continue
+                series = _Series(since=now, value=value)
+            series.value = value
+            series.samples += 1
+            if not series.firing:
+                series.firing = series.samples >= rule.for_samples and now - series.since >= rule.for_seconds
+            current[key] = series
+        with self._lock:
+            self._series[rule.name, cluster] = current
+
+    def alerts(self, clusters: Iterable[str] | None = None, pending: bool = False) -> list[AlertRow]:
+        """firing 상태의 경보를 반환합니다.
+
+        Args:
+            clusters (Iterable[str], optional): 대상 클러스터. 기본값은 None (전체)
+            pending (bool, optional): 지속 조건을 기다리는 경보도 포함할지 여부. 기본값은 False
+
+        Returns:
+            list[AlertRow]: 규칙 순서, 클러스터 순서로 정렬한 경보
+        """
+        wanted = None if clusters is None else set(clusters)
+        order = {rule.name: i for i, rule in enumerate(self.rules)}
+        rules = {rule.name: rule for rule in self.rules}
+        with self._lock:
+            items = sorted(self._series.items(), key=lambda item: (order.get(item[0][0], 0), item[0][1]))
+        rows: list[AlertRow] = []
+        for (name, cluster), states in items:
+            if wanted is not None and cluster not in wanted:
+                continue
+            rule = rules[name]
+            columns = rule.series_columns
+            for key, series in states.items():
+                if series.firing or pending:
+                    rows.append(
+                        AlertRow(
+                            cluster=cluster,
+                            alert=name,
+                            severity=rule.severity,
+                            series=", ".join(f"{c}={v}" for c, v in zip(columns, key, strict=True)),
+                            value=series.value,
+                            state=FIRING if series.firing else PENDING,
+                            since=datetime.fromtimestamp(series.since, tz=UTC),
+                        )
+                    )
+        return rows
+
+    def reset(self, clusters: Iterable[str] | None = None) -> None:
+        """series 상태를 제거합니다.
+
+        Args:
+            clusters (Iterable[str], optional): 대상 클러스터. 기본값은 None (전체)
+        """
+        targets = None if clusters is None else set(clusters)
+        with self._lock:
+            for key in list(self._series):
+                if targets is None or key[1] in targets:
+                    del self._series[key]
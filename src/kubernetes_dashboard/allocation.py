@@ -0,0 +1,194 @@
+"""Requests/limits vs allocatable analytics.
+
+이 모듈은 Pod 목록을 한 번 순회하여 컨테이너 CPU/메모리 requests와 limits를 노드별, 네임스페이스별로 합산하고,
+노드 인벤토리의 allocatable 및 metrics-server 사용량과 결합하여 노드별 할당률과 사용률, overcommit을 계산합니다.
+
+스케줄러가 실제로 기준으로 삼는 값은 capacity가 아니라 allocatable과 requests 합계이므로,
+사용률이 낮더라도 requests로 가득 찬 노드(새 Pod를 받을 수 없는 노드)를 찾을 수 있습니다.
+
+계산 방식은 kubectl describe node와 같습니다:
+- 종료된(Succeeded/Failed) Pod는 제외
+- Pod의 값은 일반 컨테이너 합계와 init 컨테이너 최댓값 중 큰 값
+- limits가 없는 컨테이너는 limits 합계에 더하지 않음
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+from functools import lru_cache
+from typing import Any
+
+from kubernetes_dashboard.inventory import NodeInfo
+from kubernetes_dashboard.quantity import cpu_to_cores, mem_to_bytes
+from kubernetes_dashboard.records import AllocationRow, NamespaceAllocationRow, intern
+
+# 노드 자원을 차지하지 않는 Pod phase
+_TERMINAL = frozenset({"Succeeded", "Failed"})
+
+
+@lru_cache(maxsize=4096)
+def _cores(value: str) -> float:
+    """CPU quantity를 변환합니다 (같은 문자열이 반복되므로 캐시, 잘못된 값은 0)."""
+    try:
+        return cpu_to_cores(value)
+    except ValueError:
+        return 0.0
+
+
+@lru_cache(maxsize=4096)
+def _bytes(value: str) -> float:
+    """메모리 quantity를 변환합니다 (같은 문자열이 반복되므로 캐시, 잘못된 값은 0)."""
+    try:
+        return mem_to_bytes(value)
+    except ValueError:
+        return 0.0
+
+
+def _totals(containers: Iterable[Any]) -> tuple[float, float, float, float]:
+    """컨테이너 목록의 (CPU requests, CPU limits, 메모리 requests, 메모리 limits) 합계를 반환합니다."""
+    cpu_req = cpu_lim = mem_req = mem_lim = 0.0
+    for container in containers:
+        resources = container.resources
+        if resources is None:
+            continue
+        requests = resources.requests
+        if requests:
+            value = requests.get("cpu")
+            if value:
+                cpu_req += _cores(value)
+            value = requests.get("memory")
+            if value:
+                mem_req += _bytes(value)
+        limits = resources.limits
+        if limits:
+            value = limits.get("cpu")
+            if value:
+                cpu_lim += _cores(value)
+            value = limits.get("memory")
+            if value:
+                mem_lim += _bytes(value)
+    return cpu_req, cpu_lim, mem_req, mem_lim
+
+
+def pod_resources(pod: Any) -> tuple[float, float, float, float]:
+    """Pod 한 개가 차지하는 requests/limits를 계산합니다.
+
+    Args:
+        pod (V1Pod): Pod 객체 (spec.containers[].resources 포함)
+
+    Returns:
+        tuple[float, float, float, float]: (CPU requests, CPU limits, 메모리 requests, 메모리 limits).
+            CPU는 코어, 메모리는 바이트
+    """
+    totals = _totals(pod.spec.containers or ())
+    if not pod.spec.init_containers:
+        return totals
+    # init 컨테이너는 순서대로 하나씩 실행되므로 가장 큰 init 컨테이너와 비교
+    for init in pod.spec.init_containers:
+        totals = tuple(map(max, totals, _totals((init,))))  # type: ignore[assignment]
+    return totals
+
+
+def _number(value: Any) -> float | None:
+    # metrics-server가 없는 노드의 사용량은 "N/A"
+    return float(value) if isinstance(value, int | float) else None
+
+
+def _percent(value: float | None, total: float) -> float | None:
+    return value / total * 100 if value is not None and total > 0 else None
+
+
+def allocation(
+    ctx: str,
+    pods: Iterable[Any],
+    nodes: Mapping[str, NodeInfo],
+    usage: Sequence[Mapping[str, Any]] = (),
+) -> tuple[list[AllocationRow], list[NamespaceAllocationRow]]:
+    """Pod 목록을 한 번 순회하여 노드별/네임스페이스별 requests와 limits 합계를 계산합니다.
+
+    Args:
+        ctx (str): Kubernetes 컨텍스트 이름
+        pods (Iterable): Pod 목록 (collectors._get_all_pods()의 items)
+        nodes (Mapping[str, NodeInfo]): 노드 인벤토리 (노드 이름 → NodeInfo)
+        usage (Sequence[Mapping[str, Any]], optional): 노드 메트릭 (collectors._node_metrics() 결과). 기본값은 없음
+
+    Returns:
+        tuple: (노드별 AllocationRow 목록 (노드 이름 순), 네임스페이스별 NamespaceAllocationRow 목록 (CPU requests 내림차순))
+    """
+    # 노드/네임스페이스 → [Pod 수, CPU requests, CPU limits, 메모리 requests, 메모리 limits]
+    by_node: dict[str, list[float]] = {name: [0, 0.0, 0.0, 0.0, 0.0] for name in nodes}
+    by_ns: dict[str, list[float]] = {}
+    for pod in pods:
+        if pod.status.phase in _TERMINAL:
+            continue
+        spec = pod.spec
+        # init 컨테이너가 없는 대부분의 Pod는 합계만 계산
+        if spec.init_containers:
+            cpu_req, cpu_lim, mem_req, mem_lim = pod_resources(pod)
+        else:
+            cpu_req, cpu_lim, mem_req, mem_lim = _totals(spec.containers or ())
+        ns = pod.metadata.namespace
+        totals = by_ns.get(ns)
+        if totals is None:
+            totals = by_ns[ns] = [0, 0.0, 0.0, 0.0, 0.0]
+        totals[0] += 1
+        totals[1] += cpu_req
+        totals[2] += cpu_lim
+        totals[3] += mem_req
+        totals[4] += mem_lim
+        node = spec.node_name
+        if node:
+            totals = by_node.get(node)
+            if totals is None:
+                totals = by_node[node] = [0, 0.0, 0.0, 0.0, 0.0]
+            totals[0] += 1
+            totals[1] += cpu_req
+            totals[2] += cpu_lim
+            totals[3] += mem_req
+            totals[4] += mem_lim
+
+    used: dict[str, tuple[float | None, float | None]] = {
+        row["node"]: (_number(row.get("cpu")), _number(row.get("mem"))) for row in usage
+    }
+    cluster = intern(ctx)
+    node_rows: list[AllocationRow] = []
+    for name in sorted(by_node):
+        count, cpu_req, cpu_lim, mem_req, mem_lim = by_node[name]
+        info = nodes.get(name)
+        # 인벤토리에 아직 없는 노드는 allocatable을 알 수 없음
+        cpu_alloc = info.cpu_allocatable if info is not None else 0.0
+        mem_alloc = info.mem_allocatable if info is not None else 0.0
+        cpu_used, mem_used = used.get(name, (None, None))
+        node_rows.append(
+            AllocationRow(
+                cluster=cluster,
+                node=intern(name),
+                pods=int(count),
+                cpu_allocatable=cpu_alloc,
+                cpu_requests=cpu_req,
+                cpu_limits=cpu_lim,
+                cpu_used=cpu_used,
+                cpu_requested_percent=_percent(cpu_req, cpu_alloc),
+                cpu_used_percent=_percent(cpu_used, cpu_alloc),
+                cpu_overcommit_percent=_percent(cpu_lim, cpu_alloc),
+                mem_allocatable=mem_alloc,
+                mem_requests=mem_req,
+                mem_limits=mem_lim,
+                mem_used=mem_used,
+                mem_requested_percent=_percent(mem_req, mem_alloc),
+                mem_used_percent=_percent(mem_used, mem_alloc),
+                mem_overcommit_percent=_percent(mem_lim, mem_alloc),
+            )
+        )
+    ns_rows = [
+        NamespaceAllocationRow(
+            cluster=cluster,
+            ns=intern(ns),
+            pods=int(count),
+            cpu_requests=cpu_req,
+            cpu_limits=cpu_lim,
+            mem_requests=mem_req,
+            mem_limits=mem_lim,
+        )
+        for ns, (count, cpu_req, cpu_lim, mem_req, mem_lim) in by_ns.items()
+    ]
+    ns_rows.sort(key=lambda row: (-row.cpu_requests, row.ns))
+    return node_rows, ns_rows
@@ -0,0 +1,412 @@
+"""Recorded snapshot archive for time-travel replay.
+
+이 모듈은 SnapshotStore가 수집한 데이터셋을 시간 순서대로 디스크에 기록하는 아카이브를 제공합니다.
+장애 사후 분석(postmortem) 시 "03:12에 대시보드가 무엇을 보여 주었는지"를 API 서버에 요청하지 않고
+다시 표시(replay)하는 데 사용합니다.
+
+아카이브는 세그먼트 단위로 나뉘며, 세그먼트마다 두 개의 파일로 구성됩니다.
+- 데이터 파일(*.kda): (클러스터, 데이터셋) 레코드를 persist 모듈 형식(열 단위 JSON + zlib)으로 압축하여 이어 붙인 파일
+- 시간 색인 파일(*.kdi): 레코드마다 고정 크기 항목(수집 시각, 오프셋, 길이, 키 해시)을 이어 붙인 파일
+
+두 파일은 mmap으로 읽습니다. 시각으로 세그먼트와 색인 항목을 이진 탐색하므로 탐색은 O(log n)이며,
+특정 시각의 스냅샷은 그 시각 이전의 레코드를 최신부터 거슬러 올라가며 (클러스터, 데이터셋)마다
+가장 최근 레코드를 찾아 만듭니다 (보통 새로고침 한 주기 안에서 끝나며, 기록이 없는 항목도 보존 기간 이전까지만 확인).
+세그먼트가 SEGMENT_BYTES를 넘으면 새 세그먼트를 시작하고, 전체 크기(DASHBOARD_ARCHIVE_MAX_MB)나
+보존 기간(DASHBOARD_ARCHIVE_MAX_AGE_HOURS)을 넘은 가장 오래된 세그먼트부터 통째로 삭제합니다.
+"""
+
+import bisect
+import os
+import struct
+import threading
+import time
+import zlib
+from collections.abc import Iterable, Iterator
+from mmap import ACCESS_READ, mmap
+from typing import Any, BinaryIO
+
+from kubernetes_dashboard.collectors import merge_snapshots
+from kubernetes_dashboard.persist import decode_cluster, encode_dataset
+
+# 아카이브 디렉토리를 지정하는 환경 변수 (지정하지 않거나 빈 문자열이면 기록하지 않음)
+ARCHIVE_DIR_ENV = "DASHBOARD_ARCHIVE_DIR"
+# 전체 크기(MiB)와 보존 기간(시간)을 지정하는 환경 변수
+ARCHIVE_MAX_MB_ENV = "DASHBOARD_ARCHIVE_MAX_MB"
+ARCHIVE_MAX_AGE_ENV = "DASHBOARD_ARCHIVE_MAX_AGE_HOURS"
+DEFAULT_MAX_MB = 1024
+DEFAULT_MAX_AGE_HOURS = 168
+# 세그먼트 하나의 최대 크기(바이트)
+SEGMENT_BYTES = 16 * 1024 * 1024
+
+_DATA_SUFFIX = ".kda"
+_INDEX_SUFFIX = ".kdi"
+# 색인 항목: 수집 시각(float64), 데이터 파일 오프셋(uint64), 레코드 길이(uint32), (클러스터, 데이터셋) crc32
+_ENTRY = struct.Struct("<dQII")
+# 아직 레코드를 읽지 않은 키의 위치 (모든 레코드보다 최신)
+_NEWEST = (float("inf"), 0)
+
+
+def archive_dir() -> str | None:
+    """아카이브 디렉토리를 반환합니다.
+
+    Returns:
+        str | None: DASHBOARD_ARCHIVE_DIR. 지정하지 않았거나 빈 문자열이면 None (기록하지 않음)
+    """
+    raw = os.environ.get(ARCHIVE_DIR_ENV, "").strip()
+    return os.path.expanduser(raw) if raw else None
+
+
+def _env_limit(name: str, default: float) -> float:
+    """양수 환경 변수 값을 읽습니다. 잘못된 값이면 경고를 출력하고 기본값을 사용합니다."""
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = float(raw)
+        if value <= 0:
+            raise ValueError(raw)
+        return value
+    except ValueError:
+        print(f"Warning: invalid {name} value {raw!r}. Using the default {default:g}.")
+        return default
+
+
+def open_archive() -> "SnapshotArchive | None":
+    """환경 변수 설정에 따라 아카이브를 엽니다.
+
+    Returns:
+        SnapshotArchive | None: 아카이브. DASHBOARD_ARCHIVE_DIR이 없으면 None
+    """
+    directory = archive_dir()
+    if directory is None:
+        return None
+    return SnapshotArchive(
+        directory,
+        max_bytes=int(_env_limit(ARCHIVE_MAX_MB_ENV, DEFAULT_MAX_MB) * 1024 * 1024),
+        max_age=_env_limit(ARCHIVE_MAX_AGE_ENV, DEFAULT_MAX_AGE_HOURS) * 3600,
+    )
+
+
+def _key(ctx: str, dataset: str) -> int:
+    """(클러스터, 데이터셋)의 색인 키 해시를 반환합니다."""
+    return zlib.crc32(f"{ctx}\0{dataset}".encode())
+
+
+def _map(path: str) -> mmap:
+    """파일을 읽기 전용으로 mmap합니다."""
+    with open(path, "rb") as f:
+        # 빈 파일은 mmap할 수 없으므로 익명 버퍼로 대체
+        return mmap(f.fileno(), 0, access=ACCESS_READ) if os.fstat(f.fileno()).st_size else mmap(-1, 1)
+
+
+class _Times:
+    """bisect에 사용하는 색인 시각 시퀀스 (mmap에서 필요한 항목만 읽음)"""
+
+    __slots__ = ("_count", "_index")
+
+    def __init__(self, index: mmap, count: int) -> None:
+        self._index = index
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> float:
+        return float(_ENTRY.unpack_from(self._index, i * _ENTRY.size)[0])
+
+
+class _Segment:
+    """데이터 파일과 시간 색인 파일 한 쌍
+
+    Attributes:
+        start (float): 세그먼트 이름의 시각 (첫 레코드의 수집 시각 이하)
+        count (int): 유효한 레코드 수
+        size (int): 두 파일의 크기 합계(바이트)
+        last (float): 마지막 레코드의 수집 시각
+    """
+
+    def __init__(self, directory: str, name: str) -> None:
+        self._base = os.path.join(directory, name)
+        self.start = int(name) / 1000
+        self.count = 0
+        self.size = 0
+        self.last = self.start
+        self._maps: tuple[mmap, mmap] | None = None
+        self._files: tuple[BinaryIO, BinaryIO] | None = None
+        self._scan()
+
+    @classmethod
+    def create(cls, directory: str, at: float) -> "_Segment":
+        """at 시각에 시작하는 빈 세그먼트를 만듭니다."""
+        stamp = int(at * 1000)
+        while os.path.exists(os.path.join(directory, f"{stamp:015d}{_INDEX_SUFFIX}")):
+            stamp += 1
+        name = f"{stamp:015d}"
+        for suffix in (_DATA_SUFFIX, _INDEX_SUFFIX):
+            open(os.path.join(directory, name + suffix), "xb").close()
+        return cls(directory, name)
+
+    def _scan(self) -> None:
+        """파일 크기에서 유효한 레코드 수를 계산합니다 (기록 도중 중단된 마지막 항목은 제외)."""
+        try:
+            data_size = os.path.getsize(self._base + _DATA_SUFFIX)
+            index_size = os.path.getsize(self._base + _INDEX_SUFFIX)
+        except OSError:
+            return
+        self.size = data_size + index_size
+        self.count = index_size // _ENTRY.size
+        index, _ = self.maps()
+        while self.count:
+            at, offset, length, _ = _ENTRY.unpack_from(index, (self.count - 1) * _ENTRY.size)
+            if offset + length <= data_size:
+                self.last = at
+                break
+            self.count -= 1
+
+    def maps(self) -> tuple[mmap, mmap]:
+        """색인과 데이터 파일의 mmap을 반환합니다 (레코드가 없으면 빈 버퍼)."""
+        if self._maps is None:
+            self._maps = (_map(self._base + _INDEX_SUFFIX), _map(self._base + _DATA_SUFFIX))
+        return self._maps
+
+    def append(self, at: float, key: int, payload: bytes) -> None:
+        """레코드를 기록합니다. 데이터를 먼저 기록하므로 중단되어도 색인이 없는 레코드만 남습니다."""
+        if self._files is None:
+            self._files = (open(self._base + _DATA_SUFFIX, "ab"), open(self._base + _INDEX_SUFFIX, "ab"))
+        data, index = self._files
+        offset = data.tell()
+        data.write(payload)
+        data.flush()
+        index.write(_ENTRY.pack(at, offset, len(payload), key))
+        index.flush()
+        self.count += 1
+        self.size += len(payload) + _ENTRY.size
+        self.last = at
+        # 다음 읽기에서 늘어난 파일을 다시 mmap
+        self._release_maps()
+
+    def records(self, before: float, after: float = 0.0) -> Iterator[tuple[int, int, int, int]]:
+        """after 이상 before 이하 시각의 레코드를 최신부터 (색인 위치, 키, 오프셋, 길이)로 반환합니다."""
+        if not self.count:
+            return
+        index, _ = self.maps()
+        times = _Times(index, self.count)
+        for i in range(bisect.bisect_right(times, before) - 1, bisect.bisect_left(times, after) - 1, -1):
+            _, offset, length, key = _ENTRY.unpack_from(index, i * _ENTRY.size)
+            yield i, key, offset, length
+
+    def read(self, offset: int, length: int) -> bytes:
+        """레코드 하나를 읽습니다."""
+        return self.maps()[1][offset : offset + length]
+
+    def _release_maps(self) -> None:
+        if self._maps is not None:
+            for m in self._maps:
+                m.close()
+            self._maps = None
+
+    def close(self) -> None:
+        """mmap과 기록용 파일을 닫습니다."""
+        self._release_maps()
+        if self._files is not None:
+            for f in self._files:
+                f.close()
+            self._files = None
+
+    def remove(self) -> None:
+        """세그먼트 파일을 삭제합니다."""
+        self.close()
+        for suffix in (_DATA_SUFFIX, _INDEX_SUFFIX):
+            try:
+                os.unlink(self._base + suffix)
+            except FileNotFoundError:
+                pass
+
+
+class SnapshotArchive:
+    """세그먼트 기반 스냅샷 아카이브
+
+    기록(append)과 읽기(load, snapshot)는 여러 스레드에서 호출할 수 있습니다.
+
+    Attributes:
+        directory (str): 세그먼트 파일 디렉토리
+        max_bytes (int): 전체 파일 크기 상한(바이트). 넘으면 가장 오래된 세그먼트부터 삭제
+        max_age (float): 보존 기간(초). 마지막 레코드가 이보다 오래된 세그먼트는 삭제
+        segment_bytes (int): 세그먼트 하나의 최대 크기(바이트)
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024,
+        max_age: float = DEFAULT_MAX_AGE_HOURS * 3600,
+        segment_bytes: int = SEGMENT_BYTES,
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.segment_bytes = segment_bytes
+        os.makedirs(directory, exist_ok=True)
+        names = sorted(
+            name.removesuffix(_INDEX_SUFFIX)
+            for name in os.listdir(directory)
+            if name.endswith(_INDEX_SUFFIX) and name.removesuffix(_INDEX_SUFFIX).isdigit()
+        )
+        self._segments = [_Segment(directory, name) for name in names]
+        # 기존 세그먼트에는 이어 쓰지 않음 (중단된 기록의 잘린 항목 뒤에 쓰지 않도록 첫 기록에서 새 세그먼트 시작)
+        self._active: _Segment | None = None
+        self._last = max((segment.last for segment in self._segments), default=0.0)
+        self._lock = threading.Lock()
+
+    def append(self, ctx: str, dataset: str, collected_at: float, value: dict[str, Any]) -> bool:
+        """데이터셋 하나의 수집 결과를 기록합니다.
+
+        색인 시각이 항상 증가하도록, 먼저 기록된 레코드보다 이른 수집 시각은 그 레코드의 시각으로 기록합니다.
+
+        Args:
+            ctx (str): Kubernetes 컨텍스트 이름
+            dataset (str): 데이터셋 이름
+            collected_at (float): 수집 시각 (Unix time)
+            value (dict[str, Any]): 스냅샷 키 → 값
+
+        Returns:
+            bool: 기록했으면 True. 저장할 수 없는 데이터셋(검색 색인 등)이면 False
+        """
+        payload = encode_dataset(ctx, dataset, collected_at, value)
+        if payload is None:
+            return False
+        with self._lock:
+            at = max(collected_at, self._last)
+            active = self._active
+            if active is None or (active.count and active.size + len(payload) > self.segment_bytes):
+                if active is not None:
+                    active.close()
+                active = self._active = _Segment.create(self.directory, at)
+                self._segments.append(active)
+            active.append(at, _key(ctx, dataset), payload)
+            self._last = at
+            self._retain(time.time())
+        return True
+
+    def _retain(self, now: float) -> None:
+        """크기나 보존 기간을 넘은 가장 오래된 세그먼트를 삭제합니다 (잠금 안에서 호출, 기록 중인 세그먼트는 유지)."""
+        total = sum(segment.size for segment in self._segments)
+        while len(self._segments) > 1 and (total > self.max_bytes or self._segments[0].last < now - self.max_age):
+            segment = self._segments.pop(0)
+            total -= segment.size
+            segment.remove()
+
+    def span(self) -> tuple[float, float] | None:
+        """기록된 첫 레코드와 마지막 레코드의 수집 시각을 반환합니다.
+
+        Returns:
+            tuple[float, float] | None: (처음, 마지막) Unix time. 기록이 없으면 None
+        """
+        with self._lock:
+            segments = [segment for segment in self._segments if segment.count]
+            if not segments:
+                return None
+            first = segments[0]
+            return float(_ENTRY.unpack_from(first.maps()[0], 0)[0]), segments[-1].last
+
+    def load(
+        self, clusters: Iterable[str], datasets: Iterable[str], at: float
+    ) -> dict[tuple[str, str], tuple[float, dict[str, Any]]]:
+        """at 시각 이전에 기록된 (클러스터, 데이터셋)별 마지막 레코드를 읽습니다.
+
+        색인의 키 해시로 요청한 항목의 레코드만 골라 읽고, 찾은 항목의 키는 더 찾지 않습니다.
+        기록이 없는 항목이 있어도 at 기준 보존 기간(max_age) 이전까지만 거슬러 올라갑니다.
+
+        Args:
+            clusters (Iterable[str]): 대상 Kubernetes 컨텍스트 이름 목록
+            datasets (Iterable[str]): 대상 데이터셋
+            at (float): 기준 시각 (Unix time)
+
+        Returns:
+            dict: (클러스터, 데이터셋) → (수집 시각, 스냅샷 키 → 값). 보존 기간 안에 at 이전 기록이 없는 항목은 포함되지 않음
+        """
+        wanted = {(ctx, dataset) for ctx in clusters for dataset in datasets}
+        # 키 해시 → 아직 찾지 못한 (클러스터, 데이터셋)
+        pending: dict[int, set[tuple[str, str]]] = {}
+        for pair in wanted:
+            pending.setdefault(_key(*pair), set()).add(pair)
+        # 키 해시 → 마지막으로 읽은 레코드의 위치 (해시 충돌이나 손상된 레코드이면 그 이전 레코드를 다시 찾음)
+        cursors: dict[int, tuple[float, int]] = {}
+        found: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+        while pending:
+            with self._lock:
+                payloads = self._latest(pending, cursors, at)
+            if not payloads:
+                break
+            # 압축 해제와 변환은 잠금 밖에서 수행하여 기록을 막지 않음
+            for key, payload in payloads.items():
+                try:
+                    ctx, entries = decode_cluster(payload)
+                except ValueError as e:
+                    print(f"Warning: skipping corrupt archive record in {self.directory}: {e}")
+                    continue
+                for dataset, entry in entries.items():
+                    # 해시 충돌 가능성이 있으므로 실제 키로 다시 확인
+                    if (ctx, dataset) in pending[key]:
+                        pending[key].discard((ctx, dataset))
+                        found[ctx, dataset] = entry
+                if not pending[key]:
+                    del pending[key]
+        return found
+
+    def _latest(
+        self, pending: dict[int, set[tuple[str, str]]], cursors: dict[int, tuple[float, int]], at: float
+    ) -> dict[int, bytes]:
+        """키 해시마다 cursors의 위치보다 이전인 가장 최근 레코드를 읽습니다 (잠금 안에서 호출).
+
+        at 이후에 시작한 세그먼트는 건너뛰고 그 이전 세그먼트를 최신부터 확인하며,
+        at 기준 보존 기간(max_age)보다 오래된 레코드는 찾지 않습니다. 읽은 레코드의 위치는 cursors에 기록합니다.
+
+        Returns:
+            dict[int, bytes]: 키 해시 → 레코드 (압축된 상태). 더 이상 레코드가 없는 키는 포함되지 않음
+        """
+        oldest = at - self.max_age
+        payloads: dict[int, bytes] = {}
+        position = bisect.bisect_right([segment.start for segment in self._segments], at)
+        for segment in reversed(self._segments[:position]):
+            if segment.last < oldest:
+                break
+            for i, key, offset, length in segment.records(at, oldest):
+                if key in pending and key not in payloads and (segment.start, i) < cursors.get(key, _NEWEST):
+                    cursors[key] = (segment.start, i)
+                    payloads[key] = segment.read(offset, length)
+                    if len(payloads) == len(pending):
+                        return payloads
+        return payloads
+
+    def snapshot(self, clusters: Iterable[str], datasets: Iterable[str], at: float) -> dict[str, Any]:
+        """at 시각에 대시보드가 표시하던 collect() 형태의 스냅샷을 만듭니다 (API 서버에 요청하지 않음).
+
+        기록이 없는 데이터셋(검색 색인 등)은 빈 값으로 포함됩니다.
+
+        Args:
+            clusters (Iterable[str]): 대상 Kubernetes 컨텍스트 이름 목록
+            datasets (Iterable[str]): 대상 데이터셋
+            at (float): 기준 시각 (Unix time)
+
+        Returns:
+            dict: collect()와 같은 형태의 통합 데이터 딕셔너리
+        """
+        selected = list(clusters)
+        wanted = frozenset(datasets)
+        found = self.load(selected, wanted, at)
+        parts: list[dict[str, Any]] = []
+        for ctx in selected:
+            part: dict[str, Any] = {}
+            for dataset in wanted:
+                if (ctx, dataset) in found:
+                    part.update(found[ctx, dataset][1])
+            parts.append(part)
+        return merge_snapshots(parts, wanted)
+
+    def close(self) -> None:
+        """열려 있는 mmap과 파일을 닫습니다."""
+        with self._lock:
+            for segment in self._segments:
+                segment.close()
+            self._active = None
@@ -6,61 +6,285 @@ ThreadPoolExecutor를 사용하여 여러 클러스터에서 동시에 데이터
 
 주요 기능:
 - Pod 상태 및 메트릭 수집
+- 최상위 소유자(Deployment 등) 단위 워크로드 집계
 - 노드 리소스 사용량 수집
+- 노드/네임스페이스별 requests/limits 대비 allocatable 할당 분석
 - Pod 로그 수집
 - 클러스터 이벤트 수집
+- 오브젝트별 마지막 관련 이벤트 색인 생성 (Pod가 비정상인 이유 표시용)
+- 노드 상세 보기용 노드별 Pod 목록 (Pod 요약과 같은 순회에서 생성)
+- Pod/노드/네임스페이스/레이블 검색 색인 생성
+
+노드 용량 등 거의 바뀌지 않는 정보는 inventory.node_inventory()에 캐시하여
+새로고침마다 메트릭 사용량만 조회합니다.
+
+모든 API 호출은 scheduler.default_scheduler()를 거치므로 API 서버별 동시 실행 수와
+요청 속도가 제한되고, 429 응답은 Retry-After에 따라 재시도됩니다.
+
+전체 네임스페이스 목록 권한이 없는 컨텍스트는 permissions 모듈의 네임스페이스 범위에 따라
+네임스페이스별 목록 요청을 병렬로 보내고 같은 스냅샷 형태로 병합합니다.
+403을 받은 요청은 권한 캐시(permissions.permission_cache())에 기록하여 새로고침마다 다시 보내지 않습니다.
 """
 
+from collections.abc import Callable, Iterable
 from concurrent.futures import ThreadPoolExecutor
-from datetime import UTC, datetime, timedelta
-from functools import reduce
-from typing import Any
+from datetime import UTC, datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
-from kubernetes.client import V1PodList
 from kubernetes.client.exceptions import ApiException
 
+from kubernetes_dashboard.allocation import allocation
+from kubernetes_dashboard.events import latest_events
+from kubernetes_dashboard.inventory import node_inventory
 from kubernetes_dashboard.kube_client import api_for
+from kubernetes_dashboard.node_pods import NodePods
+from kubernetes_dashboard.permissions import (
+    NAMESPACE_CONCURRENCY,
+    default_namespace,
+    namespace_scopes,
+    permission_cache,
+)
+from kubernetes_dashboard.procpool import process_pool
+from kubernetes_dashboard.profiling import COLLECT, profiled
 from kubernetes_dashboard.quantity import cpu_to_cores, mem_to_bytes
+from kubernetes_dashboard.records import EventRow, NodeRow, PodRow, RestartRow, SearchRow, intern
+from kubernetes_dashboard.restarts import restart_tracker
+from kubernetes_dashboard.scheduler import default_scheduler
+from kubernetes_dashboard.wire import ObjectList, list_objects
+from kubernetes_dashboard.wire import reset as reset_wire_format
+from kubernetes_dashboard.workloads import WorkloadRollup, owner_index
+
+if TYPE_CHECKING:
+    from kubernetes_dashboard.search import SearchSegment
+
+# ------------------- Datasets ------------------- #
+# 페이지가 필요로 하는 데이터 단위. collect()는 요청된 데이터셋만 수집합니다.
+PODS = "pods"
+WORKLOADS = "workloads"
+NODE_METRICS = "node_metrics"
+RESTARTS = "restarts"
+EVENTS = "events"
+SEARCH_INDEX = "search_index"
+ALLOCATION = "allocation"
+EVENT_INDEX = "event_index"
+NODE_PODS = "node_pods"
+# 검색 색인, 할당 분석, 이벤트 색인, 노드별 Pod 목록은 대시보드 페이지에서만 요청하므로 exporter/CLI의 기본 수집 대상에서 제외
+ALL_DATASETS = frozenset({PODS, WORKLOADS, NODE_METRICS, RESTARTS, EVENTS})
+
+# 데이터셋 → collect() 결과에 포함되는 키
+DATASET_KEYS: dict[str, tuple[str, ...]] = {
+    PODS: ("total_pods", "non_running_total", "non_running_pods"),
+    WORKLOADS: ("workloads",),
+    NODE_METRICS: ("node_metrics",),
+    RESTARTS: ("recent_restarts",),
+    EVENTS: ("events",),
+    SEARCH_INDEX: ("search_segments",),
+    ALLOCATION: ("node_allocation", "namespace_allocation"),
+    EVENT_INDEX: ("latest_events",),
+    NODE_PODS: ("node_pods",),
+}
+# Pod 목록이 필요한 데이터셋 (한 번만 조회하여 공유)
+_POD_DATASETS = frozenset({PODS, WORKLOADS, RESTARTS, SEARCH_INDEX, ALLOCATION, NODE_PODS})
+# 클러스터당 반환하는 재시작 컨테이너 최대 개수
+RESTART_TOP_N = 50
+# 최근 이벤트 목록(events)에 포함하는 이벤트 수
+EVENT_LIMIT = 100
+# 이벤트 목록을 나누어 조회할 때 요청 하나의 이벤트 수 (limit은 최신순이 아닌 저장 순서로 자르므로 끝까지 조회)
+EVENT_PAGE_SIZE = 500
+# 목록이 아닌 합산 대상 키
+_COUNT_KEYS = frozenset({"total_pods", "non_running_total"})
+
+
+def _request(ctx: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """API 호출을 공유 스케줄러를 통해 실행합니다.
+
+    Args:
+        ctx (str): Kubernetes 컨텍스트 이름
+        fn (Callable): 실행할 API 메서드
+        *args: fn에 전달할 위치 인자
+        **kwargs: fn에 전달할 키워드 인자
+
+    Returns:
+        fn의 반환값
+    """
+    return default_scheduler().call(ctx, fn, *args, **kwargs)
+
+
+def _list_pages(ctx: str, fn: Callable[..., Any], **kwargs: Any) -> list[Any]:
+    """목록 API를 continue 토큰으로 끝까지 나누어 요청하고 모든 항목을 반환합니다.
+
+    Args:
+        ctx (str): Kubernetes 컨텍스트 이름
+        fn (Callable): 목록 API 메서드 (list_event_for_all_namespaces 등)
+        **kwargs: fn에 전달할 키워드 인자
+
+    Returns:
+        list: 모든 페이지의 항목
+    """
+    items: list[Any] = []
+    token = None
+    while True:
+        page = _request(ctx, fn, limit=EVENT_PAGE_SIZE, _continue=token, **kwargs)
+        items.extend(page.items)
+        token = page.metadata._continue if page.metadata else None
+        if not token:
+            return items
+
+
+def _forbidden(e: ApiException) -> bool:
+    """RBAC 권한 부족(403)으로 거부된 요청인지 반환합니다."""
+    return bool(e.status == 403)
+
+
+def _list_scoped(
+    ctx: str,
+    resource: str,
+    cluster_wide: Callable[[], Any],
+    namespaced: Callable[[str], Any],
+) -> list[Any]:
+    """전체 네임스페이스 목록을 요청하거나, 권한이 없으면 허용된 네임스페이스별로 나누어 요청합니다.
+
+    네임스페이스 범위가 설정된 컨텍스트(permissions.namespace_scopes())는 처음부터 네임스페이스별로 요청합니다.
+    범위가 없는 컨텍스트에서 전체 요청이 403을 받으면 kubeconfig 컨텍스트의 기본 네임스페이스로 좁힙니다.
+    네임스페이스별 요청은 최대 NAMESPACE_CONCURRENCY개를 동시에 보내며 (API 서버별 제한은 스케줄러가 적용),
+    403을 받은 네임스페이스는 권한 캐시에 기록하고 건너뛰며, 성공한 요청은 이전 403 기록을 지웁니다.
+
+    Args:
+        ctx (str): Kubernetes 컨텍스트 이름
+        resource (str): 권한 캐시에 기록할 리소스 이름 (pods, events 등)
+        cluster_wide (Callable[[], Any]): 전체 네임스페이스 목록 요청
+        namespaced (Callable[[str], Any]): 네임스페이스 하나의 목록 요청
+
+    Returns:
+        list: 요청 결과 목록 (전체 요청이면 하나, 네임스페이스별 요청이면 성공한 네임스페이스마다 하나)
+
+    Raises:
+        ApiException: 403 이외의 오류가 발생한 경우
+    """
+    perms = permission_cache()
+    namespaces = namespace_scopes().get(ctx)
+    if namespaces is None:
+        if not perms.forbidden(ctx, resource):
+            try:
+                result = cluster_wide()
+            except ApiException as e:
+                if not _forbidden(e):
+                    raise
+                perms.mark_forbidden(ctx, resource)
+            else:
+                # 재확인에서 권한이 다시 부여된 경우 이전 403 기록을 지워 다음 거부 시 다시 경고
+                perms.mark_allowed(ctx, resource)
+                perms.mark_allowed(ctx, resource, "")
+                return [result]
+        default = default_namespace(ctx)
+        namespaces = (default,) if default else ()
+        if not namespaces:
+            if perms.mark_forbidden(ctx, resource, ""):
+                print(
+                    f"Warning: listing {resource} across all namespaces is forbidden in cluster '{ctx}' "
+                    "and no namespace scope is configured. Skipping."
+                )
+            return []
+
+    allowed = [ns for ns in namespaces if not perms.forbidden(ctx, resource, ns)]
+    if not allowed:
+        return []
+    with ThreadPoolExecutor(max_workers=min(NAMESPACE_CONCURRENCY, len(allowed))) as pool:
+        futures = [(ns, pool.submit(namespaced, ns)) for ns in allowed]
+        results: list[Any] = []
+        for ns, future in futures:
+            try:
+                results.append(future.result())
+            except ApiException as e:
+                if not _forbidden(e):
+                    raise
+                if perms.mark_forbidden(ctx, resource, ns):
+                    print(f"Warning: listing {resource} in namespace '{ns}' is forbidden in cluster '{ctx}'. Skipping.")
+            else:
+                perms.mark_allowed(ctx, resource, ns)
+    return results
 
 
 # ------------------- Single cluster functions ------------------- #
-def _get_all_pods(ctx: str) -> V1PodList:
+def _get_all_pods(ctx: str, resources: bool = False) -> ObjectList:
     """모든 Pod 목록을 반환합니다.
 
+    protobuf/gzip 형식으로 요청하고 collectors가 사용하는 필드만 변환합니다 (wire 모듈 참조).
+    전체 네임스페이스 목록 권한이 없으면 허용된 네임스페이스별로 요청하여 병합합니다 (_list_scoped() 참고).
+
     Args:
         ctx (str): Kubernetes 컨텍스트 이름
+        resources (bool, optional): 컨테이너 requests/limits(spec.containers)도 변환할지 여부. 기본값은 False
 
     Returns:
-        list: Pod 객체 목록
+        ObjectList: Pod 객체 목록 (items). 네임스페이스별로 요청한 경우 namespaces는 성공한 네임스페이스이며,
+            여러 네임스페이스를 병합한 경우 resource_version은 None
     """
     core, _ = api_for(ctx)
-    return core.list_pod_for_all_namespaces(watch=False)
+    resource = "pod_resources" if resources else "pods"
+
+    def namespaced(ns: str) -> ObjectList:
+        part: ObjectList = _request(ctx, list_objects, ctx, core, resource, ns)
+        part.namespaces = (ns,)
+        return part
+
+    parts: list[ObjectList] = _list_scoped(
+        ctx, "pods", lambda: _request(ctx, list_objects, ctx, core, resource), namespaced
+    )
+    if len(parts) == 1:
+        return parts[0]
+    return ObjectList(
+        items=[item for part in parts for item in part.items],
+        namespaces=tuple(ns for part in parts for ns in part.namespaces or ()),
+    )
 
 
-def _non_running_pods_list(ctx: str) -> list[dict[str, Any]]:
+def _non_running_pods_list(
+    ctx: str,
+    pods: list[Any] | None = None,
+    rollup: WorkloadRollup | None = None,
+    node_pods: NodePods | None = None,
+) -> list[PodRow]:
     """Non-running pods 목록을 반환합니다.
 
     Running 상태가 아닌 모든 Pod의 정보를 수집합니다.
+    rollup이 주어지면 같은 순회에서 모든 Pod를 워크로드 합계에도 더하고,
+    node_pods가 주어지면 노드별 Pod 목록에도 더합니다.
 
     Args:
         ctx (str): Kubernetes 컨텍스트 이름
+        pods (list, optional): 이미 조회한 Pod 목록. 기본값은 None (새로 조회)
+        rollup (WorkloadRollup, optional): 워크로드 집계기. 기본값은 None (집계하지 않음)
+        node_pods (NodePods, optional): 노드별 Pod 행 수집기. 기본값은 None (모으지 않음)
 
     Returns:
-        list[dict]: Non-running Pod 정보 목록 (cluster, pod, ns, node, phase, reason 포함)
+        list[PodRow]: Non-running Pod 정보 목록 (cluster, pod, ns, node, phase, reason, workload 포함)
     """
-    pods = _get_all_pods(ctx).items
+    if pods is None:
+        pods = _get_all_pods(ctx).items
+    cluster = intern(ctx)
+    owners = rollup or owner_index().rollup(ctx)
     result = []
     for p in pods:
+        owner = None
+        if rollup is not None:
+            owner = rollup.owner(p)
+            rollup.add(p, owner)
+        if node_pods is not None:
+            node_pods.add(p)
         if p.status.phase != "Running":
+            kind, name = owner or owners.owner(p)
             result.append(
-                {
-                    "cluster": ctx,
-                    "pod": p.metadata.name,
-                    "ns": p.metadata.namespace,
-                    "node": p.spec.node_name or "N/A",
-                    "phase": p.status.phase,
-                    "reason": p.status.reason or "N/A",
-                }
+                PodRow(
+                    cluster=cluster,
+                    pod=p.metadata.name,
+                    ns=intern(p.metadata.namespace),
+                    node=intern(p.spec.node_name or "N/A"),
+                    phase=intern(p.status.phase),
+                    reason=intern(p.status.reason or "N/A"),
+                    workload=f"{kind}/{name}",
+                )
             )
     return result
 
@@ -89,167 +313,389 @@ def _total_pods(ctx: str) -> int:
     return len(_get_all_pods(ctx).items)
 
 
-def _node_metrics(ctx: str) -> list[dict[str, Any]]:
-    """노드 메트릭을 수집합니다. metrics-server가 없으면 빈 리스트를 반환합니다.
+def _list_nodes(ctx: str) -> list[Any]:
+    """노드 목록을 조회합니다.
 
-    metrics.k8s.io API를 통해 노드의 CPU 및 메모리 사용량을 수집합니다.
-    metrics-server가 설치되지 않은 경우에는 노드 목록만 반환하고 메트릭은 'N/A'로 표시합니다.
+    노드 목록 권한이 없으면(403) 빈 목록을 반환하고 권한 캐시에 기록합니다. 성공하면 이전 403 기록을 지웁니다.
+
+    Args:
+        ctx (str): Kubernetes 컨텍스트 이름
+
+    Returns:
+        list: 노드 객체 목록 (V1Node와 같은 속성 이름)
+    """
+    perms = permission_cache()
+    if perms.forbidden(ctx, "nodes"):
+        return []
+    core, _ = api_for(ctx)
+    try:
+        nodes: ObjectList = _request(ctx, list_objects, ctx, core, "nodes")
+    except ApiException as e:
+        if not _forbidden(e):
+            raise
+        if perms.mark_forbidden(ctx, "nodes"):
+            print(f"Warning: listing nodes is forbidden in cluster '{ctx}'. Node information will not be available.")
+        return []
+    perms.mark_allowed(ctx, "nodes")
+    return nodes.items
+
+
+def _node_metrics(ctx: str) -> list[NodeRow]:
+    """노드 메트릭을 수집합니다.
+
+    새로고침마다 metrics.k8s.io의 사용량만 조회하고, 노드 용량은 노드 인벤토리 캐시
+    (inventory.node_inventory())에서 가져와 결합합니다. 노드 목록은 캐시 TTL이 지났거나
+    메트릭에 새 노드가 나타났을 때만 다시 조회합니다.
+    metrics-server가 설치되지 않은 경우에는 노드 목록만 반환하고 메트릭은 'N/A'로 표시하며,
+    404를 받은 클러스터는 재확인 주기가 지날 때까지 metrics.k8s.io를 다시 호출하지 않습니다.
+    메트릭 조회 권한이 없는 경우(403)도 같은 방식으로 처리하며 권한 캐시에 기록합니다.
     노드의 총 용량 대비 현재 사용량을 퍼센트(%)로 계산합니다.
 
     Args:
         ctx (str): Kubernetes 컨텍스트 이름
 
     Returns:
-        list[dict]: 노드 메트릭 정보 목록 (cluster, node, cpu, mem, cpu_percent, mem_percent 포함)
+        list[NodeRow]: 노드 메트릭 정보 목록 (cluster, node, cpu, mem, cpu_percent, mem_percent 포함)
 
     Raises:
-        ApiException: metrics-server API 호출 중 404 이외의 오류가 발생한 경우
+        ApiException: metrics-server API 호출 중 404, 403 이외의 오류가 발생한 경우
     """
-    try:
-        core, cust = api_for(ctx)
-        # 노드 용량 정보 가져오기
-        nodes = core.list_node().items
-        node_capacities: dict[str, dict[str, float]] = {}
-        for node in nodes:
-            node_name = node.metadata.name
-            node_capacities[node_name] = {
-                "cpu": cpu_to_cores(node.status.capacity["cpu"]),
-                "mem": mem_to_bytes(node.status.capacity["memory"]),
-            }
-
-        # 노드 사용량 정보 가져오기
-        res = cust.list_cluster_custom_object("metrics.k8s.io", "v1beta1", "nodes")
-        rows: list[dict[str, Any]] = []
-        for n in res["items"]:
-            node_name = n["metadata"]["name"]
-            cpu_usage = cpu_to_cores(n["usage"]["cpu"])
-            mem_usage = mem_to_bytes(n["usage"]["memory"])
-
-            # 용량 대비 사용량 퍼센트 계산
-            cpu_percent: float | str = "N/A"
-            mem_percent: float | str = "N/A"
-
-            if node_name in node_capacities:
-                cpu_capacity = node_capacities[node_name]["cpu"]
-                mem_capacity = node_capacities[node_name]["mem"]
-
-                if cpu_capacity > 0:
-                    cpu_percent = (cpu_usage / cpu_capacity) * 100
-
-                if mem_capacity > 0:
-                    mem_percent = (mem_usage / mem_capacity) * 100
-
-            rows.append(
-                {
-                    "cluster": ctx,
-                    "node": node_name,
-                    "cpu": cpu_usage,
-                    "mem": mem_usage,
-                    "cpu_percent": cpu_percent,
-                    "mem_percent": mem_percent,
-                }
+    cluster = intern(ctx)
+    inventory = node_inventory()
+    perms = permission_cache()
+    res = None
+    if inventory.metrics_available(ctx) and not perms.forbidden(ctx, "nodes.metrics"):
+        try:
+            _, cust = api_for(ctx)
+            res = _request(ctx, cust.list_cluster_custom_object, "metrics.k8s.io", "v1beta1", "nodes")
+            inventory.mark_metrics_available(ctx)
+        except ApiException as e:
+            if _forbidden(e):
+                # 메트릭 조회 권한이 없는 경우
+                if perms.mark_forbidden(ctx, "nodes.metrics"):
+                    print(
+                        f"Warning: reading node metrics is forbidden in cluster '{ctx}'. Node metrics will not be available."
+                    )
+            elif e.status == 404:
+                # metrics-server가 설치되지 않은 경우
+                if inventory.mark_metrics_unavailable(ctx):
+                    print(f"Warning: metrics-server not found in cluster '{ctx}'. Node metrics will not be available.")
+            else:
+                # 다른 API 오류는 다시 발생시킴
+                raise
+
+    if res is None:
+        # 노드 목록은 인벤토리에서 가져오되 메트릭은 N/A로 설정
+        nodes = inventory.nodes(ctx, lambda: _list_nodes(ctx))
+        return [
+            NodeRow(cluster=cluster, node=name, cpu="N/A", mem="N/A", cpu_percent="N/A", mem_percent="N/A")
+            for name in nodes
+        ]
+
+    items = res["items"]
+    nodes = inventory.nodes(ctx, lambda: _list_nodes(ctx), expect=[n["metadata"]["name"] for n in items])
+    rows: list[NodeRow] = []
+    for n in items:
+        node_name = n["metadata"]["name"]
+        cpu_usage = cpu_to_cores(n["usage"]["cpu"])
+        mem_usage = mem_to_bytes(n["usage"]["memory"])
+
+        # 용량 대비 사용량 퍼센트 계산
+        cpu_percent: float | str = "N/A"
+        mem_percent: float | str = "N/A"
+
+        info = nodes.get(node_name)
+        if info is not None:
+            if info.cpu > 0:
+                cpu_percent = (cpu_usage / info.cpu) * 100
+
+            if info.mem > 0:
+                mem_percent = (mem_usage / info.mem) * 100
+
+        rows.append(
+            NodeRow(
+                cluster=cluster,
+                node=intern(node_name),
+                cpu=cpu_usage,
+                mem=mem_usage,
+                cpu_percent=cpu_percent,
+                mem_percent=mem_percent,
             )
-        return rows
+        )
+    return rows
+
+
+def _pod_usage(ctx: str) -> dict[tuple[str, str], tuple[float, float]]:
+    """metrics-server에서 Pod별 사용량을 조회합니다 (컨테이너 합계).
+
+    Pod 목록과 같이 전체 네임스페이스 조회 권한이 없으면 허용된 네임스페이스별로 요청하여 병합합니다 (_list_scoped() 참고).
+    metrics-server가 없는 클러스터(404)는 노드 인벤토리에 기록하여 재확인 주기 또는 무효화 전까지 다시 호출하지 않습니다.
+
+    Args:
+        ctx (str): Kubernetes 컨텍스트 이름
+
+    Returns:
+        dict: (네임스페이스, Pod 이름) → (CPU 사용량(cores), 메모리 사용량(bytes)). 조회할 수 없으면 빈 딕셔너리
+
+    Raises:
+        ApiException: metrics-server API 호출 중 404, 403 이외의 오류가 발생한 경우
+    """
+    inventory = node_inventory()
+    if not inventory.metrics_available(ctx):
+        return {}
+    _, cust = api_for(ctx)
+    try:
+        parts = _list_scoped(
+            ctx,
+            "pods.metrics",
+            lambda: _request(ctx, cust.list_cluster_custom_object, "metrics.k8s.io", "v1beta1", "pods"),
+            lambda ns: _request(ctx, cust.list_namespaced_custom_object, "metrics.k8s.io", "v1beta1", ns, "pods"),
+        )
     except ApiException as e:
-        if e.status == 404:
-            # metrics-server가 설치되지 않은 경우
-            print(f"Warning: metrics-server not found in cluster '{ctx}'. Node metrics will not be available.")
-            # 노드 목록은 가져오되 메트릭은 N/A로 설정
-            core, _ = api_for(ctx)
-            nodes = core.list_node().items
-            return [
-                {
-                    "cluster": ctx,
-                    "node": n.metadata.name,
-                    "cpu": "N/A",
-                    "mem": "N/A",
-                    "cpu_percent": "N/A",
-                    "mem_percent": "N/A",
-                }
-                for n in nodes
-            ]
-        else:
-            # 다른 API 오류는 다시 발생시킴
+        if e.status != 404:
             raise
+        # metrics-server가 설치되지 않은 경우
+        if inventory.mark_metrics_unavailable(ctx):
+            print(f"Warning: metrics-server not found in cluster '{ctx}'. Pod usage will not be available.")
+        return {}
+    usage: dict[tuple[str, str], tuple[float, float]] = {}
+    for item in (item for part in parts for item in part["items"]):
+        containers = item.get("containers") or []
+        usage[item["metadata"]["namespace"], item["metadata"]["name"]] = (
+            sum(cpu_to_cores(c["usage"]["cpu"]) for c in containers),
+            sum(mem_to_bytes(c["usage"]["memory"]) for c in containers),
+        )
+    return usage
 
 
-def _recent_restarts(ctx: str) -> list[dict[str, Any]]:
-    """최근 1시간 내에 재시작된 Pod 목록을 반환합니다.
+def _recent_restarts(ctx: str, listing: ObjectList | None = None) -> list[RestartRow]:
+    """재시작이 많은 컨테이너 목록을 구간별 재시작 수와 함께 반환합니다.
 
-    컨테이너의 마지막 종료 시간을 확인하여 최근 1시간 내에 재시작된 Pod를 식별합니다.
+    Pod 목록을 RestartTracker에 반영하여 이전 수집 이후 restart_count가 늘어난 만큼을
+    재시작으로 기록하고, 최근 24시간 내 재시작한 컨테이너 중 1시간 재시작 수가 많은 순으로
+    최대 RESTART_TOP_N개를 반환합니다. 그 사이 삭제된 Pod도 기록이 남아 있으면 포함됩니다.
 
     Args:
         ctx (str): Kubernetes 컨텍스트 이름
+        listing (ObjectList, optional): 이미 조회한 Pod 목록. 기본값은 None (새로 조회).
+            네임스페이스별로 조회한 경우 포함되지 않은 네임스페이스의 재시작 기준값은 유지
 
     Returns:
-        list[dict]: 최근 재시작된 Pod 정보 목록 (cluster, pod, ns, node, restarts 포함)
+        list[RestartRow]: 재시작 정보 목록 (cluster, pod, ns, node, restarts, container,
+            restarts_5m, restarts_1h, restarts_24h 포함). restarts는 현재 누적 재시작 횟수이며
+            삭제된 Pod는 node/restarts가 None
     """
-    core, _ = api_for(ctx)
-    now = datetime.now(UTC)
-    pods = core.list_pod_for_all_namespaces(watch=False).items
-    out: list[dict[str, Any]] = []
+    if listing is None:
+        listing = _get_all_pods(ctx)
+    pods = listing.items
+    tracker = restart_tracker()
+    tracker.observe(ctx, pods, namespaces=listing.namespaces)
+
+    # 현재 Pod의 노드와 누적 재시작 횟수
+    current: dict[tuple[str, str, str], tuple[str | None, int]] = {}
     for p in pods:
         for cs in p.status.container_statuses or []:
-            term = cs.last_state.terminated
-            if term and term.finished_at and (now - term.finished_at) <= timedelta(hours=1):
-                out.append(
-                    {
-                        "cluster": ctx,
-                        "pod": p.metadata.name,
-                        "ns": p.metadata.namespace,
-                        "node": p.spec.node_name,
-                        "restarts": cs.restart_count,
-                    }
-                )
-                break
+            current[p.metadata.namespace, p.metadata.name, cs.name] = (p.spec.node_name, cs.restart_count)
+
+    cluster = intern(ctx)
+    out: list[RestartRow] = []
+    for (_, ns, pod, container), (last_5m, last_1h, last_24h) in tracker.top(RESTART_TOP_N, "1h", [ctx]):
+        node, restarts = current.get((ns, pod, container), (None, None))
+        out.append(
+            RestartRow(
+                cluster=cluster,
+                pod=pod,
+                ns=intern(ns),
+                node=intern(node),
+                restarts=restarts,
+                container=intern(container),
+                restarts_5m=last_5m,
+                restarts_1h=last_1h,
+                restarts_24h=last_24h,
+            )
+        )
     return out
 
 
 # ------------------- Multi-cluster integration entry point ------------------- #
-def collect(selected: tuple[str, ...]) -> dict[str, Any]:
+def _search_segment(ctx: str, pods: list[Any]) -> "SearchSegment":
+    """Pod 목록과 노드 인벤토리로 클러스터의 검색 색인을 만듭니다.
+
+    네임스페이스, 노드, Pod 순으로 문서를 만들며 이름, 네임스페이스, 노드, Pod phase와
+    레이블("key=value"와 값)을 검색어로 사용합니다.
+
+    Args:
+        ctx (str): Kubernetes 컨텍스트 이름
+        pods (list): 이미 조회한 Pod 목록
+
+    Returns:
+        SearchSegment: 클러스터의 검색 색인
+    """
+    # numpy는 검색 색인이 필요할 때만 import
+    from kubernetes_dashboard.search import NAMESPACE, NODE, POD, SearchSegment, label_terms
+
+    cluster = intern(ctx)
+    rows: list[SearchRow] = []
+    terms: list[list[str]] = []
+    for ns in sorted({p.metadata.namespace for p in pods}):
+        rows.append(SearchRow(cluster=cluster, kind=NAMESPACE, ns=intern(ns), name=intern(ns), node="", status=""))
+        terms.append([ns])
+    for name, info in sorted(node_inventory().nodes(ctx, partial(_list_nodes, ctx)).items()):
+        ready = "Ready" if info.conditions.get("Ready") == "True" else "NotReady"
+        rows.append(SearchRow(cluster=cluster, kind=NODE, ns="", name=name, node=name, status=ready))
+        terms.append([name, *label_terms(info.labels)])
+    for p in pods:
+        node = intern(p.spec.node_name or "")
+        phase = intern(p.status.phase or "")
+        ns = intern(p.metadata.namespace)
+        rows.append(SearchRow(cluster=cluster, kind=POD, ns=ns, name=p.metadata.name, node=node, status=phase))
+        terms.append([p.metadata.name, ns, node, phase, *label_terms(p.metadata.labels)])
+    return SearchSegment(cluster, rows, terms)
+
+
+def collect_cluster(ctx: str, datasets: Iterable[str] = ALL_DATASETS) -> dict[str, Any]:
+    """단일 클러스터에서 요청된 데이터셋만 수집합니다.
+
+    collect()와 동일한 키를 가지는 클러스터 단위 스냅샷을 반환합니다.
+    process-pool 모드(procpool.PROCESSES_ENV)가 켜져 있으면 클러스터에 배정된 워커 프로세스에서
+    수집과 요약을 수행하고 요약된 행만 돌려받습니다.
+    Pod 요약, 워크로드 집계, 재시작 정보, 할당 분석이 모두 필요하더라도 Pod 목록과 노드 메트릭은 한 번만 조회하며,
+    최근 이벤트와 이벤트 색인도 같은 이벤트 목록으로 만듭니다.
+    Pod 요약, 워크로드 집계, 노드별 Pod 목록은 한 번의 순회로 계산합니다.
+
+    Args:
+        ctx (str): Kubernetes 컨텍스트 이름
+        datasets (Iterable[str], optional): 수집할 데이터셋 (PODS, WORKLOADS, NODE_METRICS, RESTARTS, EVENTS,
+            SEARCH_INDEX, ALLOCATION, EVENT_INDEX, NODE_PODS). 기본값은 ALL_DATASETS
+
+    Returns:
+        dict: 요청된 데이터셋의 키(DATASET_KEYS 참조)만 포함하는 단일 클러스터 데이터 딕셔너리
+    """
+    wanted = frozenset(datasets)
+    pool = process_pool()
+    if pool is not None:
+        return pool.collect_cluster(ctx, wanted)
+    return _collect_cluster(ctx, wanted)
+
+
+def _collect_cluster(ctx: str, wanted: frozenset[str]) -> dict[str, Any]:
+    """현재 프로세스에서 단일 클러스터를 수집합니다 (collect_cluster() 참고)."""
+    snapshot: dict[str, Any] = {}
+    listing = _get_all_pods(ctx, resources=ALLOCATION in wanted) if wanted & _POD_DATASETS else None
+    pods = listing.items if listing is not None else None
+    rollup = owner_index().rollup(ctx) if WORKLOADS in wanted else None
+    node_pods = NodePods(ctx, _pod_usage(ctx)) if NODE_PODS in wanted else None
+
+    if PODS in wanted:
+        # 워크로드 집계와 노드별 Pod 목록도 필요하면 같은 순회에서 함께 계산
+        non_running_pods = _non_running_pods_list(ctx, pods, rollup, node_pods)
+        snapshot["total_pods"] = len(pods or [])
+        snapshot["non_running_total"] = len(non_running_pods)
+        snapshot["non_running_pods"] = non_running_pods
+    elif rollup is not None or node_pods is not None:
+        for p in pods or []:
+            if rollup is not None:
+                rollup.add(p)
+            if node_pods is not None:
+                node_pods.add(p)
+    if rollup is not None:
+        snapshot["workloads"] = rollup.rows()
+    if node_pods is not None:
+        snapshot["node_pods"] = node_pods.rows()
+    node_rows = _node_metrics(ctx) if wanted & {NODE_METRICS, ALLOCATION} else None
+    if NODE_METRICS in wanted:
+        snapshot["node_metrics"] = node_rows
+    if RESTARTS in wanted:
+        snapshot["recent_restarts"] = _recent_restarts(ctx, listing)
+    if wanted & {EVENTS, EVENT_INDEX}:
+        # 최근 이벤트와 이벤트 색인이 모두 필요하더라도 이벤트 목록은 한 번만 조회
+        events = _get_cluster_events(ctx, limit=None)
+        if EVENTS in wanted:
+            snapshot["events"] = events[:EVENT_LIMIT]
+        if EVENT_INDEX in wanted:
+            snapshot["latest_events"] = latest_events(events)
+    if SEARCH_INDEX in wanted:
+        # 클러스터마다 세그먼트 하나 (병합하면 클러스터별 세그먼트 목록)
+        snapshot["search_segments"] = [_search_segment(ctx, pods or [])]
+    if ALLOCATION in wanted:
+        nodes = node_inventory().nodes(ctx, partial(_list_nodes, ctx))
+        snapshot["node_allocation"], snapshot["namespace_allocation"] = allocation(
+            ctx, pods or [], nodes, node_rows or []
+        )
+    return snapshot
+
+
+def invalidate_caches(clusters: Iterable[str] | None = None) -> None:
+    """노드 인벤토리 등 클러스터별 캐시를 비워 다음 수집에서 다시 확인하도록 합니다.
+
+    process-pool 모드에서는 워커 프로세스의 캐시도 함께 비웁니다.
+
+    Args:
+        clusters (Iterable[str], optional): 대상 클러스터. 기본값은 None (전체)
+    """
+    targets = None if clusters is None else list(clusters)
+    node_inventory().invalidate(targets)
+    reset_wire_format(targets)
+    permission_cache().invalidate(targets)
+    pool = process_pool()
+    if pool is not None:
+        pool.invalidate(targets)
+
+
+def merge_snapshots(snapshots: Iterable[dict[str, Any]], datasets: Iterable[str] = ALL_DATASETS) -> dict[str, Any]:
+    """클러스터별 스냅샷을 하나의 통합 스냅샷으로 병합합니다.
+
+    정수 값은 합산하고, 목록 값은 순서대로 이어 붙입니다.
+    스냅샷이 없더라도 요청된 데이터셋의 키는 빈 값으로 항상 포함됩니다.
+
+    Args:
+        snapshots (Iterable[dict]): collect_cluster()가 반환한 스냅샷 목록
+        datasets (Iterable[str], optional): 결과에 포함할 데이터셋. 기본값은 모든 데이터셋
+
+    Returns:
+        dict: collect()와 동일한 형태의 통합 데이터 딕셔너리
+    """
+    merged: dict[str, Any] = {
+        key: 0 if key in _COUNT_KEYS else [] for dataset in datasets for key in DATASET_KEYS[dataset]
+    }
+    for snapshot in snapshots:
+        for key, value in snapshot.items():
+            if isinstance(value, list):
+                merged.setdefault(key, []).extend(value)
+            else:
+                merged[key] = merged.get(key, 0) + value
+    return merged
+
+
+def collect(selected: tuple[str, ...], datasets: Iterable[str] = ALL_DATASETS) -> dict[str, Any]:
     """여러 클러스터에서 데이터를 병렬로 수집하여 통합합니다.
 
     ThreadPoolExecutor를 사용하여 선택된 모든 클러스터에서 동시에 데이터를 수집합니다.
+    실제 API 서버에 대한 동시 요청 수와 속도는 공유 스케줄러가 제한합니다.
 
     Args:
         selected (tuple[str, ...]): 데이터를 수집할 Kubernetes 컨텍스트 이름 튜플
+        datasets (Iterable[str], optional): 수집할 데이터셋. 기본값은 모든 데이터셋
 
     Returns:
-        dict: 다음 키를 포함하는 통합된 데이터 딕셔너리
+        dict: 요청된 데이터셋에 해당하는 다음 키를 포함하는 통합된 데이터 딕셔너리
             - total_pods: 모든 클러스터의 총 Pod 개수
             - non_running_total: 모든 클러스터의 non-running Pod 개수
             - non_running_pods: 모든 클러스터의 non-running Pod 정보 목록
+            - workloads: 모든 클러스터의 워크로드(최상위 소유자)별 Pod 합계 목록
             - node_metrics: 모든 클러스터의 노드 메트릭 정보 목록
-            - recent_restarts: 모든 클러스터의 최근 재시작된 Pod 정보 목록
+            - recent_restarts: 모든 클러스터의 재시작이 많은 컨테이너 정보 목록 (구간별 재시작 수 포함)
             - events: 모든 클러스터의 최근 이벤트 정보 목록
+            - search_segments: 클러스터별 검색 색인(search.SearchSegment) 목록
+            - node_allocation: 모든 클러스터의 노드별 requests/limits, 사용량과 allocatable 대비 비율 목록
+            - namespace_allocation: 모든 클러스터의 네임스페이스별 requests/limits 합계 목록
+            - latest_events: 모든 클러스터의 오브젝트별 마지막 관련 이벤트 목록 (events.event_index()로 조회)
+            - node_pods: 모든 클러스터의 노드별로 묶인 Pod 목록 (node_pods.node_pod_index()로 조회)
     """
-    with ThreadPoolExecutor() as pool:
-        non_running_lists = list(pool.map(_non_running_pods_list, selected))
-        non_running = [len(nr_list) for nr_list in non_running_lists]
-        total_pods = list(pool.map(_total_pods, selected))
-
-        initial_nodes: list[dict[str, Any]] = []
-        nodes = reduce(lambda a, b: a + b, pool.map(_node_metrics, selected), initial_nodes)
-
-        initial_restarts: list[dict[str, Any]] = []
-        restarts = reduce(lambda a, b: a + b, pool.map(_recent_restarts, selected), initial_restarts)
-
-        initial_events: list[dict[str, Any]] = []
-        events = reduce(
-            lambda a, b: a + b,
-            [_get_cluster_events(ctx) for ctx in selected],
-            initial_events,
-        )
-
-    initial_non_running: list[dict[str, Any]] = []
-    return {
-        "total_pods": sum(total_pods),
-        "non_running_total": sum(non_running),
-        "non_running_pods": reduce(lambda a, b: a + b, non_running_lists, initial_non_running),
-        "node_metrics": nodes,
-        "recent_restarts": restarts,
-        "events": events,
-    }
+    wanted = frozenset(datasets)
+    workers = max(1, min(len(selected), default_scheduler().max_inflight))
+    with profiled(COLLECT), ThreadPoolExecutor(max_workers=workers) as pool:
+        return merge_snapshots(pool.map(lambda ctx: collect_cluster(ctx, wanted), selected), wanted)
 
 
 def _get_pod_logs(
@@ -273,7 +719,9 @@ def _get_pod_logs(
     """
     core, _ = api_for(ctx)
     try:
-        logs: str = core.read_namespaced_pod_log(
+        logs: str = _request(
+            ctx,
+            core.read_namespaced_pod_log,
             name=pod_name,
             namespace=namespace,
             container=container,
@@ -284,43 +732,54 @@ def _get_pod_logs(
         return f"Error retrieving logs: {e}"
 
 
-def _get_cluster_events(ctx: str, namespace: str | None = None, limit: int = 100) -> list[dict[str, Any]]:
+def _get_cluster_events(ctx: str, namespace: str | None = None, limit: int | None = 100) -> list[EventRow]:
     """클러스터 이벤트를 가져옵니다.
 
+    전체 네임스페이스 목록 권한이 없으면 허용된 네임스페이스별로 요청하여 병합하고,
+    최신 이벤트부터 limit개를 반환합니다. API의 limit은 최신순이 아니라 저장 순서로 자르므로
+    목록은 continue 토큰으로 끝까지 조회한 뒤 정렬하여 자릅니다.
+
     Args:
         ctx (str): Kubernetes 컨텍스트 이름
         namespace (str, optional): 특정 네임스페이스의 이벤트만 가져올 경우. 기본값은 None (모든 네임스페이스)
-        limit (int, optional): 가져올 이벤트 수. 기본값은 100
+        limit (int, optional): 반환할 이벤트 수. 기본값은 100 (None이면 모두 반환)
 
     Returns:
-        list[dict]: 이벤트 정보 목록 (cluster, type, reason, object, message, time 포함)
+        list[EventRow]: 최신순으로 정렬된 이벤트 정보 목록 (cluster, type, reason, object, message, time, ns 포함)
     """
     core, _ = api_for(ctx)
     try:
         if namespace:
-            events = core.list_namespaced_event(namespace=namespace, limit=limit)
+            parts = [_list_pages(ctx, core.list_namespaced_event, namespace=namespace)]
         else:
-            events = core.list_event_for_all_namespaces(limit=limit)
+            parts = _list_scoped(
+                ctx,
+                "events",
+                lambda: _list_pages(ctx, core.list_event_for_all_namespaces),
+                lambda ns: _list_pages(ctx, core.list_namespaced_event, namespace=ns),
+            )
 
-        result: list[dict[str, Any]] = []
-        for event in events.items:
+        cluster = intern(ctx)
+        result: list[EventRow] = []
+        for event in (event for events in parts for event in events):
             result.append(
-                {
-                    "cluster": ctx,
-                    "type": event.type,
-                    "reason": event.reason,
-                    "object": f"{event.involved_object.kind}/{event.involved_object.name}",
-                    "message": event.message,
-                    "time": event.last_timestamp or event.event_time,
-                }
+                EventRow(
+                    cluster=cluster,
+                    type=intern(event.type),
+                    reason=intern(event.reason),
+                    object=f"{event.involved_object.kind}/{event.involved_object.name}",
+                    message=event.message,
+                    time=event.last_timestamp or event.event_time,
+                    ns=intern(event.involved_object.namespace or None),
+                )
             )
 
         # 시간 기준 내림차순 정렬
         result.sort(
-            key=lambda x: (x["time"] if x["time"] else datetime.min.replace(tzinfo=UTC)),
+            key=lambda x: x.time if x.time else datetime.min.replace(tzinfo=UTC),
             reverse=True,
         )
-        return result
+        return result[:limit]
     except ApiException as e:
         print(f"Error retrieving events from cluster {ctx}: {e}")
         return []
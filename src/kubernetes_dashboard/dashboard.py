@@ -2,7 +2,8 @@
 
 이 모듈은 Streamlit을 사용하여 Kubernetes 멀티 클러스터 대시보드의
 UI 및 데이터 시각화를 구현합니다. 대시보드는 여러 클러스터의 개요 페이지와
-각 클러스터별 상세 페이지로 구성됩니다.
+각 클러스터별 상세 페이지로 구성됩니다. 페이지별 코드는 views 패키지에 있으며,
+선택된 페이지의 모듈만 필요할 때 import됩니다.
 
 주요 기능:
 - 여러 Kubernetes 클러스터 동시 모니터링
@@ -10,22 +11,127 @@ UI 및 데이터 시각화를 구현합니다. 대시보드는 여러 클러스
 - 노드 리소스 사용량 시각화
 - 최근 재시작된 Pod 추적
 - Pod 로그 및 클러스터 이벤트 조회
+- 전체 클러스터 Pod/노드/네임스페이스/레이블 검색
 - 자동 새로고침 기능
+- 재시작 직후 디스크에 저장된 마지막 스냅샷을 먼저 표시 (warm start)
+- 느린 새로고침 분석을 위한 선택적 샘플링 프로파일링 (speedscope flame graph)
+- 기록된 스냅샷 아카이브에서 지난 시점의 화면을 API 서버 요청 없이 다시 표시 (replay)
+- 스냅샷/표 색인 메모리 사용량 표시와 예산 초과 시 오래 조회하지 않은 클러스터를 디스크로 내보내기
 """
 
-import pandas as pd
+import time
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
 import streamlit as st
-from kubernetes.config.kube_config import list_kube_config_contexts
 
-from kubernetes_dashboard.collectors import (
-    _get_cluster_events,
-    _get_pod_logs,
-    _non_running_pods,
-    _total_pods,
-    collect,
-)
-from kubernetes_dashboard.kube_client import api_for
-from kubernetes_dashboard.quantity import fmt_bytes_gib, fmt_cores, fmt_percent
+from kubernetes_dashboard.kube_client import context_names
+from kubernetes_dashboard.memory import MIB, MemoryGovernor, memory_governor, process_rss, spill_parent
+from kubernetes_dashboard.profiling import RERUN, profile_dir, profiled
+from kubernetes_dashboard.views import LOGS_AND_EVENTS, OVERVIEW, SEARCH, PageData, load_view
+
+if TYPE_CHECKING:
+    from kubernetes_dashboard.archive import SnapshotArchive
+    from kubernetes_dashboard.store import SnapshotStore
+
+# 자동 새로고침을 사용하지 않을 때 수집 결과를 재사용하는 시간(초)
+DEFAULT_MAX_AGE = 30
+# 저장된 스냅샷을 표시하는 동안 백그라운드 수집 완료를 확인하는 간격(초)
+WARM_POLL_INTERVAL = 2
+# 사이드바 프로파일링 토글의 session_state 키
+PROFILE_KEY = "profile_rerun"
+# 사이드바 리플레이 토글의 session_state 키
+REPLAY_KEY = "replay"
+# 리플레이 시점 슬라이더 간격(초)
+REPLAY_STEP = 10
+
+
+@st.cache_resource
+def _snapshot_store() -> "SnapshotStore":
+    """모든 세션이 공유하는 데이터셋 캐시를 반환합니다."""
+    # collectors(kubernetes client)는 데이터가 처음 필요할 때 import
+    from kubernetes_dashboard.persist import snapshot_dir
+    from kubernetes_dashboard.store import SnapshotStore
+
+    return SnapshotStore(
+        max_age=DEFAULT_MAX_AGE,
+        persist_dir=snapshot_dir(),
+        archive=_snapshot_archive(),
+        governor=_memory_governor(),
+        spill_dir=spill_parent(),
+    )
+
+
+@st.cache_resource
+def _memory_governor() -> MemoryGovernor:
+    """프로세스 전체의 메모리 관리자를 반환합니다.
+
+    행 목록을 붙잡고 있는 색인 캐시(표, 이벤트, 노드별 Pod)를 가장 먼저 해제할 구성 요소로 등록합니다.
+    """
+    from kubernetes_dashboard.events import event_cache
+    from kubernetes_dashboard.node_pods import node_pod_cache
+    from kubernetes_dashboard.views.table import table_cache
+
+    governor = memory_governor()
+    for cache in (table_cache, event_cache, node_pod_cache):
+        governor.register(cache.name, cache.usage, cache.release, priority=0)
+    return governor
+
+
+def _memory_panel(governor: MemoryGovernor, store: "SnapshotStore") -> None:
+    """사이드바에 구성 요소별 메모리 사용량과 예산, 디스크로 내보낸 클러스터의 합계 값을 표시합니다."""
+    usage = governor.usage()
+    total = sum(u.bytes for u in usage)
+    budget = "제한 없음" if governor.budget is None else f"{governor.budget / MIB:,.0f} MiB"
+    with st.sidebar.expander(f"🧠 메모리 {total / MIB:,.1f} MiB / {budget}"):
+        for u in usage:
+            detail = f" — {u.detail}" if u.detail else ""
+            st.caption(f"{u.name}: {u.bytes / MIB:,.1f} MiB{detail}")
+        # 내보낸 클러스터는 다시 열 때까지 디스크에서 읽지 않고 메모리에 남긴 합계 값만 표시
+        for ctx, counts in store.spilled().items():
+            st.caption(f"💾 {ctx}: " + ", ".join(f"{key} {value:,}" for key, value in counts.items()))
+        rss = process_rss()
+        if rss is not None:
+            st.caption(f"프로세스 RSS: {rss / MIB:,.0f} MiB")
+
+
+@st.cache_resource
+def _snapshot_archive() -> "SnapshotArchive | None":
+    """모든 세션이 공유하는 스냅샷 아카이브를 반환합니다 (DASHBOARD_ARCHIVE_DIR이 없으면 None)."""
+    from kubernetes_dashboard.archive import open_archive
+
+    return open_archive()
+
+
+def _replay_time(archive: "SnapshotArchive") -> float | None:
+    """사이드바에 리플레이 시점 슬라이더를 표시하고 선택된 시각(Unix time)을 반환합니다."""
+    span = archive.span()
+    if span is None:
+        st.sidebar.info("아직 기록된 스냅샷이 없습니다.")
+        return None
+    step = timedelta(seconds=REPLAY_STEP)
+    first = datetime.fromtimestamp(span[0]).replace(microsecond=0)
+    # 마지막 기록이 포함되도록 올림
+    last = max(datetime.fromtimestamp(span[1]).replace(microsecond=0) + timedelta(seconds=1), first + step)
+    at = st.sidebar.slider("시점", min_value=first, max_value=last, value=last, step=step, format="MM/DD HH:mm:ss")
+    return at.timestamp()
+
+
+def _age(seconds: float) -> str:
+    """경과 시간을 "N초/N분/N시간" 형태로 표시합니다."""
+    if seconds < 60:
+        return f"{max(0, int(seconds))}초"
+    if seconds < 3600:
+        return f"{int(seconds // 60)}분"
+    return f"{seconds / 3600:.1f}시간"
+
+
+@st.fragment(run_every=WARM_POLL_INTERVAL)
+def _await_refresh(clusters: Sequence[str], datasets: frozenset[str], warm: list[str]) -> None:
+    """백그라운드 수집으로 저장된 스냅샷이 교체된 클러스터가 생기면 페이지 전체를 다시 실행합니다."""
+    if _snapshot_store().warm(clusters, datasets) != warm:
+        st.rerun()
 
 
 def main() -> None:
@@ -34,16 +140,24 @@ def main() -> None:
     Streamlit 애플리케이션의 진입점으로, 다음 기능을 수행합니다:
     1. 페이지 설정 및 레이아웃 구성
     2. 사이드바에서 클러스터 선택 UI 제공
-    3. 페이지 네비게이션 (개요, 클러스터별 상세 페이지, 로그/이벤트 페이지)
+    3. 페이지 네비게이션 (개요, 검색, 클러스터별 상세 페이지, 로그/이벤트 페이지)
     4. 선택된 클러스터에서 데이터 수집 및 시각화
     5. 자동 새로고침 설정
+    6. DASHBOARD_PROFILE=rerun 또는 사이드바 토글이 켜져 있으면 실행 전체를 프로파일링
     """
+    # 토글 값은 위젯을 그리기 전에 session_state에서 읽어 이번 실행 전체를 프로파일링
+    with profiled(RERUN, force=bool(st.session_state.get(PROFILE_KEY))):
+        _run()
+
+
+def _run() -> None:
+    """사이드바와 선택된 페이지를 렌더링합니다 (main() 참고)."""
     # ---------- Page setup ----------
     st.set_page_config("K8s Multi-Cluster Dashboard", layout="wide")
+    archive = _snapshot_archive()
 
     # ---------- Sidebar: cluster multi-select ----------
-    contexts, _ = list_kube_config_contexts()
-    ctx_names = [c["name"] for c in contexts]
+    ctx_names = context_names()
     selected = st.sidebar.multiselect("Select Clusters", ctx_names, default=ctx_names[:1])
     if not selected:
         st.stop()
@@ -58,9 +172,27 @@ def main() -> None:
         help="0으로 설정하면 자동 새로고침이 비활성화됩니다.",
     )
 
+    if st.sidebar.button("수동 새로고침"):
+        # 선택된 클러스터의 캐시를 비워 이번 실행에서 다시 수집
+        _snapshot_store().invalidate(selected)
+
+    st.sidebar.toggle(
+        "🔬 새로고침 프로파일링",
+        key=PROFILE_KEY,
+        help=f"켜 두는 동안 이 세션의 실행마다 flame graph(speedscope)와 상위 함수 요약을 {profile_dir()}에 저장합니다.",
+    )
+
+    # ---------- 기록된 스냅샷 리플레이 ----------
+    replay_at = None
+    if archive is not None and st.sidebar.toggle(
+        "⏪ 기록된 스냅샷 리플레이",
+        key=REPLAY_KEY,
+        help=f"{archive.directory}에 기록된 지난 시점의 화면을 API 서버에 요청하지 않고 표시합니다.",
+    ):
+        replay_at = _replay_time(archive)
+
     if refresh_interval > 0:
         st.sidebar.info(f"{refresh_interval}초마다 자동으로 새로고침됩니다.")
-        st.sidebar.button("수동 새로고침")
         st.empty()  # 새로고침을 위한 빈 요소
 
         # 자동 새로고침 스크립트 추가
@@ -77,241 +209,56 @@ def main() -> None:
         )
 
     # ---------- Page navigation ----------
-    pages = ["Overview", *selected, "Logs & Events"]
+    # 검색 색인과 로그/이벤트 조회는 기록되지 않으므로 리플레이 중에는 제외
+    pages = [OVERVIEW, *selected] if replay_at is not None else [OVERVIEW, SEARCH, *selected, LOGS_AND_EVENTS]
     page = st.sidebar.radio("🗂️ Pages", pages, index=0)
 
-    # ---------- Collect data once for all pages ----------
-    data = collect(tuple(selected))
-    df_nodes = pd.DataFrame(data["node_metrics"])
-
-    # ======================================================
-    # ================  Overview  ==========================
-    # ======================================================
-    if page == "Overview":
-        st.header("📊 Overview (Selected Clusters)")
-
-        # Pod 상태 지표
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Total Pods", data["total_pods"])
-        with col2:
-            st.metric("Unhealthy Pods", data["non_running_total"])
-
-        # Non-running pods list
-        if data["non_running_pods"]:
-            st.subheader("Non-Running Pods")
-            st.dataframe(pd.DataFrame(data["non_running_pods"]))
-        else:
-            st.success("모든 Pod가 정상적으로 실행 중입니다.")
-
-        # Format node metrics
-        if not df_nodes.empty:
-            # N/A 값 처리
-            df_nodes_filtered = df_nodes[~((df_nodes["cpu"] == "N/A") & (df_nodes["mem"] == "N/A"))]
-
-            if not df_nodes_filtered.empty:
-                # 숫자 형식의 데이터만 포함된 데이터프레임으로 필터링
-                numeric_df = df_nodes_filtered[
-                    ~((df_nodes_filtered["cpu"] == "N/A") | (df_nodes_filtered["mem"] == "N/A"))
-                ].copy()
-
-                if not numeric_df.empty:
-                    # 메모리와 CPU 값을 사람이 읽기 쉬운 형식으로 변환
-                    numeric_df["mem (GiB)"] = numeric_df["mem"].apply(fmt_bytes_gib)
-                    numeric_df["cpu (cores)"] = numeric_df["cpu"].apply(fmt_cores)
-                    numeric_df["cpu %"] = numeric_df["cpu_percent"].apply(fmt_percent)
-                    numeric_df["mem %"] = numeric_df["mem_percent"].apply(fmt_percent)
-
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.subheader("Top-3 Memory Nodes")
-                        # reset_index()를 추가하여 인덱스를 0부터 시작하도록 설정
-                        st.table(
-                            numeric_df.nlargest(3, "mem")[["cluster", "node", "mem (GiB)", "mem %"]]
-                            .rename(columns={"mem (GiB)": "memory"})
-                            .reset_index(drop=True)
-                        )
-                    with col2:
-                        st.subheader("Top-3 CPU Nodes")
-                        st.table(
-                            numeric_df.nlargest(3, "cpu")[["cluster", "node", "cpu (cores)", "cpu %"]]
-                            .rename(columns={"cpu (cores)": "cpu"})
-                            .reset_index(drop=True)
-                        )
-                else:
-                    st.info("metrics-server가 설치되지 않아 노드 리소스 사용량을 표시할 수 없습니다.")
-            else:
-                st.info("metrics-server가 설치되지 않아 노드 리소스 사용량을 표시할 수 없습니다.")
-        else:
-            st.info("노드 정보를 찾을 수 없습니다.")
-
-        # Recent restarts (all clusters)
-        if data["recent_restarts"]:
-            st.subheader("Pods Restarted in Last Hour")
-            st.dataframe(pd.DataFrame(data["recent_restarts"]))
-        else:
-            st.success("최근 1시간 내 재시작된 Pod가 없습니다.")
-
-        # 최근 이벤트 표시
-        if data["events"]:
-            st.subheader("Recent Events")
-            events_df = pd.DataFrame(data["events"][:10])  # 최근 10개 이벤트만 표시
-            st.dataframe(events_df[["cluster", "type", "reason", "object", "message", "time"]])
-        else:
-            st.info("최근 이벤트가 없습니다.")
-
-    # ======================================================
-    # ===========  Per-Cluster detailed pages  =============
-    # ======================================================
-    elif page in selected:
-        # 클러스터별 상세 페이지 표시
-        cluster = page  # page value equals context name
-        st.header(f"🔍 Cluster Detail — {cluster}")
-
-        # ------- Pod 상태 지표 -------
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Total Pods", _total_pods(cluster))
-        with col2:
-            st.metric("Unhealthy Pods", _non_running_pods(cluster))
-
-        # Non-running pods list for this cluster
-        cluster_non_running_pods = [p for p in data["non_running_pods"] if p["cluster"] == cluster]
-        if cluster_non_running_pods:
-            st.subheader("Non-Running Pods")
-            st.dataframe(pd.DataFrame(cluster_non_running_pods))
-        else:
-            st.success("모든 Pod가 정상적으로 실행 중입니다.")
-
-        # ------- Node table -------
-        st.subheader("Node Resource Usage")
-        node_df = df_nodes[df_nodes["cluster"] == cluster]
-        if not node_df.empty:
-            # N/A 값 처리
-            display_df = node_df.copy()
-
-            # 문자열 "N/A"를 그대로 표시
-            display_df["memory"] = [
-                fmt_bytes_gib(row["mem"]) if row["mem"] != "N/A" else "N/A" for _, row in display_df.iterrows()
-            ]
-            display_df["cpu"] = [
-                fmt_cores(row["cpu"]) if row["cpu"] != "N/A" else "N/A" for _, row in display_df.iterrows()
-            ]
-            display_df["cpu %"] = [
-                (fmt_percent(row["cpu_percent"]) if row["cpu_percent"] != "N/A" else "N/A")
-                for _, row in display_df.iterrows()
-            ]
-            display_df["memory %"] = [
-                (fmt_percent(row["mem_percent"]) if row["mem_percent"] != "N/A" else "N/A")
-                for _, row in display_df.iterrows()
-            ]
-
-            st.dataframe(
-                display_df[["node", "memory", "memory %", "cpu", "cpu %"]],
-                hide_index=True,
+    # ---------- 선택된 페이지의 모듈만 로드하여 렌더링 ----------
+    # 페이지가 선언한 데이터셋/클러스터만, 처음 접근하는 시점에 수집하거나 캐시에서 가져옴
+    view = load_view(str(page))
+    clusters = view.clusters(str(page), selected)
+    max_age = refresh_interval if refresh_interval > 0 else DEFAULT_MAX_AGE
+
+    def _load() -> dict[str, Any]:
+        if archive is not None and replay_at is not None:
+            data = archive.snapshot(clusters, view.DATASETS, replay_at)
+            # 리플레이에는 새로고침 간 변경 사항과 경보 상태가 없음
+            data["changes"] = []
+            data["alerts"] = []
+            st.info(
+                f"⏪ {datetime.fromtimestamp(replay_at):%Y-%m-%d %H:%M:%S} 시점에 기록된 스냅샷을 표시하는 중입니다 "
+                "(API 서버에 요청하지 않음)."
+            )
+            return data
+        store = _snapshot_store()
+        with st.spinner("클러스터 데이터를 수집하는 중..."):
+            data = store.get(clusters, view.DATASETS, max_age=max_age)
+        # 마지막 새로고침 이후 변경 사항 (Changes since last refresh 패널용)
+        data["changes"] = store.changes(clusters, view.DATASETS)
+        # 새로고침마다 평가된 경보 중 firing 상태인 것
+        data["alerts"] = store.alerts.alerts(clusters)
+
+        # 재시작 직후: 저장된 스냅샷을 나이와 함께 표시하고 새 수집이 끝나는 대로 교체
+        warm = store.warm(clusters, view.DATASETS)
+        if warm:
+            collected_at = store.collected_at(warm, view.DATASETS)
+            age = "" if collected_at is None else f"{_age(time.time() - collected_at)} 전에 "
+            st.warning(
+                f"🕒 {age}저장된 스냅샷을 표시하는 중입니다 ({', '.join(warm)}). "
+                "새 데이터를 수집하고 있으며 클러스터별로 수집이 끝나는 대로 교체됩니다."
             )
-        else:
-            st.info("노드 정보를 찾을 수 없습니다.")
-
-        # ------- Recent restarts -------
-        restarts = [r for r in data["recent_restarts"] if r["cluster"] == cluster]
-        if restarts:
-            st.subheader("Pods Restarted in Last Hour")
-            st.dataframe(pd.DataFrame(restarts))
-        else:
-            st.success("최근 1시간 내 재시작된 Pod가 없습니다.")
-
-    # ======================================================
-    # ================  Logs & Events  ====================
-    # ======================================================
-    elif page == "Logs & Events":
-        st.header("📜 Logs & Events")
-
-        # 탭 생성
-        tab1, tab2 = st.tabs(["Pod Logs", "Cluster Events"])
-
-        # Pod 로그 탭
-        with tab1:
-            st.subheader("Pod Logs")
-
-            # 클러스터 선택
-            cluster = st.selectbox("Select Cluster", selected)
-            if not cluster:
-                st.stop()
-
-            # 네임스페이스 목록 가져오기
-            core, _ = api_for(str(cluster))
-            namespaces = [ns.metadata.name for ns in core.list_namespace().items]
-            namespace = st.selectbox("Select Namespace", namespaces)
-            if not namespace:
-                st.stop()
-
-            # 선택한 네임스페이스의 Pod 목록 가져오기
-            pods = [pod.metadata.name for pod in core.list_namespaced_pod(namespace).items]
-            if not pods:
-                st.info(f"No pods found in namespace {namespace}")
-            else:
-                pod_name = st.selectbox("Select Pod", pods)
-                if not pod_name:
-                    st.stop()
-
-                # 선택한 Pod의 컨테이너 목록 가져오기
-                pod = core.read_namespaced_pod(pod_name, namespace)
-                containers = [container.name for container in pod.spec.containers]
-                container = st.selectbox("Select Container", containers)
-                if not container:
-                    st.stop()
-
-                # 로그 라인 수 선택
-                tail_lines = st.slider("Log Lines", min_value=10, max_value=500, value=100, step=10)
-
-                # 로그 가져오기
-                logs = _get_pod_logs(
-                    str(cluster),
-                    str(pod_name),
-                    str(namespace),
-                    str(container),
-                    tail_lines,
-                )
-
-                # 로그 표시
-                st.text_area("Pod Logs", logs, height=400)
-
-        # 클러스터 이벤트 탭
-        with tab2:
-            st.subheader("Cluster Events")
-
-            # 클러스터 및 네임스페이스 선택
-            col1, col2 = st.columns(2)
-            with col1:
-                event_cluster = st.selectbox("Select Cluster for Events", selected, key="event_cluster")
-                if not event_cluster:
-                    st.stop()
-
-            with col2:
-                event_namespaces = ["All Namespaces"] + [
-                    ns.metadata.name for ns in api_for(str(event_cluster))[0].list_namespace().items
-                ]
-                event_namespace = st.selectbox("Select Namespace for Events", event_namespaces)
-                if not event_namespace:
-                    st.stop()
-
-            # 이벤트 수 선택
-            event_limit = st.slider("Number of Events", min_value=10, max_value=500, value=100, step=10)
-
-            # 이벤트 가져오기
-            namespace_arg = None if event_namespace == "All Namespaces" else str(event_namespace)
-            events = _get_cluster_events(str(event_cluster), namespace=namespace_arg, limit=event_limit)
-
-            # 이벤트 표시
-            if events:
-                events_df = pd.DataFrame(events)
-                st.dataframe(
-                    events_df[["type", "reason", "object", "message", "time"]],
-                    height=400,
-                )
-            else:
-                st.info("No events found")
+            _await_refresh(clusters, view.DATASETS, warm)
+        return data
+
+    def _load_more(more_clusters: Sequence[str], datasets: frozenset[str]) -> dict[str, Any]:
+        # 노드 상세처럼 펼쳤을 때만 필요한 데이터셋 (페이지 데이터와 같은 주기로 캐시)
+        if archive is not None and replay_at is not None:
+            return archive.snapshot(more_clusters, datasets, replay_at)
+        return _snapshot_store().get(more_clusters, datasets, max_age=max_age)
+
+    view.render(str(page), selected, PageData(_load, _load_more))
+    # 이번 실행에서 만든 캐시까지 반영하도록 페이지를 그린 뒤 표시
+    _memory_panel(_memory_governor(), _snapshot_store())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,211 @@
+"""Snapshot diffing and change feed.
+
+이 모듈은 연속된 두 수집 결과(collect() 또는 collect_cluster() 형태)를 비교하여
+새로 비정상이 된 Pod, 회복된 Pod, 새 재시작, 노드 리소스 압박 변화를 찾아냅니다.
+각 레코드는 (cluster, namespace, pod) 또는 (cluster, node) 키와 비교 대상 필드의 해시로
+색인하므로 레코드 수에 비례하는 시간(O(n))에 비교합니다.
+
+비교 결과는 ChangeFeed에 순번과 함께 보관되어 대시보드 외의 소비자도
+마지막으로 읽은 순번 이후의 변경 사항만 가져갈 수 있습니다.
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+# 노드 CPU 또는 메모리 사용률이 이 값(%) 이상이면 리소스 압박 상태로 판단
+PRESSURE_THRESHOLD = 85.0
+
+# 변경 종류
+POD_UNHEALTHY = "pod_unhealthy"
+POD_CHANGED = "pod_changed"
+POD_RECOVERED = "pod_recovered"
+POD_RESTARTED = "pod_restarted"
+NODE_PRESSURE = "node_pressure"
+NODE_RELIEVED = "node_relieved"
+
+# 비정상 Pod 레코드에서 변경 여부를 판단하는 필드
+_POD_FIELDS = ("phase", "reason", "node")
+
+
+@dataclass(frozen=True)
+class Change:
+    """두 스냅샷 사이의 변경 사항 하나
+
+    Attributes:
+        kind (str): 변경 종류 (POD_UNHEALTHY 등)
+        cluster (str): Kubernetes 컨텍스트 이름
+        namespace (str | None): Pod 네임스페이스. 노드 변경이면 None
+        name (str): Pod 또는 노드 이름
+        detail (str): 사람이 읽을 수 있는 변경 내용
+    """
+
+    kind: str
+    cluster: str
+    namespace: str | None
+    name: str
+    detail: str
+
+    def to_dict(self) -> dict[str, Any]:
+        """변경 피드와 표에 사용하는 딕셔너리로 변환합니다."""
+        return {
+            "kind": self.kind,
+            "cluster": self.cluster,
+            "ns": self.namespace,
+            "name": self.name,
+            "detail": self.detail,
+        }
+
+
+def _fingerprint(row: Mapping[str, Any], fields: tuple[str, ...]) -> int:
+    return hash(tuple(row.get(field) for field in fields))
+
+
+def _pod_key(row: Mapping[str, Any]) -> tuple[Hashable, ...]:
+    return (row.get("cluster"), row.get("ns"), row.get("pod"))
+
+
+def _diff_non_running(old: list[dict[str, Any]], new: list[dict[str, Any]]) -> list[Change]:
+    """Non-running Pod 목록을 비교합니다."""
+    before = {_pod_key(row): (_fingerprint(row, _POD_FIELDS), row) for row in old}
+    changes: list[Change] = []
+    for row in new:
+        key = _pod_key(row)
+        previous = before.pop(key, None)
+        if previous is None:
+            kind, detail = POD_UNHEALTHY, f"{row.get('phase')} ({row.get('reason')})"
+        elif previous[0] != _fingerprint(row, _POD_FIELDS):
+            kind = POD_CHANGED
+            detail = f"{previous[1].get('phase')} → {row.get('phase')} ({row.get('reason')})"
+        else:
+            continue
+        changes.append(Change(kind, str(row.get("cluster")), row.get("ns"), str(row.get("pod")), detail))
+    # 새 스냅샷에 없는 Pod는 Running으로 회복되었거나 삭제된 Pod
+    for _, row in before.values():
+        changes.append(Change(POD_RECOVERED, str(row.get("cluster")), row.get("ns"), str(row.get("pod")), "Running"))
+    return changes
+
+
+def _diff_restarts(old: list[dict[str, Any]], new: list[dict[str, Any]]) -> list[Change]:
+    """재시작 목록을 비교하여 두 스냅샷 사이에 재시작한 컨테이너를 찾습니다.
+
+    목록은 구간별 재시작 수 상위 N개이므로, 새로 목록에 들어온 행은 순위만 올라왔을 수 있습니다.
+    이전 스냅샷에 있던 행은 24시간 재시작 수가 늘어난 경우, 새로 들어온 행은 최근 5분 안에 재시작한 경우만 보고합니다.
+    삭제된 Pod의 행(restarts가 None)은 건너뜁니다.
+    """
+    before = {(*_pod_key(row), row.get("container")): row.get("restarts_24h") or 0 for row in old}
+    changes: list[Change] = []
+    for row in new:
+        restarts = row.get("restarts")
+        if restarts is None:
+            continue
+        previous = before.get((*_pod_key(row), row.get("container")))
+        if previous is None:
+            delta = row.get("restarts_5m") or 0
+        else:
+            delta = (row.get("restarts_24h") or 0) - previous
+        if delta <= 0:
+            continue
+        detail = f"restarts {restarts} (+{delta})"
+        changes.append(Change(POD_RESTARTED, str(row.get("cluster")), row.get("ns"), str(row.get("pod")), detail))
+    return changes
+
+
+def _pressure(row: Mapping[str, Any], threshold: float) -> dict[str, float]:
+    """노드에서 임계값 이상인 리소스와 사용률을 반환합니다 (N/A 값은 무시)."""
+    usage = {"cpu": row.get("cpu_percent"), "memory": row.get("mem_percent")}
+    return {
+        resource: float(value)
+        for resource, value in usage.items()
+        if isinstance(value, int | float) and value >= threshold
+    }
+
+
+def _diff_nodes(old: list[dict[str, Any]], new: list[dict[str, Any]], threshold: float) -> list[Change]:
+    """노드 리소스 압박 상태 변화를 찾습니다."""
+    before = {(row.get("cluster"), row.get("node")): frozenset(_pressure(row, threshold)) for row in old}
+    changes: list[Change] = []
+    for row in new:
+        pressure = _pressure(row, threshold)
+        if frozenset(pressure) == before.get((row.get("cluster"), row.get("node")), frozenset()):
+            continue
+        if pressure:
+            kind = NODE_PRESSURE
+            detail = ", ".join(f"{resource} {value:.0f}%" for resource, value in pressure.items())
+        else:
+            kind, detail = NODE_RELIEVED, f"< {threshold:.0f}%"
+        changes.append(Change(kind, str(row.get("cluster")), None, str(row.get("node")), detail))
+    return changes
+
+
+def diff_snapshots(
+    old: Mapping[str, Any],
+    new: Mapping[str, Any],
+    pressure_threshold: float = PRESSURE_THRESHOLD,
+) -> list[Change]:
+    """두 스냅샷 사이의 변경 사항을 반환합니다.
+
+    두 스냅샷에 모두 있는 키만 비교하므로 일부 데이터셋만 담긴 스냅샷도 비교할 수 있습니다.
+
+    Args:
+        old (Mapping[str, Any]): 이전 collect() 또는 collect_cluster() 결과
+        new (Mapping[str, Any]): 새 collect() 또는 collect_cluster() 결과
+        pressure_threshold (float, optional): 노드 리소스 압박 임계값(%). 기본값은 PRESSURE_THRESHOLD
+
+    Returns:
+        list[Change]: 비정상/변경/회복 Pod, 재시작 Pod, 노드 압박 변화 순서의 변경 목록
+    """
+    changes: list[Change] = []
+    if "non_running_pods" in old and "non_running_pods" in new:
+        changes.extend(_diff_non_running(old["non_running_pods"], new["non_running_pods"]))
+    if "recent_restarts" in old and "recent_restarts" in new:
+        changes.extend(_diff_restarts(old["recent_restarts"], new["recent_restarts"]))
+    if "node_metrics" in old and "node_metrics" in new:
+        changes.extend(_diff_nodes(old["node_metrics"], new["node_metrics"], pressure_threshold))
+    return changes
+
+
+class ChangeFeed:
+    """순번이 매겨진 변경 사항의 고정 크기 버퍼
+
+    소비자는 since()에 마지막으로 받은 순번을 전달하여 그 이후의 변경 사항만 가져갑니다.
+    버퍼가 가득 차면 가장 오래된 항목부터 버립니다.
+    """
+
+    def __init__(self, maxlen: int = 1000) -> None:
+        self._entries: deque[tuple[int, float, Change]] = deque(maxlen=maxlen)
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def publish(self, changes: Iterable[Change]) -> int:
+        """변경 사항을 피드에 추가합니다.
+
+        Args:
+            changes (Iterable[Change]): 추가할 변경 사항
+
+        Returns:
+            int: 마지막으로 추가된 항목의 순번
+        """
+        now = time.time()
+        with self._lock:
+            for change in changes:
+                self._seq += 1
+                self._entries.append((self._seq, now, change))
+            return self._seq
+
+    def since(self, seq: int = 0) -> tuple[int, list[dict[str, Any]]]:
+        """지정한 순번 이후의 변경 사항을 반환합니다.
+
+        Args:
+            seq (int, optional): 마지막으로 받은 순번. 기본값은 0 (보관된 전체)
+
+        Returns:
+            tuple: (현재 마지막 순번, seq/ts 필드를 포함한 변경 사항 딕셔너리 목록)
+        """
+        with self._lock:
+            entries = [entry for entry in self._entries if entry[0] > seq]
+            latest = self._seq
+        return latest, [{"seq": n, "ts": ts, **change.to_dict()} for n, ts, change in entries]
@@ -0,0 +1,125 @@
+"""Event-to-object join index.
+
+이 모듈은 클러스터 이벤트를 관련 오브젝트(involvedObject)의 클러스터, 네임스페이스, 종류, 이름으로 묶은 색인을 제공합니다.
+수집 시 오브젝트마다 마지막 관련 이벤트 하나만 남기고(latest_events()), 색인은 같은 행 목록에 대해 한 번만 만들어
+세션과 재실행 사이에서 재사용하므로(event_index()), Non-Running Pod나 재시작 표는 행마다 이벤트 API를 호출하지 않고
+O(1) 조회로 "왜" 비정상인지 보여 주는 마지막 관련 이벤트를 표시할 수 있습니다.
+
+오브젝트마다 남기는 이벤트는 가장 최근의 Warning 이벤트이며, Warning이 없으면 가장 최근 이벤트입니다.
+"""
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any
+
+from kubernetes_dashboard.records import EventRow
+from kubernetes_dashboard.rowcache import RowCache
+
+# 정상 이벤트보다 우선하는 이벤트 타입
+WARNING = "Warning"
+# 보관하는 색인 최대 개수
+_CACHE_SIZE = 8
+
+event_cache = RowCache("events", _CACHE_SIZE)
+
+
+def latest_events(rows: Iterable[EventRow]) -> list[EventRow]:
+    """오브젝트마다 마지막 관련 이벤트 하나만 남깁니다.
+
+    Args:
+        rows (Iterable[EventRow]): 최신 이벤트부터 정렬된 이벤트 목록 (collectors._get_cluster_events() 결과)
+
+    Returns:
+        list[EventRow]: 오브젝트별 마지막 관련 이벤트
+    """
+    latest: dict[tuple[str, str | None, str], EventRow] = {}
+    for row in rows:
+        key = (row.cluster, row.ns, row.object)
+        current = latest.get(key)
+        # 최신 이벤트부터 순회하므로 먼저 본 이벤트를 유지하고, Warning만 앞선 Normal 이벤트를 대체
+        if current is None or (row.type == WARNING and current.type != WARNING):
+            latest[key] = row
+    return list(latest.values())
+
+
+class EventIndex:
+    """오브젝트별 마지막 관련 이벤트 색인"""
+
+    __slots__ = ("_latest",)
+
+    def __init__(self, rows: Iterable[EventRow]) -> None:
+        """색인을 만듭니다.
+
+        Args:
+            rows (Iterable[EventRow]): 오브젝트별 마지막 관련 이벤트 (latest_events() 결과, 여러 클러스터 병합 가능)
+        """
+        self._latest = {(row.cluster, row.ns, row.object): row for row in rows}
+
+    def __len__(self) -> int:
+        return len(self._latest)
+
+    def latest(self, cluster: str, kind: str, ns: str | None, name: str) -> EventRow | None:
+        """오브젝트의 마지막 관련 이벤트를 반환합니다.
+
+        Args:
+            cluster (str): Kubernetes 컨텍스트 이름
+            kind (str): 오브젝트 종류 (Pod, Node 등)
+            ns (str | None): 네임스페이스. 클러스터 범위 오브젝트는 None 또는 빈 문자열
+            name (str): 오브젝트 이름
+
+        Returns:
+            EventRow | None: 마지막 관련 이벤트. 없으면 None
+        """
+        return self._latest.get((cluster, ns or None, f"{kind}/{name}"))
+
+
+def event_index(rows: Sequence[EventRow]) -> EventIndex:
+    """행 목록에 대한 EventIndex를 반환합니다 (같은 행 객체 목록이면 캐시된 것을 재사용).
+
+    SnapshotStore는 새로고침 전까지 같은 행 객체를 반환하므로 views.table.table_store()와 같이
+    행 객체의 id 목록으로 캐시를 찾습니다 (rowcache.RowCache 참고).
+
+    Args:
+        rows (Sequence[EventRow]): 오브젝트별 마지막 관련 이벤트 (collect() 결과의 latest_events)
+
+    Returns:
+        EventIndex: 행 목록의 색인
+    """
+    return event_cache.get(rows, EventIndex)
+
+
+def describe(event: EventRow | None) -> str:
+    """이벤트를 표에 표시할 한 줄 설명("Reason: message")으로 변환합니다.
+
+    Args:
+        event (EventRow | None): 이벤트
+
+    Returns:
+        str: 설명. 이벤트가 없으면 빈 문자열
+    """
+    if event is None:
+        return ""
+    message = " ".join((event.message or "").split())
+    return f"{event.reason}: {message}" if event.reason else message
+
+
+def last_event_column(
+    rows: Sequence[EventRow], kind: str = "Pod", name: str = "pod"
+) -> Callable[[Mapping[str, Any]], str]:
+    """행의 마지막 관련 이벤트 설명을 반환하는 함수를 만듭니다.
+
+    views.table.render_table()의 계산 열로 사용하며, 현재 페이지의 행마다 색인을 한 번씩 조회합니다.
+
+    Args:
+        rows (Sequence[EventRow]): 오브젝트별 마지막 관련 이벤트 (collect() 결과의 latest_events)
+        kind (str, optional): 행이 가리키는 오브젝트 종류. 기본값은 "Pod"
+        name (str, optional): 오브젝트 이름이 담긴 열 (네임스페이스는 ns 열). 기본값은 "pod"
+
+    Returns:
+        Callable[[Mapping[str, Any]], str]: 행 → 마지막 관련 이벤트 설명
+    """
+    index = event_index(rows)
+
+    def column(row: Mapping[str, Any]) -> str:
+        return describe(index.latest(row["cluster"], kind, row.get("ns"), row[name]))
+
+    return column
@@ -0,0 +1,399 @@
+"""Headless Prometheus exporter for collected cluster data.
+
+이 모듈은 Streamlit 없이 collect()가 계산하는 지표(전체 Pod 수, non-running Pod 수,
+노드 CPU/메모리 사용률, 최근 재시작 수)를 주기적으로 수집하여
+Prometheus text format으로 `/metrics` 엔드포인트에 노출합니다.
+
+주요 기능:
+- 백그라운드 스레드에서 주기적으로 클러스터 데이터 수집
+- 마지막 스냅샷을 미리 렌더링해 두고 scrape 시에는 캐시된 본문만 반환 (apiserver 호출 없음)
+- 노드 단위 시계열 개수 상한 및 phase 라벨 정규화로 라벨 cardinality 제한
+- 수집 간 변경 사항을 `/changes?since=<seq>` 엔드포인트로 NDJSON 변경 피드 제공
+"""
+
+import argparse
+import json
+import threading
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs
+
+from kubernetes_dashboard.collectors import collect_cluster
+from kubernetes_dashboard.diff import ChangeFeed, diff_snapshots
+from kubernetes_dashboard.kube_client import context_names
+from kubernetes_dashboard.procpool import set_processes
+from kubernetes_dashboard.profiling import COLLECT, profiled
+from kubernetes_dashboard.restarts import WINDOWS
+
+# 재시작 수를 노출하는 구간 이름 (5m, 1h, 24h)
+RESTART_WINDOWS = tuple(name for name, _ in WINDOWS)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+CHANGES_CONTENT_TYPE = "application/x-ndjson; charset=utf-8"
+
+# 라벨 값으로 허용하는 Pod phase (그 외 값은 "Other"로 묶음)
+_KNOWN_PHASES = frozenset({"Pending", "Succeeded", "Failed", "Unknown"})
+
+_HELP: Mapping[str, tuple[str, str]] = {
+    "kubernetes_dashboard_pods": ("gauge", "Total number of pods in the cluster."),
+    "kubernetes_dashboard_non_running_pods": ("gauge", "Number of pods whose phase is not Running."),
+    "kubernetes_dashboard_recent_restarts": ("gauge", "Number of containers restarted within the last hour."),
+    "kubernetes_dashboard_container_restarts": (
+        "gauge",
+        "Container restarts observed within the window (top restarting containers only).",
+    ),
+    "kubernetes_dashboard_nodes": ("gauge", "Number of nodes reported by the collector."),
+    "kubernetes_dashboard_node_cpu_percent_max": ("gauge", "Highest node CPU usage percent in the cluster."),
+    "kubernetes_dashboard_node_memory_percent_max": ("gauge", "Highest node memory usage percent in the cluster."),
+    "kubernetes_dashboard_node_cpu_percent": ("gauge", "Node CPU usage percent (top nodes only)."),
+    "kubernetes_dashboard_node_memory_percent": ("gauge", "Node memory usage percent (top nodes only)."),
+    "kubernetes_dashboard_collect_success": ("gauge", "Whether the last collection of the cluster succeeded."),
+    "kubernetes_dashboard_collect_duration_seconds": ("gauge", "Duration of the last collection of the cluster."),
+    "kubernetes_dashboard_last_success_timestamp_seconds": (
+        "gauge",
+        "Unix time of the last successful collection of the cluster.",
+    ),
+}
+
+
+def _escape(value: str) -> str:
+    """Prometheus 라벨 값을 이스케이프합니다.
+
+    Args:
+        value (str): 라벨 값
+
+    Returns:
+        str: 백슬래시, 큰따옴표, 개행이 이스케이프된 문자열
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _sample(name: str, labels: Mapping[str, str], value: float) -> str:
+    """단일 샘플 라인을 생성합니다."""
+    label_str = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+    return f"{name}{{{label_str}}} {float(value):g}"
+
+
+def _numeric(value: Any) -> float | None:
+    """'N/A' 등 숫자가 아닌 메트릭 값을 None으로 변환합니다."""
+    if isinstance(value, int | float):
+        return float(value)
+    return None
+
+
+def render_metrics(
+    snapshots: Mapping[str, dict[str, Any]],
+    status: Mapping[str, Mapping[str, float]] | None = None,
+    max_node_series: int = 50,
+) -> str:
+    """클러스터별 스냅샷을 Prometheus text format으로 렌더링합니다.
+
+    노드 단위 시계열은 전체 fleet에서 CPU/메모리 사용률이 가장 높은
+    `max_node_series`개 노드로 제한하고, 나머지는 클러스터 단위 집계만 노출합니다.
+
+    Args:
+        snapshots (Mapping[str, dict]): 컨텍스트 이름 → collect_cluster() 결과
+        status (Mapping[str, Mapping[str, float]], optional): 컨텍스트 이름 → 수집 상태
+            (success, duration, last_success)
+        max_node_series (int, optional): 노출할 노드 단위 시계열 최대 개수. 기본값은 50
+
+    Returns:
+        str: Prometheus text exposition format 문자열
+    """
+    samples: dict[str, list[str]] = {name: [] for name in _HELP}
+    top_nodes: list[tuple[float, str, str, float | None, float | None]] = []
+
+    for cluster in sorted(snapshots):
+        data = snapshots[cluster]
+        labels = {"cluster": cluster}
+        samples["kubernetes_dashboard_pods"].append(_sample("kubernetes_dashboard_pods", labels, data["total_pods"]))
+
+        phases: dict[str, int] = dict.fromkeys(sorted(_KNOWN_PHASES | {"Other"}), 0)
+        for pod in data["non_running_pods"]:
+            phase = pod["phase"] if pod["phase"] in _KNOWN_PHASES else "Other"
+            phases[phase] += 1
+        for phase, count in phases.items():
+            samples["kubernetes_dashboard_non_running_pods"].append(
+                _sample("kubernetes_dashboard_non_running_pods", {**labels, "phase": phase}, count)
+            )
+
+        restarts = data["recent_restarts"]
+        samples["kubernetes_dashboard_recent_restarts"].append(
+            _sample(
+                "kubernetes_dashboard_recent_restarts",
+                labels,
+                sum(1 for row in restarts if row.get("restarts_1h", 0) > 0),
+            )
+        )
+        for window in RESTART_WINDOWS:
+            samples["kubernetes_dashboard_container_restarts"].append(
+                _sample(
+                    "kubernetes_dashboard_container_restarts",
+                    {**labels, "window": window},
+                    sum(row.get(f"restarts_{window}", 0) for row in restarts),
+                )
+            )
+
+        nodes = data["node_metrics"]
+        samples["kubernetes_dashboard_nodes"].append(_sample("kubernetes_dashboard_nodes", labels, len(nodes)))
+        cpu_values = [v for v in (_numeric(n["cpu_percent"]) for n in nodes) if v is not None]
+        mem_values = [v for v in (_numeric(n["mem_percent"]) for n in nodes) if v is not None]
+        if cpu_values:
+            samples["kubernetes_dashboard_node_cpu_percent_max"].append(
+                _sample("kubernetes_dashboard_node_cpu_percent_max", labels, max(cpu_values))
+            )
+        if mem_values:
+            samples["kubernetes_dashboard_node_memory_percent_max"].append(
+                _sample("kubernetes_dashboard_node_memory_percent_max", labels, max(mem_values))
+            )
+
+        for node in nodes:
+            cpu = _numeric(node["cpu_percent"])
+            mem = _numeric(node["mem_percent"])
+            if cpu is None and mem is None:
+                continue
+            top_nodes.append((max(cpu or 0.0, mem or 0.0), cluster, node["node"], cpu, mem))
+
+    # 사용률이 높은 노드만 노드 단위 시계열로 노출
+    top_nodes.sort(key=lambda item: item[0], reverse=True)
+    for _, cluster, node_name, cpu, mem in sorted(top_nodes[:max_node_series], key=lambda item: item[1:3]):
+        labels = {"cluster": cluster, "node": node_name}
+        if cpu is not None:
+            samples["kubernetes_dashboard_node_cpu_percent"].append(
+                _sample("kubernetes_dashboard_node_cpu_percent", labels, cpu)
+            )
+        if mem is not None:
+            samples["kubernetes_dashboard_node_memory_percent"].append(
+                _sample("kubernetes_dashboard_node_memory_percent", labels, mem)
+            )
+
+    for cluster in sorted(status or {}):
+        labels = {"cluster": cluster}
+        state = (status or {})[cluster]
+        samples["kubernetes_dashboard_collect_success"].append(
+            _sample("kubernetes_dashboard_collect_success", labels, state.get("success", 0.0))
+        )
+        samples["kubernetes_dashboard_collect_duration_seconds"].append(
+            _sample("kubernetes_dashboard_collect_duration_seconds", labels, state.get("duration", 0.0))
+        )
+        if state.get("last_success"):
+            samples["kubernetes_dashboard_last_success_timestamp_seconds"].append(
+                _sample("kubernetes_dashboard_last_success_timestamp_seconds", labels, state["last_success"])
+            )
+
+    lines: list[str] = []
+    for name, (metric_type, help_text) in _HELP.items():
+        if not samples[name]:
+            continue
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        lines.extend(samples[name])
+    return "\n".join(lines) + "\n"
+
+
+class MetricsCache:
+    """마지막 수집 결과와 렌더링된 /metrics 본문을 보관합니다.
+
+    수집 스레드가 update()로 클러스터 스냅샷을 갱신할 때마다 본문을 다시 렌더링하고,
+    scrape 요청은 body()로 미리 렌더링된 바이트만 읽어 갑니다.
+    수집에 실패한 클러스터는 마지막으로 성공한 스냅샷을 유지합니다.
+    성공한 스냅샷은 이전 스냅샷과 비교하여 변경 사항을 `feed`에 게시합니다.
+    """
+
+    def __init__(self, max_node_series: int = 50) -> None:
+        self.max_node_series = max_node_series
+        self._lock = threading.Lock()
+        self._snapshots: dict[str, dict[str, Any]] = {}
+        self._status: dict[str, dict[str, float]] = {}
+        self._body = render_metrics({}).encode("utf-8")
+        self.feed = ChangeFeed()
+
+    def update(self, cluster: str, snapshot: dict[str, Any] | None, duration: float) -> None:
+        """클러스터의 수집 결과를 반영하고 본문을 다시 렌더링합니다.
+
+        Args:
+            cluster (str): Kubernetes 컨텍스트 이름
+            snapshot (dict | None): collect_cluster() 결과. 수집 실패 시 None
+            duration (float): 수집에 걸린 시간(초)
+        """
+        with self._lock:
+            state = self._status.setdefault(cluster, {})
+            state["duration"] = duration
+            if snapshot is None:
+                state["success"] = 0.0
+            else:
+                if cluster in self._snapshots:
+                    self.feed.publish(diff_snapshots(self._snapshots[cluster], snapshot))
+                self._snapshots[cluster] = snapshot
+                state["success"] = 1.0
+                state["last_success"] = time.time()
+            self._body = render_metrics(self._snapshots, self._status, self.max_node_series).encode("utf-8")
+
+    def body(self) -> bytes:
+        """미리 렌더링된 /metrics 본문을 반환합니다."""
+        with self._lock:
+            return self._body
+
+
+def collect_once(cache: MetricsCache, contexts: Sequence[str], pool: ThreadPoolExecutor) -> None:
+    """모든 컨텍스트를 한 번 수집하여 캐시에 반영합니다.
+
+    클러스터 하나의 수집 실패가 다른 클러스터의 갱신을 막지 않도록 개별적으로 처리합니다.
+
+    Args:
+        cache (MetricsCache): 결과를 저장할 캐시
+        contexts (Sequence[str]): 수집할 Kubernetes 컨텍스트 이름 목록
+        pool (ThreadPoolExecutor): 클러스터별 수집에 사용할 스레드 풀
+    """
+
+    def _run(ctx: str) -> None:
+        started = time.monotonic()
+        try:
+            snapshot: dict[str, Any] | None = collect_cluster(ctx)
+        except Exception as e:
+            print(f"Error collecting metrics from cluster {ctx}: {e}")
+            snapshot = None
+        cache.update(ctx, snapshot, time.monotonic() - started)
+
+    with profiled(COLLECT, "exporter"):
+        list(pool.map(_run, contexts))
+
+
+def _collector_loop(
+    cache: MetricsCache,
+    contexts: Sequence[str],
+    interval: float,
+    stop: threading.Event,
+) -> None:
+    """stop 이벤트가 설정될 때까지 interval 간격으로 수집을 반복합니다."""
+    with ThreadPoolExecutor(max_workers=min(32, max(1, len(contexts)))) as pool:
+        while not stop.is_set():
+            started = time.monotonic()
+            collect_once(cache, contexts, pool)
+            stop.wait(max(0.0, interval - (time.monotonic() - started)))
+
+
+def make_handler(cache: MetricsCache) -> type[BaseHTTPRequestHandler]:
+    """캐시된 본문을 반환하는 HTTP 요청 핸들러 클래스를 생성합니다.
+
+    Args:
+        cache (MetricsCache): scrape 시 읽을 캐시
+
+    Returns:
+        type[BaseHTTPRequestHandler]: `/metrics`, `/changes`, `/healthz`를 처리하는 핸들러 클래스
+    """
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            path, _, query = self.path.partition("?")
+            headers: dict[str, str] = {}
+            if path == "/metrics":
+                body = cache.body()
+                content_type = CONTENT_TYPE
+            elif path == "/changes":
+                # 소비자는 X-Change-Seq 값을 다음 요청의 since로 전달
+                try:
+                    since = int(parse_qs(query).get("since", ["0"])[0])
+                except ValueError:
+                    self.send_error(400, "since must be an integer")
+                    return
+                latest, entries = cache.feed.since(since)
+                body = "".join(json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries).encode("utf-8")
+                content_type = CHANGES_CONTENT_TYPE
+                headers["X-Change-Seq"] = str(latest)
+            elif path == "/healthz":
+                body = b"ok\n"
+                content_type = "text/plain; charset=utf-8"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            # scrape마다 접근 로그를 남기지 않음
+            return
+
+    return _Handler
+
+
+def _parse_args(argv: Iterable[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="dashboard-exporter",
+        description="Serve collected Kubernetes dashboard metrics in Prometheus text format.",
+    )
+    parser.add_argument(
+        "--context",
+        action="append",
+        dest="contexts",
+        help="수집할 컨텍스트 (여러 번 지정 가능, 기본값: kubeconfig의 모든 컨텍스트)",
+    )
+    parser.add_argument("--host", default="0.0.0.0", help="바인드 주소 (기본값: 0.0.0.0)")
+    parser.add_argument("--port", type=int, default=9808, help="리스닝 포트 (기본값: 9808)")
+    parser.add_argument("--interval", type=float, default=30.0, help="수집 간격(초) (기본값: 30)")
+    parser.add_argument(
+        "--max-node-series",
+        type=int,
+        default=50,
+        help="노드 단위 시계열 최대 개수 (기본값: 50)",
+    )
+    parser.add_argument(
+        "--processes",
+        default=None,
+        help="클러스터 수집에 사용할 워커 프로세스 수 (auto: CPU 수, 기본값: DASHBOARD_COLLECT_PROCESSES 또는 0)",
+    )
+    return parser.parse_args(None if argv is None else list(argv))
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    """Exporter 진입점
+
+    수집 스레드를 시작하고 `/metrics` HTTP 서버를 실행합니다.
+
+    Args:
+        argv (Iterable[str], optional): 명령행 인자. 기본값은 sys.argv[1:]
+
+    Returns:
+        int: 프로세스 종료 코드
+    """
+    args = _parse_args(argv)
+    contexts = args.contexts or context_names()
+    if not contexts:
+        print("No Kubernetes contexts found.")
+        return 1
+
+    if args.processes is not None:
+        set_processes(args.processes)
+
+    cache = MetricsCache(max_node_series=args.max_node_series)
+    stop = threading.Event()
+    collector = threading.Thread(
+        target=_collector_loop,
+        args=(cache, contexts, args.interval, stop),
+        name="metrics-collector",
+        daemon=True,
+    )
+    collector.start()
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(cache))
+    print(f"Serving metrics for {len(contexts)} contexts on http://{args.host}:{args.port}/metrics")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
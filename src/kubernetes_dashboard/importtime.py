@@ -0,0 +1,137 @@
+"""Import-time profiling report.
+
+이 모듈은 새 Python 인터프리터에서 `-X importtime` 옵션으로 모듈을 import하여
+모듈별 import 시간을 측정하고, 시작 시간에 가장 큰 영향을 주는 모듈을 보고서로 출력합니다.
+
+사용 예:
+    python -m kubernetes_dashboard importtime
+    python -m kubernetes_dashboard importtime kubernetes_dashboard.views.overview --top 20
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+DEFAULT_MODULES = (
+    "kubernetes_dashboard.dashboard",
+    "kubernetes_dashboard.views.overview",
+    "kubernetes_dashboard.snapshot",
+)
+
+# 예: "import time:       469 |      37018 |         importlib.resources._common"
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)\s*$")
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """단일 모듈의 import 시간 (마이크로초)"""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """`-X importtime` 출력(stderr)을 파싱합니다.
+
+    Args:
+        output (str): `-X importtime` stderr 출력
+
+    Returns:
+        list[ImportTiming]: import가 완료된 순서대로 정렬된 모듈별 측정값
+    """
+    timings: list[ImportTiming] = []
+    for line in output.splitlines():
+        match = _LINE_RE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        # 최상위 import는 공백 1칸, 중첩될 때마다 2칸씩 들여쓰기됨
+        timings.append(ImportTiming(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return timings
+
+
+def profile_import(module: str) -> list[ImportTiming]:
+    """새 인터프리터에서 모듈을 import하며 import 시간을 측정합니다.
+
+    Args:
+        module (str): 측정할 모듈 이름
+
+    Returns:
+        list[ImportTiming]: 모듈별 측정값
+
+    Raises:
+        subprocess.CalledProcessError: 모듈 import에 실패한 경우
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(p for p in sys.path if p)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return parse_importtime(result.stderr)
+
+
+def format_report(module: str, timings: Sequence[ImportTiming], top: int = 15) -> str:
+    """측정값을 사람이 읽기 쉬운 보고서 문자열로 변환합니다.
+
+    Args:
+        module (str): 측정한 모듈 이름
+        timings (Sequence[ImportTiming]): parse_importtime() 결과
+        top (int, optional): 섹션별로 표시할 모듈 수. 기본값은 15
+
+    Returns:
+        str: 전체 import 시간, 최상위 패키지별 누적 시간, self 시간 상위 모듈을 담은 보고서
+    """
+    target = next((t for t in timings if t.module == module), None)
+    total_ms = (target.cumulative_us if target else sum(t.self_us for t in timings)) / 1000
+
+    # 최상위 패키지 기준 누적 self 시간
+    packages: dict[str, int] = {}
+    for t in timings:
+        root = t.module.split(".", 1)[0]
+        packages[root] = packages.get(root, 0) + t.self_us
+
+    lines = [f"Import profile for {module}: {total_ms:.1f} ms, {len(timings)} modules", ""]
+    lines.append(f"Top {top} packages by total self time:")
+    for root, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]:
+        lines.append(f"  {self_us / 1000:9.1f} ms  {root}")
+    lines.append("")
+    lines.append(f"Top {top} modules by self time:")
+    for t in sorted(timings, key=lambda item: item.self_us, reverse=True)[:top]:
+        lines.append(f"  {t.self_us / 1000:9.1f} ms  {t.module}")
+    return "\n".join(lines)
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    """Import-time 보고서 CLI 진입점
+
+    Args:
+        argv (Iterable[str], optional): 명령행 인자. 기본값은 sys.argv[1:]
+
+    Returns:
+        int: 프로세스 종료 코드
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m kubernetes_dashboard importtime",
+        description="Report which imports dominate dashboard start-up time.",
+    )
+    parser.add_argument("modules", nargs="*", default=list(DEFAULT_MODULES), help="측정할 모듈")
+    parser.add_argument("--top", type=int, default=15, help="섹션별로 표시할 모듈 수 (기본값: 15)")
+    args = parser.parse_args(None if argv is None else list(argv))
+
+    for module in args.modules:
+        print(format_report(module, profile_import(module), args.top))
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
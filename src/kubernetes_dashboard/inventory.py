@@ -0,0 +1,194 @@
+"""Node inventory cache.
+
+이 모듈은 노드의 거의 바뀌지 않는 정보(capacity, allocatable, labels, taints, conditions)를
+클러스터별로 캐시합니다. 새로고침마다 list_node()를 다시 호출하지 않고, 느린 TTL이 지났거나
+메트릭에 캐시에 없는 노드가 나타났을 때만 노드 목록을 다시 조회합니다.
+다시 조회할 때도 resourceVersion이 같은 노드는 이전에 변환한 항목을 그대로 재사용합니다.
+
+또한 metrics-server가 없어 404를 반환한 클러스터를 기억하여,
+재확인 주기가 지나기 전에는 metrics.k8s.io를 다시 호출하지 않도록 합니다.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from kubernetes_dashboard.quantity import cpu_to_cores, mem_to_bytes
+from kubernetes_dashboard.records import intern
+
+# 노드 목록을 다시 조회하는 주기(초)
+INVENTORY_TTL = 300.0
+# metrics-server가 없는 클러스터를 다시 확인하는 주기(초)
+METRICS_RETRY = 300.0
+
+
+@dataclass(frozen=True, slots=True)
+class NodeInfo:
+    """노드 한 개의 인벤토리 정보
+
+    Attributes:
+        name (str): 노드 이름
+        resource_version (str | None): 노드 객체의 resourceVersion
+        cpu (float): CPU capacity (코어)
+        mem (float): 메모리 capacity (바이트)
+        cpu_allocatable (float): 할당 가능한 CPU (코어)
+        mem_allocatable (float): 할당 가능한 메모리 (바이트)
+        labels (dict): 노드 레이블
+        taints (tuple): "key=value:effect" 형태의 taint 목록
+        conditions (dict): condition 종류 → 상태 ("True"/"False"/"Unknown")
+    """
+
+    name: str
+    resource_version: str | None
+    cpu: float
+    mem: float
+    cpu_allocatable: float
+    mem_allocatable: float
+    labels: dict[str, str]
+    taints: tuple[str, ...]
+    conditions: dict[str, str]
+
+
+def node_info(node: Any) -> NodeInfo:
+    """V1Node 객체를 NodeInfo로 변환합니다.
+
+    Args:
+        node (V1Node): list_node() 결과의 노드 객체
+
+    Returns:
+        NodeInfo: 노드 인벤토리 정보. allocatable이 없으면 capacity 값을 사용
+    """
+    capacity = node.status.capacity or {}
+    allocatable = node.status.allocatable or capacity
+    taints = tuple(
+        intern(f"{t.key}={t.value}:{t.effect}" if t.value else f"{t.key}:{t.effect}") for t in node.spec.taints or []
+    )
+    return NodeInfo(
+        name=intern(node.metadata.name),
+        resource_version=node.metadata.resource_version,
+        cpu=cpu_to_cores(capacity.get("cpu", "0")),
+        mem=mem_to_bytes(capacity.get("memory", "0")),
+        cpu_allocatable=cpu_to_cores(allocatable.get("cpu", "0")),
+        mem_allocatable=mem_to_bytes(allocatable.get("memory", "0")),
+        labels={intern(k): intern(v) for k, v in (node.metadata.labels or {}).items()},
+        taints=taints,
+        conditions={intern(c.type): intern(c.status) for c in node.status.conditions or []},
+    )
+
+
+class NodeInventory:
+    """클러스터별 노드 인벤토리와 metrics-server 가용 여부 캐시
+
+    Attributes:
+        ttl (float): 노드 목록을 다시 조회하는 주기(초)
+        metrics_retry (float): metrics-server가 없는 클러스터를 다시 확인하는 주기(초)
+    """
+
+    def __init__(
+        self,
+        ttl: float = INVENTORY_TTL,
+        metrics_retry: float = METRICS_RETRY,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.metrics_retry = metrics_retry
+        self._clock = clock
+        # cluster → (조회 시각, 노드 이름 → NodeInfo)
+        self._nodes: dict[str, tuple[float, dict[str, NodeInfo]]] = {}
+        # cluster → metrics-server 404를 받은 시각
+        self._no_metrics: dict[str, float] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def _lock_for(self, cluster: str) -> threading.Lock:
+        with self._guard:
+            return self._locks.setdefault(cluster, threading.Lock())
+
+    def nodes(
+        self,
+        cluster: str,
+        list_nodes: Callable[[], Iterable[Any]],
+        expect: Iterable[str] = (),
+    ) -> dict[str, NodeInfo]:
+        """클러스터의 노드 인벤토리를 반환합니다.
+
+        캐시가 없거나 TTL이 지났거나, expect에 캐시에 없는 노드가 있으면 list_nodes()로 다시 조회합니다.
+
+        Args:
+            cluster (str): Kubernetes 컨텍스트 이름
+            list_nodes (Callable): V1Node 목록을 반환하는 함수
+            expect (Iterable[str], optional): 존재해야 하는 노드 이름 (메트릭에 나타난 노드 등)
+
+        Returns:
+            dict[str, NodeInfo]: 노드 이름 → NodeInfo
+        """
+        with self._lock_for(cluster):
+            entry = self._nodes.get(cluster)
+            now = self._clock()
+            if entry is not None and now - entry[0] <= self.ttl and all(name in entry[1] for name in expect):
+                return entry[1]
+            previous = entry[1] if entry is not None else {}
+            nodes: dict[str, NodeInfo] = {}
+            for node in list_nodes():
+                cached = previous.get(node.metadata.name)
+                # resourceVersion이 같으면 이전 변환 결과를 재사용
+                if cached is not None and cached.resource_version == node.metadata.resource_version:
+                    nodes[cached.name] = cached
+                else:
+                    info = node_info(node)
+                    nodes[info.name] = info
+            self._nodes[cluster] = (now, nodes)
+            return nodes
+
+    def metrics_available(self, cluster: str) -> bool:
+        """metrics-server 호출을 시도해도 되는지 반환합니다.
+
+        Args:
+            cluster (str): Kubernetes 컨텍스트 이름
+
+        Returns:
+            bool: 404를 받은 적이 없거나 재확인 주기가 지났으면 True
+        """
+        missing_since = self._no_metrics.get(cluster)
+        return missing_since is None or self._clock() - missing_since > self.metrics_retry
+
+    def mark_metrics_unavailable(self, cluster: str) -> bool:
+        """metrics-server가 없는 클러스터로 기록합니다.
+
+        Args:
+            cluster (str): Kubernetes 컨텍스트 이름
+
+        Returns:
+            bool: 새로 확인된 경우 True (이미 기록되어 있던 클러스터를 재확인한 경우 False)
+        """
+        first = cluster not in self._no_metrics
+        self._no_metrics[cluster] = self._clock()
+        return first
+
+    def mark_metrics_available(self, cluster: str) -> None:
+        """metrics-server 응답을 받은 클러스터의 404 기록을 제거합니다.
+
+        Args:
+            cluster (str): Kubernetes 컨텍스트 이름
+        """
+        self._no_metrics.pop(cluster, None)
+
+    def invalidate(self, clusters: Iterable[str] | None = None) -> None:
+        """캐시를 제거하여 다음 요청에서 노드 목록과 metrics-server를 다시 확인하도록 합니다.
+
+        Args:
+            clusters (Iterable[str], optional): 제거할 클러스터. 기본값은 None (전체)
+        """
+        targets = list(self._nodes.keys() | self._no_metrics.keys()) if clusters is None else clusters
+        for cluster in targets:
+            self._nodes.pop(cluster, None)
+            self._no_metrics.pop(cluster, None)
+
+
+@lru_cache(maxsize=1)
+def node_inventory() -> NodeInventory:
+    """프로세스 전체에서 공유하는 노드 인벤토리 캐시를 반환합니다."""
+    return NodeInventory()
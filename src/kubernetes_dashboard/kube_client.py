@@ -3,6 +3,9 @@
 이 모듈은 Kubernetes API 클라이언트를 생성하고 캐싱하는 기능을 제공합니다.
 각 클러스터 컨텍스트별로 API 클라이언트를 캐싱하여 성능을 향상시킵니다.
 또한 Kubernetes secrets에서 kubeconfig를 로드하는 기능을 제공합니다.
+
+컨텍스트 목록과 클라이언트 설정은 KubeconfigIndex에서 가져오므로 kubeconfig는
+파일이 바뀐 경우에만 다시 파싱되며, 각 클라이언트는 독립된 Configuration을 사용합니다.
 """
 
 import base64
@@ -10,11 +13,18 @@ import os
 import tempfile
 from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from kubernetes_dashboard.kubeconfig import KubeconfigIndex, default_kubeconfig_paths
+from kubernetes_dashboard.lazy import lazy_function, lazy_import
 
-from kubernetes.client import CoreV1Api, CustomObjectsApi
-from kubernetes.config import list_kube_config_contexts, load_incluster_config, load_kube_config
+if TYPE_CHECKING:
+    from kubernetes.client import CoreV1Api, CustomObjectsApi
 
-from kubernetes import client
+# kubernetes 패키지는 import 비용이 크므로 API 클라이언트가 처음 필요할 때 로드
+client = lazy_import("kubernetes.client")
+kube_config = lazy_import("kubernetes.config.kube_config")
+load_incluster_config = lazy_function("kubernetes.config", "load_incluster_config")
 
 
 def load_kubeconfig_from_secret(secret_name: str = "dashboard-kubeconfig", namespace: str = "default") -> str | None:
@@ -65,12 +75,68 @@ def is_running_in_kubernetes() -> bool:
     return os.path.exists("/var/run/secrets/kubernetes.io/serviceaccount/token")
 
 
-@lru_cache(maxsize=16)
-def api_for(context: str) -> tuple[CoreV1Api, CustomObjectsApi]:
+def _kubeconfig_paths() -> list[str]:
+    """인덱스가 읽을 kubeconfig 파일 목록을 반환합니다.
+
+    Kubernetes 클러스터 내부에서 실행 중이고 secret에서 kubeconfig를 로드할 수 있으면
+    해당 파일을, 아니면 KUBECONFIG 또는 기본 경로를 사용합니다.
+    """
+    if is_running_in_kubernetes():
+        kubeconfig_path = load_kubeconfig_from_secret()
+        if kubeconfig_path:
+            return [kubeconfig_path]
+        # Secret에서 로드 실패 시 기본 kubeconfig 사용
+    return default_kubeconfig_paths()
+
+
+@lru_cache(maxsize=1)
+def kubeconfig_index() -> KubeconfigIndex:
+    """프로세스 전체에서 공유하는 kubeconfig 인덱스를 반환합니다.
+
+    kubeconfig 파일 경로는 최초 호출 시 한 번만 결정하므로, secret 기반 kubeconfig도
+    API 클라이언트마다 다시 읽지 않습니다.
+
+    Returns:
+        KubeconfigIndex: 컨텍스트 인덱스
+    """
+    paths = _kubeconfig_paths()
+    return KubeconfigIndex(lambda: paths)
+
+
+def context_names() -> list[str]:
+    """kubeconfig에 정의된 모든 컨텍스트 이름을 반환합니다.
+
+    kubernetes 패키지를 import하지 않고 kubeconfig 인덱스에서 가져오므로 사이드바를 빠르게 렌더링합니다.
+    KUBECONFIG에 여러 파일이 지정된 경우 kubectl과 같이 먼저 정의된 컨텍스트가 우선합니다.
+
+    Returns:
+        list[str]: 컨텍스트 이름 목록 (kubeconfig에 정의된 순서)
+    """
+    return kubeconfig_index().contexts()
+
+
+def apiserver_for(context: str) -> str:
+    """컨텍스트가 가리키는 API 서버 주소를 반환합니다.
+
+    같은 API 서버를 다른 사용자나 네임스페이스로 가리키는 컨텍스트를 하나로 묶는 데 사용합니다.
+
+    Args:
+        context (str): Kubernetes 컨텍스트 이름
+
+    Returns:
+        str: API 서버 주소. 알 수 없으면 컨텍스트 이름
+    """
+    entry = kubeconfig_index().lookup(context)
+    cluster = (entry.cluster or {}).get("cluster") if entry else None
+    server = cluster.get("server") if isinstance(cluster, dict) else None
+    return str(server) if server else context
+
+
+def api_for(context: str) -> tuple["CoreV1Api", "CustomObjectsApi"]:
     """특정 컨텍스트에 대한 Kubernetes API 클라이언트를 반환합니다.
 
-    LRU 캐시를 사용하여 동일한 컨텍스트에 대한 반복 호출을 최적화합니다.
-    최대 16개의 다른 컨텍스트를 캐싱할 수 있습니다.
+    클라이언트는 (컨텍스트, kubeconfig 인덱스 세대) 단위로 캐싱되므로,
+    kubeconfig 파일이 바뀌면 다음 호출에서 새 설정으로 다시 생성됩니다.
 
     Args:
         context (str): Kubernetes 컨텍스트 이름
@@ -78,33 +144,41 @@ def api_for(context: str) -> tuple[CoreV1Api, CustomObjectsApi]:
     Returns:
         tuple: (CoreV1Api, CustomObjectsApi) 클라이언트 객체 튜플
     """
-    # 테스트를 위한 캐시 초기화 (실제 환경에서는 영향 없음)
-    api_for.cache_clear()
+    return _api_for(context, kubeconfig_index().current_generation())
 
-    # Kubernetes 환경에서 실행 중이고 kubeconfig가 secret에서 로드된 경우
-    if is_running_in_kubernetes():
-        kubeconfig_path = load_kubeconfig_from_secret()
-        if kubeconfig_path:
-            load_kube_config(config_file=kubeconfig_path, context=context)
-        else:
-            # Secret에서 로드 실패 시 기본 kubeconfig 사용
-            load_kube_config(context=context)
-    else:
-        # 로컬 환경에서는 기본 kubeconfig 사용
-        load_kube_config(context=context)
 
-    return client.CoreV1Api(), client.CustomObjectsApi()
+@lru_cache(maxsize=512)
+def _api_for(context: str, generation: int) -> tuple["CoreV1Api", "CustomObjectsApi"]:
+    """컨텍스트별 API 클라이언트를 생성합니다 (generation은 캐시 키로만 사용).
+
+    Raises:
+        ConfigException: 컨텍스트가 kubeconfig에 없거나 설정이 잘못된 경우
+    """
+    entry = kubeconfig_index().lookup(context)
+    if entry is None:
+        raise kube_config.ConfigException(f"Context '{context}' not found in kubeconfig")
+
+    # 전역 기본 설정을 바꾸지 않도록 컨텍스트마다 독립된 Configuration 사용
+    configuration = client.Configuration()
+    loader = kube_config.KubeConfigLoader(
+        config_dict=entry.config_dict(),
+        active_context=context,
+        config_base_path=entry.base_path,
+    )
+    loader.load_and_set(configuration)
+    api_client = client.ApiClient(configuration=configuration)
+    return client.CoreV1Api(api_client), client.CustomObjectsApi(api_client)
 
 
 if __name__ == "__main__":
     # 테스트를 위한 간단한 실행
-    contexts, _ = list_kube_config_contexts()
-    if not contexts:
+    names = context_names()
+    if not names:
         print("No Kubernetes contexts found.")
     else:
-        print(f"Found {len(contexts)} contexts.")
-        for ctx in contexts:
-            print(f"  - {ctx['name']}")
-            core_api, custom_api = api_for(ctx["name"])
+        print(f"Found {len(names)} contexts.")
+        for name in names:
+            print(f"  - {name}")
+            core_api, custom_api = api_for(name)
             print(f"    CoreV1Api: {core_api.api_client.configuration.host}")
             print(f"    CustomObjectsApi: {custom_api.api_client.configuration.host}")
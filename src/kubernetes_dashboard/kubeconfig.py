@@ -0,0 +1,204 @@
+"""Kubeconfig context index with file-change invalidation.
+
+이 모듈은 KUBECONFIG에 지정된 하나 이상의 kubeconfig 파일을 한 번만 파싱하여
+컨텍스트 이름 → (정의된 파일, context/cluster/user 항목) 인덱스를 유지합니다.
+파일의 mtime, inode, 크기가 바뀐 경우에만 해당 파일을 다시 파싱하므로,
+수백 개의 컨텍스트가 있어도 Streamlit rerun마다 YAML을 파싱하지 않습니다.
+
+kubectl과 동일하게 여러 파일에 같은 이름의 context/cluster/user가 있으면
+먼저 나온 파일의 항목이 우선합니다.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import yaml
+
+# libyaml이 설치되어 있으면 C 구현을 사용 (대형 kubeconfig 파싱 속도 향상)
+_YAML_LOADER: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# cluster/user 항목에서 파일 경로를 값으로 가지는 키
+_FILE_KEYS = frozenset({"certificate-authority", "client-certificate", "client-key", "tokenFile"})
+
+# 파일 시그니처: (mtime_ns, inode, size). 파일이 없으면 None
+_Signature = tuple[int, int, int] | None
+
+
+def default_kubeconfig_paths() -> list[str]:
+    """KUBECONFIG 환경 변수 또는 기본 경로에서 kubeconfig 파일 목록을 반환합니다.
+
+    Returns:
+        list[str]: kubeconfig 파일 경로 목록 (우선순위 순)
+    """
+    env = os.environ.get("KUBECONFIG")
+    if env:
+        return [os.path.expanduser(p) for p in env.split(os.pathsep) if p]
+    return [os.path.expanduser("~/.kube/config")]
+
+
+@dataclass(frozen=True)
+class ContextEntry:
+    """인덱스에 저장된 단일 컨텍스트 정보
+
+    Attributes:
+        name (str): 컨텍스트 이름
+        path (str): 컨텍스트가 정의된 kubeconfig 파일 경로
+        context (dict): kubeconfig의 contexts[].context 항목
+        cluster (dict | None): 컨텍스트가 참조하는 clusters[] 항목
+        user (dict | None): 컨텍스트가 참조하는 users[] 항목
+    """
+
+    name: str
+    path: str
+    context: dict[str, Any]
+    cluster: dict[str, Any] | None
+    user: dict[str, Any] | None
+
+    @property
+    def base_path(self) -> str:
+        """컨텍스트가 정의된 kubeconfig 파일의 디렉터리"""
+        return os.path.dirname(os.path.abspath(self.path))
+
+    def config_dict(self) -> dict[str, Any]:
+        """이 컨텍스트만 포함하는 최소 kubeconfig 딕셔너리를 반환합니다."""
+        return {
+            "apiVersion": "v1",
+            "kind": "Config",
+            "current-context": self.name,
+            "contexts": [{"name": self.name, "context": self.context}],
+            "clusters": [self.cluster] if self.cluster else [],
+            "users": [self.user] if self.user else [],
+        }
+
+
+def _absolutize(item: dict[str, Any], section: str, path: str) -> dict[str, Any]:
+    """cluster/user 항목의 상대 파일 경로를 항목이 정의된 파일 기준 절대 경로로 바꿉니다.
+
+    kubectl은 상대 경로를 해당 항목이 정의된 kubeconfig 파일 기준으로 해석하므로,
+    여러 파일을 병합한 뒤에도 같은 의미를 유지하도록 미리 변환합니다.
+    """
+    body = item.get(section)
+    if not isinstance(body, dict):
+        return item
+    base = os.path.dirname(os.path.abspath(path))
+    fixed = {
+        key: os.path.join(base, value) if key in _FILE_KEYS and isinstance(value, str) and value else value
+        for key, value in body.items()
+    }
+    return {**item, section: fixed}
+
+
+def _signature(path: str) -> _Signature:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_ino, st.st_size)
+
+
+def _load(path: str) -> dict[str, Any]:
+    with open(path) as f:
+        config = yaml.load(f, Loader=_YAML_LOADER)
+    return config if isinstance(config, dict) else {}
+
+
+class KubeconfigIndex:
+    """여러 kubeconfig 파일을 병합한 컨텍스트 인덱스
+
+    파일 변경 확인(stat)은 최대 `check_interval`초에 한 번만 수행하며,
+    변경된 파일만 다시 파싱합니다. 인덱스가 바뀔 때마다 `generation`이 증가하므로
+    이 값을 캐시 키에 포함하면 kubeconfig 변경 시 API 클라이언트 캐시도 무효화됩니다.
+    """
+
+    def __init__(
+        self,
+        paths: Callable[[], list[str]] = default_kubeconfig_paths,
+        check_interval: float = 1.0,
+    ) -> None:
+        self._paths = paths
+        self.check_interval = check_interval
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._checked_at = float("-inf")
+        self._key: tuple[tuple[str, _Signature], ...] = ()
+        self._files: dict[str, tuple[_Signature, dict[str, Any]]] = {}
+        self._contexts: dict[str, ContextEntry] = {}
+
+    def _refresh(self) -> None:
+        """파일 시그니처를 확인하여 바뀐 파일만 다시 파싱하고 인덱스를 재구성합니다."""
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return
+        with self._lock:
+            if now - self._checked_at < self.check_interval:
+                return
+            key = tuple((path, _signature(path)) for path in self._paths())
+            if key != self._key:
+                self._rebuild(key)
+            self._checked_at = now
+
+    def _rebuild(self, key: tuple[tuple[str, _Signature], ...]) -> None:
+        files: dict[str, tuple[_Signature, dict[str, Any]]] = {}
+        for path, sig in key:
+            if sig is None:
+                continue
+            cached = self._files.get(path)
+            if cached and cached[0] == sig:
+                files[path] = cached
+                continue
+            try:
+                files[path] = (sig, _load(path))
+            except (OSError, yaml.YAMLError) as e:
+                print(f"Warning: failed to parse kubeconfig '{path}': {e}")
+
+        # kubectl과 같이 먼저 정의된 항목 우선
+        contexts: dict[str, tuple[str, dict[str, Any]]] = {}
+        clusters: dict[str, dict[str, Any]] = {}
+        users: dict[str, dict[str, Any]] = {}
+        for path, _ in key:
+            if path not in files:
+                continue
+            config = files[path][1]
+            for item in config.get("contexts") or []:
+                if item.get("name"):
+                    contexts.setdefault(item["name"], (path, item.get("context") or {}))
+            for item in config.get("clusters") or []:
+                if item.get("name"):
+                    clusters.setdefault(item["name"], _absolutize(item, "cluster", path))
+            for item in config.get("users") or []:
+                if item.get("name"):
+                    users.setdefault(item["name"], _absolutize(item, "user", path))
+
+        self._contexts = {
+            name: ContextEntry(name, path, ctx, clusters.get(ctx.get("cluster", "")), users.get(ctx.get("user", "")))
+            for name, (path, ctx) in contexts.items()
+        }
+        self._files = files
+        self._key = key
+        self.generation += 1
+
+    def contexts(self) -> list[str]:
+        """모든 컨텍스트 이름을 정의된 순서대로 반환합니다."""
+        self._refresh()
+        return list(self._contexts)
+
+    def lookup(self, name: str) -> ContextEntry | None:
+        """컨텍스트 이름으로 항목을 찾습니다.
+
+        Args:
+            name (str): 컨텍스트 이름
+
+        Returns:
+            ContextEntry | None: 컨텍스트 항목. 없으면 None
+        """
+        self._refresh()
+        return self._contexts.get(name)
+
+    def current_generation(self) -> int:
+        """변경 사항을 반영한 뒤 현재 인덱스 세대 번호를 반환합니다."""
+        self._refresh()
+        return self.generation
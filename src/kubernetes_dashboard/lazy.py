@@ -0,0 +1,73 @@
+"""Lazy import helpers for heavy dependencies.
+
+이 모듈은 kubernetes client처럼 import 비용이 큰 모듈을 실제로 사용할 때까지
+import를 미루기 위한 도우미를 제공합니다. 대시보드의 첫 화면이나 headless 명령처럼
+해당 모듈이 필요 없는 경로에서는 import 비용을 지불하지 않습니다.
+"""
+
+import importlib
+import sys
+import threading
+from collections.abc import Callable
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule(ModuleType):
+    """첫 속성 접근 시점에 실제 모듈을 import하는 모듈 프록시"""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_lock"] = threading.Lock()
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> ModuleType:
+        """실제 모듈을 import하여 반환합니다 (스레드 안전)."""
+        module: ModuleType | None = self.__dict__["_lazy_module"]
+        if module is None:
+            with self.__dict__["_lazy_lock"]:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+
+def lazy_import(name: str) -> ModuleType:
+    """모듈을 지연 import합니다.
+
+    이미 import된 모듈이면 그대로 반환하고, 아니면 첫 속성 접근 시 import하는 프록시를 반환합니다.
+
+    Args:
+        name (str): 모듈 이름 (예: 'kubernetes.client')
+
+    Returns:
+        ModuleType: 실제 모듈 또는 LazyModule 프록시
+    """
+    return importlib.import_module(name) if name in sys.modules else LazyModule(name)
+
+
+def lazy_function(module_name: str, attr: str) -> Callable[..., Any]:
+    """첫 호출 시점에 모듈을 import하는 함수 프록시를 반환합니다.
+
+    Args:
+        module_name (str): 함수가 정의된 모듈 이름
+        attr (str): 함수 이름
+
+    Returns:
+        Callable: 호출을 실제 함수로 전달하는 프록시 함수
+    """
+
+    def _call(*args: Any, **kwargs: Any) -> Any:
+        return getattr(importlib.import_module(module_name), attr)(*args, **kwargs)
+
+    _call.__name__ = attr
+    _call.__qualname__ = attr
+    _call.__doc__ = f"Lazy proxy for {module_name}.{attr}."
+    return _call
@@ -0,0 +1,197 @@
+"""Process-wide memory accounting and pressure handling.
+
+이 모듈은 대시보드 프로세스가 보관하는 큰 데이터(클러스터 스냅샷, rowcache.RowCache로 캐시하는 표 색인과 이벤트 색인 등)의
+메모리 사용량을 집계하고, DASHBOARD_MEMORY_BUDGET_MB를 넘으면 등록된 구성 요소에 메모리 해제를 요청하는
+MemoryGovernor를 제공합니다.
+다시 만들기 쉬운 캐시(우선순위가 낮은 구성 요소)부터 해제하며, 스냅샷 저장소는 가장 오래전에 조회한 클러스터의
+상세 행을 로컬 디스크로 내보내고(spill) 합계 값만 메모리에 남깁니다. 색인 캐시는 색인과 함께 참조하는 행 목록도 세므로,
+스냅샷을 내보낸 뒤에도 캐시가 붙잡고 있는 행은 캐시를 해제해야 메모리에서 사라집니다.
+
+사용량은 행 목록의 앞부분을 표본으로 계산한 추정치입니다. 같은 객체(intern된 클러스터/네임스페이스 이름 등)는
+표본 안에서 한 번만 세므로, 행마다 공유되는 문자열을 중복으로 세지 않습니다.
+"""
+
+import os
+import sys
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+# 메모리 예산(MiB)을 지정하는 환경 변수 (지정하지 않거나 0이면 집계만 하고 해제하지 않음)
+MEMORY_BUDGET_ENV = "DASHBOARD_MEMORY_BUDGET_MB"
+# 내보낸 스냅샷을 저장할 상위 디렉토리를 지정하는 환경 변수 (기본값: 시스템 임시 디렉토리)
+SPILL_DIR_ENV = "DASHBOARD_SPILL_DIR"
+# 행 목록의 크기를 추정할 때 사용하는 표본 행 수
+_SAMPLE = 64
+
+MIB = 1024 * 1024
+
+
+def _item_bytes(item: Any, seen: set[int]) -> int:
+    """객체 하나와 필드 값의 크기를 계산합니다 (seen에 있는 객체는 세지 않음)."""
+    if id(item) in seen:
+        return 0
+    seen.add(id(item))
+    nbytes = getattr(item, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    size = sys.getsizeof(item)
+    if isinstance(item, Mapping):
+        for value in item.values():
+            if id(value) not in seen:
+                seen.add(id(value))
+                size += sys.getsizeof(value)
+    return size
+
+
+def estimate(value: Any) -> int:
+    """스냅샷 값 하나의 대략적인 메모리 사용량을 계산합니다.
+
+    목록은 앞의 _SAMPLE개 행의 평균 크기에 행 수를 곱하고,
+    nbytes 속성이 있는 객체(search.SearchSegment, table.TableStore 등)는 그 값을 사용합니다.
+
+    Args:
+        value (Any): 스냅샷 키의 값
+
+    Returns:
+        int: 추정 바이트 수
+    """
+    if not isinstance(value, list | tuple):
+        return _item_bytes(value, set())
+    if not value:
+        return sys.getsizeof(value)
+    seen: set[int] = set()
+    sample = value[:_SAMPLE]
+    sampled = sum(_item_bytes(item, seen) for item in sample)
+    return sys.getsizeof(value) + sampled * len(value) // len(sample)
+
+
+def process_rss() -> int | None:
+    """현재 프로세스의 상주 메모리(RSS)를 반환합니다.
+
+    Returns:
+        int | None: 바이트 수. /proc를 읽을 수 없는 플랫폼이면 None
+    """
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class Usage:
+    """구성 요소 하나의 메모리 사용량
+
+    Attributes:
+        name (str): 구성 요소 이름
+        bytes (int): 추정 사용량(바이트)
+        detail (str): 화면에 함께 표시할 설명 (내보낸 클러스터 수 등)
+    """
+
+    name: str
+    bytes: int
+    detail: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class _Component:
+    name: str
+    usage: Callable[[], Usage]
+    release: Callable[[int], int] | None
+    priority: int
+
+
+class MemoryGovernor:
+    """구성 요소별 메모리 사용량 집계와 예산 초과 시 해제
+
+    Attributes:
+        budget (int | None): 메모리 예산(바이트). None이면 해제하지 않음
+    """
+
+    def __init__(self, budget: int | None = None) -> None:
+        self.budget = budget
+        self._components: dict[str, _Component] = {}
+        self._lock = threading.Lock()
+        self._enforcing = threading.Lock()
+
+    def register(
+        self,
+        name: str,
+        usage: Callable[[], Usage],
+        release: Callable[[int], int] | None = None,
+        priority: int = 0,
+    ) -> None:
+        """구성 요소를 등록합니다. 같은 이름으로 다시 등록하면 교체합니다.
+
+        Args:
+            name (str): 구성 요소 이름
+            usage (Callable[[], Usage]): 현재 사용량을 반환하는 함수
+            release (Callable[[int], int], optional): 요청한 바이트 이상을 해제하려고 시도하고
+                해제한 바이트를 반환하는 함수. 기본값은 None (해제할 수 없음)
+            priority (int, optional): 해제 순서. 낮을수록 먼저 해제 (다시 만들기 쉬운 캐시). 기본값은 0
+        """
+        with self._lock:
+            self._components[name] = _Component(name, usage, release, priority)
+
+    def _ordered(self) -> list[_Component]:
+        with self._lock:
+            return sorted(self._components.values(), key=lambda c: c.priority)
+
+    def usage(self) -> list[Usage]:
+        """등록된 구성 요소의 사용량을 해제 순서대로 반환합니다."""
+        return [component.usage() for component in self._ordered()]
+
+    def total(self) -> int:
+        """등록된 구성 요소의 사용량 합계(바이트)를 반환합니다."""
+        return sum(usage.bytes for usage in self.usage())
+
+    def enforce(self) -> int:
+        """사용량이 예산을 넘으면 우선순위가 낮은 구성 요소부터 초과분의 해제를 요청합니다.
+
+        다른 스레드가 이미 해제 중이면 기다리지 않고 바로 반환합니다.
+
+        Returns:
+            int: 해제한 바이트 수
+        """
+        if self.budget is None or not self._enforcing.acquire(blocking=False):
+            return 0
+        try:
+            excess = self.total() - self.budget
+            freed = 0
+            for component in self._ordered():
+                if freed >= excess:
+                    break
+                if component.release is not None:
+                    freed += component.release(excess - freed)
+            return freed
+        finally:
+            self._enforcing.release()
+
+
+def memory_budget() -> int | None:
+    """환경 변수에 지정된 메모리 예산을 반환합니다.
+
+    Returns:
+        int | None: 바이트 수. 지정하지 않았거나 0이면 None (해제하지 않음)
+    """
+    raw = os.environ.get(MEMORY_BUDGET_ENV, "").strip()
+    try:
+        budget = float(raw or 0)
+    except ValueError:
+        print(f"Warning: invalid {MEMORY_BUDGET_ENV} value {raw!r}. Memory pressure handling is disabled.")
+        return None
+    return int(budget * MIB) if budget > 0 else None
+
+
+def spill_parent() -> str | None:
+    """내보낸 스냅샷을 저장할 상위 디렉토리를 반환합니다 (None이면 시스템 임시 디렉토리)."""
+    return os.environ.get(SPILL_DIR_ENV, "").strip() or None
+
+
+@lru_cache(maxsize=1)
+def memory_governor() -> MemoryGovernor:
+    """프로세스 전체에서 공유하는 MemoryGovernor를 반환합니다."""
+    return MemoryGovernor(memory_budget())
@@ -0,0 +1,127 @@
+"""Node-to-pods index for the node detail view.
+
+이 모듈은 노드에 배치된 Pod 목록을 노드별로 조회하는 색인을 제공합니다.
+수집 시 Pod 요약, 워크로드 집계와 같은 Pod 목록 순회에서 Pod마다 행 하나를 만들어 노드별로 묶고(NodePods),
+행 목록은 같은 노드의 행이 연속되도록 노드 이름순으로 반환합니다. 색인은 노드마다 행 목록의 구간(시작, 끝)만
+기록하므로(NodePodIndex) 노드 하나를 여는 비용은 API 서버 호출 없이 O(노드의 Pod 수)이며,
+같은 행 목록에 대해 한 번만 만들어 세션과 재실행 사이에서 재사용합니다(node_pod_index()).
+"""
+
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any
+
+from kubernetes_dashboard.records import NodePodRow, intern
+from kubernetes_dashboard.rowcache import RowCache
+
+# 보관하는 색인 최대 개수
+_CACHE_SIZE = 8
+
+# (네임스페이스, Pod 이름) → (CPU 사용량(cores), 메모리 사용량(bytes))
+PodUsage = Mapping[tuple[str, str], tuple[float, float]]
+
+node_pod_cache = RowCache("node_pods", _CACHE_SIZE)
+
+
+class NodePods:
+    """Pod 순회 중 노드별 Pod 행을 모읍니다 (스케줄되지 않은 Pod는 제외)."""
+
+    __slots__ = ("_cluster", "_nodes", "_usage")
+
+    def __init__(self, cluster: str, usage: PodUsage | None = None) -> None:
+        """노드별 행 목록을 비운 상태로 시작합니다.
+
+        Args:
+            cluster (str): Kubernetes 컨텍스트 이름
+            usage (PodUsage, optional): metrics-server에서 조회한 Pod별 사용량. 기본값은 None (사용량 없음)
+        """
+        self._cluster = intern(cluster)
+        self._usage = usage or {}
+        self._nodes: dict[str, list[NodePodRow]] = {}
+
+    def add(self, pod: Any) -> None:
+        """Pod 하나를 배치된 노드의 행 목록에 더합니다.
+
+        Args:
+            pod (V1Pod): Pod 객체
+        """
+        node = pod.spec.node_name
+        if not node:
+            return
+        ns = intern(pod.metadata.namespace)
+        cpu, mem = self._usage.get((ns, pod.metadata.name), (None, None))
+        rows = self._nodes.get(node)
+        if rows is None:
+            rows = self._nodes[intern(node)] = []
+        rows.append(
+            NodePodRow(
+                cluster=self._cluster,
+                node=intern(node),
+                pod=pod.metadata.name,
+                ns=ns,
+                phase=intern(pod.status.phase or ""),
+                restarts=sum(cs.restart_count or 0 for cs in pod.status.container_statuses or []),
+                cpu=cpu,
+                mem=mem,
+            )
+        )
+
+    def rows(self) -> list[NodePodRow]:
+        """모은 행을 반환합니다.
+
+        Returns:
+            list[NodePodRow]: 노드 이름순으로 정렬되어 같은 노드의 행이 연속된 목록
+        """
+        return [row for node in sorted(self._nodes) for row in self._nodes[node]]
+
+
+class NodePodIndex:
+    """(클러스터, 노드) → Pod 행 구간 색인"""
+
+    __slots__ = ("_rows", "_spans")
+
+    def __init__(self, rows: Sequence[NodePodRow]) -> None:
+        """색인을 만듭니다.
+
+        Args:
+            rows (Sequence[NodePodRow]): 노드별로 묶인 Pod 행 (NodePods.rows() 결과, 여러 클러스터 병합 가능)
+        """
+        self._rows = rows
+        self._spans: dict[tuple[str, str], list[tuple[int, int]]] = {}
+        start = 0
+        for i in range(1, len(rows) + 1):
+            if i == len(rows) or rows[i].node != rows[start].node or rows[i].cluster != rows[start].cluster:
+                # 묶이지 않은 행 목록이어도 구간을 여러 개 기록하여 모두 찾음
+                self._spans.setdefault((rows[start].cluster, rows[start].node), []).append((start, i))
+                start = i
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        return iter(self._spans)
+
+    def pods(self, cluster: str, node: str) -> list[NodePodRow]:
+        """노드에 배치된 Pod 행을 반환합니다.
+
+        Args:
+            cluster (str): Kubernetes 컨텍스트 이름
+            node (str): 노드 이름
+
+        Returns:
+            list[NodePodRow]: 노드의 Pod 행. 노드가 없거나 Pod가 없으면 빈 목록
+        """
+        return [row for start, stop in self._spans.get((cluster, node), ()) for row in self._rows[start:stop]]
+
+
+def node_pod_index(rows: Sequence[NodePodRow]) -> NodePodIndex:
+    """행 목록에 대한 NodePodIndex를 반환합니다 (같은 행 객체 목록이면 캐시된 것을 재사용).
+
+    events.event_index()와 같이 행 객체의 id 목록으로 캐시를 찾습니다 (rowcache.RowCache 참고).
+
+    Args:
+        rows (Sequence[NodePodRow]): collect() 결과의 node_pods
+
+    Returns:
+        NodePodIndex: 행 목록의 색인
+    """
+    return node_pod_cache.get(rows, NodePodIndex)
@@ -0,0 +1,152 @@
+"""Namespace scopes and RBAC permission cache.
+
+이 모듈은 네임스페이스 단위 권한만 있는 컨텍스트를 위한 수집 범위(scope)와,
+403(Forbidden)을 받은 요청을 기억하는 캐시를 제공합니다.
+
+- DASHBOARD_NAMESPACE_SCOPES에 지정한 YAML 파일에 컨텍스트별 네임스페이스 목록을 적으면,
+  해당 컨텍스트는 전체 네임스페이스 목록 요청 대신 네임스페이스별 목록 요청으로 수집합니다.
+- 목록이 없는 컨텍스트에서 전체 네임스페이스 요청이 403을 받으면 kubeconfig 컨텍스트의
+  기본 네임스페이스(contexts[].context.namespace)로 범위를 좁혀 수집합니다.
+- 403을 받은 (컨텍스트, 리소스, 네임스페이스)는 재확인 주기가 지나거나 수동 새로고침하기 전까지
+  다시 요청하지 않습니다.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+
+import yaml
+
+from kubernetes_dashboard.kube_client import kubeconfig_index
+
+# 컨텍스트별 네임스페이스 목록 파일(YAML)을 지정하는 환경 변수
+SCOPES_ENV = "DASHBOARD_NAMESPACE_SCOPES"
+# 403을 받은 요청을 다시 시도하는 주기(초)
+PERMISSION_RETRY = 600.0
+# 네임스페이스별 목록 요청의 최대 동시 실행 수 (클러스터당)
+NAMESPACE_CONCURRENCY = 8
+
+
+def load_scopes(path: str | None = None) -> dict[str, tuple[str, ...]]:
+    """컨텍스트별 네임스페이스 목록 파일을 읽습니다. 잘못된 파일은 경고를 출력하고 무시합니다.
+
+    파일 형식은 `컨텍스트 이름: [네임스페이스, ...]` 매핑입니다.
+
+    Args:
+        path (str, optional): YAML 파일 경로. 기본값은 DASHBOARD_NAMESPACE_SCOPES
+
+    Returns:
+        dict[str, tuple[str, ...]]: 컨텍스트 이름 → 네임스페이스 목록
+    """
+    path = path or os.environ.get(SCOPES_ENV)
+    if not path:
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            loaded = yaml.safe_load(f) or {}
+        if not isinstance(loaded, dict):
+            raise ValueError("expected a mapping of context name to namespace list")
+        return {str(ctx): tuple(str(ns) for ns in namespaces or ()) for ctx, namespaces in loaded.items()}
+    except (OSError, ValueError, TypeError, yaml.YAMLError) as e:
+        print(f"Warning: could not load namespace scopes from {path}: {e}. Using cluster-wide collection.")
+        return {}
+
+
+@lru_cache(maxsize=1)
+def namespace_scopes() -> dict[str, tuple[str, ...]]:
+    """프로세스 전체에서 공유하는 컨텍스트별 네임스페이스 목록을 반환합니다."""
+    return load_scopes()
+
+
+def default_namespace(ctx: str) -> str | None:
+    """kubeconfig 컨텍스트에 지정된 기본 네임스페이스를 반환합니다.
+
+    Args:
+        ctx (str): Kubernetes 컨텍스트 이름
+
+    Returns:
+        str | None: 기본 네임스페이스. 지정되지 않았으면 None
+    """
+    entry = kubeconfig_index().lookup(ctx)
+    namespace = entry.context.get("namespace") if entry is not None else None
+    return str(namespace) if namespace else None
+
+
+class PermissionCache:
+    """403을 받은 (컨텍스트, 리소스, 네임스페이스) 캐시
+
+    Attributes:
+        retry (float): 403을 받은 요청을 다시 시도하는 주기(초)
+    """
+
+    def __init__(self, retry: float = PERMISSION_RETRY, clock: Callable[[], float] = time.monotonic) -> None:
+        self.retry = retry
+        self._clock = clock
+        # (cluster, resource, namespace) → 403을 받은 시각. namespace가 None이면 전체 네임스페이스 요청
+        self._forbidden: dict[tuple[str, str, str | None], float] = {}
+        self._lock = threading.Lock()
+
+    def forbidden(self, cluster: str, resource: str, namespace: str | None = None) -> bool:
+        """요청을 건너뛰어야 하는지 반환합니다.
+
+        Args:
+            cluster (str): Kubernetes 컨텍스트 이름
+            resource (str): 리소스 이름 (pods, events 등)
+            namespace (str, optional): 네임스페이스. 기본값은 None (전체 네임스페이스 요청)
+
+        Returns:
+            bool: 403을 받았고 재확인 주기가 지나지 않았으면 True
+        """
+        with self._lock:
+            since = self._forbidden.get((cluster, resource, namespace))
+        return since is not None and self._clock() - since <= self.retry
+
+    def mark_forbidden(self, cluster: str, resource: str, namespace: str | None = None) -> bool:
+        """403을 받은 요청으로 기록합니다.
+
+        Args:
+            cluster (str): Kubernetes 컨텍스트 이름
+            resource (str): 리소스 이름
+            namespace (str, optional): 네임스페이스. 기본값은 None (전체 네임스페이스 요청)
+
+        Returns:
+            bool: 새로 확인된 경우 True (이미 기록되어 있던 요청을 재확인한 경우 False)
+        """
+        with self._lock:
+            first = (cluster, resource, namespace) not in self._forbidden
+            self._forbidden[cluster, resource, namespace] = self._clock()
+        return first
+
+    def mark_allowed(self, cluster: str, resource: str, namespace: str | None = None) -> None:
+        """요청이 성공했으므로 403 기록을 제거합니다.
+
+        재확인 주기가 지나 다시 보낸 요청이 성공하면 기록을 지워, 이후 다시 거부될 때
+        mark_forbidden()이 새로 확인된 것으로 보고 경고를 다시 출력하도록 합니다.
+
+        Args:
+            cluster (str): Kubernetes 컨텍스트 이름
+            resource (str): 리소스 이름
+            namespace (str, optional): 네임스페이스. 기본값은 None (전체 네임스페이스 요청)
+        """
+        with self._lock:
+            self._forbidden.pop((cluster, resource, namespace), None)
+
+    def invalidate(self, clusters: Iterable[str] | None = None) -> None:
+        """기록을 제거하여 다음 수집에서 권한을 다시 확인하도록 합니다.
+
+        Args:
+            clusters (Iterable[str], optional): 대상 클러스터. 기본값은 None (전체)
+        """
+        targets = None if clusters is None else set(clusters)
+        with self._lock:
+            for key in list(self._forbidden):
+                if targets is None or key[0] in targets:
+                    del self._forbidden[key]
+
+
+@lru_cache(maxsize=1)
+def permission_cache() -> PermissionCache:
+    """프로세스 전체에서 공유하는 권한 캐시를 반환합니다."""
+    return PermissionCache()
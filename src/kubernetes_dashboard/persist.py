@@ -0,0 +1,222 @@
+"""Last-known snapshot persistence for warm starts.
+
+이 모듈은 SnapshotStore가 마지막으로 수집에 성공한 클러스터별 데이터셋을 로컬 디스크에 저장하고,
+프로세스가 다시 시작될 때 읽어 오는 기능을 제공합니다. 대시보드는 저장된 스냅샷을 바로 표시하고
+백그라운드에서 새로 수집합니다.
+
+파일은 클러스터마다 하나이며, 행 목록을 열 단위 JSON으로 바꾼 뒤 zlib으로 압축합니다.
+반복되는 클러스터/네임스페이스/노드 이름이 한 열에 모이므로 압축률이 높고,
+pickle을 사용하지 않으므로 파일을 읽을 때 임의 코드가 실행되지 않습니다.
+"""
+
+import json
+import os
+import tempfile
+import zlib
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+from urllib.parse import quote
+
+from kubernetes_dashboard.records import (
+    AllocationRow,
+    EventRow,
+    NamespaceAllocationRow,
+    NodePodRow,
+    NodeRow,
+    PodRow,
+    Record,
+    RestartRow,
+    WorkloadRow,
+    intern,
+    to_columns,
+)
+
+# 저장 디렉토리를 지정하는 환경 변수 (빈 문자열이면 저장하지 않음)
+SNAPSHOT_DIR_ENV = "DASHBOARD_SNAPSHOT_DIR"
+DEFAULT_SNAPSHOT_DIR = os.path.join("~", ".cache", "kubernetes-dashboard", "snapshots")
+
+_MAGIC = b"KDS1"
+_SUFFIX = ".snap"
+# 저장할 수 있는 행 타입
+_RECORD_TYPES: dict[str, type[Record]] = {
+    cls.__name__: cls
+    for cls in (
+        PodRow,
+        NodeRow,
+        RestartRow,
+        WorkloadRow,
+        EventRow,
+        AllocationRow,
+        NamespaceAllocationRow,
+        NodePodRow,
+    )
+}
+
+
+class _Unsupported(Exception):
+    """저장할 수 없는 값 (검색 색인 등). 해당 데이터셋은 저장하지 않음"""
+
+
+def snapshot_dir() -> str | None:
+    """스냅샷 저장 디렉토리를 반환합니다.
+
+    Returns:
+        str | None: DASHBOARD_SNAPSHOT_DIR 또는 기본 디렉토리. 환경 변수가 빈 문자열이면 None (비활성화)
+    """
+    raw = os.environ.get(SNAPSHOT_DIR_ENV)
+    if raw is None:
+        return os.path.expanduser(DEFAULT_SNAPSHOT_DIR)
+    return os.path.expanduser(raw) if raw.strip() else None
+
+
+def _encode_value(value: Any) -> Any:
+    """스냅샷 키 하나의 값을 JSON으로 표현할 수 있는 형태로 변환합니다."""
+    if value is None or isinstance(value, int | float | str):
+        return {"v": value}
+    if not isinstance(value, list):
+        raise _Unsupported(type(value).__name__)
+    if not value:
+        return {"v": []}
+    record_type = type(value[0])
+    if record_type.__name__ not in _RECORD_TYPES or any(type(row) is not record_type for row in value):
+        raise _Unsupported(record_type.__name__)
+    columns = list(to_columns(value, record_type).values())
+    # datetime 열은 ISO 8601 문자열로 저장
+    dates = [i for i, column in enumerate(columns) if any(isinstance(v, datetime) for v in column)]
+    for i in dates:
+        columns[i] = [None if v is None else v.isoformat() for v in columns[i]]
+    return {"t": record_type.__name__, "c": columns, "d": dates}
+
+
+def _decode_value(encoded: Mapping[str, Any]) -> Any:
+    """_encode_value()의 결과를 원래 값으로 되돌립니다."""
+    if "v" in encoded:
+        return encoded["v"]
+    record_type = _RECORD_TYPES[encoded["t"]]
+    columns: list[list[Any]] = encoded["c"]
+    dates = set(encoded.get("d", ()))
+    for i, column in enumerate(columns):
+        if i in dates:
+            columns[i] = [None if v is None else datetime.fromisoformat(v) for v in column]
+        else:
+            columns[i] = list(map(intern, column))
+    return [record_type(*values) for values in zip(*columns, strict=True)]
+
+
+def encode_cluster(ctx: str, entries: Mapping[str, tuple[float, Mapping[str, Any]]]) -> bytes:
+    """단일 클러스터의 데이터셋 캐시 항목을 압축된 바이트로 변환합니다.
+
+    저장할 수 없는 값이 포함된 데이터셋(검색 색인 등)은 건너뜁니다.
+
+    Args:
+        ctx (str): Kubernetes 컨텍스트 이름
+        entries (Mapping[str, tuple[float, Mapping[str, Any]]]): 데이터셋 → (수집 시각, 스냅샷 키 → 값)
+
+    Returns:
+        bytes: 파일에 기록할 내용
+    """
+    datasets: dict[str, Any] = {}
+    for dataset, (collected_at, value) in entries.items():
+        try:
+            datasets[dataset] = {"at": collected_at, "keys": {key: _encode_value(v) for key, v in value.items()}}
+        except _Unsupported:
+            continue
+    return _pack(ctx, datasets)
+
+
+def encode_dataset(ctx: str, dataset: str, collected_at: float, value: Mapping[str, Any]) -> bytes | None:
+    """단일 데이터셋 캐시 항목을 encode_cluster()와 같은 형식으로 변환합니다 (decode_cluster()로 읽음).
+
+    Args:
+        ctx (str): Kubernetes 컨텍스트 이름
+        dataset (str): 데이터셋 이름
+        collected_at (float): 수집 시각 (Unix time)
+        value (Mapping[str, Any]): 스냅샷 키 → 값
+
+    Returns:
+        bytes | None: 변환된 내용. 저장할 수 없는 값(검색 색인 등)이 포함되어 있으면 None
+    """
+    try:
+        keys = {key: _encode_value(v) for key, v in value.items()}
+    except _Unsupported:
+        return None
+    return _pack(ctx, {dataset: {"at": collected_at, "keys": keys}})
+
+
+def _pack(ctx: str, datasets: Mapping[str, Any]) -> bytes:
+    """인코딩된 데이터셋을 JSON으로 직렬화하고 압축합니다."""
+    payload = json.dumps({"cluster": ctx, "datasets": datasets}, separators=(",", ":"), ensure_ascii=False)
+    return _MAGIC + zlib.compress(payload.encode("utf-8"))
+
+
+def decode_cluster(data: bytes) -> tuple[str, dict[str, tuple[float, dict[str, Any]]]]:
+    """encode_cluster()의 결과를 읽습니다.
+
+    Args:
+        data (bytes): 파일 내용
+
+    Returns:
+        tuple: (컨텍스트 이름, 데이터셋 → (수집 시각, 스냅샷 키 → 값))
+
+    Raises:
+        ValueError: 형식이 맞지 않거나 손상된 경우
+    """
+    if not data.startswith(_MAGIC):
+        raise ValueError("not a dashboard snapshot file")
+    try:
+        payload = json.loads(zlib.decompress(data[len(_MAGIC) :]))
+        entries = {
+            dataset: (float(item["at"]), {key: _decode_value(v) for key, v in item["keys"].items()})
+            for dataset, item in payload["datasets"].items()
+        }
+        return str(payload["cluster"]), entries
+    except (zlib.error, KeyError, TypeError) as e:
+        raise ValueError(f"corrupt snapshot file: {e}") from e
+
+
+def _path(directory: str, ctx: str) -> str:
+    # 컨텍스트 이름에 "/"나 ":"가 포함될 수 있으므로(EKS ARN 등) 인코딩
+    return os.path.join(directory, quote(ctx, safe="") + _SUFFIX)
+
+
+def save_cluster(directory: str, ctx: str, entries: Mapping[str, tuple[float, Mapping[str, Any]]]) -> None:
+    """단일 클러스터의 스냅샷을 저장합니다 (임시 파일에 기록한 뒤 교체).
+
+    Args:
+        directory (str): 저장 디렉토리 (없으면 생성)
+        ctx (str): Kubernetes 컨텍스트 이름
+        entries (Mapping[str, tuple[float, Mapping[str, Any]]]): 데이터셋 → (수집 시각, 스냅샷 키 → 값)
+    """
+    data = encode_cluster(ctx, entries)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, _path(directory, ctx))
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_cluster(directory: str, ctx: str) -> dict[str, tuple[float, dict[str, Any]]] | None:
+    """저장된 클러스터 스냅샷을 읽습니다. 읽을 수 없는 파일은 경고를 출력하고 무시합니다.
+
+    Args:
+        directory (str): 저장 디렉토리
+        ctx (str): Kubernetes 컨텍스트 이름
+
+    Returns:
+        dict | None: 데이터셋 → (수집 시각, 스냅샷 키 → 값). 파일이 없거나 읽을 수 없으면 None
+    """
+    path = _path(directory, ctx)
+    try:
+        with open(path, "rb") as f:
+            saved, entries = decode_cluster(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Warning: ignoring snapshot file {path}: {e}")
+        return None
+    return entries if saved == ctx else None
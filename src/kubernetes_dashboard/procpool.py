@@ -0,0 +1,198 @@
+"""Optional process-pool collection mode.
+
+Pod 목록 같은 큰 API 응답의 역직렬화와 요약은 CPU를 많이 사용하므로, 스레드로 여러 클러스터를
+동시에 수집해도 GIL 때문에 코어 하나만 사용합니다. 이 모듈은 클러스터 수집을 워커 프로세스에서
+실행하고, 요약된 행(records 모듈의 행)만 부모 프로세스로 돌려받는 수집 모드를 제공합니다.
+
+각 클러스터는 항상 같은 워커 프로세스에 배정되므로 워커 안의 API 클라이언트, 노드 인벤토리,
+소유자 인덱스, 재시작 추적기가 새로고침 사이에 계속 재사용됩니다.
+워커 배정은 컨텍스트가 아니라 API 서버 주소 기준이므로 같은 API 서버를 가리키는 컨텍스트는 한 워커의
+스케줄러 제한(API 서버별 동시 실행 수, 요청 속도)을 함께 받고, 전역 동시 요청 수는 워커 수로 나누어
+워커마다 적용하므로 전체 제한은 한 프로세스에서 수집할 때와 같게 유지됩니다.
+환경 변수 DASHBOARD_COLLECT_PROCESSES에 워커 수를 지정하면 활성화됩니다 (기본값 0: 비활성화).
+"""
+
+import multiprocessing
+import os
+import threading
+import zlib
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Any
+
+from kubernetes_dashboard.kube_client import apiserver_for
+from kubernetes_dashboard.scheduler import MAX_INFLIGHT_ENV, configured_max_inflight, default_scheduler
+
+# 워커 프로세스 수를 지정하는 환경 변수 (0 또는 미설정이면 현재 프로세스에서 수집)
+PROCESSES_ENV = "DASHBOARD_COLLECT_PROCESSES"
+
+
+def _init_worker(max_inflight: int) -> None:
+    """워커 프로세스가 다시 워커 프로세스로 수집을 넘기지 않도록 하고 전역 동시 요청 수의 몫을 지정합니다."""
+    os.environ[PROCESSES_ENV] = "0"
+    os.environ[MAX_INFLIGHT_ENV] = str(max_inflight)
+    process_pool.cache_clear()
+    default_scheduler.cache_clear()
+
+
+def _collect_in_worker(ctx: str, datasets: frozenset[str]) -> dict[str, Any]:
+    """워커 프로세스에서 단일 클러스터를 수집합니다."""
+    from kubernetes_dashboard.collectors import collect_cluster
+
+    return collect_cluster(ctx, datasets)
+
+
+def _invalidate_in_worker(clusters: list[str] | None) -> None:
+    """워커 프로세스의 클러스터별 캐시를 비웁니다."""
+    from kubernetes_dashboard.collectors import invalidate_caches
+
+    invalidate_caches(clusters)
+
+
+class ClusterProcessPool:
+    """클러스터를 고정된 워커 프로세스에 배정하여 수집하는 풀
+
+    워커마다 max_workers=1인 ProcessPoolExecutor를 사용하므로 한 워커 안에서는 클러스터가
+    순서대로 수집되며, 서로 다른 워커의 클러스터는 병렬로 수집됩니다.
+
+    Attributes:
+        processes (int): 워커 프로세스 수
+        max_inflight (int): 워커 하나의 전역 최대 동시 요청 수 (전역 제한을 워커 수로 나눈 값)
+    """
+
+    def __init__(
+        self,
+        processes: int,
+        target: Callable[..., Any] = _collect_in_worker,
+        key_for: Callable[[str], str] = apiserver_for,
+    ) -> None:
+        self.processes = max(1, processes)
+        self.max_inflight = max(1, configured_max_inflight() // self.processes)
+        self._target = target
+        self._key_for = key_for
+        # spawn: 부모의 스레드/잠금 상태를 복제하지 않도록 새 인터프리터로 시작
+        self._context = multiprocessing.get_context("spawn")
+        self._executors: list[ProcessPoolExecutor | None] = [None] * self.processes
+        self._lock = threading.Lock()
+
+    def slot(self, ctx: str) -> int:
+        """컨텍스트가 배정되는 워커 번호를 반환합니다 (API 서버 주소 기준, 프로세스 재시작과 관계없이 고정)."""
+        return zlib.crc32(self._key_for(ctx).encode("utf-8")) % self.processes
+
+    def _executor(self, slot: int) -> ProcessPoolExecutor:
+        with self._lock:
+            executor = self._executors[slot]
+            if executor is None:
+                executor = self._executors[slot] = ProcessPoolExecutor(
+                    max_workers=1,
+                    mp_context=self._context,
+                    initializer=_init_worker,
+                    initargs=(self.max_inflight,),
+                )
+            return executor
+
+    def _discard(self, slot: int, executor: ProcessPoolExecutor) -> None:
+        """종료된 워커를 버려 다음 요청에서 새로 시작하도록 합니다."""
+        with self._lock:
+            if self._executors[slot] is executor:
+                self._executors[slot] = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, ctx: str, *args: Any) -> Any:
+        """컨텍스트가 배정된 워커에서 target(ctx, *args)를 실행하고 결과를 기다립니다.
+
+        Args:
+            ctx (str): Kubernetes 컨텍스트 이름
+            *args: target에 전달할 추가 인자 (pickle 가능해야 함)
+
+        Returns:
+            target의 반환값
+
+        Raises:
+            BrokenProcessPool: 실행 중 워커 프로세스가 비정상 종료된 경우 (다음 요청에서 워커를 다시 시작)
+        """
+        slot = self.slot(ctx)
+        executor = self._executor(slot)
+        try:
+            return executor.submit(self._target, ctx, *args).result()
+        except BrokenProcessPool:
+            self._discard(slot, executor)
+            raise
+
+    def collect_cluster(self, ctx: str, datasets: Iterable[str]) -> dict[str, Any]:
+        """워커 프로세스에서 collectors.collect_cluster()를 실행합니다.
+
+        Args:
+            ctx (str): Kubernetes 컨텍스트 이름
+            datasets (Iterable[str]): 수집할 데이터셋
+
+        Returns:
+            dict: collect_cluster()와 같은 형태의 단일 클러스터 스냅샷
+        """
+        return self.submit(ctx, frozenset(datasets))  # type: ignore[no-any-return]
+
+    def invalidate(self, clusters: Iterable[str] | None = None) -> None:
+        """실행 중인 워커의 클러스터별 캐시를 비웁니다.
+
+        Args:
+            clusters (Iterable[str], optional): 대상 클러스터. 기본값은 None (전체)
+        """
+        with self._lock:
+            running = [(slot, e) for slot, e in enumerate(self._executors) if e is not None]
+        targets = None if clusters is None else list(clusters)
+        for slot, executor in running:
+            mine = None if targets is None else [ctx for ctx in targets if self.slot(ctx) == slot]
+            if mine != []:
+                executor.submit(_invalidate_in_worker, mine)
+
+    def shutdown(self) -> None:
+        """모든 워커 프로세스를 종료합니다."""
+        with self._lock:
+            executors, self._executors = self._executors, [None] * self.processes
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+
+def configured_processes() -> int:
+    """환경 변수에 설정된 워커 프로세스 수를 반환합니다 (잘못된 값이면 0).
+
+    Returns:
+        int: 워커 프로세스 수. 0이면 process-pool 모드 비활성화
+    """
+    raw = os.environ.get(PROCESSES_ENV, "").strip()
+    if raw == "auto":
+        return os.cpu_count() or 1
+    try:
+        return max(0, int(raw or 0))
+    except ValueError:
+        print(f"Warning: invalid {PROCESSES_ENV} value {raw!r}. Process-pool collection is disabled.")
+        return 0
+
+
+@lru_cache(maxsize=1)
+def process_pool() -> ClusterProcessPool | None:
+    """프로세스 전체에서 공유하는 워커 풀을 반환합니다.
+
+    Returns:
+        ClusterProcessPool | None: DASHBOARD_COLLECT_PROCESSES가 1 이상이면 워커 풀, 아니면 None
+    """
+    processes = configured_processes()
+    return ClusterProcessPool(processes) if processes else None
+
+
+def set_processes(processes: int | str) -> None:
+    """CLI 옵션 등으로 워커 프로세스 수를 지정합니다.
+
+    기존 워커 풀은 종료되며, 다음 수집부터 새 설정이 적용됩니다.
+
+    Args:
+        processes (int | str): 워커 프로세스 수 또는 "auto" (CPU 수)
+    """
+    pool = process_pool()
+    if pool is not None:
+        pool.shutdown()
+    os.environ[PROCESSES_ENV] = str(processes)
+    process_pool.cache_clear()
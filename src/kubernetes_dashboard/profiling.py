@@ -0,0 +1,347 @@
+"""Opt-in sampling profiler for dashboard reruns and collections.
+
+이 모듈은 느린 새로고침의 원인(API 서버 대기, 모델 역직렬화, pandas 변환, Streamlit 직렬화 등)을
+운영 환경에서 확인할 수 있도록 main() 실행 한 번 또는 collect() 호출 한 번을 샘플링 프로파일링합니다.
+
+- DASHBOARD_PROFILE에 "rerun"(main() 실행), "collect"(collect(), SnapshotStore.get(), exporter 수집 주기)를
+  쉼표로 구분하여 지정하거나, 사이드바의 프로파일링 토글을 켜면 활성화됩니다.
+- 꺼져 있으면 환경 변수 확인 외에는 비용이 없습니다 (nullcontext 반환).
+- 켜져 있으면 별도 스레드가 일정 간격으로 sys._current_frames()를 읽어, 호출한 스레드와
+  kubernetes_dashboard 코드를 실행 중인 스레드(클러스터별 수집 스레드 등)의 스택을 기록합니다.
+  동시에 실행 중인 다른 세션의 작업도 함께 기록되며 스레드별 프로파일로 구분됩니다.
+- 결과는 DASHBOARD_PROFILE_DIR(기본값 ~/.cache/kubernetes-dashboard/profiles)에
+  speedscope 파일(https://www.speedscope.app 에서 flame graph로 확인)과 상위 함수 요약 텍스트로 저장하며,
+  최근 PROFILE_KEEP개만 남깁니다.
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from itertools import count
+from types import FrameType
+from typing import Any
+
+# 프로파일링 범위를 지정하는 환경 변수 ("rerun", "collect" 또는 "rerun,collect")
+PROFILE_ENV = "DASHBOARD_PROFILE"
+# 결과 저장 디렉토리를 지정하는 환경 변수
+PROFILE_DIR_ENV = "DASHBOARD_PROFILE_DIR"
+DEFAULT_PROFILE_DIR = os.path.join("~", ".cache", "kubernetes-dashboard", "profiles")
+RERUN = "rerun"
+COLLECT = "collect"
+# 샘플링 간격(초)과 보관할 프로파일 수
+SAMPLE_INTERVAL = 0.005
+PROFILE_KEEP = 20
+
+_SPEEDSCOPE_SUFFIX = ".speedscope.json"
+_SUMMARY_SUFFIX = ".txt"
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+# 실행 중인 샘플링 스레드 (중첩된 프로파일러가 서로를 기록하지 않도록 제외)
+_samplers: set[int] = set()
+# 같은 밀리초에 저장한 프로파일의 파일 이름을 구분하는 번호
+_sequence = count()
+# 스레드 하나에 보관하는 최대 샘플 수 (약 8분 분량, 이후 샘플은 버림)
+_MAX_SAMPLES = 100_000
+
+# 리프 프레임부터 올라가며 처음 일치하는 경로로 샘플의 분류를 정함 (일치하지 않는 표준 라이브러리 프레임은 건너뜀)
+_CATEGORIES = (
+    ("apiserver I/O", ("/socket.py", "/ssl.py", "/http/client.py", "/urllib3/")),
+    ("deserialization", ("/kubernetes/client/", "/google/protobuf/", "/kubernetes_dashboard/wire.py")),
+    ("pandas", ("/pandas/", "/numpy/", "/pyarrow/")),
+    ("streamlit", ("/streamlit/", "/tornado/", "/altair/")),
+    ("thread wait", ("/threading.py", "/queue.py", "/concurrent/futures/")),
+    ("dashboard", ("/kubernetes_dashboard/",)),
+)
+
+
+def scopes() -> frozenset[str]:
+    """DASHBOARD_PROFILE에 지정된 프로파일링 범위를 반환합니다."""
+    raw = os.environ.get(PROFILE_ENV, "")
+    return frozenset(part.strip().lower() for part in raw.split(",") if part.strip())
+
+
+def profile_dir() -> str:
+    """프로파일 저장 디렉토리를 반환합니다."""
+    return os.path.expanduser(os.environ.get(PROFILE_DIR_ENV) or DEFAULT_PROFILE_DIR)
+
+
+def categorize(files: tuple[str, ...]) -> str:
+    """스택의 파일 경로(루트 → 리프)로 샘플의 분류를 정합니다.
+
+    Args:
+        files (tuple[str, ...]): 프레임별 파일 경로 (루트 → 리프 순)
+
+    Returns:
+        str: 분류 이름 ("apiserver I/O", "deserialization", "pandas", "streamlit", "thread wait", "dashboard", "other")
+    """
+    for filename in reversed(files):
+        path = filename.replace("\\", "/")
+        for category, fragments in _CATEGORIES:
+            if any(fragment in path for fragment in fragments):
+                return category
+    return "other"
+
+
+@dataclass
+class _ThreadSamples:
+    """스레드 하나의 샘플 (스택은 프레임 번호 튜플, 루트 → 리프)"""
+
+    name: str
+    stacks: list[tuple[int, ...]] = field(default_factory=list)
+    weights: list[float] = field(default_factory=list)
+
+
+class SamplingProfiler:
+    """sys._current_frames() 기반 샘플링 프로파일러
+
+    Attributes:
+        interval (float): 샘플링 간격(초)
+        duration (float): 프로파일링한 시간(초)
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL, package_dir: str = _PACKAGE_DIR) -> None:
+        self.interval = interval
+        self.duration = 0.0
+        self._package_dir = package_dir
+        self._target: int | None = None
+        # (파일, 함수, 시작 줄) → 프레임 번호
+        self._frame_index: dict[tuple[str, str, int], int] = {}
+        self._frames: list[tuple[str, str, int]] = []
+        self._threads: dict[int, _ThreadSamples] = {}
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+        self._started = 0.0
+
+    @property
+    def sample_count(self) -> int:
+        """기록된 샘플 수 (모든 스레드 합계)"""
+        return sum(len(samples.stacks) for samples in self._threads.values())
+
+    def start(self) -> None:
+        """호출한 스레드를 대상으로 샘플링을 시작합니다."""
+        self._target = threading.get_ident()
+        self._started = time.perf_counter()
+        self._sampler = threading.Thread(target=self._run, name="dashboard-profiler", daemon=True)
+        self._sampler.start()
+
+    def stop(self) -> None:
+        """샘플링을 멈추고 샘플링 스레드가 끝날 때까지 기다립니다."""
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        self.duration = time.perf_counter() - self._started
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        _samplers.add(own)
+        try:
+            last = time.perf_counter()
+            while not self._stop.wait(self.interval):
+                now = time.perf_counter()
+                self._sample(now - last)
+                last = now
+        finally:
+            _samplers.discard(own)
+
+    def _sample(self, weight: float) -> None:
+        """모든 스레드의 현재 스택 중 대상 스레드와 대시보드 코드를 실행 중인 스레드의 스택을 기록합니다."""
+        names: dict[int, str] | None = None
+        for ident, frame in sys._current_frames().items():
+            if ident in _samplers:
+                continue
+            stack = self._stack(frame, require_package=ident != self._target)
+            if stack is None:
+                continue
+            samples = self._threads.get(ident)
+            if samples is None:
+                if names is None:
+                    names = {thread.ident: thread.name for thread in threading.enumerate() if thread.ident}
+                samples = self._threads[ident] = _ThreadSamples(names.get(ident, str(ident)))
+            if len(samples.stacks) < _MAX_SAMPLES:
+                samples.stacks.append(stack)
+                samples.weights.append(weight)
+
+    def _stack(self, frame: FrameType | None, require_package: bool) -> tuple[int, ...] | None:
+        """프레임 체인을 프레임 번호 튜플(루트 → 리프)로 변환합니다.
+
+        require_package가 True이면 대시보드 코드가 없는 스택(유휴 스레드, Streamlit 서버 등)은 None을 반환합니다.
+        """
+        keys = []
+        found = not require_package
+        while frame is not None:
+            code = frame.f_code
+            keys.append((code.co_filename, code.co_name, code.co_firstlineno))
+            if not found and code.co_filename.startswith(self._package_dir):
+                found = True
+            frame = frame.f_back
+        if not found:
+            return None
+        stack = []
+        for key in reversed(keys):
+            index = self._frame_index.get(key)
+            if index is None:
+                index = self._frame_index[key] = len(self._frames)
+                self._frames.append(key)
+            stack.append(index)
+        return tuple(stack)
+
+    def speedscope(self, name: str) -> dict[str, Any]:
+        """speedscope 파일 형식(sampled 프로파일, 스레드별 하나)으로 변환합니다.
+
+        Args:
+            name (str): 프로파일 이름
+
+        Returns:
+            dict: speedscope JSON 객체
+        """
+        profiles = [
+            {
+                "type": "sampled",
+                "name": samples.name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(samples.weights),
+                "samples": [list(stack) for stack in samples.stacks],
+                "weights": samples.weights,
+            }
+            for samples in sorted(self._threads.values(), key=lambda s: -sum(s.weights))
+        ]
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "kubernetes-dashboard",
+            "activeProfileIndex": 0,
+            "shared": {"frames": [{"name": fn, "file": file, "line": line} for file, fn, line in self._frames]},
+            "profiles": profiles,
+        }
+
+    def summary(self, name: str, top: int = 25) -> str:
+        """분류별 시간 비율과 상위 함수(self/total 기준) 요약을 만듭니다.
+
+        Args:
+            name (str): 프로파일 이름
+            top (int, optional): 표시할 함수 수. 기본값은 25
+
+        Returns:
+            str: 요약 텍스트
+        """
+        total = 0.0
+        by_category: defaultdict[str, float] = defaultdict(float)
+        self_time: defaultdict[int, float] = defaultdict(float)
+        total_time: defaultdict[int, float] = defaultdict(float)
+        # 같은 스택이 반복되므로 분류는 스택마다 한 번만 계산
+        categories: dict[tuple[int, ...], str] = {}
+        for samples in self._threads.values():
+            for stack, weight in zip(samples.stacks, samples.weights, strict=True):
+                total += weight
+                category = categories.get(stack)
+                if category is None:
+                    category = categories[stack] = categorize(tuple(self._frames[i][0] for i in stack))
+                by_category[category] += weight
+                self_time[stack[-1]] += weight
+                for index in set(stack):
+                    total_time[index] += weight
+        lines = [
+            f"Profile: {name}",
+            f"Wall time {self.duration:.3f} s, {self.interval * 1000:.0f} ms interval, "
+            f"{len(self._threads)} threads, {self.sample_count} samples ({total:.3f} thread-seconds)",
+            "",
+            "Time by category (summed over threads):",
+        ]
+        lines += [
+            f"  {category:<16} {t / total:6.1%}  {t:8.3f} s"
+            for category, t in sorted(by_category.items(), key=lambda item: -item[1])
+        ]
+        lines += ["", "Threads:"]
+        lines += [
+            f"  {samples.name:<32} {sum(samples.weights):8.3f} s"
+            for samples in sorted(self._threads.values(), key=lambda s: -sum(s.weights))
+        ]
+        lines += ["", f"Top {top} functions by self time:", f"  {'self':>6} {'total':>6}  function"]
+        for index, t in sorted(self_time.items(), key=lambda item: -item[1])[:top]:
+            file, fn, line = self._frames[index]
+            lines.append(f"  {t / total:6.1%} {total_time[index] / total:6.1%}  {fn} ({file}:{line})")
+        return "\n".join(lines) + "\n"
+
+
+def _rotate(directory: str, keep: int) -> None:
+    """오래된 프로파일을 지워 최근 keep개만 남깁니다."""
+    stems = sorted(
+        (entry.stat().st_mtime, entry.name[: -len(_SPEEDSCOPE_SUFFIX)])
+        for entry in os.scandir(directory)
+        if entry.name.endswith(_SPEEDSCOPE_SUFFIX)
+    )
+    for _, stem in stems[: max(0, len(stems) - keep)]:
+        for suffix in (_SPEEDSCOPE_SUFFIX, _SUMMARY_SUFFIX):
+            try:
+                os.unlink(os.path.join(directory, stem + suffix))
+            except FileNotFoundError:
+                pass
+
+
+def write_profile(profiler: SamplingProfiler, label: str, directory: str, keep: int = PROFILE_KEEP) -> str:
+    """speedscope 파일과 요약 텍스트를 저장하고 오래된 프로파일을 정리합니다.
+
+    Args:
+        profiler (SamplingProfiler): 멈춘 프로파일러
+        label (str): 프로파일 이름 (파일 이름에 포함)
+        directory (str): 저장 디렉토리 (없으면 생성)
+        keep (int, optional): 보관할 프로파일 수. 기본값은 PROFILE_KEEP
+
+    Returns:
+        str: 확장자를 제외한 파일 경로
+
+    Raises:
+        OSError: 파일을 기록할 수 없는 경우
+    """
+    os.makedirs(directory, exist_ok=True)
+    now = time.time()
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now)) + f"-{int(now * 1000) % 1000:03d}"
+    safe = re.sub(r"[^A-Za-z0-9_.-]+", "_", label)
+    path = os.path.join(directory, f"{stamp}-{safe}-{os.getpid()}-{next(_sequence)}")
+    with open(path + _SPEEDSCOPE_SUFFIX, "w", encoding="utf-8") as f:
+        json.dump(profiler.speedscope(label), f, separators=(",", ":"))
+    with open(path + _SUMMARY_SUFFIX, "w", encoding="utf-8") as f:
+        f.write(profiler.summary(label))
+    _rotate(directory, keep)
+    return path
+
+
+@contextmanager
+def _profile(label: str) -> Iterator[SamplingProfiler]:
+    profiler = SamplingProfiler()
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        # 샘플링 간격보다 짧게 끝난 호출(캐시 적중 등)은 저장하지 않음
+        if profiler.sample_count:
+            directory = profile_dir()
+            try:
+                path = write_profile(profiler, label, directory)
+                print(f"Profile of {label} ({profiler.duration:.2f} s) written to {path}{_SPEEDSCOPE_SUFFIX}")
+            except OSError as e:
+                print(f"Warning: could not write profile to {directory}: {e}")
+
+
+def profiled(scope: str, label: str | None = None, force: bool = False) -> AbstractContextManager[Any]:
+    """범위가 활성화되어 있으면 with 블록을 프로파일링합니다.
+
+    Args:
+        scope (str): 프로파일링 범위 (RERUN 또는 COLLECT)
+        label (str, optional): 프로파일 이름. 기본값은 scope
+        force (bool, optional): 환경 변수와 관계없이 프로파일링 (사이드바 토글). 기본값은 False
+
+    Returns:
+        AbstractContextManager: 활성화되어 있으면 SamplingProfiler를, 아니면 None을 반환하는 컨텍스트 매니저
+    """
+    if not force and scope not in scopes():
+        return nullcontext()
+    return _profile(label or scope)
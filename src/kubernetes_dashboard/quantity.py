@@ -10,7 +10,21 @@ from collections.abc import Mapping
 
 # 단위 변환 상수
 _KI = 1024
-_MEM: Mapping[str, float] = {"Ki": _KI, "Mi": _KI**2, "Gi": _KI**3, "Ti": _KI**4}
+_MEM: Mapping[str, float] = {
+    "Ki": _KI,
+    "Mi": _KI**2,
+    "Gi": _KI**3,
+    "Ti": _KI**4,
+    "Pi": _KI**5,
+    "Ei": _KI**6,
+    # 10진 접미사 (requests/limits에서 "512M" 등으로 자주 사용)
+    "k": 1e3,
+    "M": 1e6,
+    "G": 1e9,
+    "T": 1e12,
+    "P": 1e15,
+    "E": 1e18,
+}
 _CPU: Mapping[str, float] = {"n": 1e-9, "u": 1e-6, "m": 1e-3, "": 1.0}
 
 # 수량 문자열 파싱을 위한 정규식
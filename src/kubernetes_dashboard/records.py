@@ -0,0 +1,250 @@
+"""Compact row types for collected cluster data.
+
+이 모듈은 수집 함수가 반환하는 행(non-running Pod, 워크로드, 노드 메트릭, 리소스 할당, 재시작 Pod, 이벤트, 검색 문서, 경보)을
+딕셔너리 대신 `__slots__` 기반 dataclass로 표현합니다. 행마다 딕셔너리를 만들지 않고,
+반복되는 클러스터/네임스페이스/노드 이름 등은 sys.intern()으로 하나의 문자열 객체를 공유하므로
+여러 세션이 같은 스냅샷을 캐시하는 대규모 환경에서 메모리 사용량이 크게 줄어듭니다.
+
+각 행은 읽기 전용 Mapping이므로 `row["cluster"]`, `row.get(...)`, `{**row}`,
+딕셔너리와의 비교 등 기존 딕셔너리 행을 사용하던 코드가 그대로 동작합니다.
+DataFrame이 필요하면 to_columns()/frame()으로 행 객체를 거치지 않고 열 단위로 변환합니다.
+"""
+
+import sys
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, overload
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@overload
+def intern(value: str) -> str: ...
+@overload
+def intern(value: None) -> None: ...
+def intern(value: str | None) -> str | None:
+    """문자열을 intern하여 같은 값의 문자열이 하나의 객체를 공유하도록 합니다.
+
+    Args:
+        value (str | None): intern할 문자열. None이면 그대로 반환
+
+    Returns:
+        str | None: intern된 문자열
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Record(Mapping[str, Any]):
+    """읽기 전용 Mapping으로 동작하는 행의 기반 클래스"""
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__dataclass_fields__:  # type: ignore[attr-defined]
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__dataclass_fields__)  # type: ignore[attr-defined]
+
+    def __len__(self) -> int:
+        return len(self.__dataclass_fields__)  # type: ignore[attr-defined]
+
+    def to_dict(self) -> dict[str, Any]:
+        """행을 일반 딕셔너리로 변환합니다."""
+        return {key: getattr(self, key) for key in self}
+
+
+# eq=False: 딕셔너리 행과 비교할 수 있도록 Mapping의 __eq__를 사용
+@dataclass(slots=True, eq=False)
+class PodRow(Record):
+    """Running 상태가 아닌 Pod 한 개"""
+
+    cluster: str
+    pod: str
+    ns: str
+    node: str
+    phase: str
+    reason: str
+    # 최상위 소유자 "Kind/name" (workloads.WorkloadRollup 참고)
+    workload: str = ""
+
+
+@dataclass(slots=True, eq=False)
+class NodeRow(Record):
+    """노드 한 개의 리소스 사용량 (metrics-server가 없으면 값은 "N/A")"""
+
+    cluster: str
+    node: str
+    cpu: float | str
+    mem: float | str
+    cpu_percent: float | str
+    mem_percent: float | str
+
+
+@dataclass(slots=True, eq=False)
+class NodePodRow(Record):
+    """노드에 배치된 Pod 한 개 (노드 상세 보기용, 사용량은 metrics-server가 없으면 None)"""
+
+    cluster: str
+    node: str
+    pod: str
+    ns: str
+    phase: str
+    # 컨테이너 누적 재시작 횟수 합계
+    restarts: int
+    cpu: float | None = None
+    mem: float | None = None
+
+
+@dataclass(slots=True, eq=False)
+class AllocationRow(Record):
+    """노드 한 개의 requests/limits 합계와 사용량 (퍼센트는 allocatable 대비, 알 수 없으면 None)"""
+
+    cluster: str
+    node: str
+    # 종료되지 않은(Succeeded/Failed가 아닌) Pod 수
+    pods: int
+    cpu_allocatable: float
+    cpu_requests: float
+    cpu_limits: float
+    # metrics-server가 없으면 None
+    cpu_used: float | None
+    cpu_requested_percent: float | None
+    cpu_used_percent: float | None
+    # limits 합계 / allocatable (100% 초과면 overcommit)
+    cpu_overcommit_percent: float | None
+    mem_allocatable: float
+    mem_requests: float
+    mem_limits: float
+    mem_used: float | None
+    mem_requested_percent: float | None
+    mem_used_percent: float | None
+    mem_overcommit_percent: float | None
+
+
+@dataclass(slots=True, eq=False)
+class NamespaceAllocationRow(Record):
+    """네임스페이스 한 개의 requests/limits 합계 (스케줄되지 않은 Pod 포함)"""
+
+    cluster: str
+    ns: str
+    pods: int
+    cpu_requests: float
+    cpu_limits: float
+    mem_requests: float
+    mem_limits: float
+
+
+@dataclass(slots=True, eq=False)
+class RestartRow(Record):
+    """재시작한 컨테이너 한 개 (restarts는 누적 횟수, restarts_* 는 구간별 재시작 수)"""
+
+    cluster: str
+    pod: str
+    ns: str
+    node: str | None
+    restarts: int | None
+    container: str
+    restarts_5m: int
+    restarts_1h: int
+    restarts_24h: int
+
+
+@dataclass(slots=True, eq=False)
+class WorkloadRow(Record):
+    """최상위 소유자(Deployment 등) 단위로 묶은 Pod 합계"""
+
+    cluster: str
+    ns: str
+    kind: str
+    name: str
+    pods: int
+    ready: int
+    non_running: int
+    restarts: int
+
+
+@dataclass(slots=True, eq=False)
+class EventRow(Record):
+    """클러스터 이벤트 한 개"""
+
+    cluster: str
+    type: str | None
+    reason: str | None
+    object: str
+    message: str | None
+    time: datetime | None
+    # 관련 오브젝트의 네임스페이스 (클러스터 범위 오브젝트는 None)
+    ns: str | None = None
+
+
+@dataclass(slots=True, eq=False)
+class SearchRow(Record):
+    """검색 색인의 문서 한 개 (네임스페이스, 노드 또는 Pod)"""
+
+    cluster: str
+    kind: str
+    ns: str
+    name: str
+    node: str
+    # Pod phase 또는 노드 Ready 상태
+    status: str
+
+
+@dataclass(slots=True, eq=False)
+class AlertRow(Record):
+    """경보 규칙에 일치하는 series 한 개"""
+
+    cluster: str
+    alert: str
+    severity: str
+    # series를 구분하는 열 값 ("ns=default" 등)
+    series: str
+    value: float
+    # "firing" 또는 "pending" (지속 조건을 아직 만족하지 않음)
+    state: str
+    since: datetime
+
+
+def to_columns(rows: Sequence[Mapping[str, Any]], record_type: type[Record]) -> dict[str, list[Any]]:
+    """행 목록을 열 이름 → 값 목록으로 변환합니다.
+
+    행마다 딕셔너리를 만들지 않고 속성을 직접 읽으며, 값은 복사하지 않고 같은 객체를 참조합니다.
+    기존 딕셔너리 행이 섞여 있어도 변환할 수 있습니다.
+
+    Args:
+        rows (Sequence[Mapping[str, Any]]): 행 목록
+        record_type (type[Record]): 열 구성을 결정하는 행 타입
+
+    Returns:
+        dict[str, list]: 열 이름 → 값 목록 (행 타입의 필드 순서)
+    """
+    columns: dict[str, list[Any]] = {}
+    for name in record_type.__dataclass_fields__:  # type: ignore[attr-defined]
+        try:
+            columns[name] = list(map(attrgetter(name), rows))
+        except AttributeError:
+            # 딕셔너리 행이 섞여 있는 경우
+            columns[name] = [row.get(name) for row in rows]
+    return columns
+
+
+def frame(rows: Sequence[Mapping[str, Any]], record_type: type[Record]) -> "pd.DataFrame":
+    """행 목록을 DataFrame으로 변환합니다.
+
+    행이 없어도 행 타입의 열을 가진 빈 DataFrame을 반환합니다.
+
+    Args:
+        rows (Sequence[Mapping[str, Any]]): 행 목록
+        record_type (type[Record]): 열 구성을 결정하는 행 타입
+
+    Returns:
+        pd.DataFrame: 행 타입의 필드를 열로 가지는 DataFrame
+    """
+    import pandas as pd
+
+    return pd.DataFrame(to_columns(rows, record_type))
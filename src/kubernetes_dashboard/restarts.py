@@ -0,0 +1,205 @@
+"""Restart-rate tracking based on restart_count deltas.
+
+이 모듈은 수집할 때마다 컨테이너의 restart_count를 (cluster, namespace, pod, container)
+단위로 기억하고, 이전 수집과의 차이를 재시작 이벤트로 기록합니다.
+마지막 종료 시각(last_state.terminated.finished_at)만 보는 방식과 달리 종료 기록이
+덮어써진 crash loop도 놓치지 않으며, 누적 횟수 대신 5분/1시간/24시간 구간의 재시작 수를 제공합니다.
+
+구간별 합계는 이벤트가 추가되거나 구간을 벗어날 때마다 증분으로 갱신하며,
+가장 많이 재시작한 컨테이너는 heap으로 선택합니다.
+마지막 수집 이후 생성되어 처음 보는 UID의 Pod는 restart_count 전체를 새 재시작으로 취급하고,
+삭제된 Pod의 기록은 가장 긴 구간이 지나면 제거되므로 메모리 사용량이 계속 늘어나지 않습니다.
+"""
+
+import heapq
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from typing import Any
+
+# (구간 이름, 길이(초)) - 길이 오름차순
+WINDOWS: tuple[tuple[str, float], ...] = (("5m", 300.0), ("1h", 3600.0), ("24h", 86400.0))
+
+# (cluster, namespace, pod, container)
+ContainerKey = tuple[str, str, str, str]
+
+
+class _Series:
+    """컨테이너 하나의 재시작 이벤트와 구간별 합계"""
+
+    __slots__ = ("events", "heads", "sums")
+
+    def __init__(self, windows: int) -> None:
+        self.events: deque[tuple[float, int]] = deque()
+        # heads[i]: i번째 구간에서 이미 벗어난 이벤트 수 (events 앞쪽부터)
+        self.heads = [0] * windows
+        self.sums = [0] * windows
+
+    def add(self, ts: float, count: int) -> None:
+        if self.events and ts < self.events[-1][0]:
+            # 시간 순서를 유지 (첫 수집 시 과거 종료 시각으로 기록한 이벤트 등)
+            ts = self.events[-1][0]
+        self.events.append((ts, count))
+        for i in range(len(self.sums)):
+            self.sums[i] += count
+
+    def advance(self, now: float, spans: Sequence[float]) -> None:
+        """구간을 벗어난 이벤트를 합계에서 빼고, 가장 긴 구간도 벗어난 이벤트는 버립니다."""
+        for i, span in enumerate(spans):
+            cutoff = now - span
+            while self.heads[i] < len(self.events) and self.events[self.heads[i]][0] <= cutoff:
+                self.sums[i] -= self.events[self.heads[i]][1]
+                self.heads[i] += 1
+        drop = self.heads[-1]
+        for _ in range(drop):
+            self.events.popleft()
+        self.heads = [head - drop for head in self.heads]
+
+
+def _timestamp(value: Any) -> float | None:
+    """datetime을 Unix time으로 변환합니다 (None이면 None)."""
+    return value.timestamp() if value is not None and hasattr(value, "timestamp") else None
+
+
+class RestartTracker:
+    """컨테이너 재시작 횟수 변화를 추적하여 구간별 재시작 수를 계산합니다.
+
+    수집 주기 사이에 발생한 재시작은 해당 수집 시각에 발생한 것으로 기록되므로,
+    5분 구간은 수집 주기가 5분보다 짧을 때 의미가 있습니다.
+
+    Attributes:
+        windows (tuple): (구간 이름, 길이(초)) 목록
+    """
+
+    def __init__(self, windows: Sequence[tuple[str, float]] = WINDOWS) -> None:
+        self.windows = tuple(sorted(windows, key=lambda w: w[1]))
+        self._spans = [span for _, span in self.windows]
+        # cluster → (ns, pod, container) → (pod uid, restart_count)
+        self._counts: dict[str, dict[tuple[str, str, str], tuple[str | None, int]]] = {}
+        self._observed: dict[str, float] = {}
+        self._series: dict[ContainerKey, _Series] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """재시작 기록이 남아 있는 컨테이너 수"""
+        return len(self._series)
+
+    def observe(
+        self,
+        cluster: str,
+        pods: Iterable[Any],
+        now: float | None = None,
+        namespaces: Iterable[str] | None = None,
+    ) -> None:
+        """클러스터의 Pod 목록으로 재시작 횟수 변화를 반영합니다.
+
+        처음 수집하는 클러스터는 재시작 이력을 알 수 없으므로, 마지막 종료 시각이
+        가장 긴 구간 안에 있는 컨테이너만 그 시각에 1회 재시작한 것으로 기록합니다.
+        이미 수집한 클러스터에서 기준값이 없는 컨테이너는 처음 보는 UID이고 마지막 수집 이후에 생성된
+        Pod(새 Pod 또는 다시 생성된 Pod)이면 현재 restart_count 전체를 이번 수집 주기의 재시작으로 기록하고,
+        그 밖의 경우(권한 문제로 건너뛰었던 네임스페이스가 다시 조회된 경우 등)는 첫 수집과 같이 처리합니다.
+
+        Args:
+            cluster (str): Kubernetes 컨텍스트 이름
+            pods (Iterable): V1Pod 객체 목록 (list_pod_for_all_namespaces 결과)
+            now (float, optional): 수집 시각(Unix time). 기본값은 현재 시각
+            namespaces (Iterable[str], optional): 목록에 포함된 네임스페이스. 기본값은 None (전체 네임스페이스).
+                포함되지 않은 네임스페이스의 기준값은 다음 수집까지 유지
+        """
+        now = time.time() if now is None else now
+        longest = self._spans[-1]
+        with self._lock:
+            previous = self._counts.get(cluster)
+            observed = self._observed.get(cluster)
+            seen = {uid for uid, _ in previous.values()} if previous is not None else set()
+            counts: dict[tuple[str, str, str], tuple[str | None, int]] = {}
+            for pod in pods:
+                uid = pod.metadata.uid
+                created = _timestamp(pod.metadata.creation_timestamp)
+                new_pod = uid not in seen and created is not None and observed is not None and created > observed
+                for cs in pod.status.container_statuses or []:
+                    key = (pod.metadata.namespace, pod.metadata.name, cs.name)
+                    count = cs.restart_count or 0
+                    counts[key] = (uid, count)
+                    before = previous.get(key) if previous is not None else None
+                    if before is not None and before[0] == uid:
+                        # 카운터가 초기화되었으면 현재 값 전체가 새 재시작
+                        delta = count - before[1] if count >= before[1] else count
+                    elif new_pod:
+                        # 마지막 수집 이후 생성된 새 Pod 또는 다시 생성된 Pod
+                        delta = count
+                    else:
+                        # 이력을 알 수 없는 컨테이너: 가장 긴 구간 안의 마지막 종료만 1회로 기록
+                        term = cs.last_state.terminated if cs.last_state else None
+                        finished = _timestamp(term.finished_at) if term else None
+                        if count and finished is not None and now - finished < longest:
+                            self._record((cluster, *key), finished, 1)
+                        continue
+                    if delta > 0:
+                        self._record((cluster, *key), now, delta)
+            if previous is not None and namespaces is not None:
+                # 이번 목록에서 건너뛴 네임스페이스의 기준값은 유지
+                listed = set(namespaces)
+                counts.update((key, value) for key, value in previous.items() if key[0] not in listed)
+            # 현재 목록에 없는 Pod는 기준값에서 제외 (재시작 기록은 구간이 지날 때까지 유지)
+            self._counts[cluster] = counts
+            self._observed[cluster] = now
+            self._prune(now)
+
+    def _record(self, key: ContainerKey, ts: float, count: int) -> None:
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series(len(self._spans))
+        series.add(ts, count)
+
+    def _prune(self, now: float) -> None:
+        """구간을 갱신하고 기록이 없는 컨테이너와 오래 수집되지 않은 클러스터를 제거합니다."""
+        for key in [key for key, series in self._series.items() if not self._advance(series, now)]:
+            del self._series[key]
+        stale = [cluster for cluster, ts in self._observed.items() if now - ts > self._spans[-1]]
+        for cluster in stale:
+            del self._observed[cluster]
+            self._counts.pop(cluster, None)
+
+    def _advance(self, series: _Series, now: float) -> bool:
+        series.advance(now, self._spans)
+        return bool(series.events)
+
+    def top(
+        self,
+        n: int,
+        window: str = "1h",
+        clusters: Iterable[str] | None = None,
+        now: float | None = None,
+    ) -> list[tuple[ContainerKey, tuple[int, ...]]]:
+        """지정한 구간에서 재시작이 가장 많은 컨테이너를 반환합니다.
+
+        Args:
+            n (int): 반환할 최대 컨테이너 수
+            window (str, optional): 순위 기준 구간 이름. 기본값은 "1h"
+            clusters (Iterable[str], optional): 대상 클러스터. 기본값은 None (전체)
+            now (float, optional): 기준 시각(Unix time). 기본값은 현재 시각
+
+        Returns:
+            list: ((cluster, namespace, pod, container), 구간별 재시작 수) 목록.
+                기준 구간 재시작 수, 가장 긴 구간 재시작 수 순으로 내림차순 정렬
+        """
+        now = time.time() if now is None else now
+        index = [name for name, _ in self.windows].index(window)
+        targets = None if clusters is None else set(clusters)
+        with self._lock:
+            self._prune(now)
+            candidates = (
+                (key, tuple(series.sums))
+                for key, series in self._series.items()
+                if targets is None or key[0] in targets
+            )
+            return heapq.nlargest(n, candidates, key=lambda item: (item[1][index], item[1][-1]))
+
+
+@lru_cache(maxsize=1)
+def restart_tracker() -> RestartTracker:
+    """프로세스 전체에서 공유하는 재시작 추적기를 반환합니다."""
+    return RestartTracker()
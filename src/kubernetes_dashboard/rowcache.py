@@ -0,0 +1,96 @@
+"""Identity-keyed LRU cache for values derived from row lists.
+
+이 모듈은 행 목록에서 만든 값(TableStore, EventIndex, NodePodIndex 등)을 같은 행 목록에 대해 재사용하는
+RowCache를 제공합니다. SnapshotStore는 새로고침 전까지 같은 행 객체를 반환하므로 행 객체의 id 목록으로 캐시를 찾습니다.
+캐시 항목이 행 목록을 참조하므로 캐시에 있는 동안 id가 다른 객체에 재사용되지 않으며,
+해시가 충돌해도 다른 행 목록의 값을 반환하지 않도록 찾은 항목의 행 객체가 같은지 확인합니다.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from typing import Any, TypeVar
+
+from kubernetes_dashboard.memory import Usage, estimate
+
+T = TypeVar("T")
+
+
+class RowCache:
+    """행 목록 → 파생 값 LRU 캐시
+
+    Attributes:
+        name (str): 메모리 사용량에 표시할 구성 요소 이름
+        size (int): 보관하는 값 최대 개수
+    """
+
+    def __init__(self, name: str, size: int) -> None:
+        self.name = name
+        self.size = size
+        self._entries: OrderedDict[tuple[Hashable, ...], tuple[Sequence[Any], Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, rows: Sequence[Any], build: Callable[[Sequence[Any]], T], *key: Hashable) -> T:
+        """행 목록에 대한 값을 반환합니다 (같은 행 객체 목록이면 캐시된 것을 재사용).
+
+        Args:
+            rows (Sequence): 행 목록
+            build (Callable[[Sequence], T]): 캐시에 없을 때 값을 만드는 함수
+            *key (Hashable): 같은 행 목록에서 다른 값을 만드는 경우 구분할 키 (행 타입 등)
+
+        Returns:
+            T: 행 목록의 값
+        """
+        cache_key = (*key, len(rows), hash(tuple(map(id, rows))))
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and all(a is b for a, b in zip(entry[0], rows, strict=True)):
+                self._entries.move_to_end(cache_key)
+                cached: T = entry[1]
+                return cached
+        value = build(rows)
+        with self._lock:
+            self._entries[cache_key] = (rows, value)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+        return value
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        """캐시를 비웁니다."""
+        with self._lock:
+            self._entries.clear()
+
+    def usage(self) -> Usage:
+        """캐시된 값과 값이 참조하는 행 목록의 메모리 사용량을 반환합니다 (memory.MemoryGovernor 구성 요소).
+
+        행 목록은 스냅샷 저장소와 공유할 수 있지만, 저장소가 디스크로 내보낸 뒤에도 캐시가 행을 붙잡고 있으므로 함께 셉니다.
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+        rows = sum(len(entry[0]) for entry in entries)
+        return Usage(self.name, sum(_entry_bytes(entry) for entry in entries), f"{len(entries)}개 색인, {rows:,}개 행")
+
+    def release(self, target: int) -> int:
+        """가장 오래전에 사용한 값부터 target 바이트 이상을 해제합니다 (다음 조회에서 다시 만듦).
+
+        Args:
+            target (int): 해제할 바이트 수
+
+        Returns:
+            int: 해제한 바이트 수 (참조하던 행 목록 포함)
+        """
+        freed = 0
+        with self._lock:
+            while self._entries and freed < target:
+                freed += _entry_bytes(self._entries.popitem(last=False)[1])
+        return freed
+
+
+def _entry_bytes(entry: tuple[Sequence[Any], Any]) -> int:
+    """캐시 항목 하나(행 목록, 값)의 추정 바이트 수를 계산합니다."""
+    rows, value = entry
+    return estimate(rows) + estimate(value)
@@ -0,0 +1,326 @@
+"""Adaptive request scheduler for Kubernetes API servers.
+
+이 모듈은 여러 클러스터에 대한 API 호출을 조율하는 스케줄러를 제공합니다.
+수십 개의 컨텍스트를 한 번에 수집하더라도 각 API 서버에 LIST 요청이 몰리지 않도록
+동시 실행 수와 요청 속도를 제한하고, API Priority & Fairness가 반환하는 429 응답은
+Retry-After를 따라 재시도합니다.
+
+주요 기능:
+- 전역 동시 실행 수 제한 및 API 서버별 동시 실행 수 제한
+- API 서버별 토큰 버킷 요청 속도 제한
+- 429 응답 시 Retry-After + jitter 백오프 후 재시도
+- 관측된 응답 시간에 따라 API 서버별 동시 실행 수를 조정 (AIMD)
+"""
+
+import os
+import random
+import threading
+import time
+from collections.abc import Callable
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from kubernetes_dashboard.kube_client import apiserver_for
+
+T = TypeVar("T")
+
+DEFAULT_MAX_INFLIGHT = 16
+# 전역 최대 동시 요청 수를 지정하는 환경 변수 (process-pool 워커는 워커 수로 나눈 값을 받음)
+MAX_INFLIGHT_ENV = "DASHBOARD_MAX_INFLIGHT"
+DEFAULT_PER_SERVER = 8
+DEFAULT_QPS = 10.0
+DEFAULT_BURST = 20
+
+# 스로틀링 응답 상태 코드 (API Priority & Fairness)
+_THROTTLED = 429
+
+
+class TokenBucket:
+    """토큰 버킷 요청 속도 제한기
+
+    토큰이 부족하면 음수로 예약하여 대기 시간을 계산하므로, 요청 순서대로 공정하게 대기합니다.
+
+    Attributes:
+        rate (float): 초당 보충되는 토큰 수. 0 이하이면 제한하지 않음
+        burst (int): 최대 누적 토큰 수
+    """
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._paused_until = float("-inf")
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고 요청 전에 기다려야 하는 시간(초)을 반환합니다.
+
+        Returns:
+            float: 대기 시간(초). 바로 요청할 수 있으면 0
+        """
+        with self._lock:
+            now = self._clock()
+            pause = max(0.0, self._paused_until - now)
+            if self.rate <= 0:
+                return pause
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(pause, -self._tokens / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """지정한 시간 동안 새 요청을 보내지 않도록 버킷을 일시 중지합니다.
+
+        Args:
+            seconds (float): 일시 중지 시간(초)
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+class AdaptiveLimit:
+    """응답 시간에 따라 조정되는 동시 실행 수 제한 (AIMD)
+
+    호출 종류별 응답 시간의 지수 이동 평균을 기준값으로 삼아, 응답 시간이 기준값의
+    `tolerance`배 이내이면 제한을 조금씩 늘리고(가산 증가), 이를 넘거나 스로틀링되면
+    제한을 줄입니다(승산 감소).
+
+    Attributes:
+        limit (float): 현재 동시 실행 수 제한
+        in_flight (int): 현재 실행 중인 요청 수
+    """
+
+    def __init__(
+        self,
+        initial: float,
+        minimum: float = 1.0,
+        maximum: float = DEFAULT_PER_SERVER,
+        tolerance: float = 2.0,
+        alpha: float = 0.2,
+    ) -> None:
+        self.minimum = minimum
+        self.maximum = maximum
+        self.tolerance = tolerance
+        self.alpha = alpha
+        self.limit = min(maximum, max(minimum, initial))
+        self.in_flight = 0
+        self._baseline: dict[str, float] = {}
+        self._cond = threading.Condition()
+
+    def __enter__(self) -> "AdaptiveLimit":
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify()
+
+    def observe(self, op: str, latency: float) -> None:
+        """성공한 요청의 응답 시간을 반영합니다.
+
+        Args:
+            op (str): 호출 종류 (API 메서드 이름). LIST Pod와 LIST Node처럼 응답 시간이
+                다른 호출을 구분하기 위해 사용
+            latency (float): 응답 시간(초)
+        """
+        with self._cond:
+            baseline = self._baseline.get(op)
+            if baseline is None:
+                self._baseline[op] = latency
+                return
+            if latency > baseline * self.tolerance:
+                self.limit = max(self.minimum, self.limit * 0.9)
+            else:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+                self._cond.notify_all()
+            self._baseline[op] = baseline + self.alpha * (latency - baseline)
+
+    def throttled(self) -> None:
+        """스로틀링 응답을 반영하여 제한을 절반으로 줄입니다."""
+        with self._cond:
+            self.limit = max(self.minimum, self.limit / 2)
+
+
+def _retry_after(exc: BaseException, now: Callable[[], float] = time.time) -> float | None:
+    """예외의 Retry-After 헤더를 초 단위로 변환합니다 (초 또는 HTTP 날짜 형식)."""
+    headers = getattr(exc, "headers", None)
+    value = headers.get("Retry-After") if headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - now())
+    except (TypeError, ValueError):
+        return None
+
+
+class _Server:
+    """API 서버별 스케줄링 상태"""
+
+    def __init__(self, bucket: TokenBucket, limit: AdaptiveLimit) -> None:
+        self.bucket = bucket
+        self.limit = limit
+        self.requests = 0
+        self.throttled = 0
+
+
+class Scheduler:
+    """전역 및 API 서버별 제한을 적용하여 API 호출을 실행하는 스케줄러
+
+    같은 API 서버를 가리키는 여러 컨텍스트는 하나의 제한을 공유합니다.
+    재시도 대기 중에는 동시 실행 슬롯을 반납하므로 다른 클러스터의 수집은 계속 진행됩니다.
+
+    Attributes:
+        max_inflight (int): 전체 API 서버에 대한 최대 동시 요청 수
+        max_retries (int): 429 응답 시 최대 재시도 횟수
+    """
+
+    def __init__(
+        self,
+        max_inflight: int = DEFAULT_MAX_INFLIGHT,
+        per_server: int = DEFAULT_PER_SERVER,
+        qps: float = DEFAULT_QPS,
+        burst: int = DEFAULT_BURST,
+        max_retries: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        key_for: Callable[[str], str] = str,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.max_inflight = max(1, max_inflight)
+        self.per_server = max(1, per_server)
+        self.qps = qps
+        self.burst = burst
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._key_for = key_for
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng
+        self._global = threading.BoundedSemaphore(self.max_inflight)
+        self._servers: dict[str, _Server] = {}
+        self._servers_guard = threading.Lock()
+
+    def _server(self, ctx: str) -> _Server:
+        key = self._key_for(ctx)
+        with self._servers_guard:
+            server = self._servers.get(key)
+            if server is None:
+                # 처음에는 최대치의 절반에서 시작하여 응답 시간을 보며 늘림
+                limit = AdaptiveLimit(max(1, self.per_server // 2), maximum=self.per_server)
+                server = self._servers[key] = _Server(TokenBucket(self.qps, self.burst, self._clock), limit)
+            return server
+
+    def _backoff(self, attempt: int, retry_after: float | None) -> float:
+        """재시도 전 대기 시간을 계산합니다.
+
+        Retry-After가 있으면 그보다 일찍 재시도하지 않도록 최대 50%의 jitter를 더하고,
+        없으면 지수 백오프에 jitter를 적용합니다.
+        """
+        if retry_after is not None:
+            delay = min(self.max_delay, retry_after)
+            return delay + self._rng() * delay * 0.5
+        delay = min(self.max_delay, self.base_delay * 2.0**attempt)
+        return delay / 2 + self._rng() * delay / 2
+
+    def call(self, ctx: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """API 호출을 제한에 맞춰 실행하고, 429 응답은 백오프 후 재시도합니다.
+
+        Args:
+            ctx (str): Kubernetes 컨텍스트 이름
+            fn (Callable): 실행할 API 메서드 (예: core.list_node)
+            *args: fn에 전달할 위치 인자
+            **kwargs: fn에 전달할 키워드 인자
+
+        Returns:
+            fn의 반환값
+
+        Raises:
+            Exception: fn이 429 이외의 오류를 발생시키거나 재시도 횟수를 초과한 경우
+        """
+        server = self._server(ctx)
+        op = getattr(fn, "__name__", type(fn).__name__)
+        attempt = 0
+        while True:
+            with server.limit:
+                wait = server.bucket.reserve()
+                if wait > 0:
+                    self._sleep(wait)
+                with self._global:
+                    started = self._clock()
+                    try:
+                        result = fn(*args, **kwargs)
+                    except Exception as e:
+                        if getattr(e, "status", None) != _THROTTLED or attempt >= self.max_retries:
+                            raise
+                        retry_after = _retry_after(e)
+                    else:
+                        server.requests += 1
+                        server.limit.observe(op, self._clock() - started)
+                        return result
+            # 429: 같은 API 서버로 가는 새 요청도 Retry-After 동안 멈추고, 슬롯을 반납한 채 대기
+            server.throttled += 1
+            server.limit.throttled()
+            if retry_after is not None:
+                server.bucket.pause(min(self.max_delay, retry_after))
+            self._sleep(self._backoff(attempt, retry_after))
+            attempt += 1
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """API 서버별 현재 제한과 요청 통계를 반환합니다.
+
+        Returns:
+            dict: API 서버 → {limit, in_flight, requests, throttled}
+        """
+        with self._servers_guard:
+            servers = dict(self._servers)
+        return {
+            key: {
+                "limit": server.limit.limit,
+                "in_flight": server.limit.in_flight,
+                "requests": server.requests,
+                "throttled": server.throttled,
+            }
+            for key, server in servers.items()
+        }
+
+
+def configured_max_inflight() -> int:
+    """환경 변수에 설정된 전역 최대 동시 요청 수를 반환합니다 (미설정이거나 잘못된 값이면 기본값).
+
+    Returns:
+        int: 전역 최대 동시 요청 수
+    """
+    raw = os.environ.get(MAX_INFLIGHT_ENV, "").strip()
+    try:
+        return max(1, int(raw)) if raw else DEFAULT_MAX_INFLIGHT
+    except ValueError:
+        print(f"Warning: invalid {MAX_INFLIGHT_ENV} value {raw!r}. Using {DEFAULT_MAX_INFLIGHT}.")
+        return DEFAULT_MAX_INFLIGHT
+
+
+@lru_cache(maxsize=1)
+def default_scheduler() -> Scheduler:
+    """프로세스 전체에서 공유하는 스케줄러를 반환합니다.
+
+    대시보드의 여러 세션, 내보내기 모드, 스냅샷 모드가 모두 같은 제한을 공유하며,
+    같은 API 서버 주소를 가진 컨텍스트는 하나의 API 서버로 취급합니다.
+    전역 최대 동시 요청 수는 DASHBOARD_MAX_INFLIGHT로 바꿀 수 있습니다 (기본값 DEFAULT_MAX_INFLIGHT).
+
+    Returns:
+        Scheduler: 기본 설정의 스케줄러
+    """
+    return Scheduler(max_inflight=configured_max_inflight(), key_for=apiserver_for)
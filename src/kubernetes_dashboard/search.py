@@ -0,0 +1,234 @@
+"""Fleet-wide search index over pods, nodes, namespaces and labels.
+
+이 모듈은 선택한 모든 클러스터의 Pod, 노드, 네임스페이스 이름과 레이블 값을 한 번에 검색하는
+메모리 색인을 제공합니다. 색인은 클러스터마다 하나의 SearchSegment로 만들어지며,
+SnapshotStore가 클러스터별로 캐시하므로 새로고침된 클러스터의 세그먼트만 다시 만들어집니다.
+
+주요 기능:
+- 검색어(term)는 사전순으로 정렬하여 3자 미만 검색어는 접두사 범위(bisect)로 찾음
+- 3자 이상 검색어는 가장 드문 trigram의 출현 위치를 후보로 삼아 나머지 바이트를 벡터 연산으로 확인
+- 검색어 → 문서 목록(posting)은 CSR 형태의 numpy 배열로 보관하여 일치 문서를 벡터 연산으로 모음
+- 공백으로 구분한 여러 검색어는 모두 일치하는 문서만 반환 (AND)
+"""
+
+import bisect
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from kubernetes_dashboard.memory import estimate
+from kubernetes_dashboard.records import SearchRow
+
+# 문서 종류 (결과 표시 순서)
+NAMESPACE = "namespace"
+NODE = "node"
+POD = "pod"
+KINDS = (NAMESPACE, NODE, POD)
+# 이 길이(바이트) 미만의 검색어는 접두사 검색
+_TRIGRAM = 3
+# 검색 결과로 반환하는 최대 행 수
+DEFAULT_LIMIT = 200
+# 값이 Pod/리비전마다 달라 검색에 도움이 되지 않는 레이블
+IGNORED_LABELS = frozenset({"pod-template-hash", "controller-revision-hash", "pod-template-generation"})
+
+_EMPTY = np.zeros(0, dtype=np.int32)
+
+
+def label_terms(labels: Mapping[str, str] | None) -> list[str]:
+    """레이블을 검색어로 변환합니다 ("key=value"와 value).
+
+    Args:
+        labels (Mapping[str, str] | None): 레이블
+
+    Returns:
+        list[str]: 검색어 목록
+    """
+    terms: list[str] = []
+    for key, value in (labels or {}).items():
+        if key not in IGNORED_LABELS:
+            terms.append(f"{key}={value}")
+            terms.append(value)
+    return terms
+
+
+def _gather(offsets: np.ndarray, values: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    """CSR 배열에서 ids 행의 값을 모두 이어 붙여 반환합니다."""
+    starts = offsets[ids]
+    counts = offsets[ids + 1] - starts
+    total = int(counts.sum())
+    if not total:
+        return _EMPTY
+    # 각 구간의 시작 위치를 반복하고 구간 안의 순번을 더함
+    base = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return values[base + np.arange(total)]
+
+
+class SearchSegment:
+    """단일 클러스터의 검색 색인
+
+    Attributes:
+        cluster (str): Kubernetes 컨텍스트 이름
+        rows (list[SearchRow]): 문서 (검색 결과 행). 이 순서가 결과 순서
+    """
+
+    def __init__(self, cluster: str, rows: Sequence[SearchRow], terms: Sequence[Iterable[str]]) -> None:
+        """색인을 만듭니다.
+
+        Args:
+            cluster (str): Kubernetes 컨텍스트 이름
+            rows (Sequence[SearchRow]): 문서
+            terms (Sequence[Iterable[str]]): 문서별 검색어 (rows와 같은 순서, 대소문자 무시)
+        """
+        self.cluster = cluster
+        self.rows = list(rows)
+        vocab: dict[str, int] = {}
+        pair_terms: list[int] = []
+        pair_docs: list[int] = []
+        for doc, doc_terms in enumerate(terms):
+            for term in {t.lower() for t in doc_terms if t}:
+                pair_terms.append(vocab.setdefault(term, len(vocab)))
+                pair_docs.append(doc)
+
+        # 검색어 번호 = 사전순 순위 (접두사가 같은 검색어는 연속된 번호)
+        self._words = sorted(vocab)
+        rank = np.empty(len(vocab), dtype=np.int64)
+        rank[[vocab[word] for word in self._words]] = np.arange(len(vocab))
+        term_ids = rank[np.asarray(pair_terms, dtype=np.int64)]
+        # 검색어 → 문서 (검색어별 문서 번호는 오름차순)
+        order = np.argsort(term_ids, kind="stable")
+        self._docs = np.asarray(pair_docs, dtype=np.int32)[order]
+        self._offsets = np.zeros(len(vocab) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(term_ids, minlength=len(vocab)), out=self._offsets[1:])
+        self._build_trigrams()
+
+    def _build_trigrams(self) -> None:
+        """trigram → 출현 위치 색인을 만듭니다 (UTF-8 바이트 기준).
+
+        검색어를 구분자(0)로 이어 붙인 한 배열에서 연속된 3바이트를 한 번에 계산하고,
+        trigram별 출현 위치를 보관합니다. 위치로 검색어 번호를 찾고 배열에서 바로 일치 여부를 확인합니다.
+        """
+        encoded = [word.encode("utf-8") for word in self._words]
+        self._blob = np.frombuffer(b"\0".join(encoded) + b"\0", dtype=np.uint8)
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        # 검색어별 시작 위치
+        self._starts = np.cumsum(lengths + 1) - (lengths + 1)
+        self._tri_codes = self._tri_offsets = self._tri_positions = _EMPTY
+        if len(self._blob) < _TRIGRAM:
+            return
+        blob = self._blob
+        wide = blob.astype(np.int32)
+        codes = wide[:-2] << 16 | wide[1:-1] << 8 | wide[2:]
+        positions = np.flatnonzero((blob[:-2] != 0) & (blob[1:-1] != 0) & (blob[2:] != 0))
+        order = np.argsort(codes[positions], kind="stable")
+        self._tri_positions = positions[order].astype(np.int32)
+        self._tri_codes, first = np.unique(codes[positions][order], return_index=True)
+        self._tri_offsets = np.append(first, len(order))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def nbytes(self) -> int:
+        """색인 배열, 검색어, 문서 행이 차지하는 대략적인 메모리(바이트)"""
+        arrays = (self._docs, self._offsets, self._blob, self._starts)
+        trigrams = (self._tri_codes, self._tri_offsets, self._tri_positions)
+        return sum(a.nbytes for a in (*arrays, *trigrams)) + estimate(self._words) + estimate(self.rows)
+
+    def _prefix(self, token: str) -> np.ndarray:
+        """token으로 시작하는 검색어의 문서 번호를 반환합니다 (중복 포함)."""
+        lo = bisect.bisect_left(self._words, token)
+        hi = bisect.bisect_left(self._words, token + "\U0010ffff", lo)
+        return self._docs[self._offsets[lo] : self._offsets[hi]]
+
+    def _substring(self, data: bytes) -> np.ndarray:
+        """data를 포함하는 검색어의 문서 번호를 반환합니다 (중복 포함)."""
+        # 출현 횟수가 가장 적은 trigram의 위치를 후보 시작 위치로 사용
+        best: tuple[int, int, int] | None = None
+        for offset in range(len(data) - 2):
+            code = data[offset] << 16 | data[offset + 1] << 8 | data[offset + 2]
+            i = int(np.searchsorted(self._tri_codes, code))
+            if i == len(self._tri_codes) or self._tri_codes[i] != code:
+                return _EMPTY
+            size = int(self._tri_offsets[i + 1] - self._tri_offsets[i])
+            if best is None or size < best[0]:
+                best = (size, i, offset)
+        assert best is not None
+        _, i, offset = best
+        starts = self._tri_positions[self._tri_offsets[i] : self._tri_offsets[i + 1]].astype(np.int64) - offset
+        starts = starts[(starts >= 0) & (starts + len(data) <= len(self._blob))]
+        # 나머지 바이트를 벡터 연산으로 비교 (구분자가 있으므로 검색어 경계를 넘는 일치는 없음)
+        for k, byte in enumerate(data):
+            if not len(starts):
+                break
+            starts = starts[self._blob[starts + k] == byte]
+        # 출현 위치가 오름차순이므로 검색어 번호도 오름차순 (인접 중복만 제거)
+        terms = np.searchsorted(self._starts, starts, side="right") - 1
+        if len(terms) > 1:
+            terms = terms[np.concatenate(([True], terms[1:] != terms[:-1]))]
+        return _gather(self._offsets, self._docs, terms)
+
+    def query(self, tokens: Sequence[str]) -> np.ndarray:
+        """모든 검색어에 일치하는 문서 번호를 오름차순으로 반환합니다.
+
+        Args:
+            tokens (Sequence[str]): 소문자 검색어 목록
+
+        Returns:
+            np.ndarray: 문서 번호 (rows의 위치)
+        """
+        result: np.ndarray | None = None
+        for token in tokens:
+            data = token.encode("utf-8")
+            docs = self._prefix(token) if len(data) < _TRIGRAM else self._substring(data)
+            # 정렬 대신 mask로 중복 제거
+            mask = np.zeros(len(self.rows), dtype=bool)
+            mask[docs] = True
+            result = mask if result is None else result & mask
+            if not result.any():
+                break
+        return _EMPTY if result is None else np.flatnonzero(result)
+
+
+@dataclass(frozen=True, slots=True)
+class SearchResult:
+    """search() 결과
+
+    Attributes:
+        rows (list[SearchRow]): 종류(네임스페이스, 노드, Pod) 순으로 정렬한 상위 결과
+        total (int): 일치한 전체 문서 수
+    """
+
+    rows: list[SearchRow]
+    total: int
+
+
+def tokenize(query: str) -> list[str]:
+    """검색 문자열을 소문자 검색어 목록으로 나눕니다."""
+    return query.lower().split()
+
+
+def search(segments: Iterable[SearchSegment], query: str, limit: int = DEFAULT_LIMIT) -> SearchResult:
+    """여러 클러스터의 세그먼트에서 검색합니다.
+
+    Args:
+        segments (Iterable[SearchSegment]): 클러스터별 색인 (collect()의 search_segments)
+        query (str): 공백으로 구분한 검색어. 3자 미만은 접두사, 이상은 부분 문자열 일치
+        limit (int, optional): 반환할 최대 행 수. 기본값은 DEFAULT_LIMIT
+
+    Returns:
+        SearchResult: 상위 결과와 전체 일치 수
+    """
+    tokens = tokenize(query)
+    if not tokens:
+        return SearchResult(rows=[], total=0)
+    total = 0
+    rows: list[SearchRow] = []
+    for segment in segments:
+        ids = segment.query(tokens)
+        total += len(ids)
+        rows.extend(segment.rows[i] for i in ids[:limit].tolist())
+    # 종류 순으로 정렬 (같은 종류 안에서는 클러스터, 세그먼트 순서 유지)
+    rank = {kind: i for i, kind in enumerate(KINDS)}
+    rows.sort(key=lambda row: rank.get(row.kind, len(KINDS)))
+    return SearchResult(rows=rows[:limit], total=total)
@@ -0,0 +1,176 @@
+"""Fast-start CLI snapshot of collected cluster data.
+
+이 모듈은 Streamlit이나 pandas를 import하지 않고 선택한 클러스터의 데이터를 수집하여
+표준 출력으로 내보낸 뒤 종료하는 CLI 모드를 제공합니다.
+cron 작업이나 장애 대응 스크립트에서 사용하는 것을 목표로 합니다.
+
+주요 기능:
+- 클러스터 수집이 끝나는 순서대로 레코드를 스트리밍 출력
+- Pod/워크로드/노드/재시작/이벤트마다 한 개의 레코드 (JSON 배열 또는 NDJSON)
+- 출력이 끝난 클러스터의 데이터는 즉시 해제하여 메모리 사용량 최소화
+"""
+
+import argparse
+import json
+import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime
+from typing import Any, TextIO
+
+from kubernetes_dashboard.collectors import collect_cluster
+from kubernetes_dashboard.kube_client import context_names
+from kubernetes_dashboard.procpool import set_processes
+
+# 스냅샷 키 → 레코드 kind
+_RECORD_KINDS = (
+    ("non_running_pods", "pod"),
+    ("workloads", "workload"),
+    ("node_metrics", "node"),
+    ("recent_restarts", "restart"),
+    ("events", "event"),
+)
+
+
+def cluster_records(ctx: str, snapshot: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """단일 클러스터 스냅샷을 출력용 레코드로 펼칩니다.
+
+    첫 레코드는 클러스터 요약(kind=cluster)이며, 이후 Pod/워크로드/노드/재시작/이벤트마다
+    하나의 레코드를 반환합니다.
+
+    Args:
+        ctx (str): Kubernetes 컨텍스트 이름
+        snapshot (dict): collect_cluster() 결과
+
+    Yields:
+        dict: `kind` 키가 포함된 레코드
+    """
+    yield {
+        "kind": "cluster",
+        "cluster": ctx,
+        "total_pods": snapshot["total_pods"],
+        "non_running_total": snapshot["non_running_total"],
+    }
+    for key, kind in _RECORD_KINDS:
+        for row in snapshot[key]:
+            yield {"kind": kind, **row}
+
+
+def iter_records(contexts: Iterable[str], max_workers: int | None = None) -> Iterator[dict[str, Any]]:
+    """여러 클러스터를 병렬로 수집하고 완료되는 순서대로 레코드를 반환합니다.
+
+    전체 결과를 하나의 딕셔너리로 합치지 않으며, 레코드를 모두 내보낸 클러스터의
+    스냅샷은 바로 참조를 해제합니다. 수집에 실패한 클러스터는 kind=error 레코드로 표시됩니다.
+
+    Args:
+        contexts (Iterable[str]): 수집할 Kubernetes 컨텍스트 이름 목록
+        max_workers (int, optional): 동시에 수집할 클러스터 수. 기본값은 min(32, 클러스터 수)
+
+    Yields:
+        dict: `kind` 키가 포함된 레코드
+    """
+    contexts = list(contexts)
+    workers = max_workers or min(32, max(1, len(contexts)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(collect_cluster, ctx): ctx for ctx in contexts}
+        for future in as_completed(pending):
+            ctx = pending.pop(future)
+            try:
+                snapshot = future.result()
+            except Exception as e:
+                yield {"kind": "error", "cluster": ctx, "message": str(e)}
+                continue
+            yield from cluster_records(ctx, snapshot)
+            del snapshot
+
+
+def _json_default(value: Any) -> Any:
+    """json.dumps가 직렬화하지 못하는 값(datetime 등)을 변환합니다."""
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    return str(value)
+
+
+def write_records(records: Iterable[dict[str, Any]], stream: TextIO, fmt: str = "ndjson") -> int:
+    """레코드를 스트림에 순서대로 기록합니다.
+
+    Args:
+        records (Iterable[dict]): 기록할 레코드
+        stream (TextIO): 출력 스트림
+        fmt (str, optional): `ndjson` 또는 `json`. 기본값은 `ndjson`
+
+    Returns:
+        int: 기록한 error 레코드 수
+    """
+    errors = 0
+    first = True
+    if fmt == "json":
+        stream.write("[")
+    for record in records:
+        if record["kind"] == "error":
+            errors += 1
+            print(f"Error collecting data from cluster {record['cluster']}: {record['message']}", file=sys.stderr)
+        line = json.dumps(record, default=_json_default, ensure_ascii=False)
+        if fmt == "json":
+            stream.write(("\n" if first else ",\n") + line)
+        else:
+            stream.write(line + "\n")
+        # cron/파이프라인에서 클러스터별 결과를 바로 소비할 수 있도록 flush
+        stream.flush()
+        first = False
+    if fmt == "json":
+        stream.write("\n]\n" if not first else "]\n")
+    return errors
+
+
+def _parse_args(argv: Iterable[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m kubernetes_dashboard snapshot",
+        description="Print collected Kubernetes dashboard data and exit.",
+    )
+    parser.add_argument(
+        "--context",
+        action="append",
+        dest="contexts",
+        help="수집할 컨텍스트 (여러 번 지정 가능, 기본값: kubeconfig의 모든 컨텍스트)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("ndjson", "json"),
+        default="ndjson",
+        help="출력 형식 (기본값: ndjson)",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="동시에 수집할 클러스터 수")
+    parser.add_argument(
+        "--processes",
+        default=None,
+        help="클러스터 수집에 사용할 워커 프로세스 수 (auto: CPU 수, 기본값: DASHBOARD_COLLECT_PROCESSES 또는 0)",
+    )
+    return parser.parse_args(None if argv is None else list(argv))
+
+
+def main(argv: Iterable[str] | None = None, stream: TextIO | None = None) -> int:
+    """Snapshot CLI 진입점
+
+    Args:
+        argv (Iterable[str], optional): 명령행 인자. 기본값은 sys.argv[1:]
+        stream (TextIO, optional): 출력 스트림. 기본값은 sys.stdout
+
+    Returns:
+        int: 모든 클러스터 수집에 성공하면 0, 하나라도 실패하면 1
+    """
+    args = _parse_args(argv)
+    contexts = args.contexts or context_names()
+    if not contexts:
+        print("No Kubernetes contexts found.", file=sys.stderr)
+        return 1
+
+    if args.processes is not None:
+        set_processes(args.processes)
+
+    errors = write_records(iter_records(contexts, args.workers), stream or sys.stdout, args.format)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
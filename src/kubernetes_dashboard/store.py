@@ -0,0 +1,425 @@
+"""Per-cluster, per-dataset snapshot cache.
+
+이 모듈은 (클러스터, 데이터셋) 단위로 수집 결과를 보관하는 저장소를 제공합니다.
+페이지가 선언한 데이터셋 중 캐시에 없거나 오래된 항목만 collect_cluster()로 수집하고,
+나머지는 캐시에서 가져와 collect()와 같은 형태로 병합합니다.
+여러 세션이 같은 클러스터를 동시에 요청하면 클러스터별 잠금으로 중복 수집을 막습니다.
+
+데이터셋을 다시 수집할 때마다 이전 값과 비교한 변경 사항(diff.Change)을 보관하고
+ChangeFeed에 게시하므로, 비교는 세션 수와 관계없이 새로고침마다 한 번만 수행됩니다.
+경보 규칙(alerts.AlertEngine)도 같은 시점에 새 값으로 한 번씩 평가합니다.
+
+저장 디렉토리를 지정하면 클러스터를 수집할 때마다 마지막 스냅샷을 디스크에 저장하고(persist 모듈),
+프로세스가 다시 시작된 뒤 처음 요청된 클러스터는 저장된 스냅샷을 바로 반환하면서
+백그라운드에서 새로 수집합니다 (warm start).
+아카이브(archive.SnapshotArchive)를 지정하면 다시 수집한 데이터셋을 시간 순서대로 기록하여
+지난 시점의 스냅샷을 다시 표시(replay)할 수 있습니다.
+
+메모리 관리자(memory.MemoryGovernor)를 지정하면 스냅샷이 차지하는 메모리를 보고하고, 예산을 넘으면
+가장 오래전에 조회한 클러스터의 상세 행을 로컬 디스크로 내보냅니다(spill). 내보낸 데이터셋은 행 수 등
+합계 값만 메모리에 남기며, 다시 조회하면 디스크에서 읽어 옵니다. 저장할 수 없는 값(검색 색인)은 내보내지 않고
+버린 뒤 다음 조회에서 다시 수집합니다.
+"""
+
+import os
+import tempfile
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
+from typing import TYPE_CHECKING, Any
+
+from kubernetes_dashboard.alerts import AlertEngine, Rule, load_rules
+from kubernetes_dashboard.collectors import DATASET_KEYS, collect_cluster, invalidate_caches, merge_snapshots
+from kubernetes_dashboard.diff import Change, ChangeFeed, diff_snapshots
+from kubernetes_dashboard.memory import MemoryGovernor, Usage, estimate
+from kubernetes_dashboard.persist import decode_cluster, encode_dataset, load_cluster, save_cluster
+from kubernetes_dashboard.profiling import COLLECT, profiled
+
+if TYPE_CHECKING:
+    from kubernetes_dashboard.archive import SnapshotArchive
+
+
+class SnapshotStore:
+    """클러스터별 데이터셋 캐시
+
+    Attributes:
+        max_age (float): 캐시 항목을 재사용할 수 있는 기본 최대 경과 시간(초)
+        feed (ChangeFeed): 새로고침마다 발생한 변경 사항 피드
+        alerts (AlertEngine): 새로고침마다 평가하는 경보 규칙과 series 상태
+        persist_dir (str | None): 마지막 스냅샷 저장 디렉토리. None이면 저장하지 않음
+        archive (SnapshotArchive | None): 수집 결과를 기록할 아카이브. None이면 기록하지 않음
+        governor (MemoryGovernor | None): 메모리 사용량을 보고하고 해제 요청을 받을 관리자. None이면 내보내지 않음
+        spill_dir (str | None): 내보낸 데이터셋 파일을 만들 상위 디렉토리. None이면 시스템 임시 디렉토리
+    """
+
+    def __init__(
+        self,
+        max_age: float = 30.0,
+        max_workers: int = 16,
+        rules: Iterable[Rule] | None = None,
+        persist_dir: str | None = None,
+        archive: "SnapshotArchive | None" = None,
+        governor: MemoryGovernor | None = None,
+        spill_dir: str | None = None,
+    ) -> None:
+        self.max_age = max_age
+        self.persist_dir = persist_dir
+        self.archive = archive
+        self.governor = governor
+        self.spill_dir = spill_dir
+        self._entries: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+        # 무효화된 항목의 마지막 값 (다시 수집했을 때 비교 대상으로 사용)
+        self._previous: dict[tuple[str, str], dict[str, Any]] = {}
+        self._changes: dict[tuple[str, str], list[Change]] = {}
+        self.feed = ChangeFeed()
+        self.alerts = AlertEngine(load_rules() if rules is None else rules)
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="snapshot-store")
+        # 디스크에서 읽었고 아직 다시 수집하지 않은 항목, 스냅샷 파일을 확인한 클러스터, 백그라운드 수집 중인 클러스터
+        self._warm: set[tuple[str, str]] = set()
+        self._restored: set[str] = set()
+        self._refreshing: set[str] = set()
+        # 파일 기록은 한 스레드에서 순서대로 수행
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot-writer")
+        # 메모리에 있는 항목(_entries, _previous)의 추정 크기, 클러스터별 마지막 조회 시각, 요청 처리 중인 클러스터
+        self._sizes: dict[tuple[str, str], int] = {}
+        self._viewed: dict[str, float] = {}
+        self._serving: Counter[str] = Counter()
+        # 디스크로 내보낸 항목 → (수집 시각, 파일 경로, 스냅샷 키별 합계 값)
+        self._spilled: dict[tuple[str, str], tuple[float, str, dict[str, int]]] = {}
+        self._spill_root: tempfile.TemporaryDirectory[str] | None = None
+        if governor is not None:
+            governor.register("snapshots", self.memory_usage, self.release, priority=10)
+
+    def _lock_for(self, ctx: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(ctx, threading.Lock())
+
+    def _restore(self, ctx: str) -> None:
+        """저장된 스냅샷이 있으면 캐시 항목으로 읽어 옵니다 (클러스터마다 한 번, ctx 잠금 안에서 호출)."""
+        self._restored.add(ctx)
+        if self.persist_dir is None:
+            return
+        for dataset, (collected_at, value) in (load_cluster(self.persist_dir, ctx) or {}).items():
+            # 저장 이후 데이터셋 구성이 바뀐 항목은 사용하지 않음
+            if set(value) == set(DATASET_KEYS.get(dataset, ())) and (ctx, dataset) not in self._entries:
+                self._entries[ctx, dataset] = (collected_at, value)
+                self._sizes[ctx, dataset] = _value_bytes(value)
+                self._warm.add((ctx, dataset))
+
+    def _store(self, ctx: str, datasets: Iterable[str], fresh: dict[str, Any], now: float) -> None:
+        """새로 수집한 데이터셋을 캐시에 넣고 변경 사항과 경보를 계산합니다 (ctx 잠금 안에서 호출)."""
+        fresh_datasets = tuple(datasets)
+        # 내보낸 항목은 비교 대상으로 쓰기 위해 다시 읽음
+        self._unspill(ctx, fresh_datasets)
+        for dataset in fresh_datasets:
+            value = {key: fresh[key] for key in DATASET_KEYS[dataset]}
+            # 만료된 항목 또는 무효화 전 마지막 값과 비교
+            previous = self._previous.pop((ctx, dataset), None)
+            if (ctx, dataset) in self._entries:
+                previous = self._entries[ctx, dataset][1]
+            if previous is not None:
+                self._changes[ctx, dataset] = diff_snapshots(previous, value)
+                self.feed.publish(self._changes[ctx, dataset])
+            self.alerts.evaluate(ctx, value, now)
+            self._entries[ctx, dataset] = (now, value)
+            self._sizes[ctx, dataset] = _value_bytes(value)
+            self._warm.discard((ctx, dataset))
+        if self.persist_dir is not None or self.archive is not None:
+            entries = {d: entry for (c, d), entry in self._entries.items() if c == ctx}
+            spilled = {d: spill[1] for (c, d), spill in self._spilled.copy().items() if c == ctx}
+            self._writer.submit(self._save, ctx, entries, fresh_datasets, spilled)
+
+    def _save(
+        self,
+        ctx: str,
+        entries: dict[str, tuple[float, dict[str, Any]]],
+        datasets: Iterable[str],
+        spilled: dict[str, str] | None = None,
+    ) -> None:
+        if self.persist_dir is not None:
+            # 내보낸 데이터셋도 저장 파일에서 빠지지 않도록 디스크에서 읽어 함께 저장 (그 사이 다시 읽어 간 파일은 건너뜀)
+            for dataset, path in (spilled or {}).items():
+                try:
+                    entries.update(_read_spill(path, dataset))
+                except (OSError, ValueError, KeyError):
+                    continue
+            try:
+                save_cluster(self.persist_dir, ctx, entries)
+            except OSError as e:
+                print(f"Warning: could not save snapshot of {ctx} to {self.persist_dir}: {e}")
+        if self.archive is not None:
+            try:
+                # 이번에 다시 수집한 데이터셋만 기록
+                for dataset in datasets:
+                    self.archive.append(ctx, dataset, *entries[dataset])
+            except OSError as e:
+                print(f"Warning: could not archive snapshot of {ctx} to {self.archive.directory}: {e}")
+
+    def _spill_path(self) -> str:
+        """내보낸 데이터셋 파일을 만들 임시 파일 경로를 반환합니다 (디렉토리는 처음 내보낼 때 생성)."""
+        if self._spill_root is None:
+            if self.spill_dir is not None:
+                os.makedirs(self.spill_dir, exist_ok=True)
+            self._spill_root = tempfile.TemporaryDirectory(prefix="kubernetes-dashboard-spill-", dir=self.spill_dir)
+        fd, path = tempfile.mkstemp(dir=self._spill_root.name, suffix=".snap")
+        os.close(fd)
+        return path
+
+    def _spill(self, ctx: str) -> int:
+        """클러스터의 데이터셋을 디스크로 내보내고 해제한 추정 바이트를 반환합니다 (ctx 잠금 안에서 호출)."""
+        freed = 0
+        for key in [key for key in self._previous if key[0] == ctx]:
+            # 무효화 전 마지막 값은 비교에만 쓰므로 버림 (다음 수집에서는 변경 사항을 계산하지 않음)
+            del self._previous[key]
+            freed += self._sizes.pop(key, 0)
+        for key in [key for key in self._entries if key[0] == ctx]:
+            collected_at, value = self._entries[key]
+            data = encode_dataset(ctx, key[1], collected_at, value)
+            if data is not None:
+                try:
+                    path = self._spill_path()
+                    with open(path, "wb") as f:
+                        f.write(data)
+                except OSError as e:
+                    print(f"Warning: could not spill snapshot of {ctx} to disk: {e}")
+                    return freed
+                counts = {
+                    k: len(v) if isinstance(v, list) else v for k, v in value.items() if isinstance(v, list | int)
+                }
+                self._spilled[key] = (collected_at, path, counts)
+            else:
+                # 저장할 수 없는 값(검색 색인)은 버리고 다음 조회에서 다시 수집
+                self._warm.discard(key)
+            del self._entries[key]
+            freed += self._sizes.pop(key, 0)
+        return freed
+
+    def _unspill(self, ctx: str, datasets: Iterable[str]) -> None:
+        """디스크로 내보낸 데이터셋을 다시 읽어 옵니다 (ctx 잠금 안에서 호출). 읽을 수 없으면 다시 수집합니다."""
+        for dataset in datasets:
+            spilled = self._spilled.pop((ctx, dataset), None)
+            if spilled is None:
+                continue
+            try:
+                entry = _read_spill(spilled[1], dataset)[dataset]
+                os.unlink(spilled[1])
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Warning: could not read spilled snapshot of {ctx}: {e}")
+                self._warm.discard((ctx, dataset))
+                continue
+            self._entries[ctx, dataset] = entry
+            self._sizes[ctx, dataset] = _value_bytes(entry[1])
+
+    def release(self, target: int) -> int:
+        """가장 오래전에 조회한 클러스터부터 target 바이트 이상을 디스크로 내보냅니다 (MemoryGovernor 구성 요소).
+
+        요청을 처리 중이거나 수집 중인 클러스터는 내보내지 않습니다.
+
+        Args:
+            target (int): 해제할 바이트 수
+
+        Returns:
+            int: 해제한 추정 바이트 수
+        """
+        with self._locks_guard:
+            viewed = self._viewed.copy()
+            candidates = sorted((ctx for ctx in viewed if not self._serving[ctx]), key=viewed.__getitem__)
+        freed = 0
+        for ctx in candidates:
+            if freed >= target:
+                break
+            lock = self._lock_for(ctx)
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                freed += self._spill(ctx)
+            finally:
+                lock.release()
+        return freed
+
+    def memory_usage(self) -> Usage:
+        """메모리에 있는 스냅샷의 추정 사용량을 반환합니다 (MemoryGovernor 구성 요소)."""
+        spilled = {ctx for ctx, _ in self._spilled.copy()}
+        detail = f"{len(spilled)}개 클러스터를 디스크로 내보냄" if spilled else ""
+        return Usage("snapshots", sum(self._sizes.copy().values()), detail)
+
+    def spilled(self) -> dict[str, dict[str, int]]:
+        """디스크로 내보낸 클러스터의 합계 값(메모리에 남긴 값)을 반환합니다.
+
+        Returns:
+            dict[str, dict[str, int]]: 컨텍스트 이름 → 스냅샷 키 → 정수 값 또는 행 수
+        """
+        counts: dict[str, dict[str, int]] = {}
+        for (ctx, _), (_, _, values) in self._spilled.copy().items():
+            counts.setdefault(ctx, {}).update(values)
+        return counts
+
+    def _refresh(self, ctx: str, datasets: frozenset[str]) -> None:
+        """디스크에서 읽은 데이터셋을 백그라운드에서 다시 수집합니다.
+
+        수집하는 동안에는 잠금을 잡지 않으므로 다른 요청은 저장된 스냅샷을 계속 받습니다.
+        """
+        try:
+            now = time.time()
+            fresh = collect_cluster(ctx, datasets)
+            with self._lock_for(ctx):
+                self._store(ctx, datasets, fresh, now)
+        except Exception as e:
+            print(f"Warning: background refresh of {ctx} failed: {e}")
+            # 다음 요청에서 일반 수집으로 다시 시도
+            with self._lock_for(ctx):
+                self._warm.difference_update((ctx, d) for d in datasets)
+        finally:
+            with self._locks_guard:
+                self._refreshing.discard(ctx)
+
+    def _cluster(self, ctx: str, datasets: frozenset[str], max_age: float) -> dict[str, Any]:
+        """단일 클러스터의 데이터셋을 캐시에서 가져오고, 부족한 데이터셋만 수집합니다."""
+        with self._lock_for(ctx):
+            if ctx not in self._restored:
+                self._restore(ctx)
+            now = time.time()
+            self._viewed[ctx] = now
+            self._unspill(ctx, datasets)
+            missing = {d for d in datasets if (ctx, d) not in self._entries or now - self._entries[ctx, d][0] > max_age}
+            # 디스크에서 읽은 항목은 수집 시각과 관계없이 바로 반환하고 백그라운드에서 다시 수집
+            warm = frozenset(d for d in datasets if (ctx, d) in self._warm)
+            if warm:
+                missing -= warm
+                with self._locks_guard:
+                    start = ctx not in self._refreshing
+                    self._refreshing.add(ctx)
+                if start:
+                    self._pool.submit(self._refresh, ctx, warm)
+            if missing:
+                self._store(ctx, missing, collect_cluster(ctx, missing), now)
+            snapshot: dict[str, Any] = {}
+            for dataset in datasets:
+                entry = self._entries.get((ctx, dataset))
+                if entry is not None:
+                    snapshot.update(entry[1])
+            return snapshot
+
+    def get(self, clusters: Sequence[str], datasets: Iterable[str], max_age: float | None = None) -> dict[str, Any]:
+        """요청된 클러스터와 데이터셋만 수집하거나 캐시에서 가져와 병합합니다.
+
+        Args:
+            clusters (Sequence[str]): 대상 Kubernetes 컨텍스트 이름 목록
+            datasets (Iterable[str]): 필요한 데이터셋 (collectors.PODS 등)
+            max_age (float, optional): 캐시 재사용 최대 경과 시간(초). 기본값은 self.max_age
+
+        Returns:
+            dict: 요청된 데이터셋의 키만 포함하는 collect() 형태의 통합 데이터
+        """
+        wanted = frozenset(datasets)
+        if not wanted or not clusters:
+            return merge_snapshots([], wanted)
+        age = self.max_age if max_age is None else max_age
+        with self._serve(clusters), profiled(COLLECT):
+            parts = self._pool.map(self._cluster, clusters, repeat(wanted), repeat(age))
+            snapshot = merge_snapshots(parts, wanted)
+            if self.governor is not None:
+                # 요청한 클러스터는 내보내지 않도록 처리 중으로 표시한 상태에서 예산 확인
+                self.governor.enforce()
+            return snapshot
+
+    @contextmanager
+    def _serve(self, clusters: Sequence[str]) -> Iterator[None]:
+        """요청을 처리하는 동안 클러스터를 내보내기 대상에서 제외합니다."""
+        with self._locks_guard:
+            self._serving.update(clusters)
+        try:
+            yield
+        finally:
+            with self._locks_guard:
+                self._serving.subtract(clusters)
+
+    def collected_at(self, clusters: Iterable[str], datasets: Iterable[str]) -> float | None:
+        """요청된 항목 중 가장 오래된 수집 시각(Unix time)을 반환합니다.
+
+        Args:
+            clusters (Iterable[str]): 대상 Kubernetes 컨텍스트 이름 목록
+            datasets (Iterable[str]): 대상 데이터셋
+
+        Returns:
+            float | None: 가장 오래된 수집 시각. 캐시에 없는 항목이 있으면 None
+        """
+        times = [
+            self._entries.get((ctx, d), self._spilled.get((ctx, d), (None,)))[0] for ctx in clusters for d in datasets
+        ]
+        if not times or any(t is None for t in times):
+            return None
+        return min(t for t in times if t is not None)
+
+    def warm(self, clusters: Iterable[str], datasets: Iterable[str]) -> list[str]:
+        """디스크에 저장된 스냅샷을 아직 새 수집 결과로 교체하지 못한 클러스터를 반환합니다.
+
+        Args:
+            clusters (Iterable[str]): 대상 Kubernetes 컨텍스트 이름 목록
+            datasets (Iterable[str]): 대상 데이터셋
+
+        Returns:
+            list[str]: 저장된 스냅샷을 사용 중인 클러스터 (clusters 순서)
+        """
+        wanted = list(datasets)
+        return [ctx for ctx in clusters if any((ctx, d) in self._warm for d in wanted)]
+
+    def changes(self, clusters: Iterable[str], datasets: Iterable[str]) -> list[Change]:
+        """요청된 클러스터와 데이터셋의 마지막 새로고침에서 발생한 변경 사항을 반환합니다.
+
+        Args:
+            clusters (Iterable[str]): 대상 Kubernetes 컨텍스트 이름 목록
+            datasets (Iterable[str]): 대상 데이터셋
+
+        Returns:
+            list[Change]: 변경 사항 목록. 처음 수집한 데이터셋은 비교 대상이 없으므로 포함되지 않음
+        """
+        wanted = list(datasets)
+        return [change for ctx in clusters for d in wanted for change in self._changes.get((ctx, d), [])]
+
+    def invalidate(self, clusters: Iterable[str] | None = None) -> None:
+        """캐시 항목을 제거하여 다음 요청에서 다시 수집하도록 합니다.
+
+        노드 인벤토리와 metrics-server 가용 여부도 함께 다시 확인합니다.
+
+        Args:
+            clusters (Iterable[str], optional): 제거할 클러스터. 기본값은 None (전체)
+        """
+        targets = None if clusters is None else set(clusters)
+        invalidate_caches(targets)
+        contexts = {ctx for ctx, _ in [*self._entries.copy(), *self._spilled.copy()]}
+        for ctx in sorted(contexts if targets is None else contexts & targets):
+            # 다른 세션이 같은 클러스터를 읽거나 수집하는 도중에 항목이 사라지지 않도록 ctx 잠금 안에서 제거
+            with self._lock_for(ctx):
+                self._invalidate(ctx)
+
+    def _invalidate(self, ctx: str) -> None:
+        """클러스터의 캐시 항목과 내보낸 항목을 제거합니다 (ctx 잠금 안에서 호출)."""
+        for key in [key for key in self._entries if key[0] == ctx]:
+            self._previous[key] = self._entries.pop(key)[1]
+            self._warm.discard(key)
+        for key in [key for key in self._spilled if key[0] == ctx]:
+            # 내보낸 항목은 비교 대상 없이 다시 수집
+            spilled = self._spilled.pop(key)
+            self._warm.discard(key)
+            try:
+                os.unlink(spilled[1])
+            except OSError:
+                pass
+
+
+def _value_bytes(value: dict[str, Any]) -> int:
+    """캐시 항목 하나(스냅샷 키 → 값)의 추정 메모리 사용량"""
+    return sum(estimate(v) for v in value.values())
+
+
+def _read_spill(path: str, dataset: str) -> dict[str, tuple[float, dict[str, Any]]]:
+    """내보낸 데이터셋 파일을 읽습니다."""
+    with open(path, "rb") as f:
+        return {dataset: decode_cluster(f.read())[1][dataset]}
@@ -0,0 +1,175 @@
+"""Indexed in-memory table for server-side paging, sorting and filtering.
+
+이 모듈은 수집된 행 목록(records.Record)을 열 단위 numpy 배열로 변환하여
+정렬, 필터, 검색을 서버에서 수행하고 화면에 보이는 페이지의 행만 반환하는 TableStore를 제공합니다.
+장애 상황에서 수만 개의 Pending Pod를 모두 브라우저로 보내면 websocket 전송량 때문에
+페이지가 멈추므로, 표 컴포넌트는 이 저장소에서 한 페이지씩만 가져와 표시합니다.
+
+주요 기능:
+- 문자열 열은 정렬된 카테고리 코드로 변환하여 코드 비교만으로 정렬/필터
+- 열과 방향별 정렬 인덱스(argsort)를 처음 사용할 때 만들어 재사용
+- 부분 문자열 검색은 행이 아닌 고유 값(카테고리)에 대해서만 수행
+"""
+
+from collections.abc import Collection, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+from kubernetes_dashboard.memory import estimate
+from kubernetes_dashboard.records import Record, to_columns
+
+# 열 종류
+_CATEGORY = "category"
+_NUMBER = "number"
+
+
+@dataclass(frozen=True, slots=True)
+class TablePage:
+    """query() 결과 한 페이지
+
+    Attributes:
+        rows (list): 페이지에 해당하는 원본 행
+        total (int): 필터를 적용한 전체 행 수
+        offset (int): 페이지 첫 행의 위치
+    """
+
+    rows: list[Any]
+    total: int
+    offset: int
+
+
+def _number(value: Any) -> float:
+    """숫자/시각 값을 float로 변환합니다 (변환할 수 없으면 NaN)."""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return float(value)
+    return float("nan")
+
+
+def _factorize(values: list[Any]) -> tuple[list[str], np.ndarray]:
+    """값을 정렬된 카테고리와 카테고리 코드로 변환합니다 (None은 빈 문자열)."""
+    raw: dict[Any, int] = {}
+    codes = np.fromiter((raw.setdefault(v, len(raw)) for v in values), dtype=np.int64, count=len(values))
+    labels = ["" if v is None else str(v) for v in raw]
+    # 카테고리를 사전순으로 정렬하고 코드를 순위로 바꾸면 코드 정렬 = 문자열 정렬
+    order = sorted(range(len(labels)), key=labels.__getitem__)
+    rank = np.empty(len(labels), dtype=np.int64)
+    rank[order] = np.arange(len(labels))
+    return [labels[i] for i in order], rank[codes] if len(codes) else codes
+
+
+class TableStore:
+    """정렬/필터/검색을 서버에서 수행하는 열 단위 테이블
+
+    Attributes:
+        columns (tuple[str, ...]): 열 이름 (행 타입의 필드 순서)
+    """
+
+    def __init__(self, rows: Sequence[Mapping[str, Any]], record_type: type[Record]) -> None:
+        self._rows = rows
+        data = to_columns(rows, record_type)
+        self.columns = tuple(data)
+        self._kinds: dict[str, str] = {}
+        self._codes: dict[str, np.ndarray] = {}
+        self._categories: dict[str, list[str]] = {}
+        self._numbers: dict[str, np.ndarray] = {}
+        self._orders: dict[tuple[str, bool], np.ndarray] = {}
+        for name, values in data.items():
+            sample = next((v for v in values if v is not None), None)
+            if isinstance(sample, int | float | datetime) and not isinstance(sample, bool):
+                self._kinds[name] = _NUMBER
+                self._numbers[name] = np.fromiter(map(_number, values), dtype=np.float64, count=len(values))
+            else:
+                self._kinds[name] = _CATEGORY
+                self._categories[name], self._codes[name] = _factorize(values)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def nbytes(self) -> int:
+        """열 배열, 카테고리, 정렬 인덱스가 차지하는 대략적인 메모리(바이트). 원본 행은 포함하지 않음"""
+        arrays = [*self._codes.values(), *self._numbers.values(), *self._orders.values()]
+        return sum(a.nbytes for a in arrays) + sum(estimate(labels) for labels in self._categories.values())
+
+    def categories(self, column: str) -> list[str]:
+        """문자열 열의 고유 값을 정렬하여 반환합니다 (필터 선택지로 사용).
+
+        Args:
+            column (str): 열 이름
+
+        Returns:
+            list[str]: 고유 값 목록. 숫자/시각 열이면 빈 목록
+        """
+        return self._categories.get(column, [])
+
+    def _order(self, column: str, descending: bool) -> np.ndarray:
+        """열의 정렬 인덱스를 반환합니다 (처음 요청할 때 생성).
+
+        같은 값의 행은 방향과 관계없이 원래 순서를 유지하며, 값이 없는 행(NaN)은 항상 마지막입니다.
+        """
+        order = self._orders.get((column, descending))
+        if order is None:
+            keys = self._codes[column] if self._kinds[column] == _CATEGORY else self._numbers[column]
+            order = self._orders[column, descending] = np.argsort(-keys if descending else keys, kind="stable")
+        return order
+
+    def _mask(self, filters: Mapping[str, Collection[str]], search: str) -> np.ndarray | None:
+        """필터와 검색어에 해당하는 행의 mask를 반환합니다 (조건이 없으면 None)."""
+        mask: np.ndarray | None = None
+        for column, values in filters.items():
+            if not values or column not in self._codes:
+                continue
+            wanted = set(values)
+            codes = [i for i, label in enumerate(self._categories[column]) if label in wanted]
+            hit = np.isin(self._codes[column], codes)
+            mask = hit if mask is None else mask & hit
+        needle = search.strip().lower()
+        if needle:
+            found = np.zeros(len(self._rows), dtype=bool)
+            for column, labels in self._categories.items():
+                codes = [i for i, label in enumerate(labels) if needle in label.lower()]
+                if codes:
+                    found |= np.isin(self._codes[column], codes)
+            mask = found if mask is None else mask & found
+        return mask
+
+    def query(
+        self,
+        filters: Mapping[str, Collection[str]] | None = None,
+        search: str = "",
+        sort: str | None = None,
+        descending: bool = False,
+        offset: int = 0,
+        limit: int = 50,
+    ) -> TablePage:
+        """조건에 맞는 행을 정렬하여 한 페이지만 반환합니다.
+
+        Args:
+            filters (Mapping[str, Collection[str]], optional): 열 이름 → 허용 값. 빈 값이면 필터하지 않음
+            search (str, optional): 문자열 열에서 찾을 부분 문자열 (대소문자 무시). 기본값은 ""
+            sort (str, optional): 정렬 열. 기본값은 None (원래 순서)
+            descending (bool, optional): 내림차순 정렬 여부 (sort가 None이면 무시). 기본값은 False
+            offset (int, optional): 페이지 첫 행의 위치. 범위를 벗어나면 마지막 페이지. 기본값은 0
+            limit (int, optional): 페이지 크기. 기본값은 50
+
+        Returns:
+            TablePage: 페이지 행과 필터 적용 후 전체 행 수
+        """
+        mask = self._mask(filters or {}, search)
+        if sort is None:
+            order = np.arange(len(self._rows)) if mask is None else np.flatnonzero(mask)
+        else:
+            order = self._order(sort, descending)
+            if mask is not None:
+                order = order[mask[order]]
+        total = len(order)
+        if offset >= total:
+            # 범위를 벗어난 페이지는 마지막 페이지로 이동
+            offset = (total - 1) // limit * limit if total else 0
+        offset = max(0, offset)
+        return TablePage(rows=[self._rows[i] for i in order[offset : offset + limit]], total=total, offset=offset)
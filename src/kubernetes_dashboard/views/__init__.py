@@ -0,0 +1,91 @@
+"""Dashboard pages loaded on demand.
+
+각 페이지는 별도 모듈로 구성되며 다음 항목을 제공합니다.
+
+- `DATASETS`: 페이지가 필요로 하는 데이터셋 (collectors.PODS 등)
+- `clusters(page, selected)`: 데이터를 가져올 클러스터 목록
+- `render(page, selected, data)`: 페이지 렌더링 함수. `data`는 DATASETS에 해당하는
+  collect() 형태의 데이터와 마지막 새로고침 이후 변경 사항(`changes`)을 포함.
+  노드 상세처럼 사용자가 펼칠 때만 필요한 데이터셋은 `data.more()`로 그때 가져옴
+
+dashboard.py는 사용자가 선택한 페이지의 모듈만 import하므로, 다른 페이지에서만 쓰는
+pandas나 kubernetes client 등의 import 비용을 첫 렌더링 전에 지불하지 않습니다.
+또한 페이지가 선언한 데이터셋과 클러스터만 수집하거나 캐시에서 가져옵니다.
+"""
+
+import importlib
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from types import ModuleType
+from typing import Any
+
+OVERVIEW = "Overview"
+LOGS_AND_EVENTS = "Logs & Events"
+SEARCH = "Search"
+
+# 페이지 이름 → 모듈 이름 (목록에 없는 페이지는 클러스터 상세 페이지)
+_PAGE_MODULES = {
+    OVERVIEW: "kubernetes_dashboard.views.overview",
+    LOGS_AND_EVENTS: "kubernetes_dashboard.views.logs_events",
+    SEARCH: "kubernetes_dashboard.views.search",
+}
+_CLUSTER_MODULE = "kubernetes_dashboard.views.cluster"
+
+
+def load_view(page: str) -> ModuleType:
+    """페이지에 해당하는 view 모듈을 import합니다.
+
+    Args:
+        page (str): 사이드바에서 선택된 페이지 이름
+
+    Returns:
+        ModuleType: DATASETS, clusters(), render()를 제공하는 view 모듈
+    """
+    return importlib.import_module(_PAGE_MODULES.get(page, _CLUSTER_MODULE))
+
+
+class PageData(Mapping[str, Any]):
+    """페이지 데이터에 처음 접근할 때 수집을 수행하는 지연 로딩 매핑
+
+    페이지가 선언하지 않은 키에 접근하면 KeyError가 발생하므로,
+    view 모듈의 DATASETS 선언과 실제 사용이 어긋나는 것을 바로 발견할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], dict[str, Any]],
+        more: Callable[[Sequence[str], frozenset[str]], dict[str, Any]] | None = None,
+    ) -> None:
+        self._loader = loader
+        self._more = more
+        self._data: dict[str, Any] | None = None
+
+    def more(self, clusters: Sequence[str], datasets: frozenset[str]) -> dict[str, Any]:
+        """DATASETS에 선언하지 않은 데이터셋을 필요할 때 가져옵니다 (노드 상세 등).
+
+        Args:
+            clusters (Sequence[str]): 대상 Kubernetes 컨텍스트 이름 목록
+            datasets (frozenset[str]): 가져올 데이터셋 (collectors.NODE_PODS 등)
+
+        Returns:
+            dict: 요청한 데이터셋의 collect() 형태 데이터
+
+        Raises:
+            KeyError: 추가 데이터셋을 가져오는 loader 없이 만든 경우
+        """
+        if self._more is None:
+            raise KeyError(", ".join(sorted(datasets)))
+        return self._more(clusters, datasets)
+
+    def _load(self) -> dict[str, Any]:
+        if self._data is None:
+            self._data = self._loader()
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self._load()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
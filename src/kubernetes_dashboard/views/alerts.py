@@ -0,0 +1,28 @@
+"""Firing alerts panel.
+
+SnapshotStore가 새로고침마다 평가한 경보 규칙(alerts.AlertEngine) 중 firing 상태인 series를 표시합니다.
+"""
+
+from collections.abc import Sequence
+
+import streamlit as st
+
+from kubernetes_dashboard.records import AlertRow, frame
+
+# 심각도별 표시 아이콘
+_ICONS = {"critical": "🚨", "warning": "⚠️"}
+
+
+def render_alerts(alerts: Sequence[AlertRow]) -> None:
+    """firing 경보 패널을 렌더링합니다.
+
+    Args:
+        alerts (Sequence[AlertRow]): AlertEngine.alerts()가 반환한 경보
+    """
+    if not alerts:
+        st.caption("🔔 발생 중인 경보가 없습니다.")
+        return
+    st.subheader(f"🔔 Firing Alerts ({len(alerts)})")
+    df = frame(alerts, AlertRow)
+    df.insert(0, "", [_ICONS.get(severity, "") for severity in df["severity"]])
+    st.dataframe(df.drop(columns=["state"]), hide_index=True)
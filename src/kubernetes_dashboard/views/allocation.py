@@ -0,0 +1,77 @@
+"""Requests/limits vs allocatable tables.
+
+노드별 allocatable 대비 requests 할당률, 실제 사용률, limits 합계(overcommit)와
+네임스페이스별 requests/limits 합계를 표시합니다 (allocation 모듈 참고).
+"""
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import streamlit as st
+
+from kubernetes_dashboard.records import AllocationRow, NamespaceAllocationRow, frame
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_GIB = 1024**3
+
+
+def _rounded(column: "pd.Series", digits: int, scale: float = 1.0) -> "pd.Series":
+    # metrics-server가 없으면 열 전체가 None(object)이므로 float로 변환
+    return (column.astype(float) / scale).round(digits)
+
+
+def render_allocation(nodes: Sequence[AllocationRow], namespaces: Sequence[NamespaceAllocationRow]) -> None:
+    """노드별 할당 표와 네임스페이스별 requests/limits 표를 렌더링합니다.
+
+    Args:
+        nodes (Sequence[AllocationRow]): collect()의 node_allocation 행 목록
+        namespaces (Sequence[NamespaceAllocationRow]): collect()의 namespace_allocation 행 목록
+    """
+    st.subheader("Node Allocation (requests / limits vs allocatable)")
+    if not nodes:
+        st.info("노드 할당 정보를 찾을 수 없습니다.")
+        return
+    df = frame(nodes, AllocationRow)
+    for column in (
+        "cpu_overcommit_percent",
+        "mem_overcommit_percent",
+        "cpu_requested_percent",
+        "mem_requested_percent",
+    ):
+        df[column] = df[column].astype(float)
+    overcommitted = int(((df["cpu_overcommit_percent"] > 100) | (df["mem_overcommit_percent"] > 100)).sum())
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("CPU requested", f"{df['cpu_requests'].sum():.1f} / {df['cpu_allocatable'].sum():.1f} cores")
+    with col2:
+        st.metric(
+            "Memory requested",
+            f"{df['mem_requests'].sum() / _GIB:.1f} / {df['mem_allocatable'].sum() / _GIB:.1f} GiB",
+        )
+    with col3:
+        st.metric("Overcommitted nodes", overcommitted)
+
+    # 할당률이 높은 노드부터 표시 (값은 열 단위로 변환)
+    df = df.sort_values(["cpu_requested_percent", "mem_requested_percent"], ascending=False, na_position="last")
+    view = df[["node", "pods"]].copy()
+    view["cpu allocatable"] = _rounded(df["cpu_allocatable"], 2)
+    view["cpu requested %"] = _rounded(df["cpu_requested_percent"], 1)
+    view["cpu used %"] = _rounded(df["cpu_used_percent"], 1)
+    view["cpu overcommit %"] = _rounded(df["cpu_overcommit_percent"], 1)
+    view["memory allocatable (GiB)"] = _rounded(df["mem_allocatable"], 2, _GIB)
+    view["memory requested %"] = _rounded(df["mem_requested_percent"], 1)
+    view["memory used %"] = _rounded(df["mem_used_percent"], 1)
+    view["memory overcommit %"] = _rounded(df["mem_overcommit_percent"], 1)
+    st.dataframe(view, hide_index=True)
+
+    if namespaces:
+        st.subheader("Namespace Requests / Limits")
+        ns_df = frame(namespaces, NamespaceAllocationRow)
+        ns_view = ns_df[["ns", "pods"]].copy()
+        ns_view["cpu requests"] = _rounded(ns_df["cpu_requests"], 2)
+        ns_view["cpu limits"] = _rounded(ns_df["cpu_limits"], 2)
+        ns_view["memory requests (GiB)"] = _rounded(ns_df["mem_requests"], 2, _GIB)
+        ns_view["memory limits (GiB)"] = _rounded(ns_df["mem_limits"], 2, _GIB)
+        st.dataframe(ns_view, hide_index=True)
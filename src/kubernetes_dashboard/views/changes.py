@@ -0,0 +1,37 @@
+"""Changes since last refresh panel.
+
+SnapshotStore가 새로고침마다 계산한 변경 사항(diff.Change)만 표시하는 패널입니다.
+전체 표를 다시 그리지 않고 바뀐 Pod와 노드만 보여 줍니다.
+"""
+
+from collections.abc import Sequence
+
+import streamlit as st
+
+from kubernetes_dashboard.diff import Change
+
+# 변경 종류별 표시 아이콘
+_ICONS = {
+    "pod_unhealthy": "🔴",
+    "pod_changed": "🟠",
+    "pod_recovered": "🟢",
+    "pod_restarted": "🔁",
+    "node_pressure": "🔥",
+    "node_relieved": "🧊",
+}
+
+
+def render_changes(changes: Sequence[Change]) -> None:
+    """마지막 새로고침 이후의 변경 사항 패널을 렌더링합니다.
+
+    Args:
+        changes (Sequence[Change]): SnapshotStore.changes()가 반환한 변경 사항
+    """
+    with st.expander(f"🔄 Changes since last refresh ({len(changes)})", expanded=bool(changes)):
+        if not changes:
+            st.caption("마지막 새로고침 이후 변경 사항이 없습니다.")
+            return
+        st.dataframe(
+            [{"": _ICONS.get(change.kind, ""), **change.to_dict()} for change in changes],
+            hide_index=True,
+        )
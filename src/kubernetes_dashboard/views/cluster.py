@@ -0,0 +1,122 @@
+"""Per-cluster detail page.
+
+단일 클러스터의 Pod 상태, 노드별 리소스 사용량과 requests/limits 할당, 최근 재시작된 Pod를 표시합니다.
+Non-Running Pod와 재시작 표에는 이벤트 색인에서 찾은 Pod의 마지막 관련 이벤트를 함께 표시합니다.
+노드 표에서 노드를 선택하면 그 노드에 배치된 Pod 목록을 표시합니다.
+"""
+
+import streamlit as st
+
+from kubernetes_dashboard.collectors import (
+    ALLOCATION,
+    EVENT_INDEX,
+    NODE_METRICS,
+    PODS,
+    RESTARTS,
+    WORKLOADS,
+)
+from kubernetes_dashboard.events import last_event_column
+from kubernetes_dashboard.quantity import fmt_bytes_gib, fmt_cores, fmt_percent
+from kubernetes_dashboard.records import NodeRow, PodRow, RestartRow, frame
+from kubernetes_dashboard.views import PageData
+from kubernetes_dashboard.views.allocation import render_allocation
+from kubernetes_dashboard.views.changes import render_changes
+from kubernetes_dashboard.views.nodes import render_node_detail, selected_rows
+from kubernetes_dashboard.views.table import render_table
+from kubernetes_dashboard.views.workloads import render_workloads
+
+DATASETS = frozenset({PODS, WORKLOADS, NODE_METRICS, RESTARTS, ALLOCATION, EVENT_INDEX})
+
+
+def clusters(page: str, selected: list[str]) -> tuple[str, ...]:
+    """페이지에 해당하는 클러스터 하나의 데이터만 사용합니다."""
+    return (page,)
+
+
+def render(page: str, selected: list[str], data: PageData) -> None:
+    """클러스터 상세 페이지를 렌더링합니다.
+
+    Args:
+        page (str): 페이지 이름 (클러스터 컨텍스트 이름과 동일)
+        selected (list[str]): 사이드바에서 선택된 클러스터 목록
+        data (PageData): 이 클러스터의 DATASETS에 해당하는 collect() 형태의 데이터와 변경 사항(changes)
+    """
+    # 클러스터별 상세 페이지 표시
+    cluster = page  # page value equals context name
+    st.header(f"🔍 Cluster Detail — {cluster}")
+    render_changes(data["changes"])
+
+    # Pod 행 → 마지막 관련 이벤트 (현재 페이지의 행만 조회)
+    last_event = {"last event": last_event_column(data["latest_events"])}
+
+    # ------- Pod 상태 지표 -------
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Total Pods", data["total_pods"])
+    with col2:
+        st.metric("Unhealthy Pods", data["non_running_total"])
+
+    # 워크로드 단위 합계를 먼저 표시
+    render_workloads(data["workloads"], data["non_running_pods"], key=f"cluster-{cluster}")
+
+    # Non-running pods list for this cluster
+    if data["non_running_pods"]:
+        st.subheader("Non-Running Pods")
+        render_table(
+            data["non_running_pods"],
+            PodRow,
+            key=f"cluster-{cluster}-pods",
+            filters=("ns", "phase", "reason"),
+            columns=last_event,
+        )
+    else:
+        st.success("모든 Pod가 정상적으로 실행 중입니다.")
+
+    # ------- Node table -------
+    st.subheader("Node Resource Usage")
+    node_df = frame(data["node_metrics"], NodeRow)
+    if not node_df.empty:
+        # N/A 값 처리
+        display_df = node_df.copy()
+
+        # 문자열 "N/A"를 그대로 표시
+        display_df["memory"] = [
+            fmt_bytes_gib(row["mem"]) if row["mem"] != "N/A" else "N/A" for _, row in display_df.iterrows()
+        ]
+        display_df["cpu"] = [
+            fmt_cores(row["cpu"]) if row["cpu"] != "N/A" else "N/A" for _, row in display_df.iterrows()
+        ]
+        display_df["cpu %"] = [
+            (fmt_percent(row["cpu_percent"]) if row["cpu_percent"] != "N/A" else "N/A")
+            for _, row in display_df.iterrows()
+        ]
+        display_df["memory %"] = [
+            (fmt_percent(row["mem_percent"]) if row["mem_percent"] != "N/A" else "N/A")
+            for _, row in display_df.iterrows()
+        ]
+
+        chosen = selected_rows(
+            display_df[["node", "memory", "memory %", "cpu", "cpu %"]], key=f"cluster-{cluster}-nodes"
+        )
+        st.caption("행을 선택하면 노드에 배치된 Pod를 표시합니다.")
+        for node in chosen["node"]:
+            render_node_detail(cluster, node, data)
+    else:
+        st.info("노드 정보를 찾을 수 없습니다.")
+
+    # ------- Requests/limits vs allocatable -------
+    render_allocation(data["node_allocation"], data["namespace_allocation"])
+
+    # ------- Restart rate -------
+    if data["recent_restarts"]:
+        st.subheader("Container Restarts (5m / 1h / 24h)")
+        render_table(
+            data["recent_restarts"],
+            RestartRow,
+            key=f"cluster-{cluster}-restarts",
+            sort="restarts_1h",
+            descending=True,
+            columns=last_event,
+        )
+    else:
+        st.success("최근 24시간 내 재시작된 컨테이너가 없습니다.")
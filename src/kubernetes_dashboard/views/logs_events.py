@@ -0,0 +1,116 @@
+"""Pod logs and cluster events page.
+
+클러스터/네임스페이스/Pod/컨테이너를 선택하여 Pod 로그를 조회하고,
+클러스터 이벤트를 네임스페이스 단위로 조회합니다.
+"""
+
+from collections.abc import Mapping
+from typing import Any
+
+import streamlit as st
+
+from kubernetes_dashboard.collectors import _get_cluster_events, _get_pod_logs
+from kubernetes_dashboard.kube_client import api_for
+from kubernetes_dashboard.records import EventRow
+from kubernetes_dashboard.views.table import render_table
+
+# 이 페이지는 사용자가 선택한 Pod/네임스페이스만 직접 조회하므로 사전 수집이 필요 없음
+DATASETS: frozenset[str] = frozenset()
+
+
+def clusters(page: str, selected: list[str]) -> tuple[str, ...]:
+    """사전 수집할 클러스터가 없습니다."""
+    return ()
+
+
+def render(page: str, selected: list[str], data: Mapping[str, Any]) -> None:
+    """Logs & Events 페이지를 렌더링합니다.
+
+    Args:
+        page (str): 페이지 이름
+        selected (list[str]): 사이드바에서 선택된 클러스터 목록
+        data (Mapping[str, Any]): 사용하지 않음 (DATASETS가 비어 있음)
+    """
+    st.header("📜 Logs & Events")
+
+    # 탭 생성
+    tab1, tab2 = st.tabs(["Pod Logs", "Cluster Events"])
+
+    # Pod 로그 탭
+    with tab1:
+        st.subheader("Pod Logs")
+
+        # 클러스터 선택
+        cluster = st.selectbox("Select Cluster", selected)
+        if not cluster:
+            st.stop()
+
+        # 네임스페이스 목록 가져오기
+        core, _ = api_for(str(cluster))
+        namespaces = [ns.metadata.name for ns in core.list_namespace().items]
+        namespace = st.selectbox("Select Namespace", namespaces)
+        if not namespace:
+            st.stop()
+
+        # 선택한 네임스페이스의 Pod 목록 가져오기
+        pods = [pod.metadata.name for pod in core.list_namespaced_pod(namespace).items]
+        if not pods:
+            st.info(f"No pods found in namespace {namespace}")
+        else:
+            pod_name = st.selectbox("Select Pod", pods)
+            if not pod_name:
+                st.stop()
+
+            # 선택한 Pod의 컨테이너 목록 가져오기
+            pod = core.read_namespaced_pod(pod_name, namespace)
+            containers = [container.name for container in pod.spec.containers]
+            container = st.selectbox("Select Container", containers)
+            if not container:
+                st.stop()
+
+            # 로그 라인 수 선택
+            tail_lines = st.slider("Log Lines", min_value=10, max_value=500, value=100, step=10)
+
+            # 로그 가져오기
+            logs = _get_pod_logs(
+                str(cluster),
+                str(pod_name),
+                str(namespace),
+                str(container),
+                tail_lines,
+            )
+
+            # 로그 표시
+            st.text_area("Pod Logs", logs, height=400)
+
+    # 클러스터 이벤트 탭
+    with tab2:
+        st.subheader("Cluster Events")
+
+        # 클러스터 및 네임스페이스 선택
+        col1, col2 = st.columns(2)
+        with col1:
+            event_cluster = st.selectbox("Select Cluster for Events", selected, key="event_cluster")
+            if not event_cluster:
+                st.stop()
+
+        with col2:
+            event_namespaces = ["All Namespaces"] + [
+                ns.metadata.name for ns in api_for(str(event_cluster))[0].list_namespace().items
+            ]
+            event_namespace = st.selectbox("Select Namespace for Events", event_namespaces)
+            if not event_namespace:
+                st.stop()
+
+        # 이벤트 수 선택
+        event_limit = st.slider("Number of Events", min_value=10, max_value=500, value=100, step=10)
+
+        # 이벤트 가져오기
+        namespace_arg = None if event_namespace == "All Namespaces" else str(event_namespace)
+        events = _get_cluster_events(str(event_cluster), namespace=namespace_arg, limit=event_limit)
+
+        # 이벤트 표시
+        if events:
+            render_table(events, EventRow, key="events", filters=("type", "reason"), sort="time", descending=True)
+        else:
+            st.info("No events found")
@@ -0,0 +1,85 @@
+"""Node detail panel backed by the node-to-pods index.
+
+노드 표에서 행을 선택하면 그 노드에 배치된 Pod의 phase, 재시작 수, (metrics-server가 있으면) 사용량과
+마지막 관련 이벤트를 표시합니다. 노드별 Pod 행(node_pods)과 Pod 사용량은 페이지의 DATASETS에 넣지 않고
+노드를 열었을 때 그 클러스터에 대해서만 가져오므로, 노드를 열지 않은 새로고침은 Pod 메트릭을 조회하지 않습니다.
+가져온 행은 페이지 데이터와 같은 주기로 캐시되고, 노드 목록은 행 목록의 색인에서 찾습니다.
+"""
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import streamlit as st
+
+from kubernetes_dashboard.collectors import NODE_PODS
+from kubernetes_dashboard.events import describe, event_index, last_event_column
+from kubernetes_dashboard.node_pods import node_pod_index
+from kubernetes_dashboard.records import EventRow, NodePodRow, frame
+from kubernetes_dashboard.views import PageData
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_GIB = 1024**3
+
+# 노드를 열었을 때만 가져오는 데이터셋
+DETAIL_DATASETS = frozenset({NODE_PODS})
+
+
+def selected_rows(table: "pd.DataFrame", key: str) -> "pd.DataFrame":
+    """행 하나를 선택할 수 있는 표를 렌더링하고 선택된 행을 반환합니다.
+
+    Args:
+        table (pd.DataFrame): 표시할 표
+        key (str): 위젯 key
+
+    Returns:
+        pd.DataFrame: 선택된 행 (선택하지 않았으면 빈 DataFrame)
+    """
+    event = st.dataframe(table, hide_index=True, on_select="rerun", selection_mode="single-row", key=key)
+    return table.iloc[list(event.selection.rows)]
+
+
+def render_node_detail(cluster: str, node: str, data: PageData) -> None:
+    """노드 하나의 Pod 목록과 마지막 노드 이벤트를 렌더링합니다.
+
+    Args:
+        cluster (str): Kubernetes 컨텍스트 이름
+        node (str): 노드 이름
+        data (PageData): EVENT_INDEX를 선언한 페이지의 데이터 (node_pods는 이 클러스터에 대해서만 따로 가져옴)
+    """
+    latest_events: Sequence[EventRow] = data["latest_events"]
+    node_pods: Sequence[NodePodRow] = data.more((cluster,), DETAIL_DATASETS)["node_pods"]
+    pods = node_pod_index(node_pods).pods(cluster, node)
+    st.subheader(f"🖥️ Node Detail — {node} ({cluster})")
+    node_event = describe(event_index(latest_events).latest(cluster, "Node", None, node))
+    if node_event:
+        st.caption(f"마지막 노드 이벤트: {node_event}")
+    if not pods:
+        st.info("이 노드에 배치된 Pod가 없습니다.")
+        return
+
+    df = frame(pods, NodePodRow)
+    cpu = df["cpu"].astype(float)
+    mem = df["mem"].astype(float)
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Pods", len(pods))
+    with col2:
+        st.metric("Non-Running Pods", int((df["phase"] != "Running").sum()))
+    with col3:
+        st.metric("Restarts", int(df["restarts"].sum()))
+    with col4:
+        st.metric(
+            "Pod CPU / Memory", f"{cpu.sum():.2f} cores / {mem.sum() / _GIB:.1f} GiB" if cpu.notna().any() else "N/A"
+        )
+
+    view = df[["ns", "pod", "phase", "restarts"]].copy()
+    # metrics-server가 없으면 사용량 열은 표시하지 않음
+    if cpu.notna().any():
+        view["cpu (cores)"] = cpu.round(3)
+        view["memory (GiB)"] = (mem / _GIB).round(2)
+    # 노드의 Pod 수는 많아야 수백 개이므로 모든 행의 마지막 관련 이벤트를 조회
+    last_event = last_event_column(latest_events)
+    view["last event"] = [last_event(row) for row in pods]
+    st.dataframe(view.sort_values("restarts", ascending=False, kind="stable"), hide_index=True)
@@ -0,0 +1,139 @@
+"""Overview page across all selected clusters.
+
+선택된 모든 클러스터의 Pod 상태, 노드 리소스 사용량 상위 노드,
+최근 재시작된 Pod 및 최근 이벤트와 firing 상태의 경보를 표시합니다.
+Non-Running Pod와 재시작 표에는 이벤트 색인에서 찾은 Pod의 마지막 관련 이벤트를 함께 표시합니다.
+상위 노드 표에서 노드를 선택하면 그 노드에 배치된 Pod 목록을 표시합니다.
+"""
+
+import streamlit as st
+
+from kubernetes_dashboard.collectors import EVENT_INDEX, EVENTS, NODE_METRICS, PODS, RESTARTS, WORKLOADS
+from kubernetes_dashboard.events import last_event_column
+from kubernetes_dashboard.quantity import fmt_bytes_gib, fmt_cores, fmt_percent
+from kubernetes_dashboard.records import EventRow, NodeRow, PodRow, RestartRow, frame
+from kubernetes_dashboard.views import PageData
+from kubernetes_dashboard.views.alerts import render_alerts
+from kubernetes_dashboard.views.changes import render_changes
+from kubernetes_dashboard.views.nodes import render_node_detail, selected_rows
+from kubernetes_dashboard.views.table import render_table
+from kubernetes_dashboard.views.workloads import render_workloads
+
+DATASETS = frozenset({PODS, WORKLOADS, NODE_METRICS, RESTARTS, EVENTS, EVENT_INDEX})
+
+
+def clusters(page: str, selected: list[str]) -> tuple[str, ...]:
+    """선택된 모든 클러스터의 데이터를 사용합니다."""
+    return tuple(selected)
+
+
+def render(page: str, selected: list[str], data: PageData) -> None:
+    """Overview 페이지를 렌더링합니다.
+
+    Args:
+        page (str): 페이지 이름
+        selected (list[str]): 사이드바에서 선택된 클러스터 목록
+        data (PageData): DATASETS에 해당하는 collect() 형태의 데이터와 변경 사항(changes), 경보(alerts)
+    """
+    st.header("📊 Overview (Selected Clusters)")
+    render_alerts(data["alerts"])
+    render_changes(data["changes"])
+
+    df_nodes = frame(data["node_metrics"], NodeRow)
+    # Pod 행 → 마지막 관련 이벤트 (현재 페이지의 행만 조회)
+    last_event = {"last event": last_event_column(data["latest_events"])}
+
+    # Pod 상태 지표
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Total Pods", data["total_pods"])
+    with col2:
+        st.metric("Unhealthy Pods", data["non_running_total"])
+
+    # 워크로드 단위 합계를 먼저 표시
+    render_workloads(data["workloads"], data["non_running_pods"], key="overview")
+
+    # Non-running pods list
+    if data["non_running_pods"]:
+        st.subheader("Non-Running Pods")
+        render_table(
+            data["non_running_pods"],
+            PodRow,
+            key="overview-pods",
+            filters=("cluster", "ns", "phase", "reason"),
+            columns=last_event,
+        )
+    else:
+        st.success("모든 Pod가 정상적으로 실행 중입니다.")
+
+    # Format node metrics
+    if not df_nodes.empty:
+        # N/A 값 처리
+        df_nodes_filtered = df_nodes[~((df_nodes["cpu"] == "N/A") & (df_nodes["mem"] == "N/A"))]
+
+        if not df_nodes_filtered.empty:
+            # 숫자 형식의 데이터만 포함된 데이터프레임으로 필터링
+            numeric_df = df_nodes_filtered[
+                ~((df_nodes_filtered["cpu"] == "N/A") | (df_nodes_filtered["mem"] == "N/A"))
+            ].copy()
+
+            if not numeric_df.empty:
+                # 메모리와 CPU 값을 사람이 읽기 쉬운 형식으로 변환
+                numeric_df["mem (GiB)"] = numeric_df["mem"].apply(fmt_bytes_gib)
+                numeric_df["cpu (cores)"] = numeric_df["cpu"].apply(fmt_cores)
+                numeric_df["cpu %"] = numeric_df["cpu_percent"].apply(fmt_percent)
+                numeric_df["mem %"] = numeric_df["mem_percent"].apply(fmt_percent)
+
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.subheader("Top-3 Memory Nodes")
+                    # reset_index()를 추가하여 인덱스를 0부터 시작하도록 설정
+                    top_mem = selected_rows(
+                        numeric_df.nlargest(3, "mem")[["cluster", "node", "mem (GiB)", "mem %"]]
+                        .rename(columns={"mem (GiB)": "memory"})
+                        .reset_index(drop=True),
+                        key="overview-top-mem",
+                    )
+                with col2:
+                    st.subheader("Top-3 CPU Nodes")
+                    top_cpu = selected_rows(
+                        numeric_df.nlargest(3, "cpu")[["cluster", "node", "cpu (cores)", "cpu %"]]
+                        .rename(columns={"cpu (cores)": "cpu"})
+                        .reset_index(drop=True),
+                        key="overview-top-cpu",
+                    )
+                st.caption("행을 선택하면 노드에 배치된 Pod를 표시합니다.")
+                # 두 표에서 선택한 노드 (같은 노드는 한 번만)
+                chosen = dict.fromkeys(
+                    (row.cluster, row.node) for table in (top_mem, top_cpu) for row in table.itertuples()
+                )
+                for cluster, node in chosen:
+                    render_node_detail(cluster, node, data)
+            else:
+                st.info("metrics-server가 설치되지 않아 노드 리소스 사용량을 표시할 수 없습니다.")
+        else:
+            st.info("metrics-server가 설치되지 않아 노드 리소스 사용량을 표시할 수 없습니다.")
+    else:
+        st.info("노드 정보를 찾을 수 없습니다.")
+
+    # Restart rate (all clusters)
+    if data["recent_restarts"]:
+        st.subheader("Container Restarts (5m / 1h / 24h)")
+        render_table(
+            data["recent_restarts"],
+            RestartRow,
+            key="overview-restarts",
+            sort="restarts_1h",
+            descending=True,
+            columns=last_event,
+        )
+    else:
+        st.success("최근 24시간 내 재시작된 컨테이너가 없습니다.")
+
+    # 최근 이벤트 표시
+    if data["events"]:
+        st.subheader("Recent Events")
+        events_df = frame(data["events"][:10], EventRow)  # 최근 10개 이벤트만 표시
+        st.dataframe(events_df[["cluster", "type", "reason", "object", "message", "time"]])
+    else:
+        st.info("최근 이벤트가 없습니다.")
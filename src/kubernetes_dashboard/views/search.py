@@ -0,0 +1,57 @@
+"""Fleet-wide search page.
+
+선택한 모든 클러스터의 Pod, 노드, 네임스페이스 이름과 레이블 값을 한 번에 검색합니다.
+클러스터별 검색 색인(search.SearchSegment)은 수집 시 만들어져 캐시되므로,
+검색어를 입력할 때마다 API 서버를 조회하지 않고 메모리 색인에서만 찾습니다.
+"""
+
+import time
+from collections.abc import Mapping
+from typing import Any
+
+import streamlit as st
+
+from kubernetes_dashboard.collectors import SEARCH_INDEX
+from kubernetes_dashboard.records import SearchRow, frame
+from kubernetes_dashboard.search import search
+
+DATASETS = frozenset({SEARCH_INDEX})
+
+
+def clusters(page: str, selected: list[str]) -> tuple[str, ...]:
+    """선택된 모든 클러스터의 색인을 사용합니다."""
+    return tuple(selected)
+
+
+def render(page: str, selected: list[str], data: Mapping[str, Any]) -> None:
+    """검색 페이지를 렌더링합니다.
+
+    Args:
+        page (str): 페이지 이름
+        selected (list[str]): 사이드바에서 선택된 클러스터 목록
+        data (Mapping[str, Any]): DATASETS에 해당하는 collect() 형태의 데이터 (search_segments)
+    """
+    st.header("🔎 Search")
+    query = st.text_input(
+        "Pod, 노드, 네임스페이스, 레이블 검색",
+        key="search-query",
+        placeholder="예: payments-api  app=web  ip-10-0-1",
+    )
+    # 페이지를 열 때 색인을 준비하여 첫 검색이 수집을 기다리지 않도록 함
+    segments = data["search_segments"]
+    documents = sum(len(segment) for segment in segments)
+    if not query.strip():
+        st.caption(
+            f"{len(segments)}개 클러스터의 문서 {documents:,}개를 검색합니다. "
+            "공백으로 구분한 검색어는 모두 일치해야 하며, 3자 미만의 검색어는 접두사로 찾습니다."
+        )
+        return
+
+    started = time.perf_counter()
+    result = search(segments, query)
+    elapsed = (time.perf_counter() - started) * 1000
+    st.caption(f"{result.total:,}개 일치 ({elapsed:.1f} ms) · 상위 {len(result.rows):,}개 표시")
+    if result.rows:
+        st.dataframe(frame(result.rows, SearchRow), hide_index=True)
+    else:
+        st.info("일치하는 항목이 없습니다.")
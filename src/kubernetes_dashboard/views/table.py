@@ -0,0 +1,113 @@
+"""Paged table component backed by TableStore.
+
+행 목록 전체를 st.dataframe으로 보내지 않고, 필터/검색/정렬을 서버의 TableStore에서 수행한 뒤
+현재 페이지의 행만 브라우저로 전송합니다. TableStore는 같은 행 목록에 대해 한 번만 만들어
+세션과 재실행 사이에서 재사용하며, 메모리 압박 시에는 가장 오래전에 사용한 것부터 해제합니다(table_cache).
+다른 색인에서 조회하는 계산 열(마지막 관련 이벤트 등)은 현재 페이지의 행에 대해서만 계산합니다.
+"""
+
+from collections.abc import Callable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+import streamlit as st
+
+from kubernetes_dashboard.records import Record, frame
+from kubernetes_dashboard.rowcache import RowCache
+from kubernetes_dashboard.table import TableStore
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# 한 페이지에 표시하는 행 수
+PAGE_SIZE = 50
+# 보관하는 TableStore 최대 개수
+_CACHE_SIZE = 16
+
+table_cache = RowCache("tables", _CACHE_SIZE)
+
+
+def table_store(rows: Sequence[Any], record_type: type[Record]) -> TableStore:
+    """행 목록에 대한 TableStore를 반환합니다 (같은 행 객체 목록이면 캐시된 것을 재사용, rowcache.RowCache 참고).
+
+    Args:
+        rows (Sequence): 행 목록
+        record_type (type[Record]): 열 구성을 결정하는 행 타입
+
+    Returns:
+        TableStore: 행 목록의 인덱스 테이블
+    """
+    return table_cache.get(rows, lambda r: TableStore(r, record_type), record_type)
+
+
+def _page_frame(
+    rows: Sequence[Any], record_type: type[Record], columns: Mapping[str, Callable[[Mapping[str, Any]], Any]]
+) -> "pd.DataFrame":
+    """현재 페이지의 행을 계산 열과 함께 DataFrame으로 변환합니다."""
+    df = frame(rows, record_type)
+    for name, compute in columns.items():
+        df[name] = [compute(row) for row in rows]
+    return df
+
+
+def render_table(
+    rows: Sequence[Any],
+    record_type: type[Record],
+    key: str,
+    filters: Sequence[str] = (),
+    sort: str | None = None,
+    descending: bool = False,
+    page_size: int = PAGE_SIZE,
+    columns: Mapping[str, Callable[[Mapping[str, Any]], Any]] | None = None,
+) -> None:
+    """필터, 검색, 정렬, 페이지 이동을 서버에서 처리하는 표를 렌더링합니다.
+
+    행 수가 한 페이지 이하이면 조작 위젯 없이 기본 정렬만 적용하여 표시합니다.
+
+    Args:
+        rows (Sequence): 행 목록
+        record_type (type[Record]): 열 구성을 결정하는 행 타입
+        key (str): 페이지마다 다른 위젯 key 접두사
+        filters (Sequence[str], optional): 값 선택 필터를 제공할 문자열 열. 기본값은 없음
+        sort (str, optional): 기본 정렬 열. 기본값은 None (원래 순서)
+        descending (bool, optional): 기본 정렬 방향. 기본값은 False
+        page_size (int, optional): 페이지 크기. 기본값은 PAGE_SIZE
+        columns (Mapping[str, Callable], optional): 열 이름 → 행으로 값을 계산하는 함수.
+            현재 페이지의 행에만 계산하여 오른쪽에 덧붙이며 필터/검색/정렬 대상은 아님. 기본값은 None
+    """
+    extra = columns or {}
+    store = table_store(rows, record_type)
+    if len(store) <= page_size:
+        result = store.query(sort=sort, descending=descending, limit=page_size)
+        st.dataframe(_page_frame(result.rows, record_type, extra), hide_index=True)
+        return
+
+    # 필터와 검색
+    widgets = st.columns(len(filters) + 1)
+    chosen = {
+        column: widget.multiselect(column, store.categories(column), key=f"{key}-filter-{column}")
+        for widget, column in zip(widgets, filters, strict=False)
+    }
+    search = widgets[-1].text_input("검색", key=f"{key}-search")
+
+    # 정렬과 페이지
+    left, middle, right = st.columns([2, 1, 1])
+    # "" 는 원래 순서 (수집 함수가 정한 순서)
+    sortable = ["", *store.columns]
+    sort_by = left.selectbox(
+        "정렬",
+        sortable,
+        index=sortable.index(sort) if sort in sortable else 0,
+        format_func=lambda column: column or "기본 순서",
+        key=f"{key}-sort",
+    )
+    desc = middle.toggle("내림차순", value=descending, key=f"{key}-desc")
+    page = int(right.number_input("페이지", min_value=1, value=1, step=1, key=f"{key}-page"))
+
+    result = store.query(chosen, search, sort_by or None, desc, offset=(page - 1) * page_size, limit=page_size)
+    st.dataframe(_page_frame(result.rows, record_type, extra), hide_index=True)
+    pages = max(1, -(-result.total // page_size))
+    first = result.offset + 1 if result.rows else 0
+    st.caption(
+        f"{result.total:,}개 중 {first:,}~{result.offset + len(result.rows):,}번째 행 "
+        f"(페이지 {result.offset // page_size + 1}/{pages})"
+    )
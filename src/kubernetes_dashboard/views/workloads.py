@@ -0,0 +1,55 @@
+"""Workload rollup table with drill-down.
+
+수만 개의 Pod 행 대신 최상위 소유자(Deployment, StatefulSet, DaemonSet, Job 등) 단위의
+합계를 먼저 보여 주고, 선택한 워크로드의 non-running Pod만 펼쳐 봅니다.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+import streamlit as st
+
+from kubernetes_dashboard.records import PodRow, WorkloadRow
+from kubernetes_dashboard.views.table import render_table
+
+
+def _label(row: Any) -> str:
+    return f"{row['cluster']} · {row['ns']} · {row['kind']}/{row['name']}"
+
+
+def render_workloads(workloads: Sequence[Any], non_running_pods: Sequence[Any], key: str) -> None:
+    """워크로드 합계 표와 워크로드별 drill-down을 렌더링합니다.
+
+    Args:
+        workloads (Sequence): collect()의 workloads 행 목록 (문제가 많은 순으로 정렬됨)
+        non_running_pods (Sequence): collect()의 non_running_pods 행 목록
+        key (str): 페이지마다 다른 위젯 key 접두사
+    """
+    st.subheader("Workloads")
+    if not workloads:
+        st.info("워크로드 정보를 찾을 수 없습니다.")
+        return
+    # 문제가 많은 순으로 정렬된 순서를 기본으로 유지
+    render_table(workloads, WorkloadRow, key=f"{key}-workloads", filters=("cluster", "ns", "kind"))
+
+    # Ready가 아니거나 Running이 아닌 Pod가 있는 워크로드만 drill-down 대상
+    unhealthy = [row for row in workloads if row["non_running"] or row["ready"] < row["pods"]]
+    if not unhealthy:
+        return
+    choice = st.selectbox(
+        "워크로드 상세",
+        range(len(unhealthy)),
+        format_func=lambda i: _label(unhealthy[i]),
+        key=f"{key}-workload",
+    )
+    selected = unhealthy[choice or 0]
+    workload = f"{selected['kind']}/{selected['name']}"
+    pods = [
+        pod
+        for pod in non_running_pods
+        if pod["cluster"] == selected["cluster"] and pod["ns"] == selected["ns"] and pod.get("workload") == workload
+    ]
+    if pods:
+        render_table(pods, PodRow, key=f"{key}-workload-pods", filters=("phase", "reason"))
+    else:
+        st.caption(f"{selected['pods'] - selected['ready']}개 Pod가 Running 상태이지만 Ready가 아닙니다.")
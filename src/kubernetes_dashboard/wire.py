@@ -0,0 +1,509 @@
+"""Compressed and protobuf wire formats for large core list calls.
+
+Pod 목록은 API 서버에서 받아오는 데이터 중 가장 크며, kubernetes client는 JSON 응답 전체를
+V1Pod 모델 객체로 역직렬화합니다. 이 모듈은 core 목록 요청(Pod, Node)에
+`Accept-Encoding: gzip`과 `application/vnd.kubernetes.protobuf`를 요청하고,
+collectors가 사용하는 필드만 읽어 같은 속성 이름(snake_case)을 가진 가벼운 객체로 변환합니다.
+
+주요 기능:
+- protobuf 응답은 필요한 필드만 읽고 나머지(managedFields, spec.containers 등)는 길이만 보고 건너뜀
+- 서버가 JSON으로 응답하거나 protobuf 해석에 실패하면 JSON으로 자동 전환 (컨텍스트별로 기억)
+- JSON 응답도 같은 필드 스키마로 필요한 값만 꺼내 변환
+- 환경 변수 DASHBOARD_WIRE_FORMAT으로 형식 선택 (protobuf 기본값, json, client)
+"""
+
+import gzip
+import json
+import os
+import threading
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from urllib.parse import quote
+
+from kubernetes.client.exceptions import ApiException
+
+# 목록 요청 형식을 지정하는 환경 변수
+WIRE_FORMAT_ENV = "DASHBOARD_WIRE_FORMAT"
+# protobuf: protobuf 우선(JSON 대체), json: gzip JSON, client: kubernetes client 모델 역직렬화
+FORMATS = ("protobuf", "json", "client")
+
+PROTOBUF = "application/vnd.kubernetes.protobuf"
+JSON = "application/json"
+# protobuf 응답 앞의 magic 바이트 ("k8s" + 0)
+_MAGIC = b"k8s\x00"
+
+# 필드 종류
+_STR = "str"
+_INT = "int"
+_BOOL = "bool"
+_TIME = "time"
+_MSG = "msg"
+_LIST = "list"
+_MAP = "map"
+_QUANTITY_MAP = "quantity_map"
+
+# 필드 스키마: protobuf 필드 번호 → (JSON 이름, 속성 이름, 종류, 하위 스키마)
+# 필드 번호는 k8s.io/api core/v1 및 apimachinery meta/v1 generated.proto 기준
+_Schema = dict[int, tuple[str, str, str, Any]]
+
+_OWNER_REFERENCE: _Schema = {
+    1: ("kind", "kind", _STR, None),
+    3: ("name", "name", _STR, None),
+    4: ("uid", "uid", _STR, None),
+    6: ("controller", "controller", _BOOL, None),
+}
+_OBJECT_META: _Schema = {
+    1: ("name", "name", _STR, None),
+    3: ("namespace", "namespace", _STR, None),
+    5: ("uid", "uid", _STR, None),
+    6: ("resourceVersion", "resource_version", _STR, None),
+    8: ("creationTimestamp", "creation_timestamp", _TIME, None),
+    11: ("labels", "labels", _MAP, None),
+    13: ("ownerReferences", "owner_references", _LIST, _OWNER_REFERENCE),
+}
+_CONTAINER_STATE: _Schema = {
+    3: ("terminated", "terminated", _MSG, {6: ("finishedAt", "finished_at", _TIME, None)}),
+}
+_CONTAINER_STATUS: _Schema = {
+    1: ("name", "name", _STR, None),
+    3: ("lastState", "last_state", _MSG, _CONTAINER_STATE),
+    4: ("ready", "ready", _BOOL, None),
+    5: ("restartCount", "restart_count", _INT, None),
+}
+_RESOURCE_REQUIREMENTS: _Schema = {
+    1: ("limits", "limits", _QUANTITY_MAP, None),
+    2: ("requests", "requests", _QUANTITY_MAP, None),
+}
+_CONTAINER: _Schema = {
+    1: ("name", "name", _STR, None),
+    8: ("resources", "resources", _MSG, _RESOURCE_REQUIREMENTS),
+}
+POD: _Schema = {
+    1: ("metadata", "metadata", _MSG, _OBJECT_META),
+    2: ("spec", "spec", _MSG, {10: ("nodeName", "node_name", _STR, None)}),
+    3: (
+        "status",
+        "status",
+        _MSG,
+        {
+            1: ("phase", "phase", _STR, None),
+            4: ("reason", "reason", _STR, None),
+            8: ("containerStatuses", "container_statuses", _LIST, _CONTAINER_STATUS),
+        },
+    ),
+}
+# 컨테이너 requests/limits까지 읽는 Pod 스키마 (할당 분석에서만 사용, 컨테이너 spec 변환 비용이 큼)
+POD_RESOURCES: _Schema = {
+    **POD,
+    2: (
+        "spec",
+        "spec",
+        _MSG,
+        {
+            2: ("containers", "containers", _LIST, _CONTAINER),
+            10: ("nodeName", "node_name", _STR, None),
+            20: ("initContainers", "init_containers", _LIST, _CONTAINER),
+        },
+    ),
+}
+_TAINT: _Schema = {
+    1: ("key", "key", _STR, None),
+    2: ("value", "value", _STR, None),
+    3: ("effect", "effect", _STR, None),
+}
+_NODE_CONDITION: _Schema = {
+    1: ("type", "type", _STR, None),
+    2: ("status", "status", _STR, None),
+}
+NODE: _Schema = {
+    1: ("metadata", "metadata", _MSG, _OBJECT_META),
+    2: ("spec", "spec", _MSG, {5: ("taints", "taints", _LIST, _TAINT)}),
+    3: (
+        "status",
+        "status",
+        _MSG,
+        {
+            1: ("capacity", "capacity", _QUANTITY_MAP, None),
+            2: ("allocatable", "allocatable", _QUANTITY_MAP, None),
+            4: ("conditions", "conditions", _LIST, _NODE_CONDITION),
+        },
+    ),
+}
+
+# 지원하는 목록 요청: 이름 → (경로, 항목 스키마)
+RESOURCES: dict[str, tuple[str, _Schema]] = {
+    "pods": ("/api/v1/pods", POD),
+    "pod_resources": ("/api/v1/pods", POD_RESOURCES),
+    "nodes": ("/api/v1/nodes", NODE),
+}
+# 네임스페이스 단위로 요청할 수 있는 리소스의 경로
+NAMESPACED_PATHS = {
+    "pods": "/api/v1/namespaces/{namespace}/pods",
+    "pod_resources": "/api/v1/namespaces/{namespace}/pods",
+}
+
+# protobuf 응답을 처리하지 못한 컨텍스트 (invalidate 전까지 JSON만 요청)
+_json_only: set[str] = set()
+_json_only_lock = threading.Lock()
+
+
+@dataclass(slots=True)
+class ObjectList:
+    """목록 요청 결과
+
+    Attributes:
+        items (list): 필요한 필드만 채운 객체 목록 (kubernetes client 모델과 같은 속성 이름)
+        resource_version (str | None): 목록의 resourceVersion
+        namespaces (tuple[str, ...] | None): 목록에 포함된 네임스페이스. None이면 전체 네임스페이스
+    """
+
+    items: list[Any]
+    resource_version: str | None = None
+    namespaces: tuple[str, ...] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class WireResponse:
+    """API 서버 응답 본문과 전송 정보
+
+    Attributes:
+        body (bytes): 압축을 푼 응답 본문
+        content_type (str): 응답 Content-Type (파라미터 제외)
+        wire_bytes (int): 전송된 본문 크기 (압축된 크기)
+    """
+
+    body: bytes
+    content_type: str
+    wire_bytes: int
+
+
+# ------------------- protobuf ------------------- #
+def _varint(buf: bytes, pos: int) -> tuple[int, int]:
+    """pos에서 varint를 읽어 (값, 다음 위치)를 반환합니다."""
+    byte = buf[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    result = byte & 0x7F
+    shift = 7
+    pos += 1
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+        if shift >= 64:
+            raise ValueError("varint too long")
+
+
+def _fields(buf: bytes, pos: int, end: int) -> Iterable[tuple[int, int, int]]:
+    """메시지의 필드를 (필드 번호, 값, 끝 위치)로 반환합니다.
+
+    길이 구분(wire type 2) 필드의 값은 본문 시작 위치이며, 그 외 필드는 varint 값입니다.
+    고정 길이(wire type 1, 5) 필드는 collectors가 사용하지 않으므로 건너뜁니다.
+    """
+    while pos < end:
+        key, pos = _varint(buf, pos)
+        wire = key & 7
+        if wire == 2:
+            length, pos = _varint(buf, pos)
+            start, pos = pos, pos + length
+            if pos > end:
+                raise ValueError("truncated protobuf field")
+            yield key >> 3, start, pos
+        elif wire == 0:
+            value, pos = _varint(buf, pos)
+            yield key >> 3, value, -1
+        elif wire == 1:
+            pos += 8
+        elif wire == 5:
+            pos += 4
+        else:
+            raise ValueError(f"unsupported protobuf wire type {wire}")
+    if pos != end:
+        raise ValueError("truncated protobuf message")
+
+
+def _string(buf: bytes, start: int, end: int) -> str:
+    if end < 0:
+        raise ValueError("expected length-delimited field")
+    return buf[start:end].decode("utf-8")
+
+
+def _map_entry(buf: bytes, start: int, end: int, quantity: bool) -> tuple[str, str]:
+    """map 항목(key=1, value=2)을 읽습니다. Quantity 값은 내부 문자열(필드 1)을 꺼냅니다."""
+    key = value = ""
+    for number, value_start, value_end in _fields(buf, start, end):
+        if number == 1:
+            key = _string(buf, value_start, value_end)
+        elif number == 2:
+            if quantity:
+                for inner, s, e in _fields(buf, value_start, value_end):
+                    if inner == 1:
+                        value = _string(buf, s, e)
+            else:
+                value = _string(buf, value_start, value_end)
+    return key, value
+
+
+def _decode_message(buf: bytes, start: int, end: int, schema: _Schema) -> SimpleNamespace:
+    """protobuf 메시지에서 스키마의 필드만 읽어 객체로 변환합니다 (없는 필드는 None)."""
+    values: dict[str, Any] = {attr: None for _, attr, _, _ in schema.values()}
+    for number, value, value_end in _fields(buf, start, end):
+        field = schema.get(number)
+        if field is None:
+            continue
+        _, attr, kind, sub = field
+        if (kind in (_INT, _BOOL)) != (value_end < 0):
+            raise ValueError(f"unexpected wire type for field {number}")
+        if kind == _STR:
+            values[attr] = _string(buf, value, value_end)
+        elif kind == _INT:
+            values[attr] = value
+        elif kind == _BOOL:
+            values[attr] = bool(value)
+        elif kind == _MSG:
+            values[attr] = _decode_message(buf, value, value_end, sub)
+        elif kind == _LIST:
+            items = values[attr]
+            if items is None:
+                items = values[attr] = []
+            items.append(_decode_message(buf, value, value_end, sub))
+        elif kind == _TIME:
+            seconds = next((v for n, v, _ in _fields(buf, value, value_end) if n == 1), 0)
+            values[attr] = datetime.fromtimestamp(seconds, UTC)
+        else:
+            mapping = values[attr]
+            if mapping is None:
+                mapping = values[attr] = {}
+            key, item = _map_entry(buf, value, value_end, kind == _QUANTITY_MAP)
+            mapping[key] = item
+    return SimpleNamespace(**values)
+
+
+def decode_protobuf(body: bytes, schema: _Schema) -> ObjectList:
+    """protobuf 목록 응답을 변환합니다.
+
+    응답은 magic 바이트 뒤에 runtime.Unknown 메시지(raw=2에 실제 목록)가 오는 형식이며,
+    목록 메시지는 metadata=1(ListMeta, resourceVersion=2), items=2로 구성됩니다.
+
+    Args:
+        body (bytes): 압축을 푼 응답 본문
+        schema (dict): 항목 스키마 (POD, NODE)
+
+    Returns:
+        ObjectList: 변환된 목록
+
+    Raises:
+        ValueError: protobuf 형식이 아니거나 메시지가 손상된 경우
+    """
+    if not body.startswith(_MAGIC):
+        raise ValueError("missing protobuf magic")
+    raw: tuple[int, int] | None = None
+    for number, start, end in _fields(body, len(_MAGIC), len(body)):
+        if number == 2 and end >= 0:
+            raw = (start, end)
+    if raw is None:
+        raise ValueError("missing protobuf raw object")
+    items: list[Any] = []
+    resource_version = None
+    for number, start, end in _fields(body, *raw):
+        if end < 0:
+            continue
+        if number == 2:
+            items.append(_decode_message(body, start, end, schema))
+        elif number == 1:
+            for inner, s, e in _fields(body, start, end):
+                if inner == 2:
+                    resource_version = _string(body, s, e)
+    return ObjectList(items=items, resource_version=resource_version)
+
+
+# ------------------- JSON ------------------- #
+def _convert_json(data: dict[str, Any], schema: _Schema) -> SimpleNamespace:
+    """JSON 객체에서 스키마의 필드만 꺼내 객체로 변환합니다 (없는 필드는 None)."""
+    values: dict[str, Any] = {}
+    for name, attr, kind, sub in schema.values():
+        value = data.get(name)
+        if value is not None:
+            if kind == _MSG:
+                value = _convert_json(value, sub)
+            elif kind == _LIST:
+                value = [_convert_json(item, sub) for item in value]
+            elif kind == _TIME:
+                value = datetime.fromisoformat(value)
+        values[attr] = value
+    return SimpleNamespace(**values)
+
+
+def decode_json(body: bytes, schema: _Schema) -> ObjectList:
+    """JSON 목록 응답을 변환합니다.
+
+    Args:
+        body (bytes): 압축을 푼 응답 본문
+        schema (dict): 항목 스키마 (POD, NODE)
+
+    Returns:
+        ObjectList: 변환된 목록
+    """
+    data = json.loads(body)
+    return ObjectList(
+        items=[_convert_json(item, schema) for item in data.get("items") or []],
+        resource_version=(data.get("metadata") or {}).get("resourceVersion"),
+    )
+
+
+def decode(response: WireResponse, schema: _Schema) -> ObjectList:
+    """응답 Content-Type에 맞는 방식으로 목록을 변환합니다.
+
+    Raises:
+        ValueError: 지원하지 않는 Content-Type이거나 본문이 손상된 경우
+    """
+    if response.content_type == PROTOBUF:
+        return decode_protobuf(response.body, schema)
+    if response.content_type == JSON:
+        return decode_json(response.body, schema)
+    raise ValueError(f"unsupported content type {response.content_type!r}")
+
+
+# ------------------- HTTP ------------------- #
+def fetch(
+    api_client: Any,
+    path: str,
+    accept: Sequence[str],
+    compress: bool = True,
+    query: Sequence[tuple[str, Any]] = (),
+) -> WireResponse:
+    """kubernetes ApiClient로 GET 요청을 보내고 응답 본문을 그대로 받습니다.
+
+    인증, TLS, 프록시 설정은 ApiClient의 설정을 그대로 사용합니다. kubernetes 37 이상의 ApiClient는
+    param_serialize()로 요청을 만든 뒤 call_api(method, url, ...)로 보내고, 그 이전 버전은
+    call_api(resource_path, method, ...)가 요청을 만들고 보내므로 param_serialize() 유무로 구분합니다.
+
+    Args:
+        api_client (ApiClient): kubernetes ApiClient (CoreV1Api.api_client)
+        path (str): 요청 경로 (예: /api/v1/pods)
+        accept (Sequence[str]): 선호 순서대로 나열한 Content-Type
+        compress (bool, optional): gzip 압축 요청 여부. 기본값은 True
+        query (Sequence[tuple[str, Any]], optional): 쿼리 파라미터. 기본값은 없음
+
+    Returns:
+        WireResponse: 압축을 푼 본문과 Content-Type, 전송된 바이트 수
+
+    Raises:
+        ApiException: 응답 상태 코드가 2xx가 아닌 경우 (스케줄러의 429 재시도에 사용)
+    """
+    headers = {"Accept": ", ".join(accept)}
+    if compress:
+        headers["Accept-Encoding"] = "gzip"
+    if hasattr(api_client, "param_serialize"):
+        method, url, headers, body, post_params = api_client.param_serialize(
+            method="GET",
+            resource_path=path,
+            query_params=list(query),
+            header_params=headers,
+            auth_settings=["BearerToken"],
+        )
+        response = api_client.call_api(method, url, header_params=headers, body=body, post_params=post_params)
+        # RESTResponse가 감싼 urllib3 응답
+        stream = response.response
+    else:
+        # 본문을 읽지 않은 urllib3 응답을 반환 (2xx가 아니면 ApiException 발생)
+        stream = response = api_client.call_api(
+            path,
+            "GET",
+            query_params=list(query),
+            header_params=headers,
+            auth_settings=["BearerToken"],
+            _return_http_data_only=True,
+            _preload_content=False,
+        )
+    # 전송된 크기를 알 수 있도록 압축을 직접 풂
+    raw = stream.read(decode_content=False)
+    encoding = (response.headers.get("Content-Encoding") or "").strip().lower()
+    content = gzip.decompress(raw) if encoding == "gzip" else raw
+    if not 200 <= response.status <= 299:
+        # 두 버전에서 같은 생성자로 만들고 Retry-After를 읽을 수 있도록 헤더를 함께 전달
+        error = ApiException(status=response.status, reason=response.reason)
+        error.body = content.decode("utf-8", "replace")
+        error.headers = response.headers
+        raise error
+    content_type = (response.headers.get("Content-Type") or JSON).split(";")[0].strip()
+    return WireResponse(body=content, content_type=content_type, wire_bytes=len(raw))
+
+
+def wire_format() -> str:
+    """환경 변수에 설정된 목록 요청 형식을 반환합니다 (잘못된 값이면 protobuf).
+
+    Returns:
+        str: FORMATS 중 하나
+    """
+    value = os.environ.get(WIRE_FORMAT_ENV, "").strip().lower() or FORMATS[0]
+    if value not in FORMATS:
+        print(f"Warning: invalid {WIRE_FORMAT_ENV} value {value!r}. Using {FORMATS[0]}.")
+        return FORMATS[0]
+    return value
+
+
+def list_objects(ctx: str, core: Any, resource: str, namespace: str | None = None) -> ObjectList:
+    """core 목록 요청을 보내고 collectors가 사용하는 필드만 변환하여 반환합니다.
+
+    protobuf를 우선 요청하며, 서버가 JSON으로 응답하면 JSON을 변환합니다. protobuf 응답을
+    해석하지 못하면 경고를 출력하고 JSON으로 다시 요청하며, 이 컨텍스트는 reset() 전까지 JSON만 요청합니다.
+    형식이 client이면 kubernetes client의 모델 역직렬화를 그대로 사용합니다.
+
+    Args:
+        ctx (str): Kubernetes 컨텍스트 이름
+        core (CoreV1Api): 컨텍스트의 CoreV1Api
+        resource (str): RESOURCES의 키 (pods, pod_resources, nodes)
+        namespace (str, optional): 네임스페이스. 기본값은 None (전체 네임스페이스)
+
+    Returns:
+        ObjectList: 목록 (items 속성은 kubernetes client 목록 객체와 같음)
+
+    Raises:
+        ValueError: 네임스페이스 단위로 요청할 수 없는 리소스에 namespace를 지정한 경우
+    """
+    if namespace is not None and resource not in NAMESPACED_PATHS:
+        raise ValueError(f"{resource} cannot be listed per namespace")
+    fmt = wire_format()
+    if fmt == "client":
+        if namespace is not None:
+            result = core.list_namespaced_pod(namespace, watch=False)
+        else:
+            method = core.list_node if resource == "nodes" else core.list_pod_for_all_namespaces
+            result = method(watch=False)
+        return ObjectList(items=result.items, resource_version=result.metadata.resource_version)
+
+    path, schema = RESOURCES[resource]
+    if namespace is not None:
+        path = NAMESPACED_PATHS[resource].format(namespace=quote(namespace, safe=""))
+    query = [("watch", "false")]
+    with _json_only_lock:
+        protobuf = fmt == "protobuf" and ctx not in _json_only
+    if protobuf:
+        response = fetch(core.api_client, path, (PROTOBUF, JSON), query=query)
+        try:
+            return decode(response, schema)
+        except (ValueError, IndexError, UnicodeDecodeError) as e:
+            print(f"Warning: could not decode {resource} list from {ctx} as {response.content_type}: {e}. Using JSON.")
+            with _json_only_lock:
+                _json_only.add(ctx)
+    return decode(fetch(core.api_client, path, (JSON,), query=query), schema)
+
+
+def reset(clusters: Iterable[str] | None = None) -> None:
+    """JSON으로 전환된 컨텍스트가 다음 요청에서 다시 protobuf를 시도하도록 합니다.
+
+    Args:
+        clusters (Iterable[str], optional): 대상 클러스터. 기본값은 None (전체)
+    """
+    with _json_only_lock:
+        if clusters is None:
+            _json_only.clear()
+        else:
+            _json_only.difference_update(clusters)
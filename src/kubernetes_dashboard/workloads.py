@@ -0,0 +1,174 @@
+"""Workload rollups via an owner-reference index.
+
+이 모듈은 Pod를 최상위 소유자(Deployment, StatefulSet, DaemonSet, Job 등) 단위로 묶습니다.
+ReplicaSet이 소유한 Pod는 pod-template-hash 레이블로 ReplicaSet 이름에서 Deployment 이름을
+복원하므로 ReplicaSet이나 Deployment 목록을 따로 조회하지 않습니다.
+
+소유자 참조(ownerReference) UID → 최상위 소유자 해석 결과는 클러스터별로 캐시되며,
+수집할 때마다 새로 나타난 소유자만 해석하고 사라진 소유자는 제거합니다.
+집계는 collect_cluster()가 이미 수행하는 Pod 목록 순회 한 번 안에서 WorkloadRollup.add()로 누적합니다.
+"""
+
+import threading
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+from kubernetes_dashboard.records import WorkloadRow, intern
+
+# 소유자가 없는 Pod의 kind
+STANDALONE = "Pod"
+
+# (kind, name)
+Owner = tuple[str, str]
+
+
+def _controller_ref(pod: Any) -> Any:
+    """Pod의 controller 소유자 참조를 반환합니다 (없으면 첫 번째 참조, 참조가 없으면 None)."""
+    refs = pod.metadata.owner_references or []
+    for ref in refs:
+        if ref.controller:
+            return ref
+    return refs[0] if refs else None
+
+
+def resolve_owner(ref: Any, labels: dict[str, str] | None) -> Owner:
+    """소유자 참조를 최상위 소유자로 해석합니다.
+
+    Deployment가 만든 ReplicaSet의 이름은 "<deployment>-<pod-template-hash>" 형식이므로
+    Pod의 pod-template-hash 레이블과 일치하는 접미사를 제거하여 Deployment 이름을 얻습니다.
+
+    Args:
+        ref (V1OwnerReference): Pod의 controller 소유자 참조
+        labels (dict, optional): Pod 레이블
+
+    Returns:
+        tuple[str, str]: (kind, name)
+    """
+    if ref.kind == "ReplicaSet":
+        template_hash = (labels or {}).get("pod-template-hash")
+        if template_hash and ref.name.endswith(f"-{template_hash}"):
+            return ("Deployment", ref.name[: -len(template_hash) - 1])
+    return (ref.kind, ref.name)
+
+
+class OwnerIndex:
+    """클러스터별 소유자 참조 UID → 최상위 소유자 캐시"""
+
+    def __init__(self) -> None:
+        self._owners: dict[str, dict[str, Owner]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """캐시된 소유자 참조 수"""
+        return sum(len(owners) for owners in self._owners.values())
+
+    def rollup(self, cluster: str) -> "WorkloadRollup":
+        """클러스터 한 번의 Pod 순회에 사용할 집계기를 생성합니다.
+
+        Args:
+            cluster (str): Kubernetes 컨텍스트 이름
+
+        Returns:
+            WorkloadRollup: Pod마다 add()를 호출한 뒤 rows()로 결과를 얻는 집계기
+        """
+        with self._lock:
+            previous = self._owners.get(cluster, {})
+        return WorkloadRollup(self, cluster, previous)
+
+    def _replace(self, cluster: str, owners: dict[str, Owner]) -> None:
+        with self._lock:
+            self._owners[cluster] = owners
+
+    def invalidate(self, clusters: Iterable[str] | None = None) -> None:
+        """캐시를 제거합니다.
+
+        Args:
+            clusters (Iterable[str], optional): 제거할 클러스터. 기본값은 None (전체)
+        """
+        with self._lock:
+            for cluster in list(self._owners) if clusters is None else clusters:
+                self._owners.pop(cluster, None)
+
+
+class WorkloadRollup:
+    """Pod 순회 중 워크로드별 Pod 수, Ready 수, non-running 수, 재시작 수를 누적합니다."""
+
+    __slots__ = ("_cluster", "_index", "_owners", "_previous", "_totals")
+
+    def __init__(self, index: OwnerIndex, cluster: str, previous: dict[str, Owner]) -> None:
+        self._index = index
+        self._cluster = intern(cluster)
+        self._previous = previous
+        self._owners: dict[str, Owner] = {}
+        # (ns, kind, name) → [pods, ready, non_running, restarts]
+        self._totals: dict[tuple[str, str, str], list[int]] = {}
+
+    def owner(self, pod: Any) -> Owner:
+        """Pod의 최상위 소유자를 반환합니다 (캐시에 없으면 해석 후 기록).
+
+        Args:
+            pod (V1Pod): Pod 객체
+
+        Returns:
+            tuple[str, str]: (kind, name). 소유자가 없으면 (STANDALONE, Pod 이름)
+        """
+        ref = _controller_ref(pod)
+        if ref is None:
+            return (STANDALONE, pod.metadata.name)
+        owner = self._owners.get(ref.uid) or self._previous.get(ref.uid)
+        if owner is None:
+            kind, name = resolve_owner(ref, pod.metadata.labels)
+            owner = (intern(kind), intern(name))
+        self._owners[ref.uid] = owner
+        return owner
+
+    def add(self, pod: Any, owner: Owner | None = None) -> None:
+        """Pod 하나를 해당 워크로드의 합계에 더합니다.
+
+        Args:
+            pod (V1Pod): Pod 객체
+            owner (tuple[str, str], optional): 이미 구한 owner() 결과. 기본값은 None (새로 구함)
+        """
+        kind, name = owner or self.owner(pod)
+        totals = self._totals.get((pod.metadata.namespace, kind, name))
+        if totals is None:
+            totals = self._totals[pod.metadata.namespace, kind, name] = [0, 0, 0, 0]
+        statuses = pod.status.container_statuses or []
+        running = pod.status.phase == "Running"
+        totals[0] += 1
+        if running and statuses and all(cs.ready for cs in statuses):
+            totals[1] += 1
+        if not running:
+            totals[2] += 1
+        totals[3] += sum(cs.restart_count or 0 for cs in statuses)
+
+    def rows(self) -> list[WorkloadRow]:
+        """누적한 합계를 워크로드 행으로 반환하고, 소유자 캐시를 이번 순회 결과로 교체합니다.
+
+        Returns:
+            list[WorkloadRow]: non-running Pod 수, Ready가 아닌 Pod 수, 재시작 수가 많은 순으로 정렬된 목록
+        """
+        # 이번 순회에서 보이지 않은 소유자 참조는 캐시에서 제거
+        self._index._replace(self._cluster, self._owners)
+        rows = [
+            WorkloadRow(
+                cluster=self._cluster,
+                ns=intern(ns),
+                kind=kind,
+                name=name,
+                pods=pods,
+                ready=ready,
+                non_running=non_running,
+                restarts=restarts,
+            )
+            for (ns, kind, name), (pods, ready, non_running, restarts) in self._totals.items()
+        ]
+        rows.sort(key=lambda r: (-r.non_running, r.ready - r.pods, -r.restarts, r.ns, r.name))
+        return rows
+
+
+@lru_cache(maxsize=1)
+def owner_index() -> OwnerIndex:
+    """프로세스 전체에서 공유하는 소유자 참조 인덱스를 반환합니다."""
+    return OwnerIndex()
@@ -0,0 +1,124 @@
+"""Tests for the alerts module."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from kubernetes_dashboard.alerts import DEFAULT_RULES, FIRING, PENDING, AlertEngine, load_rules, parse_rule
+from kubernetes_dashboard.records import NodeRow, PodRow
+
+
+def _nodes(*cpu: float | str) -> list[NodeRow]:
+    return [NodeRow("c1", f"n{i}", 1.0, 1.0, value, 10.0) for i, value in enumerate(cpu)]
+
+
+def _pending(ns: str, count: int) -> list[PodRow]:
+    return [PodRow("c1", f"{ns}-{i}", ns, "n1", "Pending", "Unschedulable") for i in range(count)]
+
+
+class TestParseRule(unittest.TestCase):
+    """Test cases for declarative rule definitions."""
+
+    def test_expressions(self) -> None:
+        """Test parsing column, count and sum/max expressions with durations."""
+        # 함수 호출
+        rules = [parse_rule(spec) for spec in DEFAULT_RULES]
+        summed = parse_rule({"name": "R", "source": "workloads", "expr": "sum(restarts) >= 10", "by": ["ns"]})
+
+        # 결과 확인
+        cpu, _, pending, _ = rules
+        self.assertEqual(
+            (cpu.metric, cpu.op, cpu.threshold, cpu.for_samples, cpu.clear), ("cpu_percent", ">", 90, 3, 80)
+        )
+        self.assertEqual((pending.aggregate, pending.by, pending.where), ("count", ("ns",), (("phase", "Pending"),)))
+        self.assertEqual(pending.for_seconds, 600)
+        self.assertEqual((summed.aggregate, summed.metric, summed.op), ("sum", "restarts", ">="))
+
+        for spec in (
+            {"name": "R", "source": "node_metrics"},
+            {"name": "R", "source": "node_metrics", "expr": "cpu_percent >> 90"},
+            {"name": "R", "source": "node_metrics", "expr": "cpu_percent > 90", "for": "soon"},
+            {"name": "R", "source": "workloads", "expr": "sum > 1"},
+        ):
+            with self.assertRaises(ValueError):
+                parse_rule(spec)
+
+    @patch("builtins.print")
+    def test_load_rules_file(self, mock_print: MagicMock) -> None:
+        """Test loading rules from YAML and falling back to defaults on errors."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "rules.yaml")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("rules:\n  - name: Many\n    source: non_running_pods\n    expr: count > 100\n")
+
+            # 함수 호출
+            rules = load_rules(path)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("- name: Broken\n")
+            fallback = load_rules(path)
+
+        # 결과 확인
+        self.assertEqual([rule.name for rule in rules], ["Many"])
+        self.assertEqual(len(fallback), len(DEFAULT_RULES))
+        mock_print.assert_called_once()
+
+
+class TestAlertEngine(unittest.TestCase):
+    """Test cases for per-series hysteresis state."""
+
+    def test_consecutive_samples_and_clear_threshold(self) -> None:
+        """Test that a node fires after 3 samples and resolves below the clear threshold."""
+        engine = AlertEngine([parse_rule(DEFAULT_RULES[0])])
+        states = []
+
+        # 함수 호출: n0만 임계값을 넘고 n1은 metrics가 없음
+        for t, cpu in enumerate((95.0, 96.0, 97.0, 85.0, 75.0)):
+            engine.evaluate("c1", {"node_metrics": _nodes(cpu, "N/A")}, now=float(t))
+            states.append([(a.series, a.state) for a in engine.alerts(pending=True)])
+
+        # 결과 확인
+        self.assertEqual(
+            states,
+            [
+                [("node=n0", PENDING)],
+                [("node=n0", PENDING)],
+                [("node=n0", FIRING)],
+                # 90 이하여도 clear(80)를 넘으면 firing 유지
+                [("node=n0", FIRING)],
+                [],
+            ],
+        )
+
+        # pending 상태에서 임계값 아래로 내려가면 연속 샘플 수를 다시 셈
+        for t, cpu in enumerate((95.0, 85.0, 95.0, 95.0), start=10):
+            engine.evaluate("c1", {"node_metrics": _nodes(cpu)}, now=float(t))
+        self.assertEqual(engine.alerts(), [])
+
+    def test_grouped_count_for_duration(self) -> None:
+        """Test that pending pods are counted per namespace and fire after 10 minutes."""
+        engine = AlertEngine([parse_rule(DEFAULT_RULES[2])])
+        failed = PodRow("c1", "x", "team-a", "n1", "Failed", "Error")
+        rows = [*_pending("team-a", 6), *_pending("team-b", 2), failed]
+
+        # 함수 호출
+        engine.evaluate("c1", {"non_running_pods": rows}, now=0.0)
+        engine.evaluate("c2", {"non_running_pods": rows}, now=300.0)
+        engine.evaluate("c1", {"non_running_pods": rows}, now=600.0)
+        # 다른 데이터셋만 새로고침된 경우 상태를 유지
+        engine.evaluate("c1", {"node_metrics": []}, now=650.0)
+
+        # 결과 확인
+        alerts = engine.alerts(pending=True)
+        self.assertEqual(
+            [(a.cluster, a.series, a.value, a.state) for a in alerts],
+            [("c1", "ns=team-a", 6.0, FIRING), ("c2", "ns=team-a", 6.0, PENDING)],
+        )
+        self.assertEqual([a.cluster for a in engine.alerts(["c2"], pending=True)], ["c2"])
+
+        engine.evaluate("c1", {"non_running_pods": _pending("team-a", 3)}, now=700.0)
+        self.assertEqual(engine.alerts(["c1"]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""Tests for the allocation module."""
+
+import unittest
+from types import SimpleNamespace
+from typing import Any
+
+from kubernetes_dashboard.allocation import allocation, pod_resources
+from kubernetes_dashboard.inventory import NodeInfo
+from kubernetes_dashboard.records import NodeRow
+
+
+def _container(requests: dict[str, str] | None = None, limits: dict[str, str] | None = None) -> Any:
+    """테스트용 컨테이너를 생성합니다."""
+    return SimpleNamespace(name="app", resources=SimpleNamespace(requests=requests, limits=limits))
+
+
+def _pod(ns: str, node: str | None, containers: list[Any], phase: str = "Running", init: Any = None) -> Any:
+    """테스트용 Pod를 생성합니다."""
+    return SimpleNamespace(
+        metadata=SimpleNamespace(namespace=ns),
+        spec=SimpleNamespace(node_name=node, containers=containers, init_containers=init),
+        status=SimpleNamespace(phase=phase),
+    )
+
+
+def _node(name: str, cpu: float, mem: float) -> NodeInfo:
+    """테스트용 노드 인벤토리 항목을 생성합니다."""
+    return NodeInfo(name, "1", cpu, mem, cpu, mem, {}, (), {})
+
+
+class TestAllocation(unittest.TestCase):
+    """Test cases for requests/limits aggregation."""
+
+    def test_pod_resources_with_init_containers(self) -> None:
+        """Test that the larger of the container sum and the largest init container is used."""
+        # Mock 설정
+        pod = _pod(
+            "default",
+            "node1",
+            [_container({"cpu": "250m", "memory": "64Mi"}, {"cpu": "500m"}), _container({"cpu": "250m"}), _container()],
+            init=[_container({"cpu": "1", "memory": "32Mi"}, {"memory": "1Gi"})],
+        )
+
+        # 함수 호출
+        cpu_req, cpu_lim, mem_req, mem_lim = pod_resources(pod)
+
+        # 결과 확인
+        self.assertEqual(cpu_req, 1.0)
+        self.assertEqual(cpu_lim, 0.5)
+        self.assertEqual(mem_req, 64 * 1024**2)
+        self.assertEqual(mem_lim, 1024**3)
+
+    def test_allocation_by_node_and_namespace(self) -> None:
+        """Test summing per node and namespace and joining allocatable and usage."""
+        # Mock 설정
+        pods = [
+            _pod("team-a", "node1", [_container({"cpu": "1", "memory": "1Gi"}, {"cpu": "3", "memory": "2Gi"})]),
+            _pod("team-a", "node1", [_container({"cpu": "500m", "memory": "512M"})]),
+            _pod("team-b", "node2", [_container({"cpu": "2"}, {"cpu": "2"})]),
+            # 스케줄되지 않은 Pod는 네임스페이스 합계에만 포함
+            _pod("team-b", None, [_container({"cpu": "4"})], phase="Pending"),
+            # 종료된 Pod는 제외
+            _pod("team-a", "node2", [_container({"cpu": "8"})], phase="Succeeded"),
+        ]
+        nodes = {"node1": _node("node1", 2.0, 4 * 1024**3), "node2": _node("node2", 4.0, 8 * 1024**3)}
+        usage = [
+            NodeRow("c1", "node1", 1.0, 2 * 1024**3, 50.0, 50.0),
+            NodeRow("c1", "node2", "N/A", "N/A", "N/A", "N/A"),
+        ]
+
+        # 함수 호출
+        node_rows, ns_rows = allocation("c1", pods, nodes, usage)
+
+        # 결과 확인
+        node1, node2 = node_rows
+        self.assertEqual((node1.node, node1.pods), ("node1", 2))
+        self.assertEqual(node1.cpu_requests, 1.5)
+        self.assertEqual(node1.cpu_requested_percent, 75.0)
+        self.assertEqual(node1.cpu_used_percent, 50.0)
+        # limits 합계가 allocatable을 넘으면 overcommit
+        self.assertEqual(node1.cpu_overcommit_percent, 150.0)
+        self.assertEqual(node1.mem_requests, 1024**3 + 512e6)
+        self.assertEqual(node2.cpu_requested_percent, 50.0)
+        self.assertIsNone(node2.cpu_used)
+        self.assertIsNone(node2.mem_used_percent)
+        self.assertEqual(
+            [(row.ns, row.pods, row.cpu_requests, row.cpu_limits) for row in ns_rows],
+            [("team-b", 2, 6.0, 2.0), ("team-a", 2, 1.5, 3.0)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""Tests for the archive module."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from kubernetes_dashboard.archive import ARCHIVE_DIR_ENV, SnapshotArchive, open_archive
+from kubernetes_dashboard.collectors import EVENTS, PODS
+from kubernetes_dashboard.persist import decode_cluster
+from kubernetes_dashboard.records import PodRow
+
+
+def _pods(ctx: str, total: int) -> dict[str, object]:
+    """테스트용 PODS 데이터셋 값을 생성합니다."""
+    rows = [PodRow(ctx, f"web-{total}", "prod", "n1", "Pending", "N/A")]
+    return {"total_pods": total, "non_running_total": 1, "non_running_pods": rows}
+
+
+class TestSnapshotArchive(unittest.TestCase):
+    """Test cases for SnapshotArchive."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = self._tmp.name
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_replay_latest_record_per_cluster_and_dataset(self) -> None:
+        """Test that replay returns the newest record at or before the requested time."""
+        # Mock 설정
+        archive = SnapshotArchive(self.directory)
+        archive.append("c1", PODS, 100.0, _pods("c1", 1))
+        archive.append("c2", PODS, 105.0, _pods("c2", 10))
+        archive.append("c1", PODS, 110.0, _pods("c1", 2))
+        archive.append("c1", EVENTS, 120.0, {"events": []})
+
+        # 함수 호출
+        before = archive.snapshot(("c1", "c2"), {PODS}, 99.0)
+        middle = archive.snapshot(("c1", "c2"), {PODS}, 107.0)
+        latest = archive.snapshot(("c1", "c2"), {PODS, EVENTS}, 200.0)
+        archive.close()
+        # 다시 연 아카이브도 같은 기록을 읽음
+        reopened = SnapshotArchive(self.directory)
+        found = reopened.load(("c1",), {PODS}, 107.0)
+
+        # 결과 확인
+        self.assertEqual(before, {"total_pods": 0, "non_running_total": 0, "non_running_pods": []})
+        self.assertEqual(middle["total_pods"], 11)
+        self.assertEqual([row.pod for row in middle["non_running_pods"]], ["web-1", "web-10"])
+        self.assertEqual((latest["total_pods"], latest["events"]), (12, []))
+        self.assertEqual(found["c1", PODS][0], 100.0)
+        self.assertEqual(reopened.span(), (100.0, 120.0))
+        # 검색 색인 등 저장할 수 없는 값은 기록하지 않음
+        self.assertFalse(reopened.append("c1", PODS, 130.0, {"total_pods": object()}))  # type: ignore[dict-item]
+        reopened.close()
+
+    @patch("kubernetes_dashboard.archive.time.time", return_value=200.0)
+    def test_load_decodes_only_latest_requested_records(self, _mock_time: MagicMock) -> None:
+        """Test that a never-recorded cluster does not decode every record or look back past retention."""
+        # Mock 설정: 보존 기간 이전 기록 하나와 c1 기록 여러 개
+        archive = SnapshotArchive(self.directory, max_age=50.0)
+        archive.append("old", PODS, 10.0, _pods("old", 1))
+        for i in range(10):
+            archive.append("c1", PODS, 160.0 + i, _pods("c1", i))
+            archive.append("c1", EVENTS, 160.0 + i, {"events": []})
+
+        # 함수 호출
+        with patch("kubernetes_dashboard.archive.decode_cluster", wraps=decode_cluster) as mock_decode:
+            found = archive.load(("c1", "missing", "old"), {PODS}, 200.0)
+        archive.close()
+
+        # 결과 확인: 찾은 항목의 마지막 레코드 하나만 풀고, 보존 기간 이전(old)은 찾지 않음
+        self.assertEqual(set(found), {("c1", PODS)})
+        self.assertEqual(found["c1", PODS][0], 169.0)
+        self.assertEqual(mock_decode.call_count, 1)
+
+    @patch("kubernetes_dashboard.archive.time.time")
+    def test_segments_roll_and_retention(self, mock_time: MagicMock) -> None:
+        """Test that segments roll over and old segments are dropped by size and age."""
+        # Mock 설정
+        mock_time.return_value = 1000.0
+        archive = SnapshotArchive(self.directory, max_bytes=2000, max_age=500.0, segment_bytes=600)
+
+        # 함수 호출: 세그먼트마다 레코드 두세 개
+        for i in range(12):
+            archive.append("c1", PODS, 900.0 + i, _pods("c1", i))
+        by_size = sorted(os.listdir(self.directory))
+        size = sum(os.path.getsize(os.path.join(self.directory, name)) for name in by_size)
+        first_after_size = archive.span()
+        mock_time.return_value = 1500.0
+        archive.append("c1", PODS, 1400.0, _pods("c1", 99))
+        by_age = archive.span()
+        archive.close()
+
+        # 결과 확인
+        self.assertGreater(len(by_size), 2)
+        self.assertLessEqual(size, 2000)
+        assert first_after_size is not None
+        self.assertGreater(first_after_size[0], 900.0)
+        self.assertEqual(by_age, (1400.0, 1400.0))
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+
+    def test_torn_tail_is_ignored(self) -> None:
+        """Test that an index entry written without its data is ignored after a crash."""
+        # Mock 설정
+        archive = SnapshotArchive(self.directory)
+        archive.append("c1", PODS, 100.0, _pods("c1", 1))
+        archive.append("c1", PODS, 110.0, _pods("c1", 2))
+        archive.close()
+        data = next(n for n in os.listdir(self.directory) if n.endswith(".kda"))
+        with open(os.path.join(self.directory, data), "r+b") as f:
+            f.truncate(os.path.getsize(f.name) - 1)
+
+        # 함수 호출
+        reopened = SnapshotArchive(self.directory)
+        snapshot = reopened.snapshot(("c1",), {PODS}, 200.0)
+        reopened.close()
+
+        # 결과 확인
+        self.assertEqual(snapshot["total_pods"], 1)
+
+    def test_open_archive_is_opt_in(self) -> None:
+        """Test that the archive is disabled unless a directory is configured."""
+        with patch.dict(os.environ, {ARCHIVE_DIR_ENV: ""}):
+            self.assertIsNone(open_archive())
+        with patch.dict(os.environ, {ARCHIVE_DIR_ENV: self.directory}):
+            archive = open_archive()
+        self.assertIsInstance(archive, SnapshotArchive)
+
+
+if __name__ == "__main__":
+    unittest.main()
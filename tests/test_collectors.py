@@ -1,18 +1,83 @@
 """Tests for the collectors module."""
 
 import unittest
-from unittest.mock import MagicMock, patch
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import MagicMock, call, patch
+
+from kubernetes.client.exceptions import ApiException
 
 from kubernetes_dashboard.collectors import (
+    ALLOCATION,
+    EVENT_INDEX,
+    EVENT_LIMIT,
+    EVENT_PAGE_SIZE,
+    EVENTS,
+    NODE_METRICS,
+    NODE_PODS,
+    PODS,
+    SEARCH_INDEX,
+    _get_all_pods,
     _get_cluster_events,
     _get_pod_logs,
+    _list_nodes,
+    _node_metrics,
+    _pod_usage,
     collect,
 )
+from kubernetes_dashboard.inventory import node_inventory
+from kubernetes_dashboard.permissions import permission_cache
+from kubernetes_dashboard.records import EventRow
+from kubernetes_dashboard.restarts import restart_tracker
+from kubernetes_dashboard.search import search
+from kubernetes_dashboard.workloads import owner_index
+
+
+def _pod(name: str, phase: str, restarted: bool = False) -> Any:
+    """테스트용 Pod mock을 생성합니다."""
+    pod = MagicMock()
+    pod.metadata.name = name
+    pod.metadata.namespace = "default"
+    pod.metadata.uid = f"uid-{name}"
+    pod.metadata.owner_references = None
+    pod.spec.node_name = "node1"
+    pod.status.phase = phase
+    pod.status.reason = None
+    status = MagicMock()
+    status.name = "app"
+    status.restart_count = 1 if restarted else 0
+    status.last_state.terminated = MagicMock(finished_at=datetime.now(UTC)) if restarted else None
+    pod.status.container_statuses = [status]
+    return pod
+
+
+def _node(name: str) -> Any:
+    """테스트용 Node mock을 생성합니다."""
+    node = MagicMock()
+    node.metadata.name = name
+    node.metadata.resource_version = "1"
+    node.status.capacity = {"cpu": "2", "memory": "4Gi"}
+    node.status.allocatable = None
+    node.status.conditions = []
+    node.spec.taints = None
+    return node
+
+
+def _page(items: list[Any], token: str | None = None) -> Any:
+    """테스트용 목록 응답 한 페이지 mock을 생성합니다."""
+    return MagicMock(items=items, metadata=MagicMock(_continue=token))
 
 
 class TestCollectors(unittest.TestCase):
     """Test cases for the collectors module."""
 
+    def setUp(self) -> None:
+        """테스트마다 공유 재시작 추적기를 초기화합니다."""
+        restart_tracker.cache_clear()
+        node_inventory.cache_clear()
+        owner_index.cache_clear()
+        permission_cache.cache_clear()
+
     @patch("kubernetes_dashboard.collectors.api_for")
     def test_get_pod_logs(self, mock_api_for: MagicMock) -> None:
         """Test _get_pod_logs function."""
@@ -39,61 +104,56 @@ class TestCollectors(unittest.TestCase):
         mock_event.type = "Normal"
         mock_event.reason = "Created"
         mock_event.message = "Created pod"
-        mock_event.last_timestamp = None
         mock_event.event_time = None
         mock_event.involved_object.kind = "Pod"
         mock_event.involved_object.name = "test-pod"
+        mock_event.involved_object.namespace = "default"
 
-        mock_events = MagicMock()
-        mock_events.items = [mock_event]
-        mock_core.list_event_for_all_namespaces.return_value = mock_events
+        # 두 페이지로 나뉜 목록: 첫 페이지는 오래된 이벤트, 두 번째 페이지는 최신 이벤트
+        old_event = MagicMock(type="Normal", reason="Pulled", message="old", event_time=None)
+        old_event.last_timestamp = datetime(2025, 1, 1, tzinfo=UTC)
+        mock_event.last_timestamp = datetime(2025, 1, 2, tzinfo=UTC)
+        mock_core.list_event_for_all_namespaces.side_effect = [
+            _page([old_event], "next"),
+            _page([mock_event]),
+        ]
         mock_api_for.return_value = (mock_core, None)
 
         # 함수 호출
-        result = _get_cluster_events("test-cluster")
+        result = _get_cluster_events("test-cluster", limit=1)
 
-        # 결과 확인
+        # 결과 확인: 모든 페이지를 조회한 뒤 최신 이벤트부터 자름
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]["cluster"], "test-cluster")
         self.assertEqual(result[0]["type"], "Normal")
         self.assertEqual(result[0]["reason"], "Created")
         self.assertEqual(result[0]["object"], "Pod/test-pod")
         self.assertEqual(result[0]["message"], "Created pod")
+        self.assertEqual(result[0]["ns"], "default")
 
-        mock_core.list_event_for_all_namespaces.assert_called_once_with(limit=100)
+        self.assertEqual(
+            mock_core.list_event_for_all_namespaces.call_args_list,
+            [call(limit=EVENT_PAGE_SIZE, _continue=None), call(limit=EVENT_PAGE_SIZE, _continue="next")],
+        )
 
     @patch("kubernetes_dashboard.collectors._get_cluster_events")
-    @patch("kubernetes_dashboard.collectors._recent_restarts")
     @patch("kubernetes_dashboard.collectors._node_metrics")
-    @patch("kubernetes_dashboard.collectors._total_pods")
-    @patch("kubernetes_dashboard.collectors._non_running_pods_list")
+    @patch("kubernetes_dashboard.collectors._get_all_pods")
     def test_collect(
         self,
-        mock_non_running_pods_list: MagicMock,
-        mock_total_pods: MagicMock,
+        mock_get_all_pods: MagicMock,
         mock_node_metrics: MagicMock,
-        mock_recent_restarts: MagicMock,
         mock_get_cluster_events: MagicMock,
     ) -> None:
         """Test collect function."""
         # Mock 설정
-        mock_non_running_pods_list.side_effect = [
-            [{"cluster": "cluster1", "pod": "pod1"}],
-            [{"cluster": "cluster2", "pod": "pod2"}],
-        ]
-        mock_total_pods.side_effect = [10, 20]
-        mock_node_metrics.side_effect = [
-            [{"cluster": "cluster1", "node": "node1"}],
-            [{"cluster": "cluster2", "node": "node2"}],
-        ]
-        mock_recent_restarts.side_effect = [
-            [{"cluster": "cluster1", "pod": "pod1"}],
-            [{"cluster": "cluster2", "pod": "pod2"}],
-        ]
-        mock_get_cluster_events.side_effect = [
-            [{"cluster": "cluster1", "type": "Normal"}],
-            [{"cluster": "cluster2", "type": "Warning"}],
-        ]
+        pods = {
+            "cluster1": [_pod("pod1", "Pending")] + [_pod(f"ok{i}", "Running") for i in range(9)],
+            "cluster2": [_pod("pod2", "Failed", restarted=True)] + [_pod(f"ok{i}", "Running") for i in range(19)],
+        }
+        mock_get_all_pods.side_effect = lambda ctx, resources=False: MagicMock(items=pods[ctx])
+        mock_node_metrics.side_effect = lambda ctx: [{"cluster": ctx, "node": "node1"}]
+        mock_get_cluster_events.side_effect = lambda ctx, limit: [{"cluster": ctx, "type": "Normal"}]
 
         # 함수 호출
         result = collect(("cluster1", "cluster2"))
@@ -103,8 +163,299 @@ class TestCollectors(unittest.TestCase):
         self.assertEqual(result["non_running_total"], 2)
         self.assertEqual(len(result["non_running_pods"]), 2)
         self.assertEqual(len(result["node_metrics"]), 2)
-        self.assertEqual(len(result["recent_restarts"]), 2)
+        self.assertEqual(len(result["recent_restarts"]), 1)
+        self.assertEqual(len(result["workloads"]), 30)
+        self.assertEqual(result["non_running_pods"][0]["workload"], "Pod/pod1")
         self.assertEqual(len(result["events"]), 2)
+        # Pod 요약과 재시작 정보가 모두 필요해도 클러스터당 Pod 목록은 한 번만 조회
+        self.assertEqual(mock_get_all_pods.call_count, 2)
+
+    @patch("kubernetes_dashboard.collectors._get_cluster_events")
+    @patch("kubernetes_dashboard.collectors._node_metrics")
+    @patch("kubernetes_dashboard.collectors._get_all_pods")
+    def test_collect_only_requested_datasets(
+        self,
+        mock_get_all_pods: MagicMock,
+        mock_node_metrics: MagicMock,
+        mock_get_cluster_events: MagicMock,
+    ) -> None:
+        """Test that collect fetches only the requested datasets."""
+        mock_get_cluster_events.return_value = []
+
+        # 함수 호출
+        result = collect(("cluster1",), datasets={EVENTS})
+
+        # 결과 확인
+        self.assertEqual(result, {"events": []})
+        mock_get_all_pods.assert_not_called()
+        mock_node_metrics.assert_not_called()
+
+    @patch("kubernetes_dashboard.collectors._list_nodes")
+    @patch("kubernetes_dashboard.collectors._node_metrics")
+    @patch("kubernetes_dashboard.collectors._get_all_pods")
+    def test_collect_allocation(
+        self, mock_get_all_pods: MagicMock, mock_node_metrics: MagicMock, mock_list_nodes: MagicMock
+    ) -> None:
+        """Test that allocation requests container resources and reuses one node metrics call."""
+        # Mock 설정
+        pod = _pod("web-0", "Running")
+        pod.spec.init_containers = None
+        pod.spec.containers = [MagicMock(resources=MagicMock(requests={"cpu": "500m"}, limits=None))]
+        mock_get_all_pods.return_value = MagicMock(items=[pod])
+        mock_node_metrics.return_value = [{"cluster": "cluster1", "node": "node1"}]
+        mock_list_nodes.return_value = [_node("node1")]
+
+        # 함수 호출
+        result = collect(("cluster1",), datasets={ALLOCATION, NODE_METRICS})
+
+        # 결과 확인
+        mock_get_all_pods.assert_called_once_with("cluster1", resources=True)
+        mock_node_metrics.assert_called_once()
+        node = result["node_allocation"][0]
+        self.assertEqual((node.node, node.cpu_requests, node.cpu_requested_percent), ("node1", 0.5, 25.0))
+        self.assertEqual(result["namespace_allocation"][0].ns, "default")
+
+    @patch("kubernetes_dashboard.collectors._list_nodes")
+    @patch("kubernetes_dashboard.collectors._get_all_pods")
+    def test_collect_search_index(self, mock_get_all_pods: MagicMock, mock_list_nodes: MagicMock) -> None:
+        """Test building one search segment per cluster from the pod list and node inventory."""
+        # Mock 설정
+        web = _pod("web-0", "Running")
+        web.metadata.labels = {"app": "web"}
+        mock_get_all_pods.side_effect = lambda ctx, resources=False: MagicMock(items=[web, _pod("pod1", "Pending")])
+        mock_list_nodes.return_value = [_node("node1")]
+
+        # 함수 호출
+        result = collect(("cluster1", "cluster2"), datasets={SEARCH_INDEX})
+
+        # 결과 확인: 네임스페이스 1개 + 노드 1개 + Pod 2개
+        segments = result["search_segments"]
+        self.assertEqual([(s.cluster, len(s)) for s in segments], [("cluster1", 4), ("cluster2", 4)])
+        self.assertEqual([row["kind"] for row in segments[0].rows], ["namespace", "node", "pod", "pod"])
+        hits = search(segments, "app=web")
+        self.assertEqual(
+            [(row["cluster"], row["name"]) for row in hits.rows], [("cluster1", "web-0"), ("cluster2", "web-0")]
+        )
+
+    @patch("kubernetes_dashboard.collectors._get_cluster_events")
+    def test_collect_event_index(self, mock_get_cluster_events: MagicMock) -> None:
+        """Test that recent events and the event index share one events list call."""
+        # Mock 설정
+        rows = [EventRow("cluster1", "Normal", "Pulled", "Pod/web-0", f"m{i}", None, "prod") for i in range(150)]
+        mock_get_cluster_events.return_value = rows
+
+        # 함수 호출
+        result = collect(("cluster1",), datasets={EVENTS, EVENT_INDEX})
+
+        # 결과 확인
+        mock_get_cluster_events.assert_called_once_with("cluster1", limit=None)
+        self.assertEqual(len(result["events"]), EVENT_LIMIT)
+        self.assertEqual(result["latest_events"], [rows[0]])
+
+    @patch("kubernetes_dashboard.collectors.api_for")
+    @patch("kubernetes_dashboard.collectors._get_all_pods")
+    def test_collect_node_pods(self, mock_get_all_pods: MagicMock, mock_api_for: MagicMock) -> None:
+        """Test that node pods are grouped in the same pass as the pod summary, with pod usage."""
+        # Mock 설정
+        other = _pod("db-0", "Running")
+        other.spec.node_name = "node0"
+        pending = _pod("pending", "Pending")
+        pending.spec.node_name = None
+        pods = [_pod("web-0", "Running", restarted=True), other, _pod("web-1", "Failed"), pending]
+        mock_get_all_pods.return_value = MagicMock(items=pods)
+        mock_cust = MagicMock()
+        mock_cust.list_cluster_custom_object.return_value = {
+            "items": [
+                {
+                    "metadata": {"name": "web-0", "namespace": "default"},
+                    "containers": [
+                        {"usage": {"cpu": "250m", "memory": "64Mi"}},
+                        {"usage": {"cpu": "50m", "memory": "0"}},
+                    ],
+                }
+            ]
+        }
+        mock_api_for.return_value = (MagicMock(), mock_cust)
+
+        # 함수 호출
+        result = collect(("cluster1",), datasets={PODS, NODE_PODS})
+
+        # 결과 확인: 스케줄되지 않은 Pod는 제외하고 노드 이름순으로 묶음
+        mock_get_all_pods.assert_called_once()
+        self.assertEqual(result["non_running_total"], 2)
+        rows = [(row.node, row.pod, row.phase, row.restarts) for row in result["node_pods"]]
+        self.assertEqual(
+            rows, [("node0", "db-0", "Running", 0), ("node1", "web-0", "Running", 1), ("node1", "web-1", "Failed", 0)]
+        )
+        usage = result["node_pods"][1]
+        self.assertAlmostEqual(usage.cpu, 0.3)
+        self.assertEqual(usage.mem, 64 * 1024**2)
+        self.assertIsNone(result["node_pods"][2].cpu)
+
+    @patch("kubernetes_dashboard.collectors.list_objects")
+    @patch("kubernetes_dashboard.collectors.api_for")
+    def test_node_metrics_uses_inventory(self, mock_api_for: MagicMock, mock_list_objects: MagicMock) -> None:
+        """Test joining metrics to the cached node inventory."""
+        # Mock 설정
+        mock_core = MagicMock()
+        mock_list_objects.return_value = MagicMock(items=[_node("node1")])
+        mock_custom = MagicMock()
+        mock_custom.list_cluster_custom_object.return_value = {
+            "items": [{"metadata": {"name": "node1"}, "usage": {"cpu": "500m", "memory": "1Gi"}}]
+        }
+        mock_api_for.return_value = (mock_core, mock_custom)
+
+        # 함수 호출
+        _node_metrics("cluster1")
+        rows = _node_metrics("cluster1")
+
+        # 결과 확인: 사용량은 매번 조회하지만 노드 목록은 한 번만 조회
+        self.assertEqual(rows[0]["cpu_percent"], 25.0)
+        self.assertEqual(rows[0]["mem_percent"], 25.0)
+        self.assertEqual(mock_custom.list_cluster_custom_object.call_count, 2)
+        mock_list_objects.assert_called_once()
+
+    @patch("builtins.print")
+    @patch("kubernetes_dashboard.collectors.list_objects")
+    @patch("kubernetes_dashboard.collectors.api_for")
+    def test_node_metrics_without_metrics_server(
+        self, mock_api_for: MagicMock, mock_list_objects: MagicMock, mock_print: MagicMock
+    ) -> None:
+        """Test that a metrics-server 404 is not retried on every refresh."""
+        # Mock 설정
+        mock_core = MagicMock()
+        mock_list_objects.return_value = MagicMock(items=[_node("node1")])
+        mock_custom = MagicMock()
+        mock_custom.list_cluster_custom_object.side_effect = ApiException(status=404)
+        mock_api_for.return_value = (mock_core, mock_custom)
+
+        # 함수 호출
+        _node_metrics("cluster1")
+        rows = _node_metrics("cluster1")
+
+        # 결과 확인
+        self.assertEqual(rows[0]["cpu"], "N/A")
+        mock_custom.list_cluster_custom_object.assert_called_once()
+        mock_list_objects.assert_called_once()
+        mock_print.assert_called_once()
+
+    @patch("kubernetes_dashboard.collectors.default_namespace", return_value="team-a")
+    @patch("kubernetes_dashboard.collectors.list_objects")
+    @patch("kubernetes_dashboard.collectors.api_for")
+    def test_get_all_pods_falls_back_to_default_namespace(
+        self, mock_api_for: MagicMock, mock_list_objects: MagicMock, _mock_default: MagicMock
+    ) -> None:
+        """Test that a forbidden cluster-wide list is remembered and narrowed to the context namespace."""
+        # Mock 설정
+        mock_api_for.return_value = (MagicMock(), None)
+
+        def list_pods(ctx: str, core: Any, resource: str, namespace: str | None = None) -> Any:
+            if namespace is None:
+                raise ApiException(status=403)
+            return MagicMock(items=[_pod(f"{namespace}-web", "Running")], resource_version="5")
+
+        mock_list_objects.side_effect = list_pods
+
+        # 함수 호출
+        _get_all_pods("cluster1")
+        pods = _get_all_pods("cluster1")
+
+        # 결과 확인: 전체 목록은 한 번만 시도하고 이후에는 네임스페이스 단위로 요청
+        self.assertEqual([p.metadata.name for p in pods.items], ["team-a-web"])
+        namespaces = [c.args[3] if len(c.args) > 3 else None for c in mock_list_objects.call_args_list]
+        self.assertEqual(namespaces, [None, "team-a", "team-a"])
+
+    @patch("kubernetes_dashboard.collectors.default_namespace", return_value="team-a")
+    @patch("kubernetes_dashboard.collectors.list_objects")
+    @patch("kubernetes_dashboard.collectors.api_for")
+    def test_list_scoped_success_clears_forbidden(
+        self, mock_api_for: MagicMock, mock_list_objects: MagicMock, _mock_default: MagicMock
+    ) -> None:
+        """Test that a successful retry clears the 403 records so a later denial is reported again."""
+        # Mock 설정: 재확인 주기가 지난 403 기록
+        mock_api_for.return_value = (MagicMock(), None)
+        mock_list_objects.return_value = MagicMock(items=[_pod("web", "Running")], resource_version="5")
+        perms = permission_cache()
+        perms.retry = -1
+        perms.mark_forbidden("cluster1", "pods")
+        perms.mark_forbidden("cluster1", "pods", "team-a")
+        perms.mark_forbidden("cluster1", "nodes")
+
+        # 함수 호출
+        _get_all_pods("cluster1")
+        _list_nodes("cluster1")
+
+        # 결과 확인: 전체 목록이 성공했으므로 다시 거부되면 새로 확인된 것으로 기록
+        self.assertTrue(perms.mark_forbidden("cluster1", "pods"))
+        self.assertTrue(perms.mark_forbidden("cluster1", "nodes"))
+        self.assertFalse(perms.mark_forbidden("cluster1", "pods", "team-a"))
+
+    @patch("builtins.print")
+    @patch("kubernetes_dashboard.collectors.namespace_scopes")
+    @patch("kubernetes_dashboard.collectors.api_for")
+    def test_get_cluster_events_scoped(
+        self, mock_api_for: MagicMock, mock_scopes: MagicMock, mock_print: MagicMock
+    ) -> None:
+        """Test merging namespaced events and skipping forbidden namespaces on later refreshes."""
+        # Mock 설정
+        mock_scopes.return_value = {"cluster1": ("a", "b", "c")}
+        mock_core = MagicMock()
+
+        def list_events(namespace: str, limit: int, _continue: str | None) -> Any:
+            if namespace == "b":
+                raise ApiException(status=403)
+            event = MagicMock(type="Normal", reason="Pulled", message=namespace, event_time=None)
+            event.last_timestamp = datetime(2025, 1, 1, 0, ord(namespace) - ord("a"), tzinfo=UTC)
+            event.involved_object.kind = "Pod"
+            event.involved_object.name = f"{namespace}-web"
+            return _page([event])
+
+        mock_core.list_namespaced_event.side_effect = list_events
+        mock_api_for.return_value = (mock_core, None)
+
+        # 함수 호출
+        _get_cluster_events("cluster1", limit=1)
+        result = _get_cluster_events("cluster1", limit=1)
+
+        # 결과 확인: 최신 이벤트만 남고, 403을 받은 네임스페이스는 다시 요청하지 않음
+        self.assertEqual([row["object"] for row in result], ["Pod/c-web"])
+        mock_core.list_event_for_all_namespaces.assert_not_called()
+        requested = [c.kwargs["namespace"] for c in mock_core.list_namespaced_event.call_args_list]
+        self.assertEqual(sorted(requested), ["a", "a", "b", "c", "c"])
+        mock_print.assert_called_once()
+
+    @patch("builtins.print")
+    @patch("kubernetes_dashboard.collectors.namespace_scopes")
+    @patch("kubernetes_dashboard.collectors.api_for")
+    def test_pod_usage_scoped(self, mock_api_for: MagicMock, mock_scopes: MagicMock, mock_print: MagicMock) -> None:
+        """Test that namespace-scoped contexts get pod usage and a missing metrics-server is reported for pods."""
+        # Mock 설정
+        mock_scopes.return_value = {"cluster1": ("a", "b")}
+        mock_cust = MagicMock()
+
+        def list_metrics(group: str, version: str, namespace: str, plural: str) -> Any:
+            container = {"usage": {"cpu": "100m", "memory": "1Mi"}}
+            return {"items": [{"metadata": {"name": "web", "namespace": namespace}, "containers": [container]}]}
+
+        mock_cust.list_namespaced_custom_object.side_effect = list_metrics
+        mock_api_for.return_value = (MagicMock(), mock_cust)
+
+        # 함수 호출
+        usage = _pod_usage("cluster1")
+        mock_cust.list_namespaced_custom_object.side_effect = ApiException(status=404)
+        missing = _pod_usage("cluster1")
+
+        # 결과 확인: 네임스페이스별 사용량을 병합하고, metrics-server가 없으면 Pod 사용량 경고를 출력
+        self.assertEqual(sorted(usage), [("a", "web"), ("b", "web")])
+        self.assertAlmostEqual(usage["a", "web"][0], 0.1)
+        mock_cust.list_cluster_custom_object.assert_not_called()
+        self.assertEqual(missing, {})
+        self.assertIn("Pod usage will not be available", mock_print.call_args.args[0])
+
+    def test_collect_without_clusters(self) -> None:
+        """Test that requested keys exist even without clusters."""
+        result = collect((), datasets={PODS})
+        self.assertEqual(result, {"total_pods": 0, "non_running_total": 0, "non_running_pods": []})
 
 
 if __name__ == "__main__":
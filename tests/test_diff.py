@@ -0,0 +1,118 @@
+"""Tests for the diff module."""
+
+import unittest
+from typing import Any
+
+from kubernetes_dashboard.diff import (
+    NODE_PRESSURE,
+    NODE_RELIEVED,
+    POD_CHANGED,
+    POD_RECOVERED,
+    POD_RESTARTED,
+    POD_UNHEALTHY,
+    Change,
+    ChangeFeed,
+    diff_snapshots,
+)
+
+
+def _pod(name: str, phase: str = "Pending", reason: str = "N/A") -> dict[str, Any]:
+    return {"cluster": "c1", "pod": name, "ns": "default", "node": "n1", "phase": phase, "reason": reason}
+
+
+def _restart(name: str, restarts: int | None, last_5m: int, last_24h: int) -> dict[str, Any]:
+    return {
+        "cluster": "c1",
+        "ns": "default",
+        "pod": name,
+        "container": "app",
+        "restarts": restarts,
+        "restarts_5m": last_5m,
+        "restarts_1h": last_24h,
+        "restarts_24h": last_24h,
+    }
+
+
+def _node(name: str, cpu: Any, mem: Any) -> dict[str, Any]:
+    return {"cluster": "c1", "node": name, "cpu": 1.0, "mem": 1.0, "cpu_percent": cpu, "mem_percent": mem}
+
+
+class TestDiff(unittest.TestCase):
+    """Test cases for the diff module."""
+
+    def test_diff_snapshots(self) -> None:
+        """Test pod, restart and node pressure changes between two snapshots."""
+        old = {
+            "non_running_pods": [_pod("stays"), _pod("recovers"), _pod("fails")],
+            "recent_restarts": [_restart("r1", 2, 1, 1)],
+            "node_metrics": [_node("hot", 50.0, 40.0), _node("cool", 95.0, 10.0), _node("na", "N/A", "N/A")],
+        }
+        new = {
+            "non_running_pods": [_pod("stays"), _pod("fails", "Failed", "Error"), _pod("new")],
+            "recent_restarts": [_restart("r1", 3, 2, 2), _restart("r2", 1, 1, 1)],
+            "node_metrics": [_node("hot", 90.0, 86.0), _node("cool", 20.0, 10.0), _node("na", "N/A", "N/A")],
+        }
+
+        # 함수 호출
+        changes = diff_snapshots(old, new)
+
+        # 결과 확인
+        self.assertEqual(
+            [(c.kind, c.name) for c in changes],
+            [
+                (POD_CHANGED, "fails"),
+                (POD_UNHEALTHY, "new"),
+                (POD_RECOVERED, "recovers"),
+                (POD_RESTARTED, "r1"),
+                (POD_RESTARTED, "r2"),
+                (NODE_PRESSURE, "hot"),
+                (NODE_RELIEVED, "cool"),
+            ],
+        )
+        self.assertEqual(changes[0].detail, "Pending → Failed (Error)")
+        self.assertEqual(changes[3].detail, "restarts 3 (+1)")
+        self.assertEqual(changes[5].detail, "cpu 90%, memory 86%")
+        self.assertEqual(diff_snapshots(new, new), [])
+
+    def test_diff_restarts_uses_window_counts(self) -> None:
+        """Test that rows climbing into the top-N or left by deleted pods are not reported as restarts."""
+        old = {"recent_restarts": [_restart("busy", 9, 0, 5), _restart("aging", 4, 0, 3)]}
+        new = {
+            "recent_restarts": [
+                _restart("busy", 9, 0, 5),
+                _restart("aging", 4, 0, 2),
+                _restart("climbed", 7, 0, 2),
+                _restart("deleted", None, 1, 1),
+                _restart("fresh", 1, 1, 1),
+            ]
+        }
+
+        # 함수 호출
+        changes = diff_snapshots(old, new)
+
+        # 결과 확인: 최근 5분 안에 재시작한 새 행만 보고
+        self.assertEqual([(c.name, c.detail) for c in changes], [("fresh", "restarts 1 (+1)")])
+
+    def test_diff_only_compares_shared_keys(self) -> None:
+        """Test that datasets missing from either snapshot are skipped."""
+        old = {"non_running_pods": [_pod("p1")]}
+        new = {"non_running_pods": [_pod("p1")], "node_metrics": [_node("hot", 99.0, 0.0)]}
+        self.assertEqual(diff_snapshots(old, new), [])
+
+    def test_change_feed(self) -> None:
+        """Test sequence numbers and bounded retention of the change feed."""
+        feed = ChangeFeed(maxlen=2)
+        change = Change(POD_UNHEALTHY, "c1", "default", "p1", "Pending (N/A)")
+
+        self.assertEqual(feed.publish([change]), 1)
+        self.assertEqual(feed.publish([change, change]), 3)
+
+        latest, entries = feed.since(1)
+        self.assertEqual(latest, 3)
+        self.assertEqual([entry["seq"] for entry in entries], [2, 3])
+        self.assertEqual(entries[0]["name"], "p1")
+        self.assertEqual(feed.since(3), (3, []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+"""Tests for the events module."""
+
+import unittest
+from datetime import UTC, datetime
+
+from kubernetes_dashboard.events import describe, event_index, last_event_column, latest_events
+from kubernetes_dashboard.records import EventRow, PodRow, RestartRow
+
+
+def _event(cluster: str, kind_name: str, ns: str | None, type_: str, reason: str, minute: int) -> EventRow:
+    """테스트용 이벤트 행을 생성합니다."""
+    time = datetime(2025, 1, 1, 0, minute, tzinfo=UTC)
+    return EventRow(cluster, type_, reason, kind_name, f"{reason}\n message", time, ns)
+
+
+class TestEvents(unittest.TestCase):
+    """Test cases for the event-to-object index."""
+
+    def test_latest_events_prefers_recent_warning(self) -> None:
+        """Test that the newest warning wins over newer normal events for the same object."""
+        # Mock 설정: 최신 이벤트부터 정렬
+        rows = [
+            _event("c1", "Pod/web-0", "prod", "Normal", "Pulled", 5),
+            _event("c1", "Pod/web-0", "prod", "Warning", "BackOff", 4),
+            _event("c1", "Pod/web-0", "prod", "Warning", "Failed", 3),
+            _event("c1", "Pod/web-0", "dev", "Normal", "Started", 2),
+            _event("c1", "Node/node1", None, "Normal", "NodeReady", 1),
+        ]
+
+        # 함수 호출
+        latest = latest_events(rows)
+        index = event_index(latest)
+
+        # 결과 확인
+        self.assertEqual(latest, [rows[1], rows[3], rows[4]])
+        self.assertIs(event_index(latest), index)
+        self.assertIs(index.latest("c1", "Pod", "prod", "web-0"), rows[1])
+        self.assertIs(index.latest("c1", "Node", "", "node1"), rows[4])
+        self.assertIsNone(index.latest("c2", "Pod", "prod", "web-0"))
+        self.assertEqual(describe(rows[1]), "BackOff: BackOff message")
+        self.assertEqual(describe(None), "")
+
+    def test_last_event_column(self) -> None:
+        """Test looking up pod and restart rows across clusters."""
+        # Mock 설정
+        rows = [_event("c1", "Pod/web-0", "prod", "Warning", "BackOff", 1)]
+        column = last_event_column(rows)
+
+        # 함수 호출 및 결과 확인
+        self.assertEqual(column(PodRow("c1", "web-0", "prod", "n1", "Pending", "N/A")), "BackOff: BackOff message")
+        self.assertEqual(column(RestartRow("c1", "web-0", "prod", "n1", 3, "app", 0, 1, 3)), "BackOff: BackOff message")
+        self.assertEqual(column(PodRow("c2", "web-0", "prod", "n1", "Pending", "N/A")), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+"""Tests for the exporter module."""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import unittest
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from kubernetes_dashboard.exporter import MetricsCache, collect_once, make_handler, render_metrics
+
+
+def _snapshot(cluster: str, node_count: int = 1) -> dict[str, Any]:
+    return {
+        "total_pods": 10,
+        "non_running_total": 2,
+        "non_running_pods": [
+            {"cluster": cluster, "pod": "p1", "ns": "default", "node": "N/A", "phase": "Pending", "reason": "N/A"},
+            {"cluster": cluster, "pod": "p2", "ns": "default", "node": "n1", "phase": "Weird", "reason": "N/A"},
+        ],
+        "node_metrics": [
+            {
+                "cluster": cluster,
+                "node": f"node-{i}",
+                "cpu": 1.0,
+                "mem": 1.0,
+                "cpu_percent": float(i),
+                "mem_percent": "N/A",
+            }
+            for i in range(node_count)
+        ],
+        "recent_restarts": [
+            {
+                "cluster": cluster,
+                "pod": "p3",
+                "ns": "default",
+                "node": "n1",
+                "restarts": 3,
+                "container": "app",
+                "restarts_5m": 1,
+                "restarts_1h": 2,
+                "restarts_24h": 3,
+            }
+        ],
+        "events": [],
+    }
+
+
+class TestExporter(unittest.TestCase):
+    """Test cases for the exporter module."""
+
+    def test_render_metrics(self) -> None:
+        """Test rendering cluster snapshots in Prometheus text format."""
+        body = render_metrics({'c"1': _snapshot('c"1')})
+
+        # 결과 확인
+        self.assertIn('kubernetes_dashboard_pods{cluster="c\\"1"} 10', body)
+        self.assertIn('kubernetes_dashboard_non_running_pods{cluster="c\\"1",phase="Pending"} 1', body)
+        self.assertIn('kubernetes_dashboard_non_running_pods{cluster="c\\"1",phase="Other"} 1', body)
+        self.assertIn('kubernetes_dashboard_recent_restarts{cluster="c\\"1"} 1', body)
+        self.assertIn('kubernetes_dashboard_container_restarts{cluster="c\\"1",window="24h"} 3', body)
+        self.assertIn("# TYPE kubernetes_dashboard_pods gauge", body)
+        self.assertNotIn("kubernetes_dashboard_node_memory_percent{", body)
+
+    def test_render_metrics_bounds_node_series(self) -> None:
+        """Test that per-node series are limited to the busiest nodes."""
+        body = render_metrics({"c1": _snapshot("c1", node_count=20)}, max_node_series=3)
+
+        node_lines = [line for line in body.splitlines() if line.startswith("kubernetes_dashboard_node_cpu_percent{")]
+        self.assertEqual(len(node_lines), 3)
+        self.assertIn('node="node-19"', "".join(node_lines))
+        self.assertIn('kubernetes_dashboard_node_cpu_percent_max{cluster="c1"} 19', body)
+
+    @patch("kubernetes_dashboard.exporter.collect_cluster")
+    def test_collect_once_keeps_last_snapshot_on_failure(self, mock_collect_cluster: MagicMock) -> None:
+        """Test that a failed collection keeps serving the last good snapshot."""
+        cache = MetricsCache()
+        mock_collect_cluster.return_value = _snapshot("c1")
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            collect_once(cache, ["c1"], pool)
+            mock_collect_cluster.side_effect = RuntimeError("boom")
+            collect_once(cache, ["c1"], pool)
+
+        body = cache.body().decode("utf-8")
+        self.assertIn('kubernetes_dashboard_pods{cluster="c1"} 10', body)
+        self.assertIn('kubernetes_dashboard_collect_success{cluster="c1"} 0', body)
+
+    @patch("kubernetes_dashboard.exporter.collect_cluster")
+    def test_scrape_serves_cached_body(self, mock_collect_cluster: MagicMock) -> None:
+        """Test that /metrics scrapes never trigger a collection."""
+        cache = MetricsCache()
+        cache.update("c1", _snapshot("c1"), 0.5)
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(cache))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url) as resp:
+                body = resp.read().decode("utf-8")
+                content_type = resp.headers["Content-Type"]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertIn('kubernetes_dashboard_pods{cluster="c1"} 10', body)
+        self.assertTrue(content_type.startswith("text/plain; version=0.0.4"))
+        mock_collect_cluster.assert_not_called()
+
+    def test_changes_feed_endpoint(self) -> None:
+        """Test that /changes serves the diff between consecutive collections."""
+        cache = MetricsCache()
+        cache.update("c1", _snapshot("c1"), 0.5)
+        recovered = _snapshot("c1")
+        recovered["non_running_pods"] = recovered["non_running_pods"][:1]
+        cache.update("c1", recovered, 0.5)
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(cache))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/changes?since=0"
+            with urllib.request.urlopen(url) as resp:
+                lines = resp.read().decode("utf-8").splitlines()
+                seq = resp.headers["X-Change-Seq"]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # 결과 확인
+        self.assertEqual(seq, "1")
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(
+            json.loads(lines[0])["kind"],
+            "pod_recovered",
+        )
+
+    def test_exporter_does_not_import_streamlit(self) -> None:
+        """Test that the headless entry point skips the Streamlit import."""
+        code = "import sys, kubernetes_dashboard.exporter; print('streamlit' in sys.modules)"
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+        self.assertEqual(result.stdout.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""Tests for the inventory module."""
+
+import unittest
+from typing import Any
+from unittest.mock import MagicMock
+
+from kubernetes_dashboard.inventory import NodeInventory, node_info
+
+
+def _node(name: str, version: str = "1", cpu: str = "4", memory: str = "8Gi") -> Any:
+    """테스트용 Node mock을 생성합니다."""
+    node = MagicMock()
+    node.metadata.name = name
+    node.metadata.resource_version = version
+    node.metadata.labels = {"zone": "a"}
+    node.status.capacity = {"cpu": cpu, "memory": memory}
+    node.status.allocatable = {"cpu": "3500m", "memory": "7Gi"}
+    node.status.conditions = [MagicMock(type="Ready", status="True")]
+    taint = MagicMock(key="dedicated", value="gpu", effect="NoSchedule")
+    node.spec.taints = [taint]
+    return node
+
+
+class TestNodeInventory(unittest.TestCase):
+    """Test cases for NodeInventory."""
+
+    def setUp(self) -> None:
+        """가짜 시계를 사용하는 인벤토리를 생성합니다."""
+        self.now = 0.0
+        self.inventory = NodeInventory(ttl=300, metrics_retry=60, clock=lambda: self.now)
+
+    def test_node_info(self) -> None:
+        """Test converting a V1Node into NodeInfo."""
+        info = node_info(_node("n1"))
+
+        # 결과 확인
+        self.assertEqual(info.cpu, 4.0)
+        self.assertEqual(info.cpu_allocatable, 3.5)
+        self.assertEqual(info.mem_allocatable, 7 * 1024**3)
+        self.assertEqual(info.taints, ("dedicated=gpu:NoSchedule",))
+        self.assertEqual(info.conditions, {"Ready": "True"})
+        self.assertEqual(info.labels, {"zone": "a"})
+
+    def test_nodes_cached_until_ttl_or_unknown_node(self) -> None:
+        """Test listing nodes only after the TTL expires or a new node appears."""
+        # Mock 설정
+        list_nodes = MagicMock(return_value=[_node("n1")])
+
+        # 함수 호출
+        first = self.inventory.nodes("c1", list_nodes)
+        self.now = 200
+        self.inventory.nodes("c1", list_nodes, expect=["n1"])
+        self.assertEqual(list_nodes.call_count, 1)
+
+        # 메트릭에 새 노드가 나타나면 다시 조회하고, resourceVersion이 같은 노드는 재사용
+        list_nodes.return_value = [_node("n1"), _node("n2")]
+        second = self.inventory.nodes("c1", list_nodes, expect=["n1", "n2"])
+        self.assertEqual(list_nodes.call_count, 2)
+        self.assertIs(second["n1"], first["n1"])
+
+        # TTL이 지나면 다시 조회하고, resourceVersion이 바뀐 노드는 새로 변환
+        self.now = 600
+        list_nodes.return_value = [_node("n1", version="2", cpu="8"), _node("n2")]
+        third = self.inventory.nodes("c1", list_nodes)
+
+        # 결과 확인
+        self.assertEqual(list_nodes.call_count, 3)
+        self.assertEqual(third["n1"].cpu, 8.0)
+        self.assertIs(third["n2"], second["n2"])
+
+    def test_metrics_unavailable_is_remembered(self) -> None:
+        """Test skipping metrics-server until the retry interval passes."""
+        self.assertTrue(self.inventory.metrics_available("c1"))
+
+        # 처음 확인된 경우에만 True
+        self.assertTrue(self.inventory.mark_metrics_unavailable("c1"))
+        self.assertFalse(self.inventory.metrics_available("c1"))
+        self.assertTrue(self.inventory.metrics_available("c2"))
+
+        # 재확인 주기가 지나면 다시 시도
+        self.now = 61
+        self.assertTrue(self.inventory.metrics_available("c1"))
+        self.assertFalse(self.inventory.mark_metrics_unavailable("c1"))
+
+        # 무효화하면 즉시 다시 시도
+        self.inventory.invalidate(["c1"])
+        self.assertTrue(self.inventory.metrics_available("c1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
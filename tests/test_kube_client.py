@@ -1,90 +1,133 @@
 """Tests for the kube_client module."""
 
+import os
 import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+from kubernetes.config.config_exception import ConfigException
+
 from kubernetes_dashboard.kube_client import (
+    _api_for,
     api_for,
+    context_names,
     is_running_in_kubernetes,
+    kubeconfig_index,
     load_kubeconfig_from_secret,
 )
 
+KUBECONFIG = """
+apiVersion: v1
+kind: Config
+clusters:
+- name: a
+  cluster: {server: "https://a.example.com:6443"}
+- name: b
+  cluster: {server: "https://b.example.com:6443"}
+users:
+- name: u
+  user: {token: "secret-token"}
+contexts:
+- name: ctx-a
+  context: {cluster: a, user: u}
+- name: ctx-b
+  context: {cluster: b, user: u}
+current-context: ctx-a
+"""
+
 
 class TestKubeClient(unittest.TestCase):
     """Test cases for the kube_client module."""
 
     def setUp(self) -> None:
-        # 각 테스트 전에 api_for 캐시 초기화
-        api_for.cache_clear()
+        # 각 테스트 전에 kubeconfig 인덱스와 api_for 캐시 초기화
+        kubeconfig_index.cache_clear()
+        _api_for.cache_clear()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.kubeconfig = os.path.join(self._tmp.name, "config")
+        Path(self.kubeconfig).write_text(KUBECONFIG)
+
+    def tearDown(self) -> None:
+        kubeconfig_index.cache_clear()
+        _api_for.cache_clear()
+        self._tmp.cleanup()
 
-    @patch("kubernetes_dashboard.kube_client.api_for.cache_clear")
     @patch("kubernetes_dashboard.kube_client.is_running_in_kubernetes")
     @patch("kubernetes_dashboard.kube_client.load_kubeconfig_from_secret")
-    @patch("kubernetes_dashboard.kube_client.load_kube_config")
-    def test_api_for_local_env(
-        self,
-        mock_load_kube_config: MagicMock,
-        mock_load_secret: MagicMock,
-        mock_is_k8s: MagicMock,
-        _: MagicMock,
-    ) -> None:
+    def test_api_for_local_env(self, mock_load_secret: MagicMock, mock_is_k8s: MagicMock) -> None:
         """Test api_for function in local environment."""
         # 로컬 환경 시뮬레이션
         mock_is_k8s.return_value = False
 
         # 함수 호출
-        api_for("test-context")
-
-        # 로컬 kubeconfig 로드 확인
-        mock_load_kube_config.assert_called_once_with(context="test-context")
+        with patch.dict(os.environ, {"KUBECONFIG": self.kubeconfig}):
+            core, custom = api_for("ctx-b")
+            core_again, _ = api_for("ctx-b")
+
+        # 컨텍스트별 설정 및 캐시 재사용 확인
+        self.assertEqual(core.api_client.configuration.host, "https://b.example.com:6443")
+        self.assertIs(custom.api_client, core.api_client)
+        self.assertIs(core_again, core)
         mock_load_secret.assert_not_called()
 
-    @patch("kubernetes_dashboard.kube_client.api_for.cache_clear")
+    @patch("kubernetes_dashboard.kube_client.is_running_in_kubernetes")
+    def test_api_for_reloads_after_kubeconfig_change(self, mock_is_k8s: MagicMock) -> None:
+        """Test that clients are rebuilt when the kubeconfig file changes."""
+        mock_is_k8s.return_value = False
+
+        with patch.dict(os.environ, {"KUBECONFIG": self.kubeconfig}):
+            core, _ = api_for("ctx-a")
+            Path(self.kubeconfig).write_text(KUBECONFIG.replace("a.example.com", "a2.example.com"))
+            os.utime(self.kubeconfig, ns=(0, 0))
+            kubeconfig_index().check_interval = 0
+            core_new, _ = api_for("ctx-a")
+
+        self.assertEqual(core.api_client.configuration.host, "https://a.example.com:6443")
+        self.assertEqual(core_new.api_client.configuration.host, "https://a2.example.com:6443")
+
+    @patch("kubernetes_dashboard.kube_client.is_running_in_kubernetes")
+    def test_api_for_unknown_context(self, mock_is_k8s: MagicMock) -> None:
+        """Test api_for with a context that is not in the kubeconfig."""
+        mock_is_k8s.return_value = False
+
+        with patch.dict(os.environ, {"KUBECONFIG": self.kubeconfig}):
+            with self.assertRaises(ConfigException):
+                api_for("missing")
+
     @patch("kubernetes_dashboard.kube_client.is_running_in_kubernetes")
     @patch("kubernetes_dashboard.kube_client.load_kubeconfig_from_secret")
-    @patch("kubernetes_dashboard.kube_client.load_kube_config")
-    def test_api_for_k8s_env_with_secret(
-        self,
-        mock_load_kube_config: MagicMock,
-        mock_load_secret: MagicMock,
-        mock_is_k8s: MagicMock,
-        _: MagicMock,
-    ) -> None:
+    def test_api_for_k8s_env_with_secret(self, mock_load_secret: MagicMock, mock_is_k8s: MagicMock) -> None:
         """Test api_for function in Kubernetes environment with secret."""
         # Kubernetes 환경 시뮬레이션
         mock_is_k8s.return_value = True
-        mock_load_secret.return_value = "/tmp/kubeconfig"
+        mock_load_secret.return_value = self.kubeconfig
 
         # 함수 호출
-        api_for("test-context")
+        with patch.dict(os.environ, {"KUBECONFIG": "/nonexistent"}):
+            api_for("ctx-a")
+            api_for("ctx-b")
+            names = context_names()
 
-        # Secret에서 kubeconfig 로드 확인
+        # Secret은 한 번만 로드하고 해당 kubeconfig 사용
         mock_load_secret.assert_called_once()
-        mock_load_kube_config.assert_called_once_with(config_file="/tmp/kubeconfig", context="test-context")
+        self.assertEqual(names, ["ctx-a", "ctx-b"])
 
-    @patch("kubernetes_dashboard.kube_client.api_for.cache_clear")
     @patch("kubernetes_dashboard.kube_client.is_running_in_kubernetes")
     @patch("kubernetes_dashboard.kube_client.load_kubeconfig_from_secret")
-    @patch("kubernetes_dashboard.kube_client.load_kube_config")
-    def test_api_for_k8s_env_without_secret(
-        self,
-        mock_load_kube_config: MagicMock,
-        mock_load_secret: MagicMock,
-        mock_is_k8s: MagicMock,
-        _: MagicMock,
-    ) -> None:
+    def test_api_for_k8s_env_without_secret(self, mock_load_secret: MagicMock, mock_is_k8s: MagicMock) -> None:
         """Test api_for function in Kubernetes environment without secret."""
         # Kubernetes 환경 시뮬레이션 (Secret 없음)
         mock_is_k8s.return_value = True
         mock_load_secret.return_value = None
 
         # 함수 호출
-        api_for("test-context")
+        with patch.dict(os.environ, {"KUBECONFIG": self.kubeconfig}):
+            core, _ = api_for("ctx-a")
 
         # Secret 로드 실패 시 기본 kubeconfig 사용 확인
         mock_load_secret.assert_called_once()
-        mock_load_kube_config.assert_called_once_with(context="test-context")
+        self.assertEqual(core.api_client.configuration.host, "https://a.example.com:6443")
 
     @patch("os.path.exists")
     def test_is_running_in_kubernetes(self, mock_exists: MagicMock) -> None:
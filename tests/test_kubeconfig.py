@@ -0,0 +1,105 @@
+"""Tests for the kubeconfig module."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from kubernetes_dashboard.kubeconfig import KubeconfigIndex, default_kubeconfig_paths
+
+FIRST = """
+clusters:
+- name: shared
+  cluster: {server: "https://first:6443", certificate-authority: "ca.crt"}
+users:
+- name: u
+  user: {token: "t1"}
+contexts:
+- name: dup
+  context: {cluster: shared, user: u}
+- name: only-first
+  context: {cluster: shared, user: u}
+"""
+
+SECOND = """
+clusters:
+- name: shared
+  cluster: {server: "https://second:6443"}
+contexts:
+- name: dup
+  context: {cluster: shared, user: u}
+- name: only-second
+  context: {cluster: shared, user: u}
+"""
+
+
+class TestKubeconfigIndex(unittest.TestCase):
+    """Test cases for KubeconfigIndex."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.first = os.path.join(self._tmp.name, "first")
+        self.second = os.path.join(self._tmp.name, "sub", "second")
+        os.makedirs(os.path.dirname(self.second))
+        Path(self.first).write_text(FIRST)
+        Path(self.second).write_text(SECOND)
+        self.index = KubeconfigIndex(lambda: [self.first, self.second, "/nonexistent"], check_interval=0)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_merge_prefers_first_file(self) -> None:
+        """Test kubectl-style merge precedence across files."""
+        self.assertEqual(self.index.contexts(), ["dup", "only-first", "only-second"])
+
+        entry = self.index.lookup("dup")
+        assert entry is not None
+        self.assertEqual(entry.path, self.first)
+        assert entry.cluster is not None
+        self.assertEqual(entry.cluster["cluster"]["server"], "https://first:6443")
+        # 상대 경로는 정의된 파일 기준 절대 경로로 변환
+        self.assertEqual(entry.cluster["cluster"]["certificate-authority"], os.path.join(self._tmp.name, "ca.crt"))
+        self.assertIsNone(self.index.lookup("missing"))
+
+        config = entry.config_dict()
+        self.assertEqual(config["current-context"], "dup")
+        self.assertEqual([u["name"] for u in config["users"]], ["u"])
+
+    def test_only_changed_files_are_reparsed(self) -> None:
+        """Test mtime/inode based invalidation."""
+        from kubernetes_dashboard import kubeconfig
+
+        with patch("kubernetes_dashboard.kubeconfig._load", wraps=kubeconfig._load) as mock_load:
+            self.index.contexts()
+            generation = self.index.generation
+            self.index.contexts()
+            self.assertEqual(mock_load.call_count, 2)
+            self.assertEqual(self.index.generation, generation)
+
+            # 파일 교체 (inode 변경)
+            replacement = self.second + ".new"
+            Path(replacement).write_text(SECOND.replace("only-second", "renamed"))
+            os.replace(replacement, self.second)
+
+            self.assertEqual(self.index.contexts(), ["dup", "only-first", "renamed"])
+            self.assertEqual(mock_load.call_count, 3)
+            mock_load.assert_called_with(self.second)
+            self.assertEqual(self.index.generation, generation + 1)
+
+    def test_check_interval_throttles_stat(self) -> None:
+        """Test that file checks happen at most once per check interval."""
+        index = KubeconfigIndex(MagicMock(return_value=[self.first]), check_interval=3600)
+        index.contexts()
+        index.contexts()
+        index.lookup("dup")
+        self.assertEqual(index._paths.call_count, 1)  # type: ignore[attr-defined]
+
+    def test_default_paths_from_env(self) -> None:
+        """Test KUBECONFIG path list parsing."""
+        with patch.dict(os.environ, {"KUBECONFIG": os.pathsep.join(["/a", "", "/b"])}):
+            self.assertEqual(default_kubeconfig_paths(), ["/a", "/b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""Tests for the memory module."""
+
+import os
+import sys
+import unittest
+from collections.abc import Callable
+from unittest.mock import patch
+
+import numpy as np
+
+from kubernetes_dashboard.memory import MIB, MemoryGovernor, Usage, estimate, memory_budget
+from kubernetes_dashboard.records import PodRow
+
+
+class TestMemory(unittest.TestCase):
+    """Test cases for memory accounting and the governor."""
+
+    def test_estimate_extrapolates_sample(self) -> None:
+        """Test that list sizes scale with the row count and arrays report nbytes."""
+        rows = [PodRow("c1", f"pod-{i}", "default", "n1", "Pending", "N/A") for i in range(1000)]
+
+        # 함수 호출
+        small = estimate(rows[:100])
+        large = estimate(rows)
+
+        # 결과 확인
+        self.assertGreater(large, 9 * small)
+        self.assertLess(large, 11 * small)
+        self.assertEqual(estimate(np.zeros(1000, dtype=np.int64)), 8000)
+        arrays = [np.zeros(10, dtype=np.int8) for _ in range(3)]
+        self.assertEqual(estimate(arrays) - sys.getsizeof(arrays), 30)
+
+    def test_enforce_releases_low_priority_first(self) -> None:
+        """Test that the governor stops releasing once usage is back under budget."""
+        # Mock 설정
+        held = {"tables": 300, "snapshots": 500}
+        released: list[str] = []
+
+        def _release(name: str) -> Callable[[int], int]:
+            def release(target: int) -> int:
+                released.append(name)
+                freed = min(target, held[name])
+                held[name] -= freed
+                return freed
+
+            return release
+
+        governor = MemoryGovernor(budget=600)
+        governor.register(
+            "snapshots", lambda: Usage("snapshots", held["snapshots"]), _release("snapshots"), priority=10
+        )
+        governor.register("tables", lambda: Usage("tables", held["tables"]), _release("tables"))
+
+        # 함수 호출
+        freed = governor.enforce()
+
+        # 결과 확인
+        self.assertEqual(freed, 200)
+        self.assertEqual(released, ["tables"])
+        self.assertEqual([u.name for u in governor.usage()], ["tables", "snapshots"])
+        self.assertEqual(MemoryGovernor().enforce(), 0)
+
+    def test_memory_budget_from_environment(self) -> None:
+        """Test that the budget is read in MiB and invalid values disable it."""
+        with patch.dict(os.environ, {"DASHBOARD_MEMORY_BUDGET_MB": "512"}):
+            self.assertEqual(memory_budget(), 512 * MIB)
+        with patch.dict(os.environ, {"DASHBOARD_MEMORY_BUDGET_MB": "lots"}), patch("builtins.print") as mock_print:
+            self.assertIsNone(memory_budget())
+            mock_print.assert_called_once()
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertIsNone(memory_budget())
+
+
+if __name__ == "__main__":
+    unittest.main()
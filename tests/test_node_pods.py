@@ -0,0 +1,53 @@
+"""Tests for the node_pods module."""
+
+import unittest
+
+from kubernetes_dashboard.node_pods import NodePodIndex, node_pod_index
+from kubernetes_dashboard.records import NodePodRow
+
+
+def _row(cluster: str, node: str, pod: str) -> NodePodRow:
+    """테스트용 NodePodRow를 생성합니다."""
+    return NodePodRow(cluster, node, pod, "default", "Running", 0)
+
+
+class TestNodePodIndex(unittest.TestCase):
+    """Test cases for NodePodIndex."""
+
+    def test_pods_by_cluster_and_node(self) -> None:
+        """Test that spans separate clusters sharing a node name and cover ungrouped rows."""
+        # Mock 설정: 두 클러스터를 병합한 목록 + 묶이지 않은 마지막 행
+        rows = [
+            _row("c1", "n1", "a"),
+            _row("c1", "n1", "b"),
+            _row("c1", "n2", "c"),
+            _row("c2", "n1", "d"),
+            _row("c1", "n1", "e"),
+        ]
+
+        # 함수 호출
+        index = NodePodIndex(rows)
+
+        # 결과 확인
+        self.assertEqual([row.pod for row in index.pods("c1", "n1")], ["a", "b", "e"])
+        self.assertEqual([row.pod for row in index.pods("c2", "n1")], ["d"])
+        self.assertEqual(index.pods("c2", "n2"), [])
+        self.assertEqual(sorted(index), [("c1", "n1"), ("c1", "n2"), ("c2", "n1")])
+        self.assertEqual(len(NodePodIndex([])), 0)
+
+    def test_index_is_cached_per_row_list(self) -> None:
+        """Test that the same row objects reuse one index and new rows build a new one."""
+        rows = [_row("c1", "n1", "a")]
+
+        # 함수 호출
+        first = node_pod_index(rows)
+        second = node_pod_index(list(rows))
+        refreshed = node_pod_index([_row("c1", "n1", "a")])
+
+        # 결과 확인
+        self.assertIs(first, second)
+        self.assertIsNot(first, refreshed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""Tests for the permissions module."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from kubernetes_dashboard.permissions import PermissionCache, load_scopes
+
+
+class TestPermissions(unittest.TestCase):
+    """Test cases for namespace scopes and the permission cache."""
+
+    def test_permission_cache_expires(self) -> None:
+        """Test that forbidden requests are retried after the retry interval or invalidation."""
+        # Mock 설정
+        now = [0.0]
+        cache = PermissionCache(retry=60, clock=lambda: now[0])
+
+        # 함수 호출 / 결과 확인
+        self.assertTrue(cache.mark_forbidden("c1", "pods"))
+        self.assertFalse(cache.mark_forbidden("c1", "pods"))
+        cache.mark_forbidden("c1", "pods", "team-a")
+        cache.mark_forbidden("c2", "pods")
+        self.assertTrue(cache.forbidden("c1", "pods"))
+        self.assertFalse(cache.forbidden("c1", "events"))
+        self.assertTrue(cache.forbidden("c1", "pods", "team-a"))
+
+        now[0] = 61.0
+        self.assertFalse(cache.forbidden("c1", "pods"))
+
+        cache.mark_forbidden("c1", "pods")
+        cache.invalidate(["c1"])
+        self.assertFalse(cache.forbidden("c1", "pods"))
+        self.assertFalse(cache.forbidden("c1", "pods", "team-a"))
+        self.assertTrue(cache.mark_forbidden("c1", "pods"))
+
+    @patch("builtins.print")
+    def test_load_scopes(self, mock_print: MagicMock) -> None:
+        """Test reading the scope file and ignoring a malformed one."""
+        # Mock 설정
+        with tempfile.TemporaryDirectory() as tmp:
+            good = os.path.join(tmp, "scopes.yaml")
+            with open(good, "w", encoding="utf-8") as f:
+                f.write("team-a-prod: [team-a, team-a-jobs]\nempty:\n")
+            bad = os.path.join(tmp, "bad.yaml")
+            with open(bad, "w", encoding="utf-8") as f:
+                f.write("- just a list\n")
+
+            # 함수 호출
+            scopes = load_scopes(good)
+            fallback = load_scopes(bad)
+
+        # 결과 확인
+        self.assertEqual(scopes, {"team-a-prod": ("team-a", "team-a-jobs"), "empty": ()})
+        self.assertEqual(fallback, {})
+        mock_print.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""Tests for the persist module."""
+
+import os
+import tempfile
+import unittest
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from kubernetes_dashboard.persist import decode_cluster, encode_cluster, load_cluster, save_cluster
+from kubernetes_dashboard.records import EventRow, NodeRow, PodRow
+
+POD = PodRow("arn:aws:eks:ap-northeast-2:1:cluster/prod", "web-1", "default", "n1", "Pending", "Unschedulable")
+EVENT = EventRow(POD.cluster, "Warning", "BackOff", "Pod/web-1", "Back-off", datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC))
+
+
+class TestPersist(unittest.TestCase):
+    """Test cases for snapshot files."""
+
+    def test_round_trip(self) -> None:
+        """Test that rows, datetimes and counts survive encoding and unsupported datasets are skipped."""
+        # Mock 설정
+        entries: dict[str, tuple[float, dict[str, Any]]] = {
+            "pods": (100.0, {"total_pods": 3, "non_running_total": 1, "non_running_pods": [POD]}),
+            "node_metrics": (101.0, {"node_metrics": [NodeRow(POD.cluster, "n1", "N/A", "N/A", "N/A", "N/A")]}),
+            "events": (102.0, {"events": [EVENT, EventRow(POD.cluster, None, None, "Node/n1", None, None)]}),
+            "search_index": (103.0, {"search_segments": [object()]}),
+        }
+
+        # 함수 호출
+        ctx, decoded = decode_cluster(encode_cluster(POD.cluster, entries))
+
+        # 결과 확인
+        self.assertEqual(ctx, POD.cluster)
+        self.assertEqual(set(decoded), {"pods", "node_metrics", "events"})
+        self.assertEqual(decoded["pods"], entries["pods"])
+        self.assertIsInstance(decoded["pods"][1]["non_running_pods"][0], PodRow)
+        self.assertEqual(decoded["events"][1]["events"][0].time, EVENT.time)
+        self.assertEqual(decoded["node_metrics"][1]["node_metrics"][0].cpu, "N/A")
+        # 반복되는 문자열은 intern
+        self.assertIs(decoded["pods"][1]["non_running_pods"][0].cluster, decoded["events"][1]["events"][0].cluster)
+
+    @patch("builtins.print")
+    def test_save_and_load(self, mock_print: MagicMock) -> None:
+        """Test atomic saves per context and that corrupt files are ignored."""
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = os.path.join(tmp, "snapshots")
+
+            # 함수 호출
+            save_cluster(directory, POD.cluster, {"pods": (1.0, {"non_running_pods": [POD]})})
+            loaded = load_cluster(directory, POD.cluster)
+            missing = load_cluster(directory, "other")
+            (name,) = os.listdir(directory)
+            with open(os.path.join(directory, name), "r+b") as f:
+                f.seek(10)
+                f.write(b"garbage")
+            corrupt = load_cluster(directory, POD.cluster)
+
+        # 결과 확인
+        self.assertEqual(loaded, {"pods": (1.0, {"non_running_pods": [POD]})})
+        self.assertNotIn("/", name)
+        self.assertIsNone(missing)
+        self.assertIsNone(corrupt)
+        mock_print.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
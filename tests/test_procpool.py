@@ -0,0 +1,118 @@
+"""Tests for the procpool module."""
+
+import os
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from kubernetes_dashboard.collectors import collect_cluster
+from kubernetes_dashboard.procpool import PROCESSES_ENV, ClusterProcessPool, configured_processes
+from kubernetes_dashboard.scheduler import MAX_INFLIGHT_ENV, default_scheduler
+
+# 워커 프로세스 안에서만 값이 바뀌는 호출 횟수
+_calls: dict[str, int] = {}
+
+
+def _inflight(ctx: str) -> int:
+    """워커 프로세스 스케줄러의 전역 최대 동시 요청 수를 반환합니다."""
+    return default_scheduler().max_inflight
+
+
+def _count(ctx: str, crash: bool = False) -> tuple[int, int]:
+    """워커 프로세스의 pid와 해당 컨텍스트의 호출 횟수를 반환합니다."""
+    if crash:
+        os._exit(1)
+    _calls[ctx] = _calls.get(ctx, 0) + 1
+    return os.getpid(), _calls[ctx]
+
+
+class TestClusterProcessPool(unittest.TestCase):
+    """Test cases for ClusterProcessPool."""
+
+    def setUp(self) -> None:
+        """워커 2개짜리 풀을 생성합니다."""
+        self.pool = ClusterProcessPool(2, target=_count, key_for=str)
+        self.addCleanup(self.pool.shutdown)
+
+    def test_contexts_are_pinned_to_warm_workers(self) -> None:
+        """Test that a context always runs in the same worker, which keeps its state."""
+        contexts = [f"ctx-{i}" for i in range(8)]
+
+        # 함수 호출
+        first = {ctx: self.pool.submit(ctx) for ctx in contexts}
+        second = {ctx: self.pool.submit(ctx) for ctx in contexts}
+
+        # 결과 확인
+        for ctx in contexts:
+            self.assertEqual(first[ctx], (first[ctx][0], 1))
+            self.assertEqual(second[ctx], (first[ctx][0], 2))
+        self.assertEqual(len({pid for pid, _ in first.values()}), 2)
+        self.assertNotIn(os.getpid(), {pid for pid, _ in first.values()})
+
+    def test_contexts_are_pinned_by_apiserver(self) -> None:
+        """Test that contexts sharing an API server share a worker and its scheduler limits."""
+        # Mock 설정: 컨텍스트 8개가 API 서버 2개를 가리킴
+        servers = {f"ctx-{i}": f"https://api-{i % 2}:6443" for i in range(8)}
+        pool = ClusterProcessPool(2, target=_count, key_for=servers.__getitem__)
+        self.addCleanup(pool.shutdown)
+
+        # 함수 호출
+        pids = {ctx: pool.submit(ctx)[0] for ctx in servers}
+
+        # 결과 확인: 같은 API 서버의 컨텍스트는 같은 워커에서 실행
+        self.assertEqual({pool.slot(ctx) for ctx in servers if servers[ctx] == servers["ctx-0"]}, {pool.slot("ctx-0")})
+        self.assertEqual(len({pids[ctx] for ctx in servers if servers[ctx] == servers["ctx-1"]}), 1)
+
+    def test_global_concurrency_is_divided(self) -> None:
+        """Test that each worker gets its share of the global concurrency limit."""
+        with patch.dict(os.environ, {MAX_INFLIGHT_ENV: "16"}):
+            pool = ClusterProcessPool(3, target=_inflight, key_for=str)
+        self.addCleanup(pool.shutdown)
+
+        # 결과 확인
+        self.assertEqual(pool.max_inflight, 5)
+        self.assertEqual(pool.submit("ctx-0"), 5)
+
+    def test_crashed_worker_is_restarted(self) -> None:
+        """Test that a crashed worker is replaced on the next request."""
+        with self.assertRaises(BrokenProcessPool):
+            self.pool.submit("ctx-0", True)
+
+        # 결과 확인
+        pid, count = self.pool.submit("ctx-0")
+        self.assertEqual(count, 1)
+        self.assertNotEqual(pid, os.getpid())
+
+
+class TestProcessPoolMode(unittest.TestCase):
+    """Test cases for enabling the process-pool collection mode."""
+
+    def test_configured_processes(self) -> None:
+        """Test parsing the worker count from the environment."""
+        for raw, expected in (("", 0), ("4", 4), ("-1", 0), ("auto", os.cpu_count() or 1)):
+            with patch.dict(os.environ, {PROCESSES_ENV: raw}):
+                self.assertEqual(configured_processes(), expected)
+        with patch.dict(os.environ, {PROCESSES_ENV: "many"}), patch("builtins.print") as mock_print:
+            self.assertEqual(configured_processes(), 0)
+            mock_print.assert_called_once()
+
+    @patch("kubernetes_dashboard.collectors._get_all_pods")
+    @patch("kubernetes_dashboard.collectors.process_pool")
+    def test_collect_cluster_uses_pool(self, mock_process_pool: MagicMock, mock_get_all_pods: MagicMock) -> None:
+        """Test that collect_cluster delegates to the worker pool when enabled."""
+        # Mock 설정
+        snapshot: dict[str, Any] = {"events": []}
+        mock_process_pool.return_value.collect_cluster.return_value = snapshot
+
+        # 함수 호출
+        result = collect_cluster("ctx", {"events"})
+
+        # 결과 확인
+        self.assertIs(result, snapshot)
+        mock_process_pool.return_value.collect_cluster.assert_called_once_with("ctx", frozenset({"events"}))
+        mock_get_all_pods.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
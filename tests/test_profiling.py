@@ -0,0 +1,99 @@
+"""Tests for the profiling module."""
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from kubernetes_dashboard.profiling import (
+    PROFILE_DIR_ENV,
+    PROFILE_ENV,
+    SamplingProfiler,
+    categorize,
+    profiled,
+    write_profile,
+)
+
+
+def _busy(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestProfiling(unittest.TestCase):
+    """Test cases for the sampling profiler."""
+
+    def test_samples_calling_thread_only(self) -> None:
+        """Test that the calling thread is sampled and unrelated threads are not."""
+        # Mock 설정
+        stop = threading.Event()
+        idle = threading.Thread(target=stop.wait, name="unrelated", daemon=True)
+        idle.start()
+        profiler = SamplingProfiler(interval=0.001)
+
+        # 함수 호출
+        profiler.start()
+        _busy(0.1)
+        profiler.stop()
+        stop.set()
+        document = profiler.speedscope("test")
+        summary = profiler.summary("test")
+
+        # 결과 확인
+        self.assertGreater(profiler.sample_count, 10)
+        self.assertEqual([p["name"] for p in document["profiles"]], [threading.current_thread().name])
+        frames = document["shared"]["frames"]
+        profile = document["profiles"][0]
+        self.assertEqual(len(profile["samples"]), len(profile["weights"]))
+        self.assertIn("_busy", {frames[stack[-1]]["name"] for stack in profile["samples"]})
+        self.assertIn("_busy", summary.split("Top 25 functions by self time:")[1].splitlines()[2])
+
+    def test_categorize(self) -> None:
+        """Test that the leaf-most recognised frame decides the category."""
+        # 함수 호출 및 결과 확인
+        dashboard = "/app/kubernetes_dashboard/store.py"
+        self.assertEqual(categorize((dashboard, "/py/urllib3/response.py", "/py/ssl.py")), "apiserver I/O")
+        self.assertEqual(
+            categorize((dashboard, "/py/kubernetes/client/api_client.py", "/py/json/decoder.py")), "deserialization"
+        )
+        self.assertEqual(categorize(("/py/streamlit/elements/arrow.py", "/py/json/encoder.py")), "streamlit")
+        self.assertEqual(categorize((dashboard, "/py/threading.py")), "thread wait")
+        self.assertEqual(categorize(("/py/json/decoder.py",)), "other")
+
+    @patch("builtins.print")
+    def test_profiled_writes_and_rotates(self, mock_print: MagicMock) -> None:
+        """Test that profiling is off by default and enabled runs write rotated files."""
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch.dict(os.environ, {PROFILE_ENV: "", PROFILE_DIR_ENV: tmp}):
+                # 함수 호출
+                with profiled("collect") as disabled:
+                    _busy(0.02)
+                written_when_off = os.listdir(tmp)
+            with patch.dict(os.environ, {PROFILE_ENV: "rerun, collect", PROFILE_DIR_ENV: tmp}):
+                with profiled("collect") as enabled:
+                    _busy(0.03)
+            profiler = SamplingProfiler(interval=0.001)
+            profiler.start()
+            _busy(0.02)
+            profiler.stop()
+            for _ in range(3):
+                write_profile(profiler, "rerun view", tmp, keep=2)
+            names = sorted(os.listdir(tmp))
+            with open(os.path.join(tmp, names[0]), encoding="utf-8") as f:
+                document = json.load(f)
+
+        # 결과 확인
+        self.assertIsNone(disabled)
+        self.assertEqual(written_when_off, [])
+        self.assertIsInstance(enabled, SamplingProfiler)
+        self.assertEqual(len(names), 4)
+        self.assertTrue(all("rerun_view" in name for name in names))
+        self.assertEqual(document["profiles"][0]["type"], "sampled")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,6 +20,8 @@ def test_mem_to_bytes() -> None:
     assert mem_to_bytes("1Ki") == 1024
     assert mem_to_bytes("1Mi") == 1024 * 1024
     assert mem_to_bytes("1Gi") == 1024 * 1024 * 1024
+    assert mem_to_bytes("512M") == 512_000_000
+    assert mem_to_bytes("1G") == 1_000_000_000
 
 
 def test_fmt_cores() -> None:
@@ -0,0 +1,61 @@
+"""Tests for the records module."""
+
+import unittest
+
+from kubernetes_dashboard.records import NodeRow, PodRow, frame, intern, to_columns
+
+
+class TestRecords(unittest.TestCase):
+    """Test cases for the records module."""
+
+    def test_records_behave_like_dict_rows(self) -> None:
+        """Test Mapping compatibility with the previous dict rows."""
+        row = PodRow("c1", "p1", "default", "n1", "Pending", "N/A", "Job/j1")
+        as_dict = {
+            "cluster": "c1",
+            "pod": "p1",
+            "ns": "default",
+            "node": "n1",
+            "phase": "Pending",
+            "reason": "N/A",
+            "workload": "Job/j1",
+        }
+
+        # 결과 확인
+        self.assertEqual(row, as_dict)
+        self.assertEqual({**row}, as_dict)
+        self.assertEqual(row.to_dict(), as_dict)
+        self.assertEqual(row["phase"], "Pending")
+        self.assertIsNone(row.get("missing"))
+        with self.assertRaises(KeyError):
+            row["missing"]
+        self.assertFalse(hasattr(row, "__dict__"))
+
+    def test_intern_shares_string_objects(self) -> None:
+        """Test that equal names share one string object."""
+        a = "".join(["name", "space-1"])
+        b = "".join(["names", "pace-1"])
+        self.assertIsNot(a, b)
+        self.assertIs(intern(a), intern(b))
+        self.assertIsNone(intern(None))
+
+    def test_to_columns_and_frame(self) -> None:
+        """Test column conversion for record rows, dict rows and empty input."""
+        rows = [
+            NodeRow("c1", "n1", 1.0, 2.0, 10.0, 20.0),
+            {"cluster": "c1", "node": "n2", "cpu": "N/A", "mem": "N/A", "cpu_percent": "N/A", "mem_percent": "N/A"},
+        ]
+
+        columns = to_columns(rows, NodeRow)
+        self.assertEqual(list(columns), ["cluster", "node", "cpu", "mem", "cpu_percent", "mem_percent"])
+        self.assertEqual(columns["node"], ["n1", "n2"])
+
+        df = frame(rows[:1], NodeRow)
+        self.assertEqual(df.loc[0, "cpu_percent"], 10.0)
+        empty = frame([], NodeRow)
+        self.assertTrue(empty.empty)
+        self.assertIn("mem", empty.columns)
+
+
+if __name__ == "__main__":
+    unittest.main()
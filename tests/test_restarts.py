@@ -0,0 +1,118 @@
+"""Tests for the restarts module."""
+
+import unittest
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import MagicMock
+
+from kubernetes_dashboard.restarts import RestartTracker
+
+NOW = 1_000_000.0
+
+
+def _pod(
+    name: str,
+    restarts: int,
+    uid: str = "uid-1",
+    finished_at: float | None = None,
+    created_at: float = NOW + 5,
+    namespace: str = "default",
+) -> Any:
+    """테스트용 Pod mock을 생성합니다."""
+    pod = MagicMock()
+    pod.metadata.name = name
+    pod.metadata.namespace = namespace
+    pod.metadata.uid = uid
+    pod.metadata.creation_timestamp = datetime.fromtimestamp(created_at, UTC)
+    status = MagicMock()
+    status.name = "app"
+    status.restart_count = restarts
+    finished = None if finished_at is None else datetime.fromtimestamp(finished_at, UTC)
+    status.last_state.terminated = MagicMock(finished_at=finished) if finished else None
+    pod.status.container_statuses = [status]
+    return pod
+
+
+class TestRestartTracker(unittest.TestCase):
+    """Test cases for RestartTracker."""
+
+    def test_window_sums_follow_restart_count_deltas(self) -> None:
+        """Test counting restarts per window from restart_count deltas."""
+        tracker = RestartTracker()
+
+        # 첫 수집은 기준값만 기록 (종료 기록이 없으므로 재시작으로 보지 않음)
+        tracker.observe("c1", [_pod("p1", 5)], now=NOW)
+        self.assertEqual(tracker.top(10, now=NOW), [])
+
+        # 종료 기록이 덮어써져도 restart_count 차이로 재시작을 기록
+        tracker.observe("c1", [_pod("p1", 8)], now=NOW + 60)
+        tracker.observe("c1", [_pod("p1", 9)], now=NOW + 600)
+
+        # 결과 확인
+        self.assertEqual(tracker.top(10, now=NOW + 600), [(("c1", "default", "p1", "app"), (1, 4, 4))])
+        self.assertEqual(tracker.top(10, now=NOW + 4300), [(("c1", "default", "p1", "app"), (0, 0, 4))])
+
+    def test_uid_change_and_first_observation_seed(self) -> None:
+        """Test seeding from finished_at and treating a recreated pod as new restarts."""
+        tracker = RestartTracker()
+
+        # 첫 수집: 24시간 이내 종료 기록만 1회로 기록
+        tracker.observe(
+            "c1",
+            [_pod("p1", 3, finished_at=NOW - 120), _pod("old", 7, finished_at=NOW - 200_000)],
+            now=NOW,
+        )
+        self.assertEqual(tracker.top(10, now=NOW), [(("c1", "default", "p1", "app"), (1, 1, 1))])
+
+        # 같은 이름으로 다시 생성된 Pod는 restart_count 전체가 새 재시작
+        tracker.observe("c1", [_pod("p1", 2, uid="uid-2")], now=NOW + 30)
+
+        # 결과 확인
+        self.assertEqual(tracker.top(10, now=NOW + 30), [(("c1", "default", "p1", "app"), (3, 3, 3))])
+
+    def test_skipped_namespace_keeps_baseline(self) -> None:
+        """Test that a namespace missing for a cycle does not count its lifetime restarts again."""
+        tracker = RestartTracker()
+        old = NOW - 86_400 * 3
+        tracker.observe("c1", [_pod("web", 40, created_at=old, namespace="a")], now=NOW)
+
+        # 함수 호출: a 네임스페이스가 한 주기 동안 403으로 빠졌다가 다시 조회됨
+        tracker.observe("c1", [], now=NOW + 60, namespaces=())
+        tracker.observe("c1", [_pod("web", 41, created_at=old, namespace="a")], now=NOW + 120)
+        # 기준값이 없어진 뒤 다시 나타난 오래된 Pod는 마지막 종료만 1회로 기록
+        tracker.observe("c1", [], now=NOW + 180)
+        tracker.observe("c1", [_pod("web", 45, created_at=old, finished_at=NOW + 200, namespace="a")], now=NOW + 240)
+
+        # 결과 확인: 40회 누적 재시작을 새 재시작으로 기록하지 않음
+        self.assertEqual(tracker.top(10, now=NOW + 240), [(("c1", "a", "web", "app"), (2, 2, 2))])
+
+    def test_deleted_pods_are_pruned(self) -> None:
+        """Test dropping history of deleted pods after the longest window."""
+        tracker = RestartTracker()
+        tracker.observe("c1", [], now=NOW)
+        tracker.observe("c1", [_pod(f"p{i}", 1, uid=f"uid-{i}") for i in range(100)], now=NOW + 10)
+        self.assertEqual(len(tracker), 100)
+
+        # Pod 삭제 후 24시간이 지나면 기록 제거
+        tracker.observe("c1", [], now=NOW + 20)
+        tracker.observe("c1", [], now=NOW + 86_500)
+
+        # 결과 확인
+        self.assertEqual(len(tracker), 0)
+
+    def test_top_orders_by_window(self) -> None:
+        """Test selecting the most restarting containers for a window."""
+        tracker = RestartTracker()
+        tracker.observe("c1", [], now=NOW)
+        tracker.observe("c2", [], now=NOW)
+        tracker.observe("c1", [_pod("a", 1, uid="a"), _pod("b", 5, uid="b")], now=NOW + 10)
+        tracker.observe("c2", [_pod("c", 3, uid="c")], now=NOW + 10)
+
+        # 결과 확인
+        top = tracker.top(2, now=NOW + 10)
+        self.assertEqual([key[2] for key, _ in top], ["b", "c"])
+        self.assertEqual([key[2] for key, _ in tracker.top(5, clusters=["c1"], now=NOW + 10)], ["b", "a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
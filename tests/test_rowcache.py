@@ -0,0 +1,56 @@
+"""Tests for the rowcache module."""
+
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+from kubernetes_dashboard.rowcache import RowCache
+
+
+class TestRowCache(unittest.TestCase):
+    """Test cases for RowCache."""
+
+    def test_get_reuses_same_rows(self) -> None:
+        """Test that values are reused for the same row objects and rebuilt for equal copies."""
+        # Mock 설정
+        rows = [object(), object()]
+        build = MagicMock(side_effect=lambda r: list(r))
+        cache = RowCache("test", 2)
+
+        # 함수 호출
+        first = cache.get(rows, build)
+        again = cache.get(list(rows), build)
+        other = cache.get([object()], build)
+        keyed = cache.get(rows, build, "other")
+
+        # 결과 확인: 같은 행 객체 목록이면 재사용하고, 키가 다르면 따로 만듦
+        self.assertIs(again, first)
+        self.assertIsNot(other, first)
+        self.assertIsNot(keyed, first)
+        self.assertEqual(build.call_count, 3)
+        self.assertEqual(len(cache), 2)
+
+    def test_usage_counts_retained_rows(self) -> None:
+        """Test that usage and release include the row lists the cache keeps alive."""
+        # Mock 설정
+        cache = RowCache("test", 4)
+        old, new = [object()] * 1000, [object()]
+        cache.get(old, lambda r: MagicMock(nbytes=100))
+        cache.get(new, lambda r: MagicMock(nbytes=100))
+        build = MagicMock(side_effect=lambda r: MagicMock(nbytes=100))
+
+        # 함수 호출
+        usage = cache.usage()
+        freed = cache.release(1)
+        cache.get(new, build)
+        cache.get(old, build)
+
+        # 결과 확인: 행 목록까지 세고, 가장 오래전에 사용한 값만 해제
+        self.assertGreater(usage.bytes, 200 + sys.getsizeof(old))
+        self.assertEqual(usage.detail, "2개 색인, 1,001개 행")
+        self.assertGreaterEqual(freed, 100 + sys.getsizeof(old))
+        build.assert_called_once_with(old)
+
+
+if __name__ == "__main__":
+    unittest.main()
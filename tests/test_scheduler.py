@@ -0,0 +1,155 @@
+"""Tests for the scheduler module."""
+
+import os
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from kubernetes.client.exceptions import ApiException
+
+from kubernetes_dashboard.scheduler import (
+    DEFAULT_MAX_INFLIGHT,
+    MAX_INFLIGHT_ENV,
+    AdaptiveLimit,
+    Scheduler,
+    TokenBucket,
+    configured_max_inflight,
+)
+
+
+def _throttled(retry_after: str | None = "2") -> ApiException:
+    """Retry-After 헤더를 가진 429 예외를 생성합니다."""
+    exc = ApiException(status=429, reason="Too Many Requests")
+    exc.headers = {"Retry-After": retry_after} if retry_after else None
+    return exc
+
+
+class FakeClock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test cases for TokenBucket."""
+
+    def test_reserve_waits_after_burst(self) -> None:
+        """Test that requests beyond the burst are spaced by the rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=2, clock=clock)
+
+        # 결과 확인
+        self.assertEqual([bucket.reserve() for _ in range(4)], [0, 0, 0.5, 1.0])
+        clock.now = 10
+        self.assertEqual(bucket.reserve(), 0)
+
+        bucket.pause(3)
+        self.assertEqual(bucket.reserve(), 3)
+
+
+class TestScheduler(unittest.TestCase):
+    """Test cases for Scheduler."""
+
+    def _scheduler(self, clock: FakeClock, **kwargs: float) -> Scheduler:
+        return Scheduler(clock=clock, sleep=clock.sleep, rng=lambda: 1.0, **kwargs)  # type: ignore[arg-type]
+
+    def test_retries_429_with_retry_after(self) -> None:
+        """Test Retry-After backoff and concurrency reduction on 429."""
+        clock = FakeClock()
+        scheduler = self._scheduler(clock, per_server=8)
+        fn = MagicMock(side_effect=[_throttled("2"), "ok"], __name__="list_node")
+
+        # 함수 호출
+        result = scheduler.call("ctx", fn, 1, watch=False)
+
+        # 결과 확인
+        self.assertEqual(result, "ok")
+        self.assertEqual(fn.call_count, 2)
+        fn.assert_called_with(1, watch=False)
+        self.assertEqual(clock.sleeps, [3.0])  # Retry-After 2초 + 최대 jitter 50%
+        stats = scheduler.stats()["ctx"]
+        self.assertEqual(stats["throttled"], 1)
+        self.assertEqual(stats["limit"], 2)  # 초기값 4에서 절반으로 감소
+
+    def test_gives_up_after_max_retries_and_raises_other_errors(self) -> None:
+        """Test that retries are bounded and non-429 errors are not retried."""
+        clock = FakeClock()
+        scheduler = self._scheduler(clock, max_retries=2, base_delay=1)
+
+        throttled = MagicMock(side_effect=_throttled(None))
+        with self.assertRaises(ApiException):
+            scheduler.call("ctx", throttled)
+        self.assertEqual(throttled.call_count, 3)
+        self.assertEqual(clock.sleeps, [1.0, 2.0])  # 지수 백오프
+
+        failing = MagicMock(side_effect=ApiException(status=500))
+        with self.assertRaises(ApiException):
+            scheduler.call("ctx", failing)
+        self.assertEqual(failing.call_count, 1)
+
+    def test_concurrency_limits(self) -> None:
+        """Test per-server and global in-flight limits."""
+        scheduler = Scheduler(max_inflight=3, per_server=4, qps=0)
+        lock = threading.Lock()
+        active: dict[str, int] = {"a": 0, "b": 0, "total": 0}
+        peak: dict[str, int] = {"a": 0, "b": 0, "total": 0}
+
+        def request(server: str) -> None:
+            with lock:
+                for key in (server, "total"):
+                    active[key] += 1
+                    peak[key] = max(peak[key], active[key])
+            time.sleep(0.02)
+            with lock:
+                for key in (server, "total"):
+                    active[key] -= 1
+
+        threads = [threading.Thread(target=scheduler.call, args=(server, request, server)) for server in "ab" * 6]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # 결과 확인: API 서버별 초기 제한 2, 전역 제한 3
+        self.assertLessEqual(peak["a"], 2)
+        self.assertLessEqual(peak["b"], 2)
+        self.assertLessEqual(peak["total"], 3)
+        self.assertEqual(sum(s["requests"] for s in scheduler.stats().values()), 12)
+
+    def test_adaptive_limit_follows_latency(self) -> None:
+        """Test additive increase on normal latency and decrease on latency spikes."""
+        limit = AdaptiveLimit(2, maximum=4)
+
+        limit.observe("list_pod", 1.0)
+        limit.observe("list_pod", 1.0)
+        self.assertEqual(limit.limit, 2.5)
+
+        limit.observe("list_pod", 5.0)
+        self.assertAlmostEqual(limit.limit, 2.25)
+
+        # 다른 호출 종류는 별도 기준값 사용
+        limit.observe("list_node", 5.0)
+        self.assertAlmostEqual(limit.limit, 2.25)
+
+    def test_configured_max_inflight(self) -> None:
+        """Test parsing the global concurrency limit from the environment."""
+        for raw, expected in (("", DEFAULT_MAX_INFLIGHT), ("4", 4), ("0", 1)):
+            with patch.dict(os.environ, {MAX_INFLIGHT_ENV: raw}):
+                self.assertEqual(configured_max_inflight(), expected)
+        with patch.dict(os.environ, {MAX_INFLIGHT_ENV: "many"}), patch("builtins.print") as mock_print:
+            self.assertEqual(configured_max_inflight(), DEFAULT_MAX_INFLIGHT)
+            mock_print.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""Tests for the search module."""
+
+import unittest
+
+from kubernetes_dashboard.records import SearchRow
+from kubernetes_dashboard.search import NAMESPACE, NODE, POD, SearchSegment, label_terms, search
+
+
+def _segment(cluster: str, pods: list[tuple[str, str, dict[str, str]]]) -> SearchSegment:
+    """테스트용 세그먼트를 만듭니다 (네임스페이스, 노드 1개, Pod 순)."""
+    rows = [SearchRow(cluster, NAMESPACE, ns, ns, "", "") for ns in sorted({ns for _, ns, _ in pods})]
+    terms: list[list[str]] = [[row.name] for row in rows]
+    rows.append(SearchRow(cluster, NODE, "", "ip-10-0-1-1", "ip-10-0-1-1", "Ready"))
+    terms.append(["ip-10-0-1-1", "topology.kubernetes.io/zone=ap-northeast-2a", "ap-northeast-2a"])
+    for name, ns, labels in pods:
+        rows.append(SearchRow(cluster, POD, ns, name, "ip-10-0-1-1", "Running"))
+        terms.append([name, ns, "ip-10-0-1-1", "Running", *label_terms(labels)])
+    return SearchSegment(cluster, rows, terms)
+
+
+PODS = [
+    ("web-7d9c8f6b5-abcde", "shop", {"app": "web", "pod-template-hash": "7d9c8f6b5"}),
+    ("web-7d9c8f6b5-fghij", "shop", {"app": "web", "pod-template-hash": "7d9c8f6b5"}),
+    ("payments-api-0", "payments", {"app": "Payments-API"}),
+    ("db-0", "shop", {"app": "db"}),
+]
+
+
+class TestSearchSegment(unittest.TestCase):
+    """Test cases for the per-cluster index."""
+
+    def setUp(self) -> None:
+        self.segment = _segment("c1", PODS)
+
+    def _names(self, query: str) -> list[str]:
+        return [self.segment.rows[i].name for i in self.segment.query(query.lower().split())]
+
+    def test_prefix_and_substring(self) -> None:
+        """Test prefix matching for short tokens and trigram substring matching."""
+        # 3자 미만: 접두사 일치
+        self.assertEqual(self._names("db"), ["db-0"])
+        self.assertEqual(self._names("w"), ["web-7d9c8f6b5-abcde", "web-7d9c8f6b5-fghij"])
+        # 3자 이상: 부분 문자열 일치 (trigram이 모두 있지만 연속하지 않는 경우 제외)
+        self.assertEqual(self._names("fghij"), ["web-7d9c8f6b5-fghij"])
+        self.assertEqual(self._names("api"), ["payments-api-0"])
+        self.assertEqual(self._names("b-7d9"), ["web-7d9c8f6b5-abcde", "web-7d9c8f6b5-fghij"])
+        self.assertEqual(self._names("abcdefg"), [])
+
+    def test_labels_namespaces_and_and(self) -> None:
+        """Test label values, namespace documents and AND across tokens."""
+        # 레이블 값은 대소문자를 무시하고, 무시하는 레이블(pod-template-hash)은 색인하지 않음
+        self.assertEqual(self._names("app=payments-api"), ["payments-api-0"])
+        self.assertEqual(self._names("pod-template-hash"), [])
+        # 네임스페이스 문서와 해당 네임스페이스의 Pod
+        self.assertEqual(self._names("shop"), ["shop", "web-7d9c8f6b5-abcde", "web-7d9c8f6b5-fghij", "db-0"])
+        # 모든 검색어가 일치해야 함
+        self.assertEqual(self._names("shop app=web abcde"), ["web-7d9c8f6b5-abcde"])
+        self.assertEqual(self._names("2a"), [])
+        self.assertEqual(self._names("northeast"), ["ip-10-0-1-1"])
+
+    def test_search_across_segments(self) -> None:
+        """Test merging results from several clusters ordered by kind."""
+        segments = [self.segment, _segment("c2", [("web-0", "shop", {"app": "web"})])]
+
+        # 함수 호출
+        result = search(segments, "shop", limit=3)
+
+        # 결과 확인: 네임스페이스 문서가 먼저, 전체 일치 수는 limit과 관계없음
+        self.assertEqual(result.total, 6)
+        self.assertEqual(
+            [(row.cluster, row.kind) for row in result.rows], [("c1", NAMESPACE), ("c2", NAMESPACE), ("c1", POD)]
+        )
+        self.assertEqual(search(segments, "  ").total, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""Tests for the snapshot module."""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import unittest
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from kubernetes_dashboard.snapshot import main
+
+
+def _snapshot(cluster: str) -> dict[str, Any]:
+    return {
+        "total_pods": 3,
+        "non_running_total": 1,
+        "non_running_pods": [
+            {"cluster": cluster, "pod": "p1", "ns": "default", "node": "N/A", "phase": "Pending", "reason": "N/A"}
+        ],
+        "workloads": [
+            {
+                "cluster": cluster,
+                "ns": "default",
+                "kind": "Deployment",
+                "name": "web",
+                "pods": 3,
+                "ready": 2,
+                "non_running": 1,
+                "restarts": 0,
+            }
+        ],
+        "node_metrics": [
+            {"cluster": cluster, "node": "n1", "cpu": 1.0, "mem": 2.0, "cpu_percent": 10.0, "mem_percent": 20.0}
+        ],
+        "recent_restarts": [],
+        "events": [
+            {
+                "cluster": cluster,
+                "type": "Warning",
+                "reason": "BackOff",
+                "object": "Pod/p1",
+                "message": "Back-off",
+                "time": datetime(2025, 1, 1, tzinfo=UTC),
+            }
+        ],
+    }
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test cases for the snapshot module."""
+
+    @patch("kubernetes_dashboard.snapshot.collect_cluster")
+    def test_main_ndjson(self, mock_collect_cluster: MagicMock) -> None:
+        """Test streaming one NDJSON record per row."""
+        mock_collect_cluster.side_effect = _snapshot
+        out = io.StringIO()
+
+        # 함수 호출
+        code = main(["--context", "a", "--context", "b", "--format", "ndjson"], out)
+
+        # 결과 확인
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(code, 0)
+        self.assertEqual(len(records), 10)
+        self.assertEqual({r["cluster"] for r in records if r["kind"] == "cluster"}, {"a", "b"})
+        event = next(r for r in records if r["kind"] == "event")
+        self.assertEqual(event["time"], "2025-01-01T00:00:00+00:00")
+
+    @patch("kubernetes_dashboard.snapshot.collect_cluster")
+    def test_main_json_with_error(self, mock_collect_cluster: MagicMock) -> None:
+        """Test JSON array output and failure reporting."""
+
+        def _collect(ctx: str) -> dict[str, Any]:
+            if ctx == "bad":
+                raise RuntimeError("forbidden")
+            return _snapshot(ctx)
+
+        mock_collect_cluster.side_effect = _collect
+        out = io.StringIO()
+
+        with patch("sys.stderr", new_callable=io.StringIO):
+            code = main(["--context", "a", "--context", "bad", "--format", "json"], out)
+
+        records = json.loads(out.getvalue())
+        self.assertEqual(code, 1)
+        self.assertIn({"kind": "error", "cluster": "bad", "message": "forbidden"}, records)
+        self.assertEqual(sum(1 for r in records if r["kind"] == "pod"), 1)
+
+    @patch("kubernetes_dashboard.snapshot.collect_cluster")
+    def test_main_json_empty(self, mock_collect_cluster: MagicMock) -> None:
+        """Test that an empty result is still a valid JSON array."""
+        out = io.StringIO()
+        with patch("kubernetes_dashboard.snapshot.iter_records", return_value=iter([])):
+            main(["--context", "a", "--format", "json"], out)
+        self.assertEqual(json.loads(out.getvalue()), [])
+
+    def test_snapshot_does_not_import_ui_modules(self) -> None:
+        """Test that the snapshot CLI skips the Streamlit and pandas imports."""
+        code = "import sys, kubernetes_dashboard.snapshot; print('streamlit' in sys.modules or 'pandas' in sys.modules)"
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+        self.assertEqual(result.stdout.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""Start-up time budget and lazy import tests."""
+
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+from kubernetes_dashboard.importtime import parse_importtime
+
+# 콜드 스타트부터 첫 렌더링까지 허용하는 시간(초). CI 환경에 따라 환경 변수로 조정 가능
+STARTUP_BUDGET_SECONDS = float(os.environ.get("DASHBOARD_STARTUP_BUDGET", "6"))
+
+DASHBOARD_PATH = Path(__file__).resolve().parents[1] / "src" / "kubernetes_dashboard" / "dashboard.py"
+
+KUBECONFIG = """
+apiVersion: v1
+kind: Config
+clusters:
+- name: c1
+  cluster: {server: "https://127.0.0.1:6443"}
+users:
+- name: u1
+  user: {token: "x"}
+contexts:
+- name: ctx-a
+  context: {cluster: c1, user: u1}
+- name: ctx-b
+  context: {cluster: c1, user: u1}
+current-context: ctx-a
+"""
+
+
+def _run_python(code: str, kubeconfig: str) -> str:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path), "KUBECONFIG": kubeconfig}
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+    )
+    if result.returncode != 0:
+        raise AssertionError(result.stderr)
+    return result.stdout.strip()
+
+
+class TestStartup(unittest.TestCase):
+    """Start-up budget test cases."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.kubeconfig = os.path.join(self._tmp.name, "config")
+        Path(self.kubeconfig).write_text(KUBECONFIG)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_dashboard_import_is_lazy(self) -> None:
+        """Test that importing the dashboard does not load pandas or the kubernetes client."""
+        code = """
+            import sys
+            import kubernetes_dashboard.dashboard
+            print(sorted(m for m in ("pandas", "kubernetes") if m in sys.modules))
+        """
+        self.assertEqual(_run_python(code, self.kubeconfig), "[]")
+
+    def test_cold_start_to_first_render_within_budget(self) -> None:
+        """Test that a cold start renders the first page within the budget."""
+        code = f"""
+            import time
+            started = time.perf_counter()
+            from unittest.mock import patch
+            from streamlit.testing.v1 import AppTest
+
+            empty = {{
+                "total_pods": 0,
+                "non_running_total": 0,
+                "non_running_pods": [],
+                "workloads": [],
+                "node_metrics": [],
+                "recent_restarts": [],
+                "events": [],
+                "latest_events": [],
+                "node_pods": [],
+            }}
+            at = AppTest.from_file({str(DASHBOARD_PATH)!r}, default_timeout=120)
+            with patch("kubernetes_dashboard.collectors.collect_cluster", return_value=empty) as collect:
+                at.run()
+            assert not at.exception, at.exception
+            # 노드를 열지 않으면 노드별 Pod 행과 Pod 사용량을 수집하지 않음
+            assert collect.called and all("node_pods" not in c.args[1] for c in collect.call_args_list), collect
+            assert at.header[0].value.startswith("📊 Overview"), at.header
+            print(time.perf_counter() - started)
+        """
+        elapsed = float(_run_python(code, self.kubeconfig))
+        self.assertLess(elapsed, STARTUP_BUDGET_SECONDS)
+
+    def test_parse_importtime(self) -> None:
+        """Test parsing `-X importtime` output."""
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       100 |        100 |     yaml.error\n"
+            "import time:       200 |        300 |   yaml\n"
+            "import time:        50 |        350 | kubernetes_dashboard.kube_client\n"
+        )
+        timings = parse_importtime(output)
+        self.assertEqual([t.module for t in timings], ["yaml.error", "yaml", "kubernetes_dashboard.kube_client"])
+        self.assertEqual([t.depth for t in timings], [2, 1, 0])
+        self.assertEqual(timings[2].cumulative_us, 350)
+
+
+if __name__ == "__main__":
+    unittest.main()
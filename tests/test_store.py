@@ -0,0 +1,239 @@
+"""Tests for the store module."""
+
+import tempfile
+import threading
+import time
+import unittest
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from kubernetes_dashboard.alerts import parse_rule
+from kubernetes_dashboard.archive import SnapshotArchive
+from kubernetes_dashboard.collectors import EVENTS, NODE_METRICS, PODS
+from kubernetes_dashboard.memory import MemoryGovernor
+from kubernetes_dashboard.records import NodeRow
+from kubernetes_dashboard.store import SnapshotStore
+
+
+def _collect_cluster(ctx: str, datasets: Any) -> dict[str, Any]:
+    """요청된 데이터셋의 키만 반환하는 collect_cluster 대체 함수"""
+    snapshot: dict[str, Any] = {}
+    if PODS in datasets:
+        snapshot.update(total_pods=1, non_running_total=0, non_running_pods=[])
+    if NODE_METRICS in datasets:
+        snapshot["node_metrics"] = [{"cluster": ctx, "node": "n1"}]
+    if EVENTS in datasets:
+        snapshot["events"] = [{"cluster": ctx}]
+    return snapshot
+
+
+class TestSnapshotStore(unittest.TestCase):
+    """Test cases for SnapshotStore."""
+
+    @patch("kubernetes_dashboard.store.collect_cluster")
+    def test_get_fetches_only_missing_datasets(self, mock_collect_cluster: MagicMock) -> None:
+        """Test that cached datasets are reused and only missing ones are fetched."""
+        mock_collect_cluster.side_effect = _collect_cluster
+        store = SnapshotStore(max_age=60)
+
+        # 함수 호출
+        first = store.get(("c1", "c2"), {PODS, NODE_METRICS})
+        second = store.get(("c1",), {PODS, EVENTS})
+
+        # 결과 확인
+        self.assertEqual(first["total_pods"], 2)
+        self.assertEqual(len(first["node_metrics"]), 2)
+        self.assertNotIn("events", first)
+        self.assertEqual(second["total_pods"], 1)
+        self.assertEqual(second["events"], [{"cluster": "c1"}])
+        self.assertNotIn("node_metrics", second)
+        self.assertEqual(mock_collect_cluster.call_count, 3)
+        mock_collect_cluster.assert_called_with("c1", {EVENTS})
+
+    @patch("kubernetes_dashboard.store.collect_cluster")
+    def test_expired_and_invalidated_entries_are_refetched(self, mock_collect_cluster: MagicMock) -> None:
+        """Test max_age expiry and explicit invalidation."""
+        mock_collect_cluster.side_effect = _collect_cluster
+        store = SnapshotStore(max_age=60)
+
+        store.get(("c1",), {PODS})
+        store.get(("c1",), {PODS})
+        self.assertEqual(mock_collect_cluster.call_count, 1)
+        self.assertIsNotNone(store.collected_at(("c1",), {PODS}))
+
+        store.get(("c1",), {PODS}, max_age=-1)
+        self.assertEqual(mock_collect_cluster.call_count, 2)
+
+        store.invalidate(["c1"])
+        self.assertIsNone(store.collected_at(("c1",), {PODS}))
+        store.get(("c1",), {PODS})
+        self.assertEqual(mock_collect_cluster.call_count, 3)
+
+    @patch("kubernetes_dashboard.store.collect_cluster")
+    def test_invalidate_waits_for_cluster_read(self, mock_collect_cluster: MagicMock) -> None:
+        """Test that invalidation from another session does not remove entries while a cluster is being read."""
+        store = SnapshotStore(max_age=60)
+        invalidating: list[threading.Thread] = []
+
+        def _collect(ctx: str, datasets: Any) -> dict[str, Any]:
+            if EVENTS in datasets:
+                # 수집 도중 다른 세션이 수동 새로고침
+                thread = threading.Thread(target=store.invalidate, args=(["c1"],))
+                thread.start()
+                thread.join(0.2)
+                invalidating.append(thread)
+            return _collect_cluster(ctx, datasets)
+
+        mock_collect_cluster.side_effect = _collect
+        store.get(("c1",), {PODS})
+
+        # 함수 호출
+        snapshot = store.get(("c1",), {PODS, EVENTS})
+        invalidating[0].join(5)
+
+        # 결과 확인: 읽기가 끝날 때까지 무효화를 기다리고, 끝난 뒤에는 항목을 제거
+        self.assertEqual((snapshot["total_pods"], snapshot["events"]), (1, [{"cluster": "c1"}]))
+        self.assertFalse(invalidating[0].is_alive())
+        self.assertIsNone(store.collected_at(("c1",), {PODS}))
+
+    @patch("kubernetes_dashboard.store.collect_cluster")
+    def test_refresh_records_changes(self, mock_collect_cluster: MagicMock) -> None:
+        """Test that refreshed datasets are diffed against the previous value."""
+        pending = {"cluster": "c1", "pod": "p1", "ns": "default", "node": "n1", "phase": "Pending", "reason": "N/A"}
+        mock_collect_cluster.side_effect = [
+            {"total_pods": 1, "non_running_total": 0, "non_running_pods": []},
+            {"total_pods": 1, "non_running_total": 1, "non_running_pods": [pending]},
+        ]
+        store = SnapshotStore(max_age=60)
+
+        # 처음 수집한 데이터셋은 비교 대상이 없음
+        store.get(("c1",), {PODS})
+        self.assertEqual(store.changes(("c1",), {PODS}), [])
+
+        # 수동 새로고침 후에도 무효화 전 값과 비교
+        store.invalidate(["c1"])
+        store.get(("c1",), {PODS})
+        changes = store.changes(("c1",), {PODS})
+        self.assertEqual([(c.kind, c.name) for c in changes], [("pod_unhealthy", "p1")])
+        self.assertEqual(store.feed.since(0)[0], 1)
+        self.assertEqual(store.changes(("c2",), {PODS}), [])
+
+    @patch("kubernetes_dashboard.store.collect_cluster")
+    def test_refresh_evaluates_alerts(self, mock_collect_cluster: MagicMock) -> None:
+        """Test that alert rules are evaluated once per refreshed dataset, not per request."""
+        pending = {"cluster": "c1", "pod": "p1", "ns": "default", "node": "n1", "phase": "Pending", "reason": "N/A"}
+        mock_collect_cluster.return_value = {"total_pods": 1, "non_running_total": 1, "non_running_pods": [pending]}
+        rule = parse_rule({"name": "Pending", "source": "non_running_pods", "expr": "count > 0", "for": 2})
+        store = SnapshotStore(max_age=60, rules=[rule])
+
+        # 캐시에서 가져온 요청은 샘플로 세지 않음
+        store.get(("c1",), {PODS})
+        store.get(("c1",), {PODS})
+        self.assertEqual(store.alerts.alerts(), [])
+
+        store.get(("c1",), {PODS}, max_age=-1)
+        self.assertEqual([(a.cluster, a.alert, a.value) for a in store.alerts.alerts()], [("c1", "Pending", 1.0)])
+
+    @patch("kubernetes_dashboard.store.collect_cluster")
+    def test_warm_start_from_persisted_snapshot(self, mock_collect_cluster: MagicMock) -> None:
+        """Test that a restarted store serves the saved snapshot and replaces it in the background."""
+        with tempfile.TemporaryDirectory() as tmp:
+            # 첫 프로세스: 수집한 스냅샷을 저장
+            mock_collect_cluster.side_effect = _collect_cluster
+            first = SnapshotStore(max_age=60, persist_dir=tmp)
+            first.get(("c1",), {PODS})
+            first._writer.shutdown(wait=True)
+
+            # 재시작한 프로세스: 새 수집이 끝나기 전에도 저장된 값을 바로 반환
+            release = threading.Event()
+
+            def _slow(ctx: str, datasets: Any) -> dict[str, Any]:
+                release.wait(5)
+                return {"total_pods": 7, "non_running_total": 0, "non_running_pods": []}
+
+            mock_collect_cluster.side_effect = _slow
+            store = SnapshotStore(max_age=60, persist_dir=tmp)
+            warm = store.get(("c1",), {PODS})
+            self.assertEqual(warm["total_pods"], 1)
+            self.assertEqual(store.warm(("c1", "c2"), {PODS}), ["c1"])
+            self.assertLess(store.collected_at(("c1",), {PODS}) or 0, time.time())
+            # 백그라운드 수집 중에 다시 요청해도 수집을 중복 시작하지 않음
+            self.assertEqual(store.get(("c1",), {PODS})["total_pods"], 1)
+
+            release.set()
+            deadline = time.time() + 5
+            while store.warm(("c1",), {PODS}) and time.time() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(store.get(("c1",), {PODS})["total_pods"], 7)
+            self.assertEqual(mock_collect_cluster.call_count, 2)
+            store._writer.shutdown(wait=True)
+
+    @patch("kubernetes_dashboard.store.collect_cluster")
+    def test_refreshed_datasets_are_archived(self, mock_collect_cluster: MagicMock) -> None:
+        """Test that each refresh appends only the refreshed datasets to the archive."""
+        mock_collect_cluster.side_effect = _collect_cluster
+        with tempfile.TemporaryDirectory() as tmp:
+            archive = SnapshotArchive(tmp)
+            store = SnapshotStore(max_age=60, archive=archive)
+
+            # 함수 호출
+            store.get(("c1",), {PODS})
+            store.invalidate()
+            store.get(("c1",), {PODS, EVENTS})
+            store._writer.shutdown(wait=True)
+            replayed = archive.snapshot(("c1",), {PODS, EVENTS}, time.time())
+            records = sum(1 for segment in archive._segments for _ in segment.records(time.time()))
+            archive.close()
+
+        # 결과 확인: 저장할 수 없는 이벤트 dict 행은 기록하지 않음
+        self.assertEqual(records, 2)
+        self.assertEqual(replayed, {"total_pods": 1, "non_running_total": 0, "non_running_pods": [], "events": []})
+
+    @patch("kubernetes_dashboard.store.collect_cluster")
+    def test_memory_pressure_spills_least_recently_viewed_cluster(self, mock_collect_cluster: MagicMock) -> None:
+        """Test that over-budget snapshots are spilled to disk and read back on the next view."""
+
+        def _collect(ctx: str, datasets: Any) -> dict[str, Any]:
+            snapshot = _collect_cluster(ctx, datasets)
+            if NODE_METRICS in datasets:
+                snapshot["node_metrics"] = [NodeRow(ctx, f"n{i}", 1.0, 2.0, 3.0, 4.0) for i in range(200)]
+            return snapshot
+
+        mock_collect_cluster.side_effect = _collect
+        wanted = {PODS, NODE_METRICS, EVENTS}
+        with tempfile.TemporaryDirectory() as tmp:
+            # Mock 설정: 1바이트 예산이므로 요청 처리 중이 아닌 클러스터는 모두 내보냄
+            governor = MemoryGovernor(budget=1)
+            store = SnapshotStore(max_age=60, governor=governor, spill_dir=tmp)
+
+            # 함수 호출
+            store.get(("c1",), wanted)
+            self.assertEqual(store.spilled(), {})
+            before = governor.total()
+            store.get(("c2",), wanted)
+            spilled = store.spilled()
+            after = store.memory_usage().bytes
+            again = store.get(("c1",), wanted)
+
+            # 결과 확인: 합계 값만 메모리에 남기고, 다시 조회하면 저장할 수 없는 이벤트만 다시 수집
+            self.assertEqual(
+                spilled, {"c1": {"total_pods": 1, "non_running_total": 0, "non_running_pods": 0, "node_metrics": 200}}
+            )
+            self.assertLess(after, 2 * before)
+            self.assertIsNotNone(store.collected_at(("c2",), {PODS, NODE_METRICS}))
+            self.assertEqual([row.node for row in again["node_metrics"]], [f"n{i}" for i in range(200)])
+            self.assertEqual(again["total_pods"], 1)
+            self.assertEqual(mock_collect_cluster.call_count, 3)
+            mock_collect_cluster.assert_called_with("c1", {EVENTS})
+            self.assertEqual(set(store.spilled()), {"c2"})
+
+    @patch("kubernetes_dashboard.store.collect_cluster")
+    def test_get_without_datasets_does_not_collect(self, mock_collect_cluster: MagicMock) -> None:
+        """Test that pages without datasets never trigger a collection."""
+        store = SnapshotStore()
+        self.assertEqual(store.get(("c1",), set()), {})
+        mock_collect_cluster.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
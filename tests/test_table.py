@@ -0,0 +1,89 @@
+"""Tests for the table module."""
+
+import unittest
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from kubernetes_dashboard.records import EventRow, PodRow, RestartRow
+from kubernetes_dashboard.table import TableStore
+from kubernetes_dashboard.views.table import table_store
+
+
+def _pods() -> list[PodRow]:
+    """테스트용 Pod 행 목록을 생성합니다."""
+    return [
+        PodRow("c2", "web-1", "prod", "n1", "Pending", "N/A"),
+        PodRow("c1", "api-1", "dev", "n2", "Failed", "Evicted"),
+        PodRow("c1", "web-2", "prod", "n1", "Pending", "N/A"),
+        PodRow("c2", "db-1", "prod", "n3", "Unknown", "NodeLost"),
+    ]
+
+
+class TestTableStore(unittest.TestCase):
+    """Test cases for TableStore."""
+
+    def test_filter_sort_and_page(self) -> None:
+        """Test server-side filtering, sorting and paging."""
+        store = TableStore(_pods(), PodRow)
+
+        # 함수 호출
+        page = store.query({"ns": ["prod"], "phase": []}, sort="pod", descending=True, limit=2)
+
+        # 결과 확인
+        self.assertEqual(page.total, 3)
+        self.assertEqual([row["pod"] for row in page.rows], ["web-2", "web-1"])
+        self.assertEqual(store.categories("cluster"), ["c1", "c2"])
+        second = store.query({"ns": ["prod"]}, sort="pod", descending=True, offset=2, limit=2)
+        self.assertEqual([row["pod"] for row in second.rows], ["db-1"])
+        # 범위를 벗어난 페이지는 마지막 페이지
+        self.assertEqual(store.query(offset=100, limit=3).offset, 3)
+
+    def test_search_matches_any_string_column(self) -> None:
+        """Test case-insensitive substring search across string columns."""
+        store = TableStore(_pods(), PodRow)
+
+        # 결과 확인
+        self.assertEqual([row["pod"] for row in store.query(search="EVICT").rows], ["api-1"])
+        self.assertEqual(store.query(search="web", filters={"cluster": ["c1"]}).total, 1)
+        self.assertEqual(store.query(search="missing").total, 0)
+
+    def test_numeric_and_time_columns(self) -> None:
+        """Test sorting numbers and datetimes with missing values last."""
+        restarts = [
+            RestartRow("c1", "a", "ns", "n1", 3, "app", 0, 1, 3),
+            RestartRow("c1", "b", "ns", None, None, "app", 0, 5, 5),
+            RestartRow("c1", "c", "ns", "n1", 1, "app", 0, 1, 1),
+        ]
+        events = [
+            EventRow("c1", "Normal", "Pulled", "Pod/a", "m", datetime(2025, 1, 1, tzinfo=UTC)),
+            EventRow("c1", "Warning", "BackOff", "Pod/b", "m", None),
+            EventRow("c1", "Normal", "Started", "Pod/c", "m", datetime(2025, 1, 2, tzinfo=UTC)),
+        ]
+
+        # 결과 확인: 같은 값은 원래 순서 유지, 값이 없으면 마지막
+        by_rate = TableStore(restarts, RestartRow).query(sort="restarts_1h", descending=True)
+        self.assertEqual([row["pod"] for row in by_rate.rows], ["b", "a", "c"])
+        by_total = TableStore(restarts, RestartRow).query(sort="restarts", descending=True)
+        self.assertEqual([row["pod"] for row in by_total.rows], ["a", "c", "b"])
+        by_time = TableStore(events, EventRow).query(sort="time", descending=True)
+        self.assertEqual([row["object"] for row in by_time.rows], ["Pod/c", "Pod/a", "Pod/b"])
+
+    def test_table_store_cache_checks_row_identity(self) -> None:
+        """Test that a cache key collision does not return another row list's table."""
+        first, second = _pods(), _pods()[::-1]
+
+        # Mock 설정: 모든 id 목록의 해시가 충돌
+        with patch("kubernetes_dashboard.rowcache.hash", return_value=0, create=True):
+            # 함수 호출
+            store = table_store(first, PodRow)
+            other = table_store(second, PodRow)
+            again = table_store(list(second), PodRow)
+
+        # 결과 확인: 같은 행 객체 목록이면 재사용
+        self.assertIsNot(store, other)
+        self.assertEqual(other.query().rows, second)
+        self.assertIs(again, other)
+
+
+if __name__ == "__main__":
+    unittest.main()
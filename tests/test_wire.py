@@ -0,0 +1,321 @@
+"""Tests for the wire module."""
+
+import gzip
+import json
+import threading
+import unittest
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from kubernetes.client import ApiClient, Configuration
+from kubernetes.client.exceptions import ApiException
+
+from kubernetes_dashboard.wire import (
+    JSON,
+    NODE,
+    POD,
+    POD_RESOURCES,
+    PROTOBUF,
+    WireResponse,
+    decode_json,
+    decode_protobuf,
+    fetch,
+    list_objects,
+    reset,
+)
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _field(number: int, value: Any) -> bytes:
+    """protobuf 필드 하나를 인코딩합니다 (int는 varint, str/bytes는 길이 구분)."""
+    if isinstance(value, int):
+        return _varint(number << 3) + _varint(value)
+    data = value.encode() if isinstance(value, str) else value
+    return _varint(number << 3 | 2) + _varint(len(data)) + data
+
+
+def _msg(*fields: bytes) -> bytes:
+    return b"".join(fields)
+
+
+def _envelope(kind: str, items: list[bytes]) -> bytes:
+    """runtime.Unknown으로 감싼 목록 응답을 만듭니다."""
+    raw = _msg(_field(1, _field(2, "12345")), *(_field(2, item) for item in items))
+    unknown = _msg(_field(1, _msg(_field(1, "v1"), _field(2, kind))), _field(2, raw), _field(4, PROTOBUF))
+    return b"k8s\x00" + unknown
+
+
+FINISHED = datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)
+
+POD_JSON = {
+    "metadata": {
+        "name": "web-7d9c8f6b5-abcde",
+        "namespace": "default",
+        "uid": "uid-1",
+        "resourceVersion": "42",
+        "labels": {"app": "web", "pod-template-hash": "7d9c8f6b5"},
+        "ownerReferences": [{"kind": "ReplicaSet", "name": "web-7d9c8f6b5", "uid": "rs-1", "controller": True}],
+        "managedFields": [{"manager": "kubelet"}],
+    },
+    "spec": {
+        "containers": [
+            {
+                "name": "app",
+                "image": "nginx",
+                "resources": {"limits": {"memory": "128Mi"}, "requests": {"cpu": "250m", "memory": "64Mi"}},
+            }
+        ],
+        "nodeName": "node1",
+    },
+    "status": {
+        "phase": "Running",
+        "containerStatuses": [
+            {
+                "name": "app",
+                "ready": True,
+                "restartCount": 3,
+                "lastState": {"terminated": {"exitCode": 1, "finishedAt": "2025-01-02T03:04:05Z"}},
+            }
+        ],
+    },
+}
+
+POD_PROTOBUF = _msg(
+    _field(
+        1,
+        _msg(
+            _field(1, "web-7d9c8f6b5-abcde"),
+            _field(3, "default"),
+            _field(5, "uid-1"),
+            _field(6, "42"),
+            _field(11, _msg(_field(1, "app"), _field(2, "web"))),
+            _field(11, _msg(_field(1, "pod-template-hash"), _field(2, "7d9c8f6b5"))),
+            _field(13, _msg(_field(1, "ReplicaSet"), _field(3, "web-7d9c8f6b5"), _field(4, "rs-1"), _field(6, 1))),
+            _field(17, _msg(_field(1, "kubelet"))),
+            # 사용하지 않는 고정 길이 필드 (wire type 1)
+            _varint(99 << 3 | 1) + bytes(8),
+        ),
+    ),
+    _field(
+        2,
+        _msg(
+            _field(
+                2,
+                _msg(
+                    _field(1, "app"),
+                    _field(2, "nginx"),
+                    _field(
+                        8,
+                        _msg(
+                            _field(1, _msg(_field(1, "memory"), _field(2, _field(1, "128Mi")))),
+                            _field(2, _msg(_field(1, "cpu"), _field(2, _field(1, "250m")))),
+                            _field(2, _msg(_field(1, "memory"), _field(2, _field(1, "64Mi")))),
+                        ),
+                    ),
+                ),
+            ),
+            _field(10, "node1"),
+        ),
+    ),
+    _field(
+        3,
+        _msg(
+            _field(1, "Running"),
+            _field(
+                8,
+                _msg(
+                    _field(1, "app"),
+                    _field(3, _field(3, _msg(_field(1, 1), _field(6, _field(1, int(FINISHED.timestamp())))))),
+                    _field(4, 1),
+                    _field(5, 3),
+                ),
+            ),
+        ),
+    ),
+)
+
+
+class TestDecode(unittest.TestCase):
+    """Test cases for protobuf and JSON list decoding."""
+
+    def test_protobuf_matches_json(self) -> None:
+        """Test that protobuf and JSON responses decode to the same objects."""
+        # 함수 호출
+        from_protobuf = decode_protobuf(_envelope("PodList", [POD_PROTOBUF]), POD_RESOURCES)
+        from_json = decode_json(
+            json.dumps({"metadata": {"resourceVersion": "12345"}, "items": [POD_JSON]}).encode(), POD_RESOURCES
+        )
+        # 기본 스키마는 컨테이너 spec을 변환하지 않음
+        summary = decode_protobuf(_envelope("PodList", [POD_PROTOBUF]), POD).items[0]
+
+        # 결과 확인
+        self.assertEqual(from_protobuf, from_json)
+        self.assertEqual(from_protobuf.resource_version, "12345")
+        pod = from_protobuf.items[0]
+        self.assertEqual(pod.metadata.owner_references[0].kind, "ReplicaSet")
+        self.assertTrue(pod.metadata.owner_references[0].controller)
+        self.assertEqual(pod.spec.node_name, "node1")
+        self.assertEqual(pod.spec.containers[0].resources.requests, {"cpu": "250m", "memory": "64Mi"})
+        self.assertIsNone(pod.spec.init_containers)
+        self.assertFalse(hasattr(summary.spec, "containers"))
+        self.assertIsNone(pod.status.reason)
+        status = pod.status.container_statuses[0]
+        self.assertEqual(status.restart_count, 3)
+        self.assertEqual(status.last_state.terminated.finished_at, FINISHED)
+
+    def test_node_quantities(self) -> None:
+        """Test decoding node capacity maps, taints and conditions."""
+        # Mock 설정
+        node = _msg(
+            _field(1, _msg(_field(1, "node1"), _field(6, "7"))),
+            _field(2, _field(5, _msg(_field(1, "dedicated"), _field(3, "NoSchedule")))),
+            _field(
+                3,
+                _msg(
+                    _field(1, _msg(_field(1, "cpu"), _field(2, _field(1, "4")))),
+                    _field(2, _msg(_field(1, "memory"), _field(2, _field(1, "3Gi")))),
+                    _field(4, _msg(_field(1, "Ready"), _field(2, "True"))),
+                ),
+            ),
+        )
+
+        # 함수 호출
+        result = decode_protobuf(_envelope("NodeList", [node]), NODE).items[0]
+
+        # 결과 확인
+        self.assertEqual(result.metadata.resource_version, "7")
+        self.assertEqual(result.status.capacity, {"cpu": "4"})
+        self.assertEqual(result.status.allocatable, {"memory": "3Gi"})
+        self.assertEqual(result.status.conditions[0].status, "True")
+        self.assertEqual((result.spec.taints[0].key, result.spec.taints[0].value), ("dedicated", None))
+
+    def test_corrupt_protobuf(self) -> None:
+        """Test that truncated or non-protobuf bodies raise ValueError."""
+        body = _envelope("PodList", [POD_PROTOBUF])
+        with self.assertRaises(ValueError):
+            decode_protobuf(body[:-5], POD)
+        with self.assertRaises(ValueError):
+            decode_protobuf(b'{"items": []}', POD)
+
+
+class TestFetch(unittest.TestCase):
+    """Test cases for list requests and content negotiation."""
+
+    def setUp(self) -> None:
+        reset()
+
+    def test_fetch_gzip(self) -> None:
+        """Test that gzip bodies are decompressed and wire bytes are reported."""
+        # Mock 설정
+        body = json.dumps({"items": [POD_JSON] * 20}).encode()
+        compressed = gzip.compress(body)
+        api_client = MagicMock()
+        api_client.param_serialize.return_value = ("GET", "https://k8s/api/v1/pods", {}, None, [])
+        response = api_client.call_api.return_value
+        response.status = 200
+        response.headers = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        response.response.read.return_value = compressed
+
+        # 함수 호출
+        result = fetch(api_client, "/api/v1/pods", (PROTOBUF, JSON))
+
+        # 결과 확인
+        self.assertEqual(result, WireResponse(body=body, content_type=JSON, wire_bytes=len(compressed)))
+        headers = api_client.param_serialize.call_args.kwargs["header_params"]
+        self.assertEqual(headers["Accept"], f"{PROTOBUF}, {JSON}")
+        self.assertEqual(headers["Accept-Encoding"], "gzip")
+
+        # 429 응답은 스케줄러가 재시도할 수 있도록 ApiException으로 전달
+        response.status = 429
+        response.headers = {"Retry-After": "1"}
+        response.response.read.return_value = b"Too many requests"
+        with self.assertRaises(ApiException) as raised:
+            fetch(api_client, "/api/v1/pods", (JSON,))
+        self.assertEqual(raised.exception.status, 429)
+        self.assertEqual(raised.exception.headers, {"Retry-After": "1"})
+
+    def test_fetch_real_api_client(self) -> None:
+        """Test fetch against a real ApiClient so the installed client's request API is exercised."""
+        # Mock 설정: gzip JSON 목록과 429를 반환하는 로컬 API 서버
+        body = json.dumps({"items": [POD_JSON]}).encode()
+        seen: list[tuple[str, str | None, str | None]] = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                seen.append((self.path, self.headers["Authorization"], self.headers["Accept-Encoding"]))
+                if "limited" in self.path:
+                    self.send_response(429)
+                    self.send_header("Retry-After", "1")
+                    self.end_headers()
+                    return
+                payload = gzip.compress(body)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        config = Configuration(host=f"http://127.0.0.1:{server.server_address[1]}")
+        config.api_key = {"authorization": "token"}
+        config.api_key_prefix = {"authorization": "Bearer"}
+        try:
+            # 함수 호출
+            result = fetch(ApiClient(config), "/api/v1/pods", (JSON,), query=[("watch", "false")])
+            with self.assertRaises(ApiException) as raised:
+                fetch(ApiClient(config), "/api/v1/limited", (JSON,))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # 결과 확인
+        self.assertEqual((result.body, result.content_type), (body, JSON))
+        self.assertEqual(seen[0], ("/api/v1/pods?watch=false", "Bearer token", "gzip"))
+        self.assertEqual(raised.exception.status, 429)
+        assert raised.exception.headers is not None
+        self.assertEqual(raised.exception.headers["Retry-After"], "1")
+
+    @patch("builtins.print")
+    @patch("kubernetes_dashboard.wire.fetch")
+    def test_fallback_to_json(self, mock_fetch: MagicMock, mock_print: MagicMock) -> None:
+        """Test falling back to JSON when a protobuf response cannot be decoded."""
+        # Mock 설정
+        body = json.dumps({"items": [POD_JSON]}).encode()
+        mock_fetch.side_effect = lambda client, path, accept, **kwargs: (
+            WireResponse(b"k8s\x00\x12\xff", PROTOBUF, 6) if PROTOBUF in accept else WireResponse(body, JSON, len(body))
+        )
+
+        # 함수 호출
+        first = list_objects("cluster1", MagicMock(), "pods")
+        second = list_objects("cluster1", MagicMock(), "pods")
+
+        # 결과 확인: 한 번 실패한 컨텍스트는 JSON만 요청
+        self.assertEqual(first, second)
+        self.assertEqual(first.items[0].metadata.name, "web-7d9c8f6b5-abcde")
+        self.assertEqual([call.args[2] for call in mock_fetch.call_args_list], [(PROTOBUF, JSON), (JSON,), (JSON,)])
+        mock_print.assert_called_once()
+
+        # reset 이후에는 다시 protobuf를 요청
+        reset(["cluster1"])
+        list_objects("cluster1", MagicMock(), "pods")
+        self.assertEqual(mock_fetch.call_args_list[3].args[2], (PROTOBUF, JSON))
+
+
+if __name__ == "__main__":
+    unittest.main()
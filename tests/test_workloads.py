@@ -0,0 +1,98 @@
+"""Tests for the workloads module."""
+
+import unittest
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from kubernetes_dashboard.workloads import OwnerIndex, resolve_owner
+
+
+def _ref(kind: str, name: str, uid: str) -> Any:
+    """테스트용 ownerReference mock을 생성합니다."""
+    ref = MagicMock(kind=kind, uid=uid, controller=True)
+    ref.name = name
+    return ref
+
+
+def _pod(name: str, owner: Any = None, phase: str = "Running", ready: bool = True, restarts: int = 0) -> Any:
+    """테스트용 Pod mock을 생성합니다."""
+    pod = MagicMock()
+    pod.metadata.name = name
+    pod.metadata.namespace = "default"
+    pod.metadata.labels = {"pod-template-hash": "5d9f7c"}
+    pod.metadata.owner_references = [owner] if owner else None
+    pod.status.phase = phase
+    pod.status.container_statuses = [MagicMock(ready=ready, restart_count=restarts)]
+    return pod
+
+
+class TestWorkloads(unittest.TestCase):
+    """Test cases for the workloads module."""
+
+    def test_resolve_owner(self) -> None:
+        """Test resolving ReplicaSet owners to their Deployment."""
+        labels = {"pod-template-hash": "5d9f7c"}
+
+        # 결과 확인
+        self.assertEqual(resolve_owner(_ref("ReplicaSet", "web-5d9f7c", "u1"), labels), ("Deployment", "web"))
+        self.assertEqual(resolve_owner(_ref("ReplicaSet", "bare", "u2"), labels), ("ReplicaSet", "bare"))
+        self.assertEqual(resolve_owner(_ref("StatefulSet", "db", "u3"), None), ("StatefulSet", "db"))
+
+    def test_rollup_aggregates_per_workload(self) -> None:
+        """Test desired/ready/non-running/restart aggregates per top-level owner."""
+        # Mock 설정
+        rs = _ref("ReplicaSet", "web-5d9f7c", "rs-1")
+        ds = _ref("DaemonSet", "agent", "ds-1")
+        pods = [
+            _pod("web-a", rs),
+            _pod("web-b", rs, ready=False, restarts=2),
+            _pod("web-c", rs, phase="Pending"),
+            _pod("agent-a", ds, restarts=1),
+            _pod("debug"),
+        ]
+
+        # 함수 호출
+        rollup = OwnerIndex().rollup("c1")
+        for pod in pods:
+            rollup.add(pod)
+        rows = [row.to_dict() for row in rollup.rows()]
+
+        # 결과 확인: 문제가 있는 워크로드가 먼저
+        self.assertEqual(
+            rows[0],
+            {
+                "cluster": "c1",
+                "ns": "default",
+                "kind": "Deployment",
+                "name": "web",
+                "pods": 3,
+                "ready": 1,
+                "non_running": 1,
+                "restarts": 2,
+            },
+        )
+        self.assertEqual([(r["kind"], r["name"]) for r in rows[1:]], [("DaemonSet", "agent"), ("Pod", "debug")])
+
+    def test_owner_index_is_incremental(self) -> None:
+        """Test that only new owner references are resolved and stale ones are dropped."""
+        index = OwnerIndex()
+        first = index.rollup("c1")
+        first.add(_pod("web-a", _ref("ReplicaSet", "web-5d9f7c", "rs-1")))
+        first.add(_pod("old-a", _ref("ReplicaSet", "old-5d9f7c", "rs-old")))
+        first.rows()
+        self.assertEqual(len(index), 2)
+
+        # 함수 호출
+        with patch("kubernetes_dashboard.workloads.resolve_owner", wraps=resolve_owner) as mock_resolve:
+            second = index.rollup("c1")
+            second.add(_pod("web-b", _ref("ReplicaSet", "web-5d9f7c", "rs-1")))
+            second.add(_pod("api-a", _ref("ReplicaSet", "api-5d9f7c", "rs-2")))
+            second.rows()
+
+        # 결과 확인
+        mock_resolve.assert_called_once()
+        self.assertEqual(len(index), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()